@@ -8,6 +8,8 @@
 #include "header/network/network_matrix.h"
 #include "header/basic/constants.h"
 #include "header/apis/steps_api_search_buffer.h"
+#include "header/apis/steps_api_field.h"
+#include "header/basic/base_case_struct.h"
 #include <ctime>
 #include <string>
 
@@ -67,6 +69,21 @@ class STEPS
         void reset();
         void terminate();
 
+        void copy_from_toolkit(STEPS& toolkit);
+
+        void cache_base_case();
+        bool reset_to_base_case();
+        void release_base_case();
+        bool is_base_case_cached() const;
+
+        void append_case_source_file(const string& file, unsigned long long checksum);
+        void clear_case_source_files();
+        vector<string> get_case_source_files() const;
+        vector<unsigned long long> get_case_source_file_checksums() const;
+
+        vector<string> get_all_dynamic_model_records();
+        void load_dynamic_model_records(const vector<string>& records);
+
         POWER_SYSTEM_DATABASE& get_power_system_database();
         DYNAMIC_MODEL_DATABASE& get_dynamic_model_database();
         POWERFLOW_SOLVER& get_powerflow_solver();
@@ -84,7 +101,15 @@ class STEPS
     public:
         char steps_char_buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
         STEPS_API_SEARCH_BUFFER api_search_buffer;
+        vector<STEPS_API_FIELD> api_fields;
     private:
+        void copy_dynamic_models_from_toolkit(STEPS& toolkit);
+        void add_copy_of_dynamic_model(const MODEL* model);
+        template<class T> void add_copy_of_dynamic_model_of_type(const MODEL* model);
+        vector<MODEL*> get_all_dynamic_models();
+        void append_dynamic_model(vector<MODEL*>& models, MODEL* model);
+        void append_dynamic_model_record(vector<string>& records, const MODEL* model);
+
         string toolkit_name;
 
         POWER_SYSTEM_DATABASE power_system_db;
@@ -95,6 +120,11 @@ class STEPS
 
         NETWORK_MATRIX network_matrix;
 
+        BASE_CASE_STRUCT base_case;
+
+        vector<string> case_source_files;
+        vector<unsigned long long> case_source_file_checksums;
+
         time_t clock_when_system_started;
 
         ofstream log_file;
@@ -19,11 +19,17 @@ EXPORT_STEPS_DLL unsigned int api_get_const_INDEX_NOT_EXIST();
 EXPORT_STEPS_DLL void api_set_toolkit_log_file(char* log_file, bool log_file_append_mode=false, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL unsigned int api_generate_new_toolkit(char* log_fie=NULL);
+EXPORT_STEPS_DLL unsigned int api_clone_toolkit(unsigned int toolkit_index=INDEX_NOT_EXIST, char* log_file=NULL);
 EXPORT_STEPS_DLL void api_delete_toolkit(unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL void api_initialize_toolkit(unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_clear_toolkit(unsigned int toolkit_index=INDEX_NOT_EXIST);
 
+EXPORT_STEPS_DLL void api_cache_base_case(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_reset_to_base_case(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_release_base_case(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_is_base_case_cached(unsigned int toolkit_index=INDEX_NOT_EXIST);
+
 EXPORT_STEPS_DLL void api_set_toolkit_parallel_thread_number(unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL unsigned int api_get_toolkit_parallel_thread_number(unsigned int toolkit_index=INDEX_NOT_EXIST);
 
@@ -55,6 +61,8 @@ EXPORT_STEPS_DLL void api_load_powerflow_result_from_file(char* file, char* file
 EXPORT_STEPS_DLL void api_save_powerflow_data_to_file(char* file, char* file_type, bool export_zero_impedance_line=true, bool export_out_of_service_bus=true, unsigned int powerflow_data_save_mode=0, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_load_dynamic_data_from_file(char* file, char* file_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_save_dynamic_data_to_file(char* file, char* file_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_save_case_snapshot(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_load_case_snapshot(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL void api_add_bus(unsigned int bus_number, char* bus_name, double base_voltage_in_kV, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_add_generator(unsigned int bus_number, char* identifier, unsigned int toolkit_index=INDEX_NOT_EXIST);
@@ -127,6 +135,10 @@ EXPORT_STEPS_DLL void api_initialize_device_search(const char* device_type, unsi
 EXPORT_STEPS_DLL unsigned int api_get_current_device_bus_number(const char* device_type, const char* side, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL const char* api_get_current_device_identifier(const char* device_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_goto_next_device(const char* device_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_device_search_result_count(const char* device_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_get_device_search_result_bus_numbers(const char* device_type, const char* side, unsigned int* buses, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_device_search_result_identifiers(const char* device_type, char* identifiers, unsigned int n_bytes, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_set_device_search_result(const char* device_type, const unsigned int* buses, const char* identifiers, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL void api_initialize_area_search(unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL unsigned int api_get_current_area_number(unsigned int toolkit_index=INDEX_NOT_EXIST);
@@ -239,6 +251,19 @@ EXPORT_STEPS_DLL void api_set_owner_string_data(unsigned int owner, char* parame
 EXPORT_STEPS_DLL bool api_get_owner_boolean_data(unsigned int owner, char* parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_set_owner_boolean_data(unsigned int owner, char* parameter_name, bool value, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
+EXPORT_STEPS_DLL void api_get_device_search_result_integer_data(const char* device_type, const char* side, const char* parameter_name, int* values, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_get_device_search_result_float_data(const char* device_type, const char* side, const char* parameter_name, double* values, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_get_device_search_result_boolean_data(const char* device_type, const char* side, const char* parameter_name, bool* values, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_set_device_search_result_float_data(const char* device_type, const char* side, const char* parameter_names, const double* values, unsigned int n, bool mark_changed_buses, unsigned int toolkit_index=INDEX_NOT_EXIST);
+
+EXPORT_STEPS_DLL unsigned int api_get_device_field_id(const char* device_type, const char* par_type, const char* side, const char* parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL int api_get_device_integer_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_set_device_integer_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, int value, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL double api_get_device_float_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_set_device_float_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, double value, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_get_device_boolean_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_set_device_boolean_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, bool value, unsigned int toolkit_index=INDEX_NOT_EXIST);
+
 EXPORT_STEPS_DLL void api_set_dynamic_model(char* model_string, char* file_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL const char* api_get_generator_related_model_name(unsigned int bus, char* identifier, char* model_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
@@ -308,6 +333,7 @@ EXPORT_STEPS_DLL void api_show_powerflow_result(unsigned int toolkit_index=INDEX
 EXPORT_STEPS_DLL void api_save_powerflow_result(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_save_extended_powerflow_result(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_save_jacobian_matrix(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_build_jacobian_matrix(unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL void api_build_network_Y_matrix(unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_build_decoupled_network_B_matrix(unsigned int toolkit_index=INDEX_NOT_EXIST);
@@ -319,6 +345,11 @@ EXPORT_STEPS_DLL void api_save_decoupled_network_B_matrix(char* file, unsigned i
 EXPORT_STEPS_DLL void api_save_dc_network_B_matrix(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_save_dynamic_network_Y_matrix(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_save_network_Z_matrix(char* file, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_network_matrix_size(const char* matrix_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_network_matrix_entry_count(const char* matrix_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_get_network_matrix_in_compressed_column_form(const char* matrix_type, int* starting_indices, int* row_indices, double* real_values, double* imag_values, unsigned int n, unsigned int nnz, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_get_network_matrix_bus_numbers(const char* matrix_type, unsigned int* buses, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_get_network_Z_columns(const char* sequence, const unsigned int* buses, unsigned int ncol, double* real_values, double* imag_values, unsigned int n, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 
 EXPORT_STEPS_DLL unsigned int api_get_dynamic_simulator_integer_parameter(char* parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
@@ -362,11 +393,28 @@ EXPORT_STEPS_DLL void api_prepare_transformer_related_meter(unsigned int ibus, u
 EXPORT_STEPS_DLL void api_prepare_hvdc_related_meter(unsigned int ibus, unsigned int jbus, char* id, char* meter_type, char* side, char* var_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_prepare_equivalent_device_related_meter(unsigned int bus, char* id, char* meter_type, char* var_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
+EXPORT_STEPS_DLL unsigned int api_get_meter_count(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL const char* api_get_meter_name(unsigned int meter_index, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL const double* api_get_meter_buffer(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_meter_buffer_column_count(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_meter_buffer_stored_count(unsigned int toolkit_index=INDEX_NOT_EXIST);
+
 EXPORT_STEPS_DLL void api_start_dynamic_simulation(unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_stop_dynamic_simulation(unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_run_simulation_to_time(double t_end, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_run_simulation_to_time_with_callback(double t_end, bool (*callback)(double), unsigned int callback_step_interval, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_run_a_step(unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL bool api_get_system_angular_stable_flag(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_get_dynamic_simulation_early_stop_flag(unsigned int toolkit_index=INDEX_NOT_EXIST);
+
+EXPORT_STEPS_DLL void api_add_meter_stop_condition(unsigned int meter_index, double lower_limit, double upper_limit, double duration_in_s, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_clear_meter_stop_conditions(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_meter_stop_condition_count(unsigned int toolkit_index=INDEX_NOT_EXIST);
+
+EXPORT_STEPS_DLL unsigned int api_save_dynamic_state(unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL bool api_restore_dynamic_state(unsigned int handle, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL void api_release_dynamic_state(unsigned int handle, unsigned int toolkit_index=INDEX_NOT_EXIST);
+EXPORT_STEPS_DLL unsigned int api_get_dynamic_state_count(unsigned int toolkit_index=INDEX_NOT_EXIST);
 
 EXPORT_STEPS_DLL void api_set_bus_fault(unsigned int bus, char* fault_type, double fault_G, double fault_B, unsigned int toolkit_index=INDEX_NOT_EXIST);
 EXPORT_STEPS_DLL void api_clear_bus_fault(unsigned int bus, char* fault_type, unsigned int toolkit_index=INDEX_NOT_EXIST);
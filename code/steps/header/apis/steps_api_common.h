@@ -21,4 +21,20 @@ void set_owner_of_nonbus_device(NONBUS_DEVICE* device, string parameter_name, in
 double get_owner_fraction_of_nonbus_device(NONBUS_DEVICE* device, string parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
 void set_owner_fraction_of_nonbus_device(NONBUS_DEVICE* device, string parameter_name, double value, unsigned int toolkit_index=INDEX_NOT_EXIST);
 
+vector<NONBUS_DEVICE*> get_nonbus_devices_in_api_search_buffer(STEPS& toolkit, const string& DEVICE_TYPE);
+vector<SOURCE*> get_sources_in_api_search_buffer(STEPS& toolkit, const string& DEVICE_TYPE);
+
+int get_nonbus_device_integer_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
+double get_nonbus_device_float_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
+bool get_nonbus_device_boolean_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, unsigned int toolkit_index=INDEX_NOT_EXIST);
+void set_nonbus_device_integer_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, int value, unsigned int toolkit_index=INDEX_NOT_EXIST);
+void set_nonbus_device_float_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, double value, unsigned int toolkit_index=INDEX_NOT_EXIST);
+void set_nonbus_device_boolean_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, bool value, unsigned int toolkit_index=INDEX_NOT_EXIST);
+void set_device_search_result_float_data_of_parameter(STEPS& toolkit, const string& DEVICE_TYPE, const char* side, const string& parameter_name, const double* values, unsigned int n, unsigned int toolkit_index);
+bool is_injection_parameter_of_device(const string& DEVICE_TYPE, const string& PARAMETER_NAME);
+
+STEPS_API_FIELD_CODE get_api_field_code(STEPS_API_FIELD_DEVICE device, char par_type, const string& PARAMETER_NAME);
+DEVICE_ID get_device_id_of_api_field(const STEPS_API_FIELD& field, unsigned int ibus, unsigned int jbus, unsigned int kbus, const string& identifier);
+STEPS_API_FIELD* get_api_field_with_field_id(STEPS& toolkit, unsigned int field_id, char par_type, string api_func);
+
 #endif // STEPS_API_COMMON_H
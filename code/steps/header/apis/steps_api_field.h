@@ -0,0 +1,64 @@
+#ifndef STEPS_API_FIELD_H
+#define STEPS_API_FIELD_H
+
+#include <string>
+
+using namespace std;
+
+enum STEPS_API_FIELD_DEVICE
+{
+    API_FIELD_BUS,
+    API_FIELD_GENERATOR,
+    API_FIELD_WT_GENERATOR,
+    API_FIELD_PV_UNIT,
+    API_FIELD_ENERGY_STORAGE,
+    API_FIELD_LOAD,
+    API_FIELD_FIXED_SHUNT,
+    API_FIELD_LINE,
+    API_FIELD_TRANSFORMER,
+    API_FIELD_HVDC
+};
+
+enum STEPS_API_FIELD_CODE
+{
+    API_FIELD_BY_NAME,
+    API_FIELD_BUS_VBASE_KV,
+    API_FIELD_BUS_V_PU,
+    API_FIELD_BUS_V_KV,
+    API_FIELD_BUS_ANGLE_RAD,
+    API_FIELD_BUS_ANGLE_DEG,
+    API_FIELD_SOURCE_STATUS,
+    API_FIELD_SOURCE_PGEN_MW,
+    API_FIELD_SOURCE_QGEN_MVAR,
+    API_FIELD_SOURCE_PMAX_MW,
+    API_FIELD_SOURCE_PMIN_MW,
+    API_FIELD_SOURCE_QMAX_MVAR,
+    API_FIELD_SOURCE_QMIN_MVAR,
+    API_FIELD_SOURCE_VREG_PU,
+    API_FIELD_LOAD_STATUS,
+    API_FIELD_LOAD_PP0_MW,
+    API_FIELD_LOAD_QP0_MVAR,
+    API_FIELD_LOAD_P_MW,
+    API_FIELD_LOAD_Q_MVAR,
+    API_FIELD_LINE_STATUS_SEND,
+    API_FIELD_LINE_STATUS_RECV,
+    API_FIELD_LINE_PSEND_MW,
+    API_FIELD_LINE_QSEND_MVAR,
+    API_FIELD_LINE_PRECV_MW,
+    API_FIELD_LINE_QRECV_MVAR
+};
+
+class STEPS_API_FIELD
+{
+    public:
+        STEPS_API_FIELD();
+        ~STEPS_API_FIELD();
+
+        string device_type;
+        STEPS_API_FIELD_DEVICE device;
+        char par_type;
+        string side;
+        string parameter_name;
+        STEPS_API_FIELD_CODE code;
+};
+#endif // STEPS_API_FIELD_H
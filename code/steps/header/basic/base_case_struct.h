@@ -0,0 +1,24 @@
+#ifndef BASE_CASE_STRUCT_H
+#define BASE_CASE_STRUCT_H
+
+#include "header/basic/device_state_struct.h"
+#include <vector>
+
+using namespace std;
+
+struct BASE_CASE_STRUCT
+{
+    bool cached;
+    bool powerflow_converged;
+
+    DEVICE_STATE_STRUCT device_state;
+
+    vector<double> source_p_generation_in_MW;
+    vector<double> source_q_generation_in_MVar;
+    vector<double> hvdc_alpha_or_gamma_in_deg;
+    vector<double> hvdc_transformer_tap_in_pu;
+    vector<double> hvdc_dc_voltage_in_kV;
+    vector<double> hvdc_dc_current_in_kA;
+};
+
+#endif // BASE_CASE_STRUCT_H
@@ -18,6 +18,17 @@ public:
     clock_t get_clock_when_matrix_is_changed() const;
     clock_t get_clock_when_LU_factorization_is_performed() const;
 
+    void set_symbolic_analysis_reuse_logic(bool logic);
+    bool get_symbolic_analysis_reuse_logic() const;
+
+    void reset_LU_statistics();
+    unsigned int get_symbolic_analysis_count() const;
+    unsigned int get_numeric_factorization_count() const;
+    unsigned int get_solution_count() const;
+    double get_symbolic_analysis_time_in_s() const;
+    double get_numeric_factorization_time_in_s() const;
+    double get_solution_time_in_s() const;
+
     bool matrix_in_compressed_column_form()  const;
 
     complex<double> get_entry_value(int row, int col)  const;
@@ -65,8 +76,18 @@ public:
     virtual void save_matrix_to_file(string filename)  const = 0;
 
     virtual unsigned int get_memory_usage_in_bytes() = 0;
+protected:
+    double get_LU_timer_in_s() const;
+    void append_symbolic_analysis_time_in_s(double time);
+    void append_numeric_factorization_time_in_s(double time);
+    void append_solution_time_in_s(double time);
 private:
     clock_t clock_when_matrix_is_changed;
     clock_t clock_when_LU_factorization_is_performed;
+    unsigned long long matrix_change_count, matrix_change_count_when_LU_factorization_is_performed;
+
+    bool symbolic_analysis_reuse_enabled;
+    unsigned int symbolic_analysis_count, numeric_factorization_count, solution_count;
+    double symbolic_analysis_time_in_s, numeric_factorization_time_in_s, solution_time_in_s;
 };
 #endif // COMPLEX_SPARSE_MATRIX_H
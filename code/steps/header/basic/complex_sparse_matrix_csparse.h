@@ -59,6 +59,8 @@ private:
     void solve_Lx_eq_b(vector<complex<double> >& b);
     void solve_xU_eq_b(vector<complex<double> >& b);
     void copy_from_const_matrix(const COMPLEX_SPARSE_MATRIX_CSPARSE& matrix);
+    bool is_pattern_same_as_matrix(const COMPLEX_SPARSE_MATRIX_CSPARSE& matrix) const;
+    void free_LU_factorization();
     cxs     *matrix_complex;
     cxsn    *LU;
     cxss    *LU_symbolic;
@@ -26,6 +26,7 @@ class COMPLEX_SPARSE_MATRIX_TEST : public Test::Suite
         void test_constructor();
 
         void test_add_entry();
+        void test_convert_to_triplet_form();
         void test_set_get_matrix();
 
         void test_matrix_format();
@@ -50,6 +51,7 @@ class COMPLEX_SPARSE_MATRIX_TEST : public Test::Suite
         void test_LU_factorization();
         void test_slove_Ax_equal_b();
         void test_solve_Ax_equal_b_with_operator_slash();
+        void test_solve_Ax_equal_b_with_singular_matrix();
 
         void test_copy_with_operator_equal();
         void test_copy_with_copy_constructor();
@@ -40,6 +40,7 @@ class DEVICE_ID
         void set_maximum_allowed_terminal_count(unsigned int n);
         void set_device_type_and_allowed_terminal_count(string device_type);
         bool is_given_terminal_acceptable(const TERMINAL& terminal);
+        void copy_from_const_device_id(const DEVICE_ID& device_id);
 
     private:
         string device_type;
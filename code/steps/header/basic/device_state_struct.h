@@ -0,0 +1,32 @@
+#ifndef DEVICE_STATE_STRUCT_H
+#define DEVICE_STATE_STRUCT_H
+
+#include "header/basic/fault.h"
+#include "header/basic/steps_enum.h"
+#include <vector>
+#include <map>
+
+using namespace std;
+
+struct DEVICE_STATE_STRUCT
+{
+    vector<BUS_TYPE> bus_types;
+    vector<double> bus_voltages_in_pu;
+    vector<double> bus_angles_in_rad;
+    vector<FAULT> bus_faults;
+
+    vector<bool> source_status;
+    vector<double> source_mbase_in_MVA;
+    vector<unsigned int> wt_generator_lumped_count;
+    vector<unsigned int> pv_unit_lumped_count;
+    vector<bool> load_status;
+    vector<double> load_scale_in_pu;
+    vector<bool> fixed_shunt_status;
+    vector<bool> line_breaker_status;
+    vector< map<double,FAULT> > line_faults;
+    vector<bool> transformer_breaker_status;
+    vector<bool> hvdc_status;
+    vector<bool> equivalent_device_status;
+};
+
+#endif // DEVICE_STATE_STRUCT_H
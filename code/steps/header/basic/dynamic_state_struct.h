@@ -0,0 +1,35 @@
+#ifndef DYNAMIC_STATE_STRUCT_H
+#define DYNAMIC_STATE_STRUCT_H
+
+#include "header/basic/device_state_struct.h"
+#include "header/model/bus_frequency_model/bus_frequency_model.h"
+#include <vector>
+#include <complex>
+
+using namespace std;
+
+struct DYNAMIC_STATE_STRUCT
+{
+    bool in_use;
+
+    double time_in_s;
+    double time_step_in_s;
+    bool rotor_angle_stable;
+    double iteration_accelerator;
+
+    vector<char> model_warehouse;
+
+    DEVICE_STATE_STRUCT device_state;
+
+    vector<complex<double> > bus_Euler_complex_numbers;
+    vector<BUS_FREQUENCY_MODEL> bus_frequency_models;
+    vector<complex<double> > internal_bus_complex_voltage_in_pu;
+
+    vector<double> meter_values;
+    vector<double> meter_buffer;
+    unsigned int meter_buffer_stored_count;
+    vector<bool> meter_stop_condition_violated;
+    vector<double> meter_stop_condition_violation_start_time_in_s;
+};
+
+#endif // DYNAMIC_STATE_STRUCT_H
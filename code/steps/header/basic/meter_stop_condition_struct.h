@@ -0,0 +1,14 @@
+#ifndef METER_STOP_CONDITION_STRUCT_H
+#define METER_STOP_CONDITION_STRUCT_H
+
+struct METER_STOP_CONDITION_STRUCT
+{
+    unsigned int meter_index;
+    double lower_limit;
+    double upper_limit;
+    double duration_in_s;
+    bool violated;
+    double violation_start_time_in_s;
+};
+
+#endif // METER_STOP_CONDITION_STRUCT_H
@@ -60,6 +60,8 @@ private:
     void solve_Lx_eq_b(vector<double>& b);
     void solve_xU_eq_b(vector<double>& b);
     void copy_from_const_matrix(const SPARSE_MATRIX_CSPARSE& matrix);
+    bool is_pattern_same_as_matrix(const SPARSE_MATRIX_CSPARSE& matrix) const;
+    void free_LU_factorization();
     cs     *matrix_real; // real components
     cs     *matrix_imag; // imaginary components , not used for real matrix
     csn    *LU;
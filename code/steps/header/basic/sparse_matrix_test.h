@@ -50,6 +50,8 @@ class SPARSE_MATRIX_TEST : public Test::Suite
         void test_LU_factorization();
         void test_slove_Ax_equal_b();
         void test_solve_Ax_equal_b_with_operator_slash();
+        void test_solve_Ax_equal_b_with_singular_matrix();
+        void test_LU_factorization_with_symbolic_analysis_reused();
 
         void test_copy_with_operator_equal();
         void test_copy_with_copy_constructor();
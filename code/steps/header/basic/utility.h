@@ -6,6 +6,7 @@
 #include "header/toolkit/powerflow_solver/powerflow_solver.h"
 #include "header/toolkit/dynamic_simulator/dynamic_simulator.h"
 #include <complex>
+#include <ctime>
 
 string num2str(int number);
 string num2str(unsigned int number);
@@ -86,6 +87,11 @@ complex<double> get_dq2xy_rotation_with_angle_in_deg(double angle);
 complex<double> get_dq2xy_rotation_with_angle_in_rad(double angle);
 
 bool is_file_exist(const string& file);
+unsigned long long get_checksum_of_data(const char* data, size_t size, unsigned long long checksum=14695981039346656037ULL);
+unsigned long long get_checksum_of_text(const char* text, size_t size, unsigned long long checksum=14695981039346656037ULL);
+unsigned long long get_checksum_of_file(const string& file);
+
+tm get_local_time(time_t tt);
 
 void show_information_with_leading_time_stamp_with_default_toolkit(const string& info);
 void show_information_with_leading_time_stamp_with_default_toolkit(ostringstream& stream);
@@ -99,6 +105,7 @@ string psse_dyr_string2steps_string(const string& data);
 
 void initialize_package();
 unsigned int generate_new_toolkit(string log_file="");
+unsigned int clone_toolkit(unsigned int toolkit_index, string log_file="");
 void delete_toolkit(unsigned int toolkit_index);
 unsigned int get_toolkit_count();
 STEPS& get_default_toolkit();
@@ -65,6 +65,7 @@ class UTILITY_TEST : public Test::Suite
 
         void test_generate_and_delete_toolkit();
         void test_get_toolkit();
+        void test_run_toolkits_in_parallel_threads();
 };
 
 #endif//UTILITY_TEST_H
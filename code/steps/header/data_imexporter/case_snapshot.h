@@ -0,0 +1,76 @@
+#ifndef CASE_SNAPSHOT_H
+#define CASE_SNAPSHOT_H
+
+#include "header/power_system_database.h"
+#include <string>
+#include <vector>
+#include <complex>
+
+using namespace std;
+
+class CASE_SNAPSHOT
+{
+    public:
+        CASE_SNAPSHOT(STEPS& toolkit);
+        ~CASE_SNAPSHOT();
+        STEPS& get_toolkit() const;
+
+        bool save_case_snapshot(const string& file);
+        bool load_case_snapshot(const string& file);
+    private:
+        void write_unsigned_int(unsigned int value);
+        void write_unsigned_long_long(unsigned long long value);
+        void write_bool(bool value);
+        void write_double(double value);
+        void write_complex(const complex<double>& value);
+        void write_string(const string& value);
+        void write_rating(const RATING& rating);
+        void write_fault(const FAULT& fault);
+        void write_ownership(const NONBUS_DEVICE& device);
+
+        unsigned int read_unsigned_int();
+        unsigned long long read_unsigned_long_long();
+        bool read_bool();
+        double read_double();
+        complex<double> read_complex();
+        string read_string();
+        RATING read_rating();
+        FAULT read_fault();
+        void read_ownership(NONBUS_DEVICE& device);
+
+        bool is_snapshot_stale();
+        bool load_snapshot_payload();
+
+        void save_power_system_database();
+        void save_bus(const BUS& bus);
+        void save_source(const SOURCE& source);
+        void save_load(const LOAD& load);
+        void save_fixed_shunt(const FIXED_SHUNT& shunt);
+        void save_line(const LINE& line);
+        void save_transformer(const TRANSFORMER& trans);
+        void save_hvdc(const HVDC& hvdc);
+        void save_equivalent_device(const EQUIVALENT_DEVICE& edevice);
+        void save_dynamic_model_records();
+
+        void load_power_system_database();
+        void load_bus(BUS& bus);
+        void load_source(SOURCE& source);
+        void load_load(LOAD& load);
+        void load_fixed_shunt(FIXED_SHUNT& shunt);
+        void load_line(LINE& line);
+        void load_transformer(TRANSFORMER& trans);
+        void load_hvdc(HVDC& hvdc);
+        void load_equivalent_device(EQUIVALENT_DEVICE& edevice);
+        void load_dynamic_model_records();
+    private:
+        STEPS* toolkit;
+
+        string snapshot_buffer;
+
+        const char* snapshot_data;
+        size_t snapshot_size;
+        size_t snapshot_position;
+        bool snapshot_corrupted;
+};
+
+#endif // CASE_SNAPSHOT_H
@@ -0,0 +1,36 @@
+#ifndef CASE_SNAPSHOT_TEST_H
+#define CASE_SNAPSHOT_TEST_H
+
+#include <istream>
+#include <cstdlib>
+#include <cstring>
+#include <iostream>
+
+#ifdef _MSC_VER
+	#pragma warning (disable: 4290)
+#endif
+
+#include "cpptest.h"
+
+#include "header/data_imexporter/case_snapshot.h"
+#include "header/STEPS.h"
+using namespace std;
+
+class CASE_SNAPSHOT_TEST : public Test::Suite
+{
+    public:
+        CASE_SNAPSHOT_TEST();
+    protected:
+        virtual void setup();
+        virtual void tear_down();
+    private:
+        void test_record_case_source_files();
+        void test_save_and_load_case_snapshot();
+        void test_run_dynamic_simulation_with_loaded_case_snapshot();
+        void test_reject_stale_case_snapshot();
+        void test_reject_case_snapshot_with_missing_source_file();
+
+        void copy_file(const string& source, const string& destination);
+};
+
+#endif//CASE_SNAPSHOT_TEST_H
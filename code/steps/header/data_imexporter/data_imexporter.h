@@ -6,6 +6,7 @@
 #include <fstream>
 #include <vector>
 #include <set>
+#include <cstdio>
 
 using namespace std;
 class DATA_IMEXPORTER
@@ -28,6 +29,13 @@ class DATA_IMEXPORTER
 
         void export_shadowed_bus_pair(string file) const;
 
+        void clear_data_file_checksum();
+        void update_data_file_checksum(const char* data);
+        void update_data_file_checksum_with_rest_of_file(FILE* fid);
+        void set_data_file_loaded_flag(bool flag);
+        unsigned long long get_data_file_checksum() const;
+        bool is_data_file_loaded() const;
+
         virtual void load_powerflow_data(string pf_source) = 0;
         virtual void load_powerflow_result(string pf_source) = 0;
         virtual void load_dynamic_data(string dy_source) = 0;
@@ -61,6 +69,9 @@ class DATA_IMEXPORTER
         POWERFLOW_DATA_SAVE_MODE powerflow_data_save_mode;
 
         vector<unsigned int> ordered_buses_to_export;
+
+        unsigned long long data_file_checksum;
+        bool data_file_loaded;
 };
 
 #endif // DATA_IMEXPORTER_H
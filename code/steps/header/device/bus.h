@@ -82,6 +82,7 @@ class BUS : public DEVICE
         double get_base_period_in_s() const;
         double get_voltage_to_regulate_in_pu() const;
         complex<double> get_positive_sequence_complex_voltage_in_pu() const;
+        complex<double> get_positive_sequence_Euler_complex_number() const;
         complex<double> get_positive_sequence_complex_voltage_in_kV() const;
         complex<double> get_negative_sequence_complex_voltage_in_pu() const;
         complex<double> get_negative_sequence_complex_voltage_in_kV() const;
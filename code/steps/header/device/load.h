@@ -65,6 +65,8 @@ class LOAD : public NONBUS_DEVICE
         static double get_load_scale_with_voltage(double exp, double v, LOAD_CURRENT_VOLTAGE_REDUCE_TYPE cv_type = LOAD_ELLIPTICAL_CV);
         static double get_load_scale_with_Imax_and_voltage(double Imax, double v, double vth, LOAD_CURRENT_VOLTAGE_REDUCE_TYPE cv_type);
 
+        // voltage thresholds are shared by loads of all toolkits of the process, and are not settable with APIs.
+        // keep them unchanged while toolkits run in parallel threads
         static void set_voltage_threshold_of_constant_power_load_in_pu(double v);
         static void set_voltage_threshold_of_constant_current_load_in_pu(double v);
         static double get_voltage_threshold_of_constant_power_load_in_pu();
@@ -24,6 +24,9 @@ class DYNAMIC_MODEL_DATABASE
 
         void check_device_model_minimum_time_constants();
 
+        void save_model_warehouse(vector<char>& buffer) const;
+        bool restore_model_warehouse(const vector<char>& buffer);
+
         unsigned int get_memory_usage_in_bytes();
     private:
         unsigned int get_model_size(MODEL* model) const;
@@ -62,7 +62,16 @@ class NETWORK_MATRIX
         complex<double> get_zero_sequence_self_impedance_of_physical_bus(unsigned int bus);
         complex<double> get_zero_sequence_mutual_impedance_between_physical_bus(unsigned int ibus, unsigned int jbus);
 
+        vector<complex<double> > get_positive_sequence_network_Z_columns_of_physical_buses(const vector<unsigned int>& buses);
+        vector<complex<double> > get_negative_sequence_network_Z_columns_of_physical_buses(const vector<unsigned int>& buses);
+        vector<complex<double> > get_zero_sequence_network_Z_columns_of_physical_buses(const vector<unsigned int>& buses);
+
+        bool add_device_to_dynamic_network_Y_matrix(const DEVICE_ID& did);
+        bool remove_device_from_dynamic_network_Y_matrix(const DEVICE_ID& did);
+
         void optimize_network_ordering();
+        unsigned int get_network_Y_matrix_build_count() const;
+        void mark_network_Y_matrix_outdated();
         void check_network_connectivity(bool remove_void_island=false);
         vector< vector<unsigned int> > get_islands_with_internal_bus_number();
         vector< vector<unsigned int> > get_islands_with_physical_bus_number();
@@ -115,6 +124,7 @@ class NETWORK_MATRIX
         void add_two_winding_transformer_to_dc_network(const TRANSFORMER& trans);
 
         void add_bus_fault_to_dynamic_network();
+        void add_bus_fault_to_dynamic_network(const BUS& bus);
         void add_lines_to_dynamic_network();
         void add_faulted_line_to_dynamic_network(const LINE& line);
         void add_generators_to_dynamic_network();
@@ -123,6 +133,8 @@ class NETWORK_MATRIX
         void add_wt_generator_to_dynamic_network(WT_GENERATOR& gen);
         void add_motor_loads_to_dynamic_network();
         void add_motor_load_to_dynamic_network(const LOAD& load);
+        bool add_device_to_dynamic_network(const DEVICE_ID& did);
+        bool update_dynamic_network_Y_matrix_with_device(const DEVICE_ID& did, double scale);
 
         void add_lines_to_sequence_network();
         void add_faulted_line_to_sequence_network(const LINE& line);
@@ -138,6 +150,7 @@ class NETWORK_MATRIX
         vector<complex<double> > get_complex_impedance_of_column_from_this_Y_matrix(unsigned int col);
         complex<double> get_self_impedance_of_physical_bus_from_this_Y_matrix(unsigned int bus);
         complex<double> get_mutual_impedance_between_physical_bus_from_this_Y_matrix(unsigned int ibus, unsigned int jbus);
+        vector<complex<double> > get_network_Z_columns_of_physical_buses_from_this_Y_matrix(const vector<unsigned int>& buses);
 
 
         bool is_condition_ok() const;
@@ -157,5 +170,7 @@ class NETWORK_MATRIX
         STEPS_COMPLEX_SPARSE_MATRIX* this_Z_matrix_pointer;
         STEPS_SPARSE_MATRIX this_jacobian;
         INPHNO inphno;
+
+        unsigned int network_Y_matrix_build_count;
 };
 #endif // NETWORK_MATRIX_H
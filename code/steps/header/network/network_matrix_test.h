@@ -32,8 +32,12 @@ class NETWORK_MATRIX_TEST : public Test::Suite
         void test_optimize_network_ordering();
         void test_check_network_connectivity();
         void test_get_islands();
+        void test_get_islands_with_isolated_bus_out_of_matrix();
         void test_save_network_Y_matrix_to_file();
         void test_build_network_with_bus_out_of_service();
+        void test_update_dynamic_network_Y_matrix_incrementally();
+
+        void check_dynamic_network_Y_matrix_with_rebuilt_matrix();
     private:
         NETWORK_MATRIX* network_matrix;
 };
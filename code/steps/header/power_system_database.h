@@ -19,6 +19,7 @@
 
 #include "header/basic/bus_index.h"
 #include "header/basic/device_index_map.h"
+#include "header/basic/device_state_struct.h"
 
 #include <string>
 
@@ -106,6 +107,8 @@ class POWER_SYSTEM_DATABASE
         void append_zone(ZONE& zone);
         void append_owner(OWNER& owner);
 
+        void copy_from_power_system_database(POWER_SYSTEM_DATABASE& psdb);
+
         void update_device_id(const DEVICE_ID& did_old, const DEVICE_ID& did_new);
 
         void update_all_bus_base_frequency(double fbase_Hz);
@@ -478,6 +481,10 @@ class POWER_SYSTEM_DATABASE
         void update_overshadowed_bus_count();
         unsigned int get_equivalent_bus_of_bus(unsigned int bus);
 
+        void save_device_state(DEVICE_STATE_STRUCT& state);
+        bool is_device_state_applicable(const DEVICE_STATE_STRUCT& state);
+        unsigned int restore_device_state(const DEVICE_STATE_STRUCT& state, bool& bus_type_changed);
+
         unsigned int get_memory_usage_in_bytes();
     private:
         void check_source_status_for_out_of_service_bus(unsigned int bus);
@@ -10,6 +10,7 @@ extern STEPS default_toolkit;
 extern STEPS* toolkits[STEPS_MAX_TOOLKIT_SIZE];
 extern std::mutex mtx;
 
+// shared by all toolkits of the process. keep it unchanged while toolkits run in parallel threads
 extern bool use_steps_fast_math;
 
 #endif // STEPS_NAMESPACE_H
@@ -2,6 +2,8 @@
 #define DYNAMICS_SIMULATOR_H
 
 #include "header/basic/power_mismatch_struct.h"
+#include "header/basic/meter_stop_condition_struct.h"
+#include "header/basic/dynamic_state_struct.h"
 #include "header/meter/meter.h"
 #include "header/network/network_matrix.h"
 #include "header/basic/sparse_matrix_define.h"
@@ -9,6 +11,8 @@
 
 class POWER_SYSTEM_DATABASE;
 
+typedef bool (*DYNAMIC_SIMULATION_STEP_CALLBACK)(double time);
+
 class DYNAMICS_SIMULATOR
 {
     public:
@@ -47,6 +51,8 @@ class DYNAMICS_SIMULATOR
         void set_automatic_iteration_accelerator_tune_logic(bool logic);
         void set_rotor_angle_stability_surveillance_flag(bool flag);
         void set_rotor_angle_stability_threshold_in_deg(double angle_th);
+        void set_network_matrix_incremental_update_logic(bool logic);
+        void set_symbolic_analysis_reuse_logic(bool logic);
 
         unsigned int get_max_DAE_iteration() const;
         unsigned int get_min_DAE_iteration() const;
@@ -60,8 +66,11 @@ class DYNAMICS_SIMULATOR
         bool get_automatic_iteration_accelerator_tune_logic() const;
         bool get_rotor_angle_stability_surveillance_flag() const;
         double get_rotor_angle_stability_threshold_in_deg() const;
+        bool get_network_matrix_incremental_update_logic() const;
+        bool get_symbolic_analysis_reuse_logic() const;
 
         void show_dynamic_simulator_configuration() const;
+        void copy_settings_from_dynamic_simulator(const DYNAMICS_SIMULATOR& simulator);
 
         unsigned int get_memory_usage_in_bytes();
 
@@ -69,6 +78,14 @@ class DYNAMICS_SIMULATOR
         void set_network_matrix_update_as_required();
         bool is_network_matrix_update_required() const;
 
+        void reset_LU_statistics();
+        unsigned int get_LU_symbolic_analysis_count() const;
+        unsigned int get_LU_numeric_factorization_count() const;
+        unsigned int get_LU_solution_count() const;
+        double get_LU_symbolic_analysis_time_in_s() const;
+        double get_LU_numeric_factorization_time_in_s() const;
+        double get_LU_solution_time_in_s() const;
+
         void prepare_meters();
         void prepare_bus_related_meters();
         void prepare_generator_related_meters();
@@ -102,9 +119,29 @@ class DYNAMICS_SIMULATOR
         void set_output_file(string filename);
         string get_output_file() const;
 
+        void set_meter_buffer_capacity(unsigned int capacity);
+        unsigned int get_meter_buffer_capacity() const;
+        void set_meter_buffer_ring_logic(bool logic);
+        bool get_meter_buffer_ring_logic() const;
+        const double* get_meter_buffer() const;
+        unsigned int get_meter_buffer_column_count() const;
+        unsigned int get_meter_buffer_stored_count() const;
+
+        void add_meter_stop_condition(unsigned int meter_index, double lower_limit, double upper_limit, double duration_in_s);
+        void clear_meter_stop_conditions();
+        unsigned int get_meter_stop_condition_count() const;
+        bool get_early_stop_flag() const;
+
+        unsigned int save_dynamic_state();
+        bool restore_dynamic_state(unsigned int handle);
+        void release_dynamic_state(unsigned int handle);
+        void release_all_dynamic_states();
+        unsigned int get_dynamic_state_count() const;
+
         void start();
         void stop();
         void run_to(double time);
+        void run_to(double time, DYNAMIC_SIMULATION_STEP_CALLBACK callback, unsigned int callback_step_interval);
         void run_a_step();
         void update_with_event();
         void run_all_models(DYNAMIC_MODE mode);
@@ -194,6 +231,9 @@ class DYNAMICS_SIMULATOR
         void close_meter_output_files();
         void save_meter_information();
         void save_meter_values();
+        void allocate_meter_buffer();
+        void save_meter_values_to_buffer();
+        bool is_meter_stop_condition_met();
 
         bool solve_network();
         void initialize_internal_bus_voltage_vector();
@@ -234,6 +274,8 @@ class DYNAMICS_SIMULATOR
         void update_bus_voltage();
 
         void update_network_dynamic_matrix();
+        void remove_device_from_network_dynamic_matrix(const DEVICE_ID& did);
+        void add_device_to_network_dynamic_matrix(const DEVICE_ID& did);
 
         void guess_bus_voltage_with_bus_fault_set(unsigned int bus, const FAULT& fault);
         void guess_bus_voltage_with_bus_fault_cleared(unsigned int bus, const FAULT& fault);
@@ -298,11 +340,23 @@ class DYNAMICS_SIMULATOR
 
         bool csv_file_export_enabled, json_file_export_enabled, bin_file_export_enabled;
 
+        unsigned int meter_buffer_capacity, meter_buffer_column_count, meter_buffer_stored_count;
+        bool meter_buffer_ring_enabled;
+        vector<double> meter_buffer;
+
+        vector<METER_STOP_CONDITION_STRUCT> meter_stop_conditions;
+        bool early_stop_flag;
+
+        vector<DYNAMIC_STATE_STRUCT> dynamic_states;
+
         bool relay_action_flag;
 
         bool detailed_log_enabled;
 
         bool network_matrix_update_required;
+        bool network_matrix_incremental_update_enabled;
+        bool symbolic_analysis_reuse_enabled;
+        unsigned int network_Y_matrix_build_count_of_dynamic_network, network_Y_matrix_build_count_of_jacobian;
 };
 
 #endif // DYNAMICS_SIMULATOR_H
@@ -65,6 +65,10 @@ class DYNAMICS_SIMULATOR_TEST : public Test::Suite
         void test_run_IEEE_9_bus_model_with_WT3_models();
         void test_run_IEEE_9_bus_model_with_all_WT3_models();
 
+        void test_save_and_restore_dynamic_state();
+        void test_reset_to_base_case_with_partially_tripped_wt_generator();
+        void test_restore_dynamic_state_with_partially_tripped_wt_generator();
+
     private:
         void run_single_machine_model_for_model_test();
 };
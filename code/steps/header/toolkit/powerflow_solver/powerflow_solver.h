@@ -19,7 +19,7 @@ class POWERFLOW_SOLVER
 
         NETWORK_MATRIX& get_network_matrix();
 
-        void initialize_powerflow_solver();
+        void initialize_powerflow_solver(bool network_matrix_is_reused=false);
 
         void set_max_iteration(unsigned int iteration);
         void set_allowed_max_active_power_imbalance_in_MW(double P);
@@ -32,6 +32,11 @@ class POWERFLOW_SOLVER
         void set_non_divergent_solution_logic(bool logic);
         void set_var_limit_check_logic(bool logic);
         void set_export_jacobian_matrix_step_by_step_logic(bool flag);
+        void set_symbolic_analysis_reuse_logic(bool logic);
+
+        void append_bus_with_changed_injection(unsigned int bus);
+        void clear_buses_with_changed_injection();
+        vector<unsigned int> get_buses_with_changed_injection() const;
 
         unsigned int get_max_iteration() const;
         double get_allowed_max_active_power_imbalance_in_MW() const;
@@ -45,13 +50,17 @@ class POWERFLOW_SOLVER
         bool get_non_divergent_solution_logic() const;
         bool get_var_limit_check_logic() const;
         bool get_export_jacobian_matrix_step_by_step_logic() const;
+        bool get_symbolic_analysis_reuse_logic() const;
 
         void show_powerflow_solver_configuration() const;
 
+        void copy_from_powerflow_solver(POWERFLOW_SOLVER& solver);
+
         void solve_with_full_Newton_Raphson_solution();
         void solve_with_fast_decoupled_solution();
         void solve_with_modified_Gaussian_Seidel_solution();
 
+        void set_convergence_flag(bool flag);
         bool get_convergence_flag() const;
         bool is_converged();
 
@@ -64,11 +73,26 @@ class POWERFLOW_SOLVER
         void save_network_Y_matrix_to_file(const string& filename) const;
         void save_jacobian_matrix_to_file(const string& filename);
         void save_bus_powerflow_result_to_file(const string& filename) const;
+        void build_jacobian_matrix();
+        STEPS_SPARSE_MATRIX& get_jacobian_matrix();
+        vector<unsigned int> get_internal_P_equation_buses() const;
+        vector<unsigned int> get_internal_Q_equation_buses() const;
         unsigned int get_iteration_count() const;
 
+        void reset_LU_statistics();
+        unsigned int get_LU_symbolic_analysis_count() const;
+        unsigned int get_LU_numeric_factorization_count() const;
+        unsigned int get_LU_solution_count() const;
+        double get_LU_symbolic_analysis_time_in_s() const;
+        double get_LU_numeric_factorization_time_in_s() const;
+        double get_LU_solution_time_in_s() const;
+
         unsigned int get_memory_usage_in_bytes();
     private:
+        bool is_network_matrix_reusable(unsigned int network_Y_matrix_build_count) const;
         void prepare_devices_for_solution();
+        vector<BUS*> get_buses_to_initialize();
+        vector<SOURCE*> get_sources_to_initialize();
         void initialize_bus_type();
         void initialize_bus_voltage_to_regulate();
         void initialize_bus_voltage();
@@ -118,8 +142,6 @@ class POWERFLOW_SOLVER
 
         void extract_bus_power_mismatch_for_solution();
 
-        void set_convergence_flag(bool flag);
-
         STEPS* toolkit;
 
         JACOBIAN_BUILDER* jacobian_builder;
@@ -139,6 +161,7 @@ class POWERFLOW_SOLVER
         bool non_divergent_solution_enabled;
         bool var_limit_check_enabled;
         bool export_jacobian_matrix_step_by_step;
+        bool symbolic_analysis_reuse_enabled;
 
         bool converged;
 
@@ -159,6 +182,10 @@ class POWERFLOW_SOLVER
         vector<EQUIVALENT_DEVICE*> e_devices;
 
         vector<BUS*> internal_bus_pointers;
+
+        vector<unsigned int> buses_with_changed_injection;
+
+        unsigned int network_Y_matrix_build_count_of_NR_solution, network_Y_matrix_build_count_of_PQ_solution;
 };
 
 #endif // POWERFLOW_SOLVER_H
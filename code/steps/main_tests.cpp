@@ -51,6 +51,7 @@
 #include "header/data_imexporter/steps_imexporter_test.h"
 #include "header/data_imexporter/psse_imexporter_test.h"
 #include "header/data_imexporter/bpa_imexporter_test.h"
+#include "header/data_imexporter/case_snapshot_test.h"
 #include "header/data_imexporter/equivalent_model_imexporter_test.h"
 
 #include "header/network/network_matrix_test.h"
@@ -257,6 +258,8 @@ int main(int argc, char* argv[])
 
         ts.add(unique_ptr<Test::Suite>(new BPA_IMEXPORTER_TEST));
 
+        ts.add(unique_ptr<Test::Suite>(new CASE_SNAPSHOT_TEST));
+
         //ts.add(unique_ptr<Test::Suite>(new EQUIVALENT_MODEL_IMEXPORTER_TEST));
 
 
@@ -2,6 +2,8 @@
 #include "header/basic/utility.h"
 #include "header/steps_namespace.h"
 #include "header/basic/steps_enum.h"
+#include "header/data_imexporter/psse_imexporter.h"
+#include "header/model/all_supported_models.h"
 #include <iostream>
 #include <chrono>
 #include <thread>
@@ -13,8 +15,6 @@ STEPS::STEPS(const string& name, const string& log_file) : power_system_db(*this
                                                            dynamic_simulator(*this),
                                                            network_matrix(*this)
 {
-    disable_use_steps_fast_math_logic();
-
     ostringstream osstream;
     std::this_thread::sleep_for(std::chrono::milliseconds(10));
 
@@ -305,6 +305,9 @@ void STEPS::clear()
     dynamic_simulator.clear();
 
     network_matrix.clear();
+
+    release_base_case();
+    clear_case_source_files();
 }
 
 void STEPS::open_log_file(const string& file, bool log_file_append_mode)
@@ -380,6 +383,363 @@ void STEPS::terminate()
     show_information_with_leading_time_stamp(osstream);
 }
 
+void STEPS::copy_from_toolkit(STEPS& toolkit)
+{
+    if(this==(&toolkit)) return;
+
+    clear();
+
+    detailed_log_enabled = toolkit.is_detailed_log_enabled();
+    optimize_network_enabled = toolkit.is_optimize_network_enabled();
+    set_dynamic_model_database_size_in_bytes(toolkit.get_dynamic_model_database_size_in_bytes());
+
+    power_system_db.copy_from_power_system_database(toolkit.get_power_system_database());
+    copy_dynamic_models_from_toolkit(toolkit);
+    powerflow_solver.copy_from_powerflow_solver(toolkit.get_powerflow_solver());
+    dynamic_simulator.copy_settings_from_dynamic_simulator(toolkit.get_dynamic_simulator());
+    base_case = toolkit.base_case;
+    case_source_files = toolkit.case_source_files;
+    case_source_file_checksums = toolkit.case_source_file_checksums;
+
+    set_thread_number(toolkit.get_thread_number());
+
+    ostringstream osstream;
+    osstream<<"STEPS simulation toolkit ["<<toolkit_name<<"] is copied from toolkit ["<<toolkit.get_toolkit_name()<<"].";
+    show_information_with_leading_time_stamp(osstream);
+}
+
+void STEPS::copy_dynamic_models_from_toolkit(STEPS& toolkit)
+{
+    vector<MODEL*> models = toolkit.get_all_dynamic_models();
+    unsigned int n = models.size();
+    for(unsigned int i=0; i!=n; ++i)
+        add_copy_of_dynamic_model(models[i]);
+}
+
+template<class T> void STEPS::add_copy_of_dynamic_model_of_type(const MODEL* model)
+{
+    // the copy is built with this toolkit, and keeps it when model data is assigned from model of another toolkit
+    T copy(*this);
+    copy = *((const T*) model);
+    copy.set_device_id(model->get_device_id());
+    dynamic_model_db.add_model(&copy);
+}
+
+void STEPS::add_copy_of_dynamic_model(const MODEL* model)
+{
+    string model_name = model->get_model_name();
+    if(model_name=="GENCLS") { add_copy_of_dynamic_model_of_type<GENCLS>(model); return; }
+    if(model_name=="GENROU") { add_copy_of_dynamic_model_of_type<GENROU>(model); return; }
+    if(model_name=="GENSAL") { add_copy_of_dynamic_model_of_type<GENSAL>(model); return; }
+
+    if(model_name=="COMP") { add_copy_of_dynamic_model_of_type<COMP>(model); return; }
+    if(model_name=="IEEEVC") { add_copy_of_dynamic_model_of_type<IEEEVC>(model); return; }
+    if(model_name=="PSASPVC") { add_copy_of_dynamic_model_of_type<PSASPVC>(model); return; }
+
+    if(model_name=="SEXS") { add_copy_of_dynamic_model_of_type<SEXS>(model); return; }
+    if(model_name=="IEEET1") { add_copy_of_dynamic_model_of_type<IEEET1>(model); return; }
+    if(model_name=="PSASPE1") { add_copy_of_dynamic_model_of_type<PSASPE1>(model); return; }
+    if(model_name=="PSASPE2") { add_copy_of_dynamic_model_of_type<PSASPE2>(model); return; }
+    if(model_name=="CSEET1") { add_copy_of_dynamic_model_of_type<CSEET1>(model); return; }
+    if(model_name=="CSEET2") { add_copy_of_dynamic_model_of_type<CSEET2>(model); return; }
+    if(model_name=="PSASPE13") { add_copy_of_dynamic_model_of_type<PSASPE13>(model); return; }
+    if(model_name=="PSASPE14") { add_copy_of_dynamic_model_of_type<PSASPE14>(model); return; }
+
+    if(model_name=="IEE2ST") { add_copy_of_dynamic_model_of_type<IEE2ST>(model); return; }
+    if(model_name=="PSASPS1") { add_copy_of_dynamic_model_of_type<PSASPS1>(model); return; }
+    if(model_name=="PSASPS2") { add_copy_of_dynamic_model_of_type<PSASPS2>(model); return; }
+    if(model_name=="PSASPS3") { add_copy_of_dynamic_model_of_type<PSASPS3>(model); return; }
+    if(model_name=="PSASPS4") { add_copy_of_dynamic_model_of_type<PSASPS4>(model); return; }
+    if(model_name=="PSASPS5") { add_copy_of_dynamic_model_of_type<PSASPS5>(model); return; }
+    if(model_name=="PSASPS6") { add_copy_of_dynamic_model_of_type<PSASPS6>(model); return; }
+    if(model_name=="PSASPS8") { add_copy_of_dynamic_model_of_type<PSASPS8>(model); return; }
+
+    if(model_name=="IEEEG1") { add_copy_of_dynamic_model_of_type<IEEEG1>(model); return; }
+    if(model_name=="IEEEG1SB") { add_copy_of_dynamic_model_of_type<IEEEG1SB>(model); return; }
+    if(model_name=="IEEEG2") { add_copy_of_dynamic_model_of_type<IEEEG2>(model); return; }
+    if(model_name=="IEEEG3") { add_copy_of_dynamic_model_of_type<IEEEG3>(model); return; }
+    if(model_name=="IEESGO") { add_copy_of_dynamic_model_of_type<IEESGO>(model); return; }
+    if(model_name=="TGOV1") { add_copy_of_dynamic_model_of_type<TGOV1>(model); return; }
+    if(model_name=="GAST2A") { add_copy_of_dynamic_model_of_type<GAST2A>(model); return; }
+    if(model_name=="URCSCT") { add_copy_of_dynamic_model_of_type<URCSCT>(model); return; }
+
+    if(model_name=="LCFB1") { add_copy_of_dynamic_model_of_type<LCFB1>(model); return; }
+
+    if(model_name=="ESTR0") { add_copy_of_dynamic_model_of_type<ESTR0>(model); return; }
+
+    if(model_name=="IEEL") { add_copy_of_dynamic_model_of_type<IEEL>(model); return; }
+    if(model_name=="CIM6") { add_copy_of_dynamic_model_of_type<CIM6>(model); return; }
+
+    if(model_name=="UVLS") { add_copy_of_dynamic_model_of_type<UVLS>(model); return; }
+    if(model_name=="UFLS") { add_copy_of_dynamic_model_of_type<UFLS>(model); return; }
+    if(model_name=="PUFLS") { add_copy_of_dynamic_model_of_type<PUFLS>(model); return; }
+
+    if(model_name=="CDC4T") { add_copy_of_dynamic_model_of_type<CDC4T>(model); return; }
+    if(model_name=="CDC6T") { add_copy_of_dynamic_model_of_type<CDC6T>(model); return; }
+
+    if(model_name=="WT3G0") { add_copy_of_dynamic_model_of_type<WT3G0>(model); return; }
+    if(model_name=="WT3G1") { add_copy_of_dynamic_model_of_type<WT3G1>(model); return; }
+    if(model_name=="WT3G2") { add_copy_of_dynamic_model_of_type<WT3G2>(model); return; }
+    if(model_name=="AERD0") { add_copy_of_dynamic_model_of_type<AERD0>(model); return; }
+    if(model_name=="WT3T0") { add_copy_of_dynamic_model_of_type<WT3T0>(model); return; }
+    if(model_name=="WT3E0") { add_copy_of_dynamic_model_of_type<WT3E0>(model); return; }
+    if(model_name=="WT3E1") { add_copy_of_dynamic_model_of_type<WT3E1>(model); return; }
+    if(model_name=="WT3P0") { add_copy_of_dynamic_model_of_type<WT3P0>(model); return; }
+    if(model_name=="FILEWIND") { add_copy_of_dynamic_model_of_type<FILEWIND>(model); return; }
+    if(model_name=="WTRLY0") { add_copy_of_dynamic_model_of_type<WTRLY0>(model); return; }
+
+    if(model_name=="PVCV0") { add_copy_of_dynamic_model_of_type<PVCV0>(model); return; }
+    if(model_name=="PVGU1") { add_copy_of_dynamic_model_of_type<PVGU1>(model); return; }
+
+    if(model_name=="ARXL") { add_copy_of_dynamic_model_of_type<ARXL>(model); return; }
+
+    ostringstream osstream;
+    osstream<<"Model '"<<model_name<<"' is not supported in STEPS::"<<__FUNCTION__<<". It is not copied to toolkit ["<<toolkit_name<<"].\n"
+            <<"Update STEPS::"<<__FUNCTION__<<"() is required to include the new model.";
+    show_information_with_leading_time_stamp(osstream);
+}
+
+vector<MODEL*> STEPS::get_all_dynamic_models()
+{
+    vector<MODEL*> models;
+    POWER_SYSTEM_DATABASE& psdb = power_system_db;
+
+    vector<GENERATOR*> gens = psdb.get_all_generators();
+    unsigned int n = gens.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        GENERATOR* gen = gens[i];
+        append_dynamic_model(models, gen->get_sync_generator_model());
+        append_dynamic_model(models, gen->get_compensator_model());
+        append_dynamic_model(models, gen->get_exciter_model());
+        append_dynamic_model(models, gen->get_stabilizer_model());
+        append_dynamic_model(models, gen->get_turbine_governor_model());
+        append_dynamic_model(models, gen->get_turbine_load_controller_model());
+    }
+    vector<WT_GENERATOR*> wt_gens = psdb.get_all_wt_generators();
+    n = wt_gens.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        WT_GENERATOR* wt_gen = wt_gens[i];
+        append_dynamic_model(models, wt_gen->get_wt_generator_model());
+        append_dynamic_model(models, wt_gen->get_wt_aerodynamic_model());
+        append_dynamic_model(models, wt_gen->get_wt_turbine_model());
+        append_dynamic_model(models, wt_gen->get_wt_electrical_model());
+        append_dynamic_model(models, wt_gen->get_wt_pitch_model());
+        append_dynamic_model(models, wt_gen->get_wind_speed_model());
+        append_dynamic_model(models, wt_gen->get_wt_relay_model());
+    }
+    vector<PV_UNIT*> pvs = psdb.get_all_pv_units();
+    n = pvs.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        PV_UNIT* pv = pvs[i];
+        append_dynamic_model(models, pv->get_pv_converter_model());
+        append_dynamic_model(models, pv->get_pv_panel_model());
+        append_dynamic_model(models, pv->get_pv_electrical_model());
+        append_dynamic_model(models, pv->get_pv_irradiance_model());
+    }
+    vector<ENERGY_STORAGE*> estorages = psdb.get_all_energy_storages();
+    n = estorages.size();
+    for(unsigned int i=0; i!=n; ++i)
+        append_dynamic_model(models, estorages[i]->get_energy_storage_model());
+    vector<HVDC*> hvdcs = psdb.get_all_hvdcs();
+    n = hvdcs.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        HVDC* hvdc = hvdcs[i];
+        append_dynamic_model(models, hvdc->get_hvdc_model());
+        append_dynamic_model(models, hvdc->get_auxiliary_signal_model());
+    }
+    vector<EQUIVALENT_DEVICE*> edevices = psdb.get_all_equivalent_devices();
+    n = edevices.size();
+    for(unsigned int i=0; i!=n; ++i)
+        append_dynamic_model(models, edevices[i]->get_equivalent_model());
+    vector<LOAD*> loads = psdb.get_all_loads();
+    n = loads.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        LOAD* load = loads[i];
+        append_dynamic_model(models, load->get_load_model());
+        append_dynamic_model(models, load->get_load_voltage_relay_model());
+        append_dynamic_model(models, load->get_load_frequency_relay_model());
+    }
+    return models;
+}
+
+vector<string> STEPS::get_all_dynamic_model_records()
+{
+    vector<string> records;
+    vector<MODEL*> models = get_all_dynamic_models();
+    unsigned int n = models.size();
+    for(unsigned int i=0; i!=n; ++i)
+        append_dynamic_model_record(records, models[i]);
+    return records;
+}
+
+void STEPS::load_dynamic_model_records(const vector<string>& records)
+{
+    PSSE_IMEXPORTER importer(*this);
+    unsigned int n = records.size();
+    for(unsigned int i=0; i!=n; ++i)
+        importer.load_one_model(records[i]);
+}
+
+void STEPS::append_dynamic_model(vector<MODEL*>& models, MODEL* model)
+{
+    if(model!=NULL)
+        models.push_back(model);
+}
+
+void STEPS::append_dynamic_model_record(vector<string>& records, const MODEL* model)
+{
+    // models hold pointers to toolkit, devices, and blocks of this toolkit,
+    // so they are recorded as standard PSS/E records to be rebuilt in case snapshot.
+    if(model==NULL)
+        return;
+
+    string data = model->get_standard_psse_string();
+    size_t index_of_slash = data.find('/');
+    if(index_of_slash!=string::npos)
+        data = data.substr(0, index_of_slash);
+    data = replace_string_contents(data, "\n", " ");
+    data = trim_string(data);
+    if(data=="")
+        return;
+
+    records.push_back(string2csv(data));
+}
+
+void STEPS::cache_base_case()
+{
+    ostringstream osstream;
+
+    base_case.cached = true;
+    base_case.powerflow_converged = powerflow_solver.get_convergence_flag();
+
+    power_system_db.save_device_state(base_case.device_state);
+
+    vector<SOURCE*> sources = power_system_db.get_all_sources();
+    unsigned int n = sources.size();
+    base_case.source_p_generation_in_MW.resize(n);
+    base_case.source_q_generation_in_MVar.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        base_case.source_p_generation_in_MW[i] = sources[i]->get_p_generation_in_MW();
+        base_case.source_q_generation_in_MVar[i] = sources[i]->get_q_generation_in_MVar();
+    }
+
+    vector<HVDC*> hvdcs = power_system_db.get_all_hvdcs();
+    n = hvdcs.size();
+    base_case.hvdc_alpha_or_gamma_in_deg.resize(2*n);
+    base_case.hvdc_transformer_tap_in_pu.resize(2*n);
+    base_case.hvdc_dc_voltage_in_kV.resize(2*n);
+    base_case.hvdc_dc_current_in_kA.resize(2*n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        HVDC* hvdc = hvdcs[i];
+        for(unsigned int j=0; j!=2; ++j)
+        {
+            HVDC_CONVERTER_SIDE converter = (j==0?RECTIFIER:INVERTER);
+            base_case.hvdc_alpha_or_gamma_in_deg[2*i+j] = hvdc->get_converter_alpha_or_gamma_in_deg(converter);
+            base_case.hvdc_transformer_tap_in_pu[2*i+j] = hvdc->get_converter_transformer_tap_in_pu(converter);
+            base_case.hvdc_dc_voltage_in_kV[2*i+j] = hvdc->get_converter_dc_voltage_in_kV(converter);
+            base_case.hvdc_dc_current_in_kA[2*i+j] = hvdc->get_converter_dc_current_in_kA(converter);
+        }
+    }
+
+    osstream<<"Base case is cached with "<<power_system_db.get_bus_count()<<" buses.";
+    show_information_with_leading_time_stamp(osstream);
+}
+
+bool STEPS::reset_to_base_case()
+{
+    ostringstream osstream;
+    if(not base_case.cached)
+    {
+        osstream<<"Error. Base case is not cached. Base case cannot be reset.";
+        show_information_with_leading_time_stamp(osstream);
+        return false;
+    }
+
+    if(not power_system_db.is_device_state_applicable(base_case.device_state))
+    {
+        osstream<<"Error. Devices are added or removed after base case is cached. Base case cannot be reset.";
+        show_information_with_leading_time_stamp(osstream);
+        return false;
+    }
+
+    bool bus_type_changed = false;
+    unsigned int changed_device_count = power_system_db.restore_device_state(base_case.device_state, bus_type_changed);
+
+    // solved source outputs and HVDC operating points are always written back.
+    vector<SOURCE*> sources = power_system_db.get_all_sources();
+    unsigned int n = sources.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        sources[i]->set_p_generation_in_MW(base_case.source_p_generation_in_MW[i]);
+        sources[i]->set_q_generation_in_MVar(base_case.source_q_generation_in_MVar[i]);
+    }
+
+    vector<HVDC*> hvdcs = power_system_db.get_all_hvdcs();
+    n = hvdcs.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        HVDC* hvdc = hvdcs[i];
+        for(unsigned int j=0; j!=2; ++j)
+        {
+            HVDC_CONVERTER_SIDE converter = (j==0?RECTIFIER:INVERTER);
+            hvdc->set_converter_alpha_or_gamma_in_deg(converter, base_case.hvdc_alpha_or_gamma_in_deg[2*i+j]);
+            hvdc->set_converter_transformer_tap_in_pu(converter, base_case.hvdc_transformer_tap_in_pu[2*i+j]);
+            hvdc->set_converter_dc_voltage_in_kV(converter, base_case.hvdc_dc_voltage_in_kV[2*i+j]);
+            hvdc->set_converter_dc_current_in_kA(converter, base_case.hvdc_dc_current_in_kA[2*i+j]);
+        }
+    }
+
+    if(changed_device_count!=0)
+        network_matrix.mark_network_Y_matrix_outdated();
+
+    powerflow_solver.set_convergence_flag(base_case.powerflow_converged);
+    dynamic_simulator.set_network_matrix_update_as_required();
+
+    osstream<<"Base case is reset with "<<changed_device_count<<" changed devices restored.";
+    show_information_with_leading_time_stamp(osstream);
+    return true;
+}
+
+void STEPS::release_base_case()
+{
+    base_case = BASE_CASE_STRUCT();
+    base_case.cached = false;
+}
+
+bool STEPS::is_base_case_cached() const
+{
+    return base_case.cached;
+}
+
+void STEPS::append_case_source_file(const string& file, unsigned long long checksum)
+{
+    case_source_files.push_back(file);
+    case_source_file_checksums.push_back(checksum);
+}
+
+void STEPS::clear_case_source_files()
+{
+    case_source_files.clear();
+    case_source_file_checksums.clear();
+}
+
+vector<string> STEPS::get_case_source_files() const
+{
+    return case_source_files;
+}
+
+vector<unsigned long long> STEPS::get_case_source_file_checksums() const
+{
+    return case_source_file_checksums;
+}
+
 POWER_SYSTEM_DATABASE& STEPS::get_power_system_database()
 {
     return power_system_db;
@@ -462,14 +822,14 @@ void STEPS::show_information_with_leading_time_stamp(const string& info)
 string STEPS::get_system_time_stamp_string()
 {
     time_t tt = time(NULL);
-    tm* local_time= localtime(&tt);
+    tm local_time = get_local_time(tt);
     time_t clock_now = clock();
 
     double elapsed_time_in_s = (1.0/double(CLOCKS_PER_SEC))*double(clock_now-STEPS::clock_when_system_started);
 
     char time_stamp[40];
-    snprintf(time_stamp,40, "[%d-%02d-%02d %02d:%02d:%02d][% 8.3f]", local_time->tm_year + 1900, local_time->tm_mon + 1,
-            local_time->tm_mday, local_time->tm_hour, local_time->tm_min, local_time->tm_sec, elapsed_time_in_s);
+    snprintf(time_stamp,40, "[%d-%02d-%02d %02d:%02d:%02d][% 8.3f]", local_time.tm_year + 1900, local_time.tm_mon + 1,
+            local_time.tm_mday, local_time.tm_hour, local_time.tm_min, local_time.tm_sec, elapsed_time_in_s);
     return string(time_stamp);
 }
 
@@ -284,4 +284,44 @@ void set_owner_fraction_of_nonbus_device(NONBUS_DEVICE* device, string parameter
     show_parameter_not_supported_for_device_with_api(PARAMETER_NAME, device->get_device_id(), __FUNCTION__);
 }
 
+vector<NONBUS_DEVICE*> get_nonbus_devices_in_api_search_buffer(STEPS& toolkit, const string& DEVICE_TYPE)
+{
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    vector<NONBUS_DEVICE*> devices;
+    if(DEVICE_TYPE=="GENERATOR")
+        devices.assign(buffer.generators.begin(), buffer.generators.end());
+    if(DEVICE_TYPE=="WT GENERATOR")
+        devices.assign(buffer.wt_generators.begin(), buffer.wt_generators.end());
+    if(DEVICE_TYPE=="PV UNIT")
+        devices.assign(buffer.pv_units.begin(), buffer.pv_units.end());
+    if(DEVICE_TYPE=="LOAD")
+        devices.assign(buffer.loads.begin(), buffer.loads.end());
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        devices.assign(buffer.fixed_shunts.begin(), buffer.fixed_shunts.end());
+    if(DEVICE_TYPE=="LINE")
+        devices.assign(buffer.lines.begin(), buffer.lines.end());
+    if(DEVICE_TYPE=="TRANSFORMER")
+        devices.assign(buffer.transformers.begin(), buffer.transformers.end());
+    if(DEVICE_TYPE=="HVDC")
+        devices.assign(buffer.hvdcs.begin(), buffer.hvdcs.end());
+    if(DEVICE_TYPE=="EQUIVALENT DEVICE")
+        devices.assign(buffer.equivalent_devices.begin(), buffer.equivalent_devices.end());
+    if(DEVICE_TYPE=="ENERGY STORAGE")
+        devices.assign(buffer.energy_storages.begin(), buffer.energy_storages.end());
+    return devices;
+}
 
+vector<SOURCE*> get_sources_in_api_search_buffer(STEPS& toolkit, const string& DEVICE_TYPE)
+{
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    vector<SOURCE*> sources;
+    if(DEVICE_TYPE=="GENERATOR")
+        sources.assign(buffer.generators.begin(), buffer.generators.end());
+    if(DEVICE_TYPE=="WT GENERATOR")
+        sources.assign(buffer.wt_generators.begin(), buffer.wt_generators.end());
+    if(DEVICE_TYPE=="PV UNIT")
+        sources.assign(buffer.pv_units.begin(), buffer.pv_units.end());
+    if(DEVICE_TYPE=="ENERGY STORAGE")
+        sources.assign(buffer.energy_storages.begin(), buffer.energy_storages.end());
+    return sources;
+}
@@ -4,15 +4,20 @@
 #include "header/data_imexporter/psse_imexporter.h"
 #include "header/data_imexporter/bpa_imexporter.h"
 #include "header/data_imexporter/steps_imexporter.h"
+#include "header/data_imexporter/case_snapshot.h"
 
 void api_load_powerflow_data_from_file(char* file, char* file_type, unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
+    // source files of former case are not sources of the new case
+    toolkit.clear_case_source_files();
     string string_file_type = string2upper(file_type);
     if(string_file_type=="PSSE" or string_file_type=="PSS/E")
     {
         PSSE_IMEXPORTER importer(toolkit);
         importer.load_powerflow_data(file);
+        if(importer.is_data_file_loaded())
+            toolkit.append_case_source_file(file, importer.get_data_file_checksum());
     }
     else
     {
@@ -20,6 +25,8 @@ void api_load_powerflow_data_from_file(char* file, char* file_type, unsigned int
         {
             BPA_IMEXPORTER importer(toolkit);
             importer.load_powerflow_data(file);
+            if(importer.is_data_file_loaded())
+                toolkit.append_case_source_file(file, importer.get_data_file_checksum());
         }
     }
 }
@@ -92,6 +99,8 @@ void api_load_dynamic_data_from_file(char* file, char* file_type, unsigned int t
     {
         PSSE_IMEXPORTER importer(toolkit);
         importer.load_dynamic_data(file);
+        if(importer.is_data_file_loaded())
+            toolkit.append_case_source_file(file, importer.get_data_file_checksum());
     }
     else
     {
@@ -99,6 +108,8 @@ void api_load_dynamic_data_from_file(char* file, char* file_type, unsigned int t
         {
             BPA_IMEXPORTER importer(toolkit);
             importer.load_dynamic_data(file);
+            if(importer.is_data_file_loaded())
+                toolkit.append_case_source_file(file, importer.get_data_file_checksum());
         }
     }
 }
@@ -122,3 +133,17 @@ void api_save_dynamic_data_to_file(char* file, char* file_type, unsigned int too
     }
 }
 
+bool api_save_case_snapshot(char* file, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    CASE_SNAPSHOT snapshot(toolkit);
+    return snapshot.save_case_snapshot(file);
+}
+
+bool api_load_case_snapshot(char* file, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    CASE_SNAPSHOT snapshot(toolkit);
+    return snapshot.load_case_snapshot(file);
+}
+
@@ -24,6 +24,14 @@ unsigned int api_get_dynamic_simulator_integer_parameter(char* parameter_name, u
         return ds.get_max_event_update_iteration();
     if(PARAMETER_NAME=="MAX_NET_DIVERGENT_THRESHOLD" or PARAMETER_NAME=="MAX NETWORK DIVERGENT THRESHOLD")
         return ds.get_max_network_solution_divergent_threshold();
+    if(PARAMETER_NAME=="METER BUFFER CAPACITY")
+        return ds.get_meter_buffer_capacity();
+    if(PARAMETER_NAME=="LU SYMBOLIC ANALYSIS COUNT")
+        return ds.get_LU_symbolic_analysis_count();
+    if(PARAMETER_NAME=="LU NUMERIC FACTORIZATION COUNT")
+        return ds.get_LU_numeric_factorization_count();
+    if(PARAMETER_NAME=="LU SOLUTION COUNT")
+        return ds.get_LU_solution_count();
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for dynamic simulator with api %s.\n"
@@ -68,6 +76,11 @@ void api_set_dynamic_simulator_integer_parameter(char* parameter_name, int value
         ds.set_max_network_solution_divergent_threshold(value);
         return;
     }
+    if(PARAMETER_NAME=="METER BUFFER CAPACITY")
+    {
+        ds.set_meter_buffer_capacity(value);
+        return;
+    }
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for dynamic simulator with api %s.\n",
@@ -87,6 +100,12 @@ double api_get_dynamic_simulator_float_parameter(char* parameter_name, unsigned
         return ds.get_iteration_accelerator();
     if(PARAMETER_NAME=="ANGLE STABILITY THRESHOLD IN DEG")
         return ds.get_rotor_angle_stability_threshold_in_deg();
+    if(PARAMETER_NAME=="LU SYMBOLIC ANALYSIS TIME IN S")
+        return ds.get_LU_symbolic_analysis_time_in_s();
+    if(PARAMETER_NAME=="LU NUMERIC FACTORIZATION TIME IN S")
+        return ds.get_LU_numeric_factorization_time_in_s();
+    if(PARAMETER_NAME=="LU SOLUTION TIME IN S")
+        return ds.get_LU_solution_time_in_s();
 
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
@@ -182,6 +201,12 @@ bool api_get_dynamic_simulator_boolean_parameter(char* parameter_name, unsigned
         return ds.is_csv_file_export_enabled();
     if(PARAMETER_NAME=="JSON EXPORT LOGIC")
         return ds.is_json_file_export_enabled();
+    if(PARAMETER_NAME=="METER BUFFER RING LOGIC")
+        return ds.get_meter_buffer_ring_logic();
+    if(PARAMETER_NAME=="NETWORK MATRIX INCREMENTAL UPDATE LOGIC")
+        return ds.get_network_matrix_incremental_update_logic();
+    if(PARAMETER_NAME=="SYMBOLIC ANALYSIS REUSE LOGIC")
+        return ds.get_symbolic_analysis_reuse_logic();
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for dynamic simulator with api %s.\n"
@@ -225,6 +250,21 @@ void api_set_dynamic_simulator_boolean_parameter(char* parameter_name, bool valu
         ds.set_json_file_export_enable_flag(value);
         return;
     }
+    if(PARAMETER_NAME=="METER BUFFER RING LOGIC")
+    {
+        ds.set_meter_buffer_ring_logic(value);
+        return;
+    }
+    if(PARAMETER_NAME=="NETWORK MATRIX INCREMENTAL UPDATE LOGIC")
+    {
+        ds.set_network_matrix_incremental_update_logic(value);
+        return;
+    }
+    if(PARAMETER_NAME=="SYMBOLIC ANALYSIS REUSE LOGIC")
+    {
+        ds.set_symbolic_analysis_reuse_logic(value);
+        return;
+    }
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for dynamic simulator with api %s.\n",
              PARAMETER_NAME.c_str(), __FUNCTION__);
@@ -434,6 +474,44 @@ void api_prepare_equivalent_device_related_meter(unsigned int bus, char* id, cha
     ds.prepare_equivalent_device_related_meter(did, meter_type, var_name);
 }
 
+unsigned int api_get_meter_count(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_meter_count();
+}
+
+const char* api_get_meter_name(unsigned int meter_index, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+	snprintf(toolkit.steps_char_buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "%s", "");
+    if(meter_index<ds.get_meter_count())
+        snprintf(toolkit.steps_char_buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "%s", (ds.get_meter(meter_index).get_meter_name()).c_str());
+    return toolkit.steps_char_buffer;
+}
+
+const double* api_get_meter_buffer(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_meter_buffer();
+}
+
+unsigned int api_get_meter_buffer_column_count(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_meter_buffer_column_count();
+}
+
+unsigned int api_get_meter_buffer_stored_count(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_meter_buffer_stored_count();
+}
+
 void api_start_dynamic_simulation(unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
@@ -455,6 +533,13 @@ void api_run_simulation_to_time(double t_end, unsigned int toolkit_index)
     ds.run_to(t_end);
 }
 
+void api_run_simulation_to_time_with_callback(double t_end, bool (*callback)(double), unsigned int callback_step_interval, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    ds.run_to(t_end, callback, callback_step_interval);
+}
+
 void api_run_a_step(unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
@@ -469,6 +554,62 @@ bool api_get_system_angular_stable_flag(unsigned int toolkit_index)
     return ds.get_system_angular_stable_flag();
 }
 
+bool api_get_dynamic_simulation_early_stop_flag(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_early_stop_flag();
+}
+
+void api_add_meter_stop_condition(unsigned int meter_index, double lower_limit, double upper_limit, double duration_in_s, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    ds.add_meter_stop_condition(meter_index, lower_limit, upper_limit, duration_in_s);
+}
+
+void api_clear_meter_stop_conditions(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    ds.clear_meter_stop_conditions();
+}
+
+unsigned int api_get_meter_stop_condition_count(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_meter_stop_condition_count();
+}
+
+unsigned int api_save_dynamic_state(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.save_dynamic_state();
+}
+
+bool api_restore_dynamic_state(unsigned int handle, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.restore_dynamic_state(handle);
+}
+
+void api_release_dynamic_state(unsigned int handle, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    ds.release_dynamic_state(handle);
+}
+
+unsigned int api_get_dynamic_state_count(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    DYNAMICS_SIMULATOR& ds = toolkit.get_dynamic_simulator();
+    return ds.get_dynamic_state_count();
+}
+
 void api_set_bus_fault(unsigned int bus, char* fault_type, double fault_G, double fault_B, unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
@@ -0,0 +1,18 @@
+#include "header/apis/steps_api_field.h"
+#include <iostream>
+using namespace std;
+
+STEPS_API_FIELD::STEPS_API_FIELD()
+{
+    device_type = "BUS";
+    device = API_FIELD_BUS;
+    par_type = 'F';
+    side = "";
+    parameter_name = "";
+    code = API_FIELD_BY_NAME;
+}
+
+STEPS_API_FIELD::~STEPS_API_FIELD()
+{
+    ;
+}
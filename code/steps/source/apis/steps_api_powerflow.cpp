@@ -13,6 +13,16 @@ unsigned int api_get_powerflow_solver_integer_parameter(char* parameter_name, un
     string PARAMETER_NAME = string2upper(parameter_name);
     if(PARAMETER_NAME=="MAX ITERATION")
         return solver.get_max_iteration();
+    if(PARAMETER_NAME=="LU SYMBOLIC ANALYSIS COUNT")
+        return solver.get_LU_symbolic_analysis_count();
+    if(PARAMETER_NAME=="LU NUMERIC FACTORIZATION COUNT")
+        return solver.get_LU_numeric_factorization_count();
+    if(PARAMETER_NAME=="LU SOLUTION COUNT")
+        return solver.get_LU_solution_count();
+    if(PARAMETER_NAME=="P EQUATION BUS COUNT")
+        return solver.get_internal_P_equation_buses().size();
+    if(PARAMETER_NAME=="Q EQUATION BUS COUNT")
+        return solver.get_internal_Q_equation_buses().size();
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for powerflow solver with api %s.\n"
@@ -61,6 +71,12 @@ double api_get_powerflow_solver_float_parameter(char* parameter_name, unsigned i
         return solver.get_maximum_angle_change_in_deg();
     if(PARAMETER_NAME=="MAX ANGLE CHANGE IN RAD")
         return solver.get_maximum_angle_change_in_rad();
+    if(PARAMETER_NAME=="LU SYMBOLIC ANALYSIS TIME IN S")
+        return solver.get_LU_symbolic_analysis_time_in_s();
+    if(PARAMETER_NAME=="LU NUMERIC FACTORIZATION TIME IN S")
+        return solver.get_LU_numeric_factorization_time_in_s();
+    if(PARAMETER_NAME=="LU SOLUTION TIME IN S")
+        return solver.get_LU_solution_time_in_s();
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for powerflow solver with api %s.\n"
@@ -136,6 +152,8 @@ bool api_get_powerflow_solver_boolean_parameter(char* parameter_name, unsigned i
         return solver.get_var_limit_check_logic();
     if(PARAMETER_NAME=="EXPORT JACOBIAN LOGIC")
         return solver.get_export_jacobian_matrix_step_by_step_logic();
+    if(PARAMETER_NAME=="SYMBOLIC ANALYSIS REUSE LOGIC")
+        return solver.get_symbolic_analysis_reuse_logic();
 
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for powerflow solver with api %s.\n"
@@ -175,6 +193,11 @@ void api_set_powerflow_solver_boolean_parameter(char* parameter_name, bool value
         solver.set_export_jacobian_matrix_step_by_step_logic(value);
         return;
     }
+    if(PARAMETER_NAME=="SYMBOLIC ANALYSIS REUSE LOGIC")
+    {
+        solver.set_symbolic_analysis_reuse_logic(value);
+        return;
+    }
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Parameter '%s' is not supported for powerflow solver with api %s.\n",
              PARAMETER_NAME.c_str(), __FUNCTION__);
@@ -256,6 +279,13 @@ void api_save_jacobian_matrix(char* file, unsigned int toolkit_index)
     solver.save_jacobian_matrix_to_file(file);
 }
 
+void api_build_jacobian_matrix(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    POWERFLOW_SOLVER& solver = toolkit.get_powerflow_solver();
+    solver.build_jacobian_matrix();
+}
+
 void api_build_network_Y_matrix(unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
@@ -335,3 +365,224 @@ void api_save_network_Z_matrix(char* file, unsigned int toolkit_index)
     NETWORK_MATRIX& network_matrix = solver.get_network_matrix();
     network_matrix.save_network_Z_matrix_to_file(file);
 }
+
+STEPS_COMPLEX_SPARSE_MATRIX* get_complex_network_matrix_with_api(STEPS& toolkit, const string& MATRIX_TYPE)
+{
+    NETWORK_MATRIX& network_matrix = toolkit.get_network_matrix();
+    if(MATRIX_TYPE=="NETWORK Y" or MATRIX_TYPE=="Y")
+        return &(network_matrix.get_network_Y_matrix());
+    if(MATRIX_TYPE=="DYNAMIC Y")
+        return &(network_matrix.get_dynamic_network_Y_matrix());
+
+    STEPS_COMPLEX_SPARSE_MATRIX* matrix = NULL;
+    if(MATRIX_TYPE=="POSITIVE SEQUENCE Y")
+        matrix = &(network_matrix.get_positive_sequence_network_Y_matrix());
+    if(MATRIX_TYPE=="NEGATIVE SEQUENCE Y")
+        matrix = &(network_matrix.get_negative_sequence_network_Y_matrix());
+    if(MATRIX_TYPE=="ZERO SEQUENCE Y")
+        matrix = &(network_matrix.get_zero_sequence_network_Y_matrix());
+    if(matrix!=NULL and not matrix->matrix_in_compressed_column_form())
+        matrix->compress_and_merge_duplicate_entries();
+    return matrix;
+}
+
+STEPS_SPARSE_MATRIX* get_real_network_matrix_with_api(STEPS& toolkit, const string& MATRIX_TYPE)
+{
+    NETWORK_MATRIX& network_matrix = toolkit.get_network_matrix();
+    if(MATRIX_TYPE=="DECOUPLED BP" or MATRIX_TYPE=="BP")
+        return &(network_matrix.get_decoupled_network_BP_matrix());
+    if(MATRIX_TYPE=="DECOUPLED BQ" or MATRIX_TYPE=="BQ")
+        return &(network_matrix.get_decoupled_network_BQ_matrix());
+    if(MATRIX_TYPE=="DC B")
+        return &(network_matrix.get_dc_network_B_matrix());
+    if(MATRIX_TYPE=="JACOBIAN")
+    {
+        STEPS_SPARSE_MATRIX& jacobian = toolkit.get_powerflow_solver().get_jacobian_matrix();
+        if(not jacobian.matrix_in_compressed_column_form())
+            jacobian.compress_and_merge_duplicate_entries();
+        return &jacobian;
+    }
+    return NULL;
+}
+
+void show_network_matrix_type_not_supported_with_api(STEPS& toolkit, const string& MATRIX_TYPE, const char* function_name)
+{
+    char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
+    snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Network matrix type '%s' is not supported with api %s.\n"
+             "Valid types are: NETWORK Y, DECOUPLED BP, DECOUPLED BQ, DC B, DYNAMIC Y, JACOBIAN,\n"
+             "POSITIVE SEQUENCE Y, NEGATIVE SEQUENCE Y, ZERO SEQUENCE Y.", MATRIX_TYPE.c_str(), function_name);
+    toolkit.show_information_with_leading_time_stamp(buffer);
+}
+
+unsigned int api_get_network_matrix_size(const char* matrix_type, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string MATRIX_TYPE = string2upper(matrix_type);
+
+    // matrix without any entry, e.g. jacobian before powerflow is solved, is of size 0
+    STEPS_COMPLEX_SPARSE_MATRIX* cmatrix = get_complex_network_matrix_with_api(toolkit, MATRIX_TYPE);
+    if(cmatrix!=NULL)
+        return (cmatrix->get_starting_index_of_column(cmatrix->get_matrix_size())!=0? cmatrix->get_matrix_size() : 0);
+    STEPS_SPARSE_MATRIX* rmatrix = get_real_network_matrix_with_api(toolkit, MATRIX_TYPE);
+    if(rmatrix!=NULL)
+        return (rmatrix->get_starting_index_of_column(rmatrix->get_matrix_size())!=0? rmatrix->get_matrix_size() : 0);
+
+    show_network_matrix_type_not_supported_with_api(toolkit, MATRIX_TYPE, __FUNCTION__);
+    return 0;
+}
+
+unsigned int api_get_network_matrix_entry_count(const char* matrix_type, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string MATRIX_TYPE = string2upper(matrix_type);
+
+    STEPS_COMPLEX_SPARSE_MATRIX* cmatrix = get_complex_network_matrix_with_api(toolkit, MATRIX_TYPE);
+    if(cmatrix!=NULL)
+        return cmatrix->get_starting_index_of_column(cmatrix->get_matrix_size());
+    STEPS_SPARSE_MATRIX* rmatrix = get_real_network_matrix_with_api(toolkit, MATRIX_TYPE);
+    if(rmatrix!=NULL)
+        return rmatrix->get_starting_index_of_column(rmatrix->get_matrix_size());
+
+    show_network_matrix_type_not_supported_with_api(toolkit, MATRIX_TYPE, __FUNCTION__);
+    return 0;
+}
+
+void api_get_network_matrix_in_compressed_column_form(const char* matrix_type, int* starting_indices, int* row_indices, double* real_values, double* imag_values, unsigned int n, unsigned int nnz, unsigned int toolkit_index)
+{
+    // starting_indices should hold n+1 values, row_indices, real_values, and imag_values (if not NULL) should hold nnz values
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string MATRIX_TYPE = string2upper(matrix_type);
+
+    STEPS_COMPLEX_SPARSE_MATRIX* cmatrix = get_complex_network_matrix_with_api(toolkit, MATRIX_TYPE);
+    STEPS_SPARSE_MATRIX* rmatrix = NULL;
+    if(cmatrix==NULL)
+        rmatrix = get_real_network_matrix_with_api(toolkit, MATRIX_TYPE);
+    if(cmatrix==NULL and rmatrix==NULL)
+    {
+        show_network_matrix_type_not_supported_with_api(toolkit, MATRIX_TYPE, __FUNCTION__);
+        return;
+    }
+
+    unsigned int size = (cmatrix!=NULL? cmatrix->get_matrix_size() : rmatrix->get_matrix_size());
+    unsigned int nentry = (cmatrix!=NULL? cmatrix->get_starting_index_of_column(size) : rmatrix->get_starting_index_of_column(size));
+    if(nentry==0)
+        size = 0;
+    if(n!=size or nnz!=nentry)
+    {
+        char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
+        snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Network matrix '%s' is of size %u with %u entries, but size %u with %u entries is given with api %s.\n"
+                 "No entry will be returned.", MATRIX_TYPE.c_str(), size, nentry, n, nnz, __FUNCTION__);
+        toolkit.show_information_with_leading_time_stamp(buffer);
+        return;
+    }
+
+    if(cmatrix!=NULL)
+    {
+        for(unsigned int i=0; i<=n; ++i)
+            starting_indices[i] = cmatrix->get_starting_index_of_column(i);
+        for(unsigned int k=0; k<nnz; ++k)
+        {
+            row_indices[k] = cmatrix->get_row_number_of_entry_index(k);
+            real_values[k] = cmatrix->get_real_entry_value(k);
+            if(imag_values!=NULL)
+                imag_values[k] = cmatrix->get_imag_entry_value(k);
+        }
+    }
+    else
+    {
+        // B matrices keep complex admittance of branches, and the B value is the imaginary part, as jacobian builder uses
+        bool is_B_matrix = (MATRIX_TYPE!="JACOBIAN");
+        for(unsigned int i=0; i<=n; ++i)
+            starting_indices[i] = rmatrix->get_starting_index_of_column(i);
+        for(unsigned int k=0; k<nnz; ++k)
+        {
+            row_indices[k] = rmatrix->get_row_number_of_entry_index(k);
+            real_values[k] = (is_B_matrix? rmatrix->get_imag_entry_value(k) : rmatrix->get_real_entry_value(k));
+            if(imag_values!=NULL)
+                imag_values[k] = 0.0;
+        }
+    }
+}
+
+void api_get_network_matrix_bus_numbers(const char* matrix_type, unsigned int* buses, unsigned int n, unsigned int toolkit_index)
+{
+    // physical bus number of each row (and column) of the matrix
+    // for JACOBIAN, P equation buses are followed by Q equation buses
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string MATRIX_TYPE = string2upper(matrix_type);
+    NETWORK_MATRIX& network_matrix = toolkit.get_network_matrix();
+
+    if(MATRIX_TYPE=="JACOBIAN")
+    {
+        POWERFLOW_SOLVER& solver = toolkit.get_powerflow_solver();
+        vector<unsigned int> internal_buses = solver.get_internal_P_equation_buses();
+        vector<unsigned int> internal_Q_equation_buses = solver.get_internal_Q_equation_buses();
+        internal_buses.insert(internal_buses.end(), internal_Q_equation_buses.begin(), internal_Q_equation_buses.end());
+
+        n = min(n, (unsigned int)(internal_buses.size()));
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = network_matrix.get_physical_bus_number_of_internal_bus(internal_buses[i]);
+        return;
+    }
+
+    if(get_complex_network_matrix_with_api(toolkit, MATRIX_TYPE)==NULL and
+       get_real_network_matrix_with_api(toolkit, MATRIX_TYPE)==NULL)
+    {
+        show_network_matrix_type_not_supported_with_api(toolkit, MATRIX_TYPE, __FUNCTION__);
+        return;
+    }
+
+    n = min(n, api_get_network_matrix_size(matrix_type, toolkit_index));
+    for(unsigned int i=0; i<n; ++i)
+        buses[i] = network_matrix.get_physical_bus_number_of_internal_bus(i);
+}
+
+void api_get_network_Z_columns(const char* sequence, const unsigned int* buses, unsigned int ncol, double* real_values, double* imag_values, unsigned int n, unsigned int toolkit_index)
+{
+    // real_values and imag_values should hold n*ncol values. column j of Z matrix is stored in [j*n, j*n+n)
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    NETWORK_MATRIX& network_matrix = toolkit.get_network_matrix();
+    string SEQUENCE = string2upper(sequence);
+
+    vector<unsigned int> physical_buses(buses, buses+ncol);
+    vector<complex<double> > Z;
+    if(SEQUENCE=="POSITIVE")
+        Z = network_matrix.get_positive_sequence_network_Z_columns_of_physical_buses(physical_buses);
+    else
+    {
+        if(SEQUENCE=="NEGATIVE")
+            Z = network_matrix.get_negative_sequence_network_Z_columns_of_physical_buses(physical_buses);
+        else
+        {
+            if(SEQUENCE=="ZERO")
+                Z = network_matrix.get_zero_sequence_network_Z_columns_of_physical_buses(physical_buses);
+            else
+            {
+                char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
+                snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Sequence '%s' is not supported with api %s.\n"
+                         "Valid sequences are: POSITIVE, NEGATIVE, ZERO.", SEQUENCE.c_str(), __FUNCTION__);
+                toolkit.show_information_with_leading_time_stamp(buffer);
+            }
+        }
+    }
+
+    unsigned int nvalue = n*ncol;
+    if(Z.size()!=nvalue)
+    {
+        char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
+        snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "%u columns of %s sequence network Z matrix of size %u are not solved with api %s.\n"
+                 "NAN will be returned.", ncol, SEQUENCE.c_str(), n, __FUNCTION__);
+        toolkit.show_information_with_leading_time_stamp(buffer);
+        for(unsigned int k=0; k<nvalue; ++k)
+        {
+            real_values[k] = NAN;
+            imag_values[k] = NAN;
+        }
+        return;
+    }
+    for(unsigned int k=0; k<nvalue; ++k)
+    {
+        real_values[k] = Z[k].real();
+        imag_values[k] = Z[k].imag();
+    }
+}
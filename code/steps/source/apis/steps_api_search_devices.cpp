@@ -6,6 +6,7 @@
 #include "header/data_imexporter/psse_imexporter.h"
 #include "header/data_imexporter/bpa_imexporter.h"
 #include <iostream>
+#include <sstream>
 using namespace std;
 
 unsigned int api_bus_name2bus_number(const char* bus_name, unsigned int toolkit_index)
@@ -611,3 +612,359 @@ void api_goto_next_owner(unsigned int toolkit_index)
     if(index<n)
 		++(toolkit.api_search_buffer.owner_pointer);
 }
+
+unsigned int api_get_device_search_result_count(const char* device_type, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string DEVICE_TYPE = string2upper(device_type);
+    if(DEVICE_TYPE=="BUS")
+        return toolkit.api_search_buffer.buses.size();
+    if(DEVICE_TYPE=="GENERATOR")
+        return toolkit.api_search_buffer.generators.size();
+    if(DEVICE_TYPE=="WT GENERATOR")
+        return toolkit.api_search_buffer.wt_generators.size();
+    if(DEVICE_TYPE=="PV UNIT")
+        return toolkit.api_search_buffer.pv_units.size();
+    if(DEVICE_TYPE=="LOAD")
+        return toolkit.api_search_buffer.loads.size();
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return toolkit.api_search_buffer.fixed_shunts.size();
+    if(DEVICE_TYPE=="LINE")
+        return toolkit.api_search_buffer.lines.size();
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return toolkit.api_search_buffer.transformers.size();
+    if(DEVICE_TYPE=="HVDC")
+        return toolkit.api_search_buffer.hvdcs.size();
+    if(DEVICE_TYPE=="EQUIVALENT DEVICE")
+        return toolkit.api_search_buffer.equivalent_devices.size();
+    if(DEVICE_TYPE=="ENERGY STORAGE")
+        return toolkit.api_search_buffer.energy_storages.size();
+
+    show_parameter_not_supported_with_api(DEVICE_TYPE, __FUNCTION__);
+    return 0;
+}
+
+void api_get_device_search_result_bus_numbers(const char* device_type, const char* side, unsigned int* buses, unsigned int n, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    string DEVICE_TYPE = string2upper(device_type);
+    string SIDE = string2upper(side);
+
+    n = min(n, api_get_device_search_result_count(device_type, toolkit_index));
+    if(DEVICE_TYPE=="BUS")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.buses[i]->get_bus_number();
+        return;
+    }
+    if(DEVICE_TYPE=="GENERATOR")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.generators[i]->get_generator_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="WT GENERATOR")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.wt_generators[i]->get_source_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="PV UNIT")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.pv_units[i]->get_unit_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="LOAD")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.loads[i]->get_load_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="FIXED SHUNT")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.fixed_shunts[i]->get_shunt_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="LINE")
+    {
+        bool sending_side = (SIDE=="SENDING" or SIDE=="SEND");
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = sending_side ? buffer.lines[i]->get_sending_side_bus() : buffer.lines[i]->get_receiving_side_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="TRANSFORMER")
+    {
+        TRANSFORMER_WINDING_SIDE winding = TERTIARY_SIDE;
+        if(SIDE=="PRIMARY")
+            winding = PRIMARY_SIDE;
+        if(SIDE=="SECONDARY")
+            winding = SECONDARY_SIDE;
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.transformers[i]->get_winding_bus(winding);
+        return;
+    }
+    if(DEVICE_TYPE=="HVDC")
+    {
+        HVDC_CONVERTER_SIDE converter = (SIDE=="RECTIFIER" or SIDE=="REC") ? RECTIFIER : INVERTER;
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.hvdcs[i]->get_converter_bus(converter);
+        return;
+    }
+    if(DEVICE_TYPE=="EQUIVALENT DEVICE")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.equivalent_devices[i]->get_equivalent_device_bus();
+        return;
+    }
+    if(DEVICE_TYPE=="ENERGY STORAGE")
+    {
+        for(unsigned int i=0; i<n; ++i)
+            buses[i] = buffer.energy_storages[i]->get_energy_storage_bus();
+        return;
+    }
+}
+
+unsigned int api_get_device_search_result_identifiers(const char* device_type, char* identifiers, unsigned int n_bytes, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string DEVICE_TYPE = string2upper(device_type);
+
+    vector<NONBUS_DEVICE*> devices = get_nonbus_devices_in_api_search_buffer(toolkit, DEVICE_TYPE);
+    unsigned int n = devices.size();
+    string ids = "";
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        ids += devices[i]->get_device_id().get_device_identifier();
+        ids += "\n";
+    }
+    unsigned int n_required = ids.size()+1;
+    if(identifiers!=NULL and n_bytes>=n_required)
+        snprintf(identifiers, n_bytes, "%s", ids.c_str());
+    return n_required;
+}
+
+unsigned int api_set_device_search_result(const char* device_type, const unsigned int* buses, const char* identifiers, unsigned int n, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    string DEVICE_TYPE = string2upper(device_type);
+
+    vector<string> ids;
+    if(DEVICE_TYPE!="BUS")
+    {
+        istringstream stream(identifiers);
+        string id;
+        while(getline(stream, id))
+            ids.push_back(id);
+        if(ids.size()<n)
+        {
+            show_parameter_not_supported_with_api("IDENTIFIERS OF "+DEVICE_TYPE, __FUNCTION__);
+            return 0;
+        }
+    }
+
+    if(DEVICE_TYPE=="BUS")
+    {
+        buffer.buses.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            BUS* bus = psdb.get_bus(buses[i]);
+            if(bus==NULL)
+            {
+                show_device_not_exist_with_api(get_bus_device_id(buses[i]), __FUNCTION__);
+                buffer.buses.clear();
+                return 0;
+            }
+            buffer.buses.push_back(bus);
+        }
+        buffer.bus_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="GENERATOR")
+    {
+        buffer.generators.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_generator_device_id(buses[i], ids[i]);
+            GENERATOR* generator = psdb.get_generator(did);
+            if(generator==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.generators.clear();
+                return 0;
+            }
+            buffer.generators.push_back(generator);
+        }
+        buffer.generator_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="WT GENERATOR")
+    {
+        buffer.wt_generators.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_wt_generator_device_id(buses[i], ids[i]);
+            WT_GENERATOR* wt_generator = psdb.get_wt_generator(did);
+            if(wt_generator==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.wt_generators.clear();
+                return 0;
+            }
+            buffer.wt_generators.push_back(wt_generator);
+        }
+        buffer.wt_generator_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="PV UNIT")
+    {
+        buffer.pv_units.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_pv_unit_device_id(buses[i], ids[i]);
+            PV_UNIT* pv_unit = psdb.get_pv_unit(did);
+            if(pv_unit==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.pv_units.clear();
+                return 0;
+            }
+            buffer.pv_units.push_back(pv_unit);
+        }
+        buffer.pv_unit_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="ENERGY STORAGE")
+    {
+        buffer.energy_storages.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_energy_storage_device_id(buses[i], ids[i]);
+            ENERGY_STORAGE* energy_storage = psdb.get_energy_storage(did);
+            if(energy_storage==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.energy_storages.clear();
+                return 0;
+            }
+            buffer.energy_storages.push_back(energy_storage);
+        }
+        buffer.energy_storage_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="LOAD")
+    {
+        buffer.loads.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_load_device_id(buses[i], ids[i]);
+            LOAD* load = psdb.get_load(did);
+            if(load==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.loads.clear();
+                return 0;
+            }
+            buffer.loads.push_back(load);
+        }
+        buffer.load_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="FIXED SHUNT")
+    {
+        buffer.fixed_shunts.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_fixed_shunt_device_id(buses[i], ids[i]);
+            FIXED_SHUNT* fixed_shunt = psdb.get_fixed_shunt(did);
+            if(fixed_shunt==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.fixed_shunts.clear();
+                return 0;
+            }
+            buffer.fixed_shunts.push_back(fixed_shunt);
+        }
+        buffer.fixed_shunt_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="EQUIVALENT DEVICE")
+    {
+        buffer.equivalent_devices.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_equivalent_device_id(buses[i], ids[i]);
+            EQUIVALENT_DEVICE* edevice = psdb.get_equivalent_device(did);
+            if(edevice==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.equivalent_devices.clear();
+                return 0;
+            }
+            buffer.equivalent_devices.push_back(edevice);
+        }
+        buffer.equivalent_device_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="LINE")
+    {
+        buffer.lines.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_line_device_id(buses[i], buses[n+i], ids[i]);
+            LINE* line = psdb.get_line(did);
+            if(line==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.lines.clear();
+                return 0;
+            }
+            buffer.lines.push_back(line);
+        }
+        buffer.line_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="TRANSFORMER")
+    {
+        buffer.transformers.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_transformer_device_id(buses[i], buses[n+i], buses[2*n+i], ids[i]);
+            TRANSFORMER* transformer = psdb.get_transformer(did);
+            if(transformer==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.transformers.clear();
+                return 0;
+            }
+            buffer.transformers.push_back(transformer);
+        }
+        buffer.transformer_pointer = 0;
+        return n;
+    }
+    if(DEVICE_TYPE=="HVDC")
+    {
+        buffer.hvdcs.clear();
+        for(unsigned int i=0; i<n; ++i)
+        {
+            DEVICE_ID did = get_hvdc_device_id(buses[i], buses[n+i], ids[i]);
+            HVDC* hvdc = psdb.get_hvdc(did);
+            if(hvdc==NULL)
+            {
+                show_device_not_exist_with_api(did, __FUNCTION__);
+                buffer.hvdcs.clear();
+                return 0;
+            }
+            buffer.hvdcs.push_back(hvdc);
+        }
+        buffer.hvdc_pointer = 0;
+        return n;
+    }
+
+    show_parameter_not_supported_with_api(DEVICE_TYPE, __FUNCTION__);
+    return 0;
+}
@@ -7,6 +7,8 @@
 void api_set_dynamic_model(char* model_string, char* file_type, unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
+    // models of motor loads and WT generators may add source admittance to dynamic network Y matrix
+    toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
     string data(model_string);
     string FileType(file_type);
     FileType = string2upper(FileType);
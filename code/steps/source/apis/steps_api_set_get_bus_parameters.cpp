@@ -103,6 +103,7 @@ void api_set_bus_integer_data(unsigned int bus, char* parameter_name, int value,
                     break;
                 }
             }
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             return;
         }
         if(PARAMETER_NAME=="AREA" or PARAMETER_NAME=="AREA NUMBER")
@@ -180,7 +181,10 @@ void api_set_bus_float_data(unsigned int bus, char* parameter_name, double value
     {
         string PARAMETER_NAME = string2upper(parameter_name);
         if(PARAMETER_NAME=="VBASE_KV" or PARAMETER_NAME=="BASE VOLTAGE IN KV")
+        {
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             return busptr->set_base_voltage_in_kV(value);
+        }
 
         if(PARAMETER_NAME=="V_PU" or PARAMETER_NAME=="VOLTAGE IN PU")
             return busptr->set_positive_sequence_voltage_in_pu(value);
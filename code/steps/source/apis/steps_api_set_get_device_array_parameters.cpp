@@ -0,0 +1,416 @@
+#include "header/apis/steps_api.h"
+#include "header/apis/steps_api_common.h"
+#include "header/basic/utility.h"
+#include "header/steps_namespace.h"
+#include <sstream>
+
+int get_nonbus_device_integer_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, unsigned int toolkit_index)
+{
+    DEVICE_ID did = device->get_device_id();
+    TERMINAL terminal = did.get_device_terminal();
+    string identifier = did.get_device_identifier();
+    char* id = const_cast<char*>(identifier.c_str());
+    char* par_name = const_cast<char*>(parameter_name);
+    char* par_side = const_cast<char*>(side);
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return api_get_source_integer_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="LOAD")
+        return api_get_load_integer_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return api_get_fixed_shunt_integer_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="LINE")
+        return api_get_line_integer_data(terminal[0], terminal[1], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return api_get_transformer_integer_data(terminal[0], terminal[1], terminal[2], id, par_side, par_name, toolkit_index);
+    if(DEVICE_TYPE=="HVDC")
+        return api_get_hvdc_integer_data(terminal[0], terminal[1], id, par_side, par_name, toolkit_index);
+    return 0;
+}
+
+double get_nonbus_device_float_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, unsigned int toolkit_index)
+{
+    DEVICE_ID did = device->get_device_id();
+    TERMINAL terminal = did.get_device_terminal();
+    string identifier = did.get_device_identifier();
+    char* id = const_cast<char*>(identifier.c_str());
+    char* par_name = const_cast<char*>(parameter_name);
+    char* par_side = const_cast<char*>(side);
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return api_get_source_float_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="LOAD")
+        return api_get_load_float_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return api_get_fixed_shunt_float_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="LINE")
+        return api_get_line_float_data(terminal[0], terminal[1], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return api_get_transformer_float_data(terminal[0], terminal[1], terminal[2], id, par_side, par_name, toolkit_index);
+    if(DEVICE_TYPE=="HVDC")
+        return api_get_hvdc_float_data(terminal[0], terminal[1], id, par_side, par_name, toolkit_index);
+    return 0.0;
+}
+
+bool get_nonbus_device_boolean_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, unsigned int toolkit_index)
+{
+    DEVICE_ID did = device->get_device_id();
+    TERMINAL terminal = did.get_device_terminal();
+    string identifier = did.get_device_identifier();
+    char* id = const_cast<char*>(identifier.c_str());
+    char* par_name = const_cast<char*>(parameter_name);
+    char* par_side = const_cast<char*>(side);
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return api_get_source_boolean_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="LOAD")
+        return api_get_load_boolean_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return api_get_fixed_shunt_boolean_data(terminal[0], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="LINE")
+        return api_get_line_boolean_data(terminal[0], terminal[1], id, par_name, toolkit_index);
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return api_get_transformer_boolean_data(terminal[0], terminal[1], terminal[2], id, par_side, par_name, toolkit_index);
+    if(DEVICE_TYPE=="HVDC")
+        return api_get_hvdc_boolean_data(terminal[0], terminal[1], id, par_side, par_name, toolkit_index);
+    return false;
+}
+
+void set_nonbus_device_integer_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, int value, unsigned int toolkit_index)
+{
+    DEVICE_ID did = device->get_device_id();
+    TERMINAL terminal = did.get_device_terminal();
+    string identifier = did.get_device_identifier();
+    char* id = const_cast<char*>(identifier.c_str());
+    char* par_name = const_cast<char*>(parameter_name);
+    char* par_side = const_cast<char*>(side);
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return api_set_source_integer_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="LOAD")
+        return api_set_load_integer_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return api_set_fixed_shunt_integer_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="LINE")
+        return api_set_line_integer_data(terminal[0], terminal[1], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return api_set_transformer_integer_data(terminal[0], terminal[1], terminal[2], id, par_side, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="HVDC")
+        return api_set_hvdc_integer_data(terminal[0], terminal[1], id, par_side, par_name, value, toolkit_index);
+}
+
+void set_nonbus_device_float_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, double value, unsigned int toolkit_index)
+{
+    DEVICE_ID did = device->get_device_id();
+    TERMINAL terminal = did.get_device_terminal();
+    string identifier = did.get_device_identifier();
+    char* id = const_cast<char*>(identifier.c_str());
+    char* par_name = const_cast<char*>(parameter_name);
+    char* par_side = const_cast<char*>(side);
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return api_set_source_float_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="LOAD")
+        return api_set_load_float_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return api_set_fixed_shunt_float_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="LINE")
+        return api_set_line_float_data(terminal[0], terminal[1], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return api_set_transformer_float_data(terminal[0], terminal[1], terminal[2], id, par_side, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="HVDC")
+        return api_set_hvdc_float_data(terminal[0], terminal[1], id, par_side, par_name, value, toolkit_index);
+}
+
+void set_nonbus_device_boolean_data_with_api(NONBUS_DEVICE* device, const string& DEVICE_TYPE, const char* side, const char* parameter_name, bool value, unsigned int toolkit_index)
+{
+    DEVICE_ID did = device->get_device_id();
+    TERMINAL terminal = did.get_device_terminal();
+    string identifier = did.get_device_identifier();
+    char* id = const_cast<char*>(identifier.c_str());
+    char* par_name = const_cast<char*>(parameter_name);
+    char* par_side = const_cast<char*>(side);
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return api_set_source_boolean_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="LOAD")
+        return api_set_load_boolean_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="FIXED SHUNT")
+        return api_set_fixed_shunt_boolean_data(terminal[0], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="LINE")
+        return api_set_line_boolean_data(terminal[0], terminal[1], id, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="TRANSFORMER")
+        return api_set_transformer_boolean_data(terminal[0], terminal[1], terminal[2], id, par_side, par_name, value, toolkit_index);
+    if(DEVICE_TYPE=="HVDC")
+        return api_set_hvdc_boolean_data(terminal[0], terminal[1], id, par_side, par_name, value, toolkit_index);
+}
+
+void set_device_search_result_float_data_of_parameter(STEPS& toolkit, const string& DEVICE_TYPE, const char* side, const string& parameter_name, const double* values, unsigned int n, unsigned int toolkit_index)
+{
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    string PARAMETER_NAME = string2upper(parameter_name);
+
+    if(DEVICE_TYPE=="BUS")
+    {
+        vector<BUS*>& buses = buffer.buses;
+        for(unsigned int i=0; i<n; ++i)
+            api_set_bus_float_data(buses[i]->get_bus_number(), const_cast<char*>(parameter_name.c_str()), values[i], toolkit_index);
+        return;
+    }
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+    {
+        vector<SOURCE*> sources = get_sources_in_api_search_buffer(toolkit, DEVICE_TYPE);
+        if(PARAMETER_NAME=="PGEN_MW" or PARAMETER_NAME=="ACTIVE POWER GENERATION IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                sources[i]->set_p_generation_in_MW(values[i]);
+            return;
+        }
+        if(PARAMETER_NAME=="QGEN_MVAR" or PARAMETER_NAME=="REACTIVE POWER GENERATION IN MVAR")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                sources[i]->set_q_generation_in_MVar(values[i]);
+            return;
+        }
+    }
+
+    if(DEVICE_TYPE=="LOAD")
+    {
+        vector<LOAD*>& loads = buffer.loads;
+        if(PARAMETER_NAME=="PP0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT POWER ACTIVE POWER IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                loads[i]->set_nominal_constant_power_load_in_MVA(complex<double>(values[i], loads[i]->get_nominal_constant_power_load_in_MVA().imag()));
+            return;
+        }
+        if(PARAMETER_NAME=="QP0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT POWER REACTIVE POWER IN MVAR")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                loads[i]->set_nominal_constant_power_load_in_MVA(complex<double>(loads[i]->get_nominal_constant_power_load_in_MVA().real(), values[i]));
+            return;
+        }
+        if(PARAMETER_NAME=="PI0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT CURRENT ACTIVE POWER IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                loads[i]->set_nominal_constant_current_load_in_MVA(complex<double>(values[i], loads[i]->get_nominal_constant_current_load_in_MVA().imag()));
+            return;
+        }
+        if(PARAMETER_NAME=="QI0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT CURRENT REACTIVE POWER IN MVAR")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                loads[i]->set_nominal_constant_current_load_in_MVA(complex<double>(loads[i]->get_nominal_constant_current_load_in_MVA().real(), values[i]));
+            return;
+        }
+        if(PARAMETER_NAME=="PZ0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT IMPEDANCE ACTIVE POWER IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                loads[i]->set_nominal_constant_impedance_load_in_MVA(complex<double>(values[i], loads[i]->get_nominal_constant_impedance_load_in_MVA().imag()));
+            return;
+        }
+        if(PARAMETER_NAME=="QZ0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT IMPEDANCE REACTIVE POWER IN MVAR")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                loads[i]->set_nominal_constant_impedance_load_in_MVA(complex<double>(loads[i]->get_nominal_constant_impedance_load_in_MVA().real(), values[i]));
+            return;
+        }
+    }
+
+    vector<NONBUS_DEVICE*> devices = get_nonbus_devices_in_api_search_buffer(toolkit, DEVICE_TYPE);
+    for(unsigned int i=0; i<n; ++i)
+        set_nonbus_device_float_data_with_api(devices[i], DEVICE_TYPE, side, parameter_name.c_str(), values[i], toolkit_index);
+}
+
+void api_get_device_search_result_integer_data(const char* device_type, const char* side, const char* parameter_name, int* values, unsigned int n, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    string DEVICE_TYPE = string2upper(device_type);
+    string PARAMETER_NAME = string2upper(parameter_name);
+
+    n = min(n, api_get_device_search_result_count(device_type, toolkit_index));
+    if(DEVICE_TYPE=="BUS")
+    {
+        vector<BUS*>& buses = buffer.buses;
+        if(PARAMETER_NAME=="AREA" or PARAMETER_NAME=="AREA NUMBER")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_area_number();
+            return;
+        }
+        if(PARAMETER_NAME=="ZONE" or PARAMETER_NAME=="ZONE NUMBER")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_zone_number();
+            return;
+        }
+        for(unsigned int i=0; i<n; ++i)
+            values[i] = api_get_bus_integer_data(buses[i]->get_bus_number(), const_cast<char*>(parameter_name), toolkit_index);
+        return;
+    }
+
+    vector<NONBUS_DEVICE*> devices = get_nonbus_devices_in_api_search_buffer(toolkit, DEVICE_TYPE);
+    for(unsigned int i=0; i<n; ++i)
+        values[i] = get_nonbus_device_integer_data_with_api(devices[i], DEVICE_TYPE, side, parameter_name, toolkit_index);
+}
+
+void api_get_device_search_result_float_data(const char* device_type, const char* side, const char* parameter_name, double* values, unsigned int n, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    string DEVICE_TYPE = string2upper(device_type);
+    string PARAMETER_NAME = string2upper(parameter_name);
+
+    n = min(n, api_get_device_search_result_count(device_type, toolkit_index));
+    if(DEVICE_TYPE=="BUS")
+    {
+        vector<BUS*>& buses = buffer.buses;
+        if(PARAMETER_NAME=="VBASE_KV" or PARAMETER_NAME=="BASE VOLTAGE IN KV")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_base_voltage_in_kV();
+            return;
+        }
+        if(PARAMETER_NAME=="V_PU" or PARAMETER_NAME=="VOLTAGE IN PU")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_positive_sequence_voltage_in_pu();
+            return;
+        }
+        if(PARAMETER_NAME=="V_KV" or PARAMETER_NAME=="VOLTAGE IN KV")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_positive_sequence_voltage_in_kV();
+            return;
+        }
+        if(PARAMETER_NAME=="ANGLE_RAD" or PARAMETER_NAME=="ANGLE IN RAD")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_positive_sequence_angle_in_rad();
+            return;
+        }
+        if(PARAMETER_NAME=="ANGLE_DEG" or PARAMETER_NAME=="ANGLE IN DEG")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = buses[i]->get_positive_sequence_angle_in_deg();
+            return;
+        }
+        for(unsigned int i=0; i<n; ++i)
+            values[i] = api_get_bus_float_data(buses[i]->get_bus_number(), const_cast<char*>(parameter_name), toolkit_index);
+        return;
+    }
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+    {
+        vector<SOURCE*> sources = get_sources_in_api_search_buffer(toolkit, DEVICE_TYPE);
+        if(PARAMETER_NAME=="PGEN_MW" or PARAMETER_NAME=="ACTIVE POWER GENERATION IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = sources[i]->get_p_generation_in_MW();
+            return;
+        }
+        if(PARAMETER_NAME=="QGEN_MVAR" or PARAMETER_NAME=="REACTIVE POWER GENERATION IN MVAR")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = sources[i]->get_q_generation_in_MVar();
+            return;
+        }
+        if(PARAMETER_NAME=="PMAX_MW" or PARAMETER_NAME=="MAX ACTIVE POWER GENERATION IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = sources[i]->get_p_max_in_MW();
+            return;
+        }
+        if(PARAMETER_NAME=="PMIN_MW" or PARAMETER_NAME=="MIN ACTIVE POWER GENERATION IN MW")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = sources[i]->get_p_min_in_MW();
+            return;
+        }
+    }
+
+    vector<NONBUS_DEVICE*> devices = get_nonbus_devices_in_api_search_buffer(toolkit, DEVICE_TYPE);
+    for(unsigned int i=0; i<n; ++i)
+        values[i] = get_nonbus_device_float_data_with_api(devices[i], DEVICE_TYPE, side, parameter_name, toolkit_index);
+}
+
+void api_get_device_search_result_boolean_data(const char* device_type, const char* side, const char* parameter_name, bool* values, unsigned int n, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_SEARCH_BUFFER& buffer = toolkit.api_search_buffer;
+    string DEVICE_TYPE = string2upper(device_type);
+    string PARAMETER_NAME = string2upper(parameter_name);
+
+    n = min(n, api_get_device_search_result_count(device_type, toolkit_index));
+    if(DEVICE_TYPE=="BUS")
+    {
+        vector<BUS*>& buses = buffer.buses;
+        for(unsigned int i=0; i<n; ++i)
+            values[i] = api_get_bus_boolean_data(buses[i]->get_bus_number(), const_cast<char*>(parameter_name), toolkit_index);
+        return;
+    }
+
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+    {
+        vector<SOURCE*> sources = get_sources_in_api_search_buffer(toolkit, DEVICE_TYPE);
+        if(PARAMETER_NAME=="STATUS")
+        {
+            for(unsigned int i=0; i<n; ++i)
+                values[i] = sources[i]->get_status();
+            return;
+        }
+    }
+
+    vector<NONBUS_DEVICE*> devices = get_nonbus_devices_in_api_search_buffer(toolkit, DEVICE_TYPE);
+    for(unsigned int i=0; i<n; ++i)
+        values[i] = get_nonbus_device_boolean_data_with_api(devices[i], DEVICE_TYPE, side, parameter_name, toolkit_index);
+}
+
+bool is_injection_parameter_of_device(const string& DEVICE_TYPE, const string& PARAMETER_NAME)
+{
+    // only buses with changed injections of sources and loads can be marked for the next powerflow solution
+    if(DEVICE_TYPE=="GENERATOR" or DEVICE_TYPE=="WT GENERATOR" or DEVICE_TYPE=="PV UNIT" or DEVICE_TYPE=="ENERGY STORAGE")
+        return PARAMETER_NAME=="PGEN_MW" or PARAMETER_NAME=="ACTIVE POWER GENERATION IN MW" or
+               PARAMETER_NAME=="QGEN_MVAR" or PARAMETER_NAME=="REACTIVE POWER GENERATION IN MVAR" or
+               PARAMETER_NAME=="PMAX_MW" or PARAMETER_NAME=="MAX ACTIVE POWER GENERATION IN MW" or
+               PARAMETER_NAME=="PMIN_MW" or PARAMETER_NAME=="MIN ACTIVE POWER GENERATION IN MW" or
+               PARAMETER_NAME=="QMAX_MVAR" or PARAMETER_NAME=="MAX REACTIVE POWER GENERATION IN MVAR" or
+               PARAMETER_NAME=="QMIN_MVAR" or PARAMETER_NAME=="MIN REACTIVE POWER GENERATION IN MVAR" or
+               PARAMETER_NAME=="VREG_PU" or PARAMETER_NAME=="VOLTAGE TO REGULATE IN PU";
+    if(DEVICE_TYPE=="LOAD")
+        return PARAMETER_NAME=="PP0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT POWER ACTIVE POWER IN MW" or
+               PARAMETER_NAME=="QP0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT POWER REACTIVE POWER IN MVAR" or
+               PARAMETER_NAME=="PI0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT CURRENT ACTIVE POWER IN MW" or
+               PARAMETER_NAME=="QI0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT CURRENT REACTIVE POWER IN MVAR" or
+               PARAMETER_NAME=="PZ0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT IMPEDANCE ACTIVE POWER IN MW" or
+               PARAMETER_NAME=="QZ0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT IMPEDANCE REACTIVE POWER IN MVAR";
+    return false;
+}
+
+void api_set_device_search_result_float_data(const char* device_type, const char* side, const char* parameter_names, const double* values, unsigned int n, bool mark_changed_buses, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string DEVICE_TYPE = string2upper(device_type);
+
+    n = min(n, api_get_device_search_result_count(device_type, toolkit_index));
+
+    istringstream stream(parameter_names);
+    string parameter_name;
+    unsigned int k = 0;
+    bool injection_changed = false;
+    while(getline(stream, parameter_name))
+    {
+        set_device_search_result_float_data_of_parameter(toolkit, DEVICE_TYPE, side, parameter_name, values+k*n, n, toolkit_index);
+        if(is_injection_parameter_of_device(DEVICE_TYPE, string2upper(parameter_name)))
+            injection_changed = true;
+        ++k;
+    }
+
+    if(mark_changed_buses and injection_changed)
+    {
+        POWERFLOW_SOLVER& solver = toolkit.get_powerflow_solver();
+        vector<NONBUS_DEVICE*> devices = get_nonbus_devices_in_api_search_buffer(toolkit, DEVICE_TYPE);
+        for(unsigned int i=0; i<n; ++i)
+            solver.append_bus_with_changed_injection(devices[i]->get_device_id().get_device_terminal()[0]);
+    }
+}
@@ -0,0 +1,442 @@
+#include "header/apis/steps_api.h"
+#include "header/apis/steps_api_common.h"
+#include "header/basic/utility.h"
+#include "header/steps_namespace.h"
+
+STEPS_API_FIELD_CODE get_api_field_code(STEPS_API_FIELD_DEVICE device, char par_type, const string& PARAMETER_NAME)
+{
+    if(device==API_FIELD_BUS and par_type=='F')
+    {
+        if(PARAMETER_NAME=="VBASE_KV" or PARAMETER_NAME=="BASE VOLTAGE IN KV")
+            return API_FIELD_BUS_VBASE_KV;
+        if(PARAMETER_NAME=="V_PU" or PARAMETER_NAME=="VOLTAGE IN PU")
+            return API_FIELD_BUS_V_PU;
+        if(PARAMETER_NAME=="V_KV" or PARAMETER_NAME=="VOLTAGE IN KV")
+            return API_FIELD_BUS_V_KV;
+        if(PARAMETER_NAME=="ANGLE_RAD" or PARAMETER_NAME=="ANGLE IN RAD")
+            return API_FIELD_BUS_ANGLE_RAD;
+        if(PARAMETER_NAME=="ANGLE_DEG" or PARAMETER_NAME=="ANGLE IN DEG")
+            return API_FIELD_BUS_ANGLE_DEG;
+    }
+    if(device==API_FIELD_GENERATOR or device==API_FIELD_WT_GENERATOR or device==API_FIELD_PV_UNIT or device==API_FIELD_ENERGY_STORAGE)
+    {
+        if(par_type=='B' and PARAMETER_NAME=="STATUS")
+            return API_FIELD_SOURCE_STATUS;
+        if(par_type=='F')
+        {
+            if(PARAMETER_NAME=="PGEN_MW" or PARAMETER_NAME=="ACTIVE POWER GENERATION IN MW")
+                return API_FIELD_SOURCE_PGEN_MW;
+            if(PARAMETER_NAME=="QGEN_MVAR" or PARAMETER_NAME=="REACTIVE POWER GENERATION IN MVAR")
+                return API_FIELD_SOURCE_QGEN_MVAR;
+            if(PARAMETER_NAME=="PMAX_MW" or PARAMETER_NAME=="MAX ACTIVE POWER GENERATION IN MW")
+                return API_FIELD_SOURCE_PMAX_MW;
+            if(PARAMETER_NAME=="PMIN_MW" or PARAMETER_NAME=="MIN ACTIVE POWER GENERATION IN MW")
+                return API_FIELD_SOURCE_PMIN_MW;
+            if(PARAMETER_NAME=="QMAX_MVAR" or PARAMETER_NAME=="MAX REACTIVE POWER GENERATION IN MVAR")
+                return API_FIELD_SOURCE_QMAX_MVAR;
+            if(PARAMETER_NAME=="QMIN_MVAR" or PARAMETER_NAME=="MIN REACTIVE POWER GENERATION IN MVAR")
+                return API_FIELD_SOURCE_QMIN_MVAR;
+            if(PARAMETER_NAME=="VREG_PU" or PARAMETER_NAME=="VOLTAGE TO REGULATE IN PU")
+                return API_FIELD_SOURCE_VREG_PU;
+        }
+    }
+    if(device==API_FIELD_LOAD)
+    {
+        if(par_type=='B' and PARAMETER_NAME=="STATUS")
+            return API_FIELD_LOAD_STATUS;
+        if(par_type=='F')
+        {
+            if(PARAMETER_NAME=="PP0_MW" or PARAMETER_NAME=="NOMINAL CONSTANT POWER ACTIVE POWER IN MW")
+                return API_FIELD_LOAD_PP0_MW;
+            if(PARAMETER_NAME=="QP0_MVAR" or PARAMETER_NAME=="NOMINAL CONSTANT POWER REACTIVE POWER IN MVAR")
+                return API_FIELD_LOAD_QP0_MVAR;
+            if(PARAMETER_NAME=="P_MW" or PARAMETER_NAME=="TOTAL ACTUAL ACTIVE POWER IN MW")
+                return API_FIELD_LOAD_P_MW;
+            if(PARAMETER_NAME=="Q_MVAR" or PARAMETER_NAME=="TOTAL ACTUAL REACTIVE POWER IN MVAR")
+                return API_FIELD_LOAD_Q_MVAR;
+        }
+    }
+    if(device==API_FIELD_LINE)
+    {
+        if(par_type=='B')
+        {
+            if(PARAMETER_NAME=="STATUS_SEND" or PARAMETER_NAME=="SENDING SIDE BREAKER STATUS")
+                return API_FIELD_LINE_STATUS_SEND;
+            if(PARAMETER_NAME=="STATUS_RECV" or PARAMETER_NAME=="RECEIVING SIDE BREAKER STATUS")
+                return API_FIELD_LINE_STATUS_RECV;
+        }
+        if(par_type=='F')
+        {
+            if(PARAMETER_NAME=="PSEND_MW")
+                return API_FIELD_LINE_PSEND_MW;
+            if(PARAMETER_NAME=="QSEND_MVAR")
+                return API_FIELD_LINE_QSEND_MVAR;
+            if(PARAMETER_NAME=="PRECV_MW")
+                return API_FIELD_LINE_PRECV_MW;
+            if(PARAMETER_NAME=="QRECV_MVAR")
+                return API_FIELD_LINE_QRECV_MVAR;
+        }
+    }
+    return API_FIELD_BY_NAME;
+}
+
+DEVICE_ID get_device_id_of_api_field(const STEPS_API_FIELD& field, unsigned int ibus, unsigned int jbus, unsigned int kbus, const string& identifier)
+{
+    switch(field.device)
+    {
+        case API_FIELD_BUS:
+            return get_bus_device_id(ibus);
+        case API_FIELD_GENERATOR:
+            return get_generator_device_id(ibus, identifier);
+        case API_FIELD_WT_GENERATOR:
+            return get_wt_generator_device_id(ibus, identifier);
+        case API_FIELD_PV_UNIT:
+            return get_pv_unit_device_id(ibus, identifier);
+        case API_FIELD_ENERGY_STORAGE:
+            return get_energy_storage_device_id(ibus, identifier);
+        case API_FIELD_LOAD:
+            return get_load_device_id(ibus, identifier);
+        case API_FIELD_FIXED_SHUNT:
+            return get_fixed_shunt_device_id(ibus, identifier);
+        case API_FIELD_LINE:
+            return get_line_device_id(ibus, jbus, identifier);
+        case API_FIELD_TRANSFORMER:
+            return get_transformer_device_id(ibus, jbus, kbus, identifier);
+        case API_FIELD_HVDC:
+        default:
+            return get_hvdc_device_id(ibus, jbus, identifier);
+    }
+}
+
+STEPS_API_FIELD* get_api_field_with_field_id(STEPS& toolkit, unsigned int field_id, char par_type, string api_func)
+{
+    if(field_id<toolkit.api_fields.size() and toolkit.api_fields[field_id].par_type==par_type)
+        return &(toolkit.api_fields[field_id]);
+    else
+    {
+        char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
+        snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Field id %u is not a valid field id of type %c with api %s.\n"
+                 "Nothing will be changed.\n"
+                 "If return value is expected, 0/0.0/False will be returned",
+                 field_id, par_type, api_func.c_str());
+        toolkit.show_information_with_leading_time_stamp(buffer);
+        return NULL;
+    }
+}
+
+unsigned int api_get_device_field_id(const char* device_type, const char* par_type, const char* side, const char* parameter_name, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    string DEVICE_TYPE = string2upper(device_type);
+    string PAR_TYPE = string2upper(par_type);
+
+    STEPS_API_FIELD field;
+    field.device_type = DEVICE_TYPE;
+    field.side = string2upper(side);
+    field.parameter_name = string2upper(parameter_name);
+
+    if(DEVICE_TYPE=="BUS") field.device = API_FIELD_BUS;
+    else if(DEVICE_TYPE=="GENERATOR") field.device = API_FIELD_GENERATOR;
+    else if(DEVICE_TYPE=="WT GENERATOR") field.device = API_FIELD_WT_GENERATOR;
+    else if(DEVICE_TYPE=="PV UNIT") field.device = API_FIELD_PV_UNIT;
+    else if(DEVICE_TYPE=="ENERGY STORAGE") field.device = API_FIELD_ENERGY_STORAGE;
+    else if(DEVICE_TYPE=="LOAD") field.device = API_FIELD_LOAD;
+    else if(DEVICE_TYPE=="FIXED SHUNT") field.device = API_FIELD_FIXED_SHUNT;
+    else if(DEVICE_TYPE=="LINE") field.device = API_FIELD_LINE;
+    else if(DEVICE_TYPE=="TRANSFORMER") field.device = API_FIELD_TRANSFORMER;
+    else if(DEVICE_TYPE=="HVDC") field.device = API_FIELD_HVDC;
+    else
+    {
+        show_parameter_not_supported_with_api(DEVICE_TYPE, __FUNCTION__, toolkit_index);
+        return INDEX_NOT_EXIST;
+    }
+
+    if(PAR_TYPE=="I" or PAR_TYPE=="INT" or PAR_TYPE=="INTEGER") field.par_type = 'I';
+    else if(PAR_TYPE=="F" or PAR_TYPE=="D" or PAR_TYPE=="FLOAT" or PAR_TYPE=="DOUBLE") field.par_type = 'F';
+    else if(PAR_TYPE=="B" or PAR_TYPE=="BOOL" or PAR_TYPE=="BOOLEAN") field.par_type = 'B';
+    else
+    {
+        show_parameter_not_supported_with_api(PAR_TYPE, __FUNCTION__, toolkit_index);
+        return INDEX_NOT_EXIST;
+    }
+
+    vector<STEPS_API_FIELD>& fields = toolkit.api_fields;
+    unsigned int n = fields.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        if(fields[i].device==field.device and fields[i].par_type==field.par_type and
+           fields[i].side==field.side and fields[i].parameter_name==field.parameter_name)
+            return i;
+    }
+    field.code = get_api_field_code(field.device, field.par_type, field.parameter_name);
+    fields.push_back(field);
+    return n;
+}
+
+int api_get_device_integer_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_FIELD* field = get_api_field_with_field_id(toolkit, field_id, 'I', __FUNCTION__);
+    if(field==NULL)
+        return 0;
+
+    char* par_name = const_cast<char*>(field->parameter_name.c_str());
+    if(field->device==API_FIELD_BUS)
+        return api_get_bus_integer_data(ibus, par_name, toolkit_index);
+
+    DEVICE_ID did = get_device_id_of_api_field(*field, ibus, jbus, kbus, identifier);
+    NONBUS_DEVICE* device = toolkit.get_power_system_database().get_nonbus_device(did);
+    if(device!=NULL)
+        return get_nonbus_device_integer_data_with_api(device, field->device_type, field->side.c_str(), par_name, toolkit_index);
+    else
+    {
+        show_device_not_exist_with_api(did, __FUNCTION__, toolkit_index);
+        return 0;
+    }
+}
+
+void api_set_device_integer_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, int value, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_FIELD* field = get_api_field_with_field_id(toolkit, field_id, 'I', __FUNCTION__);
+    if(field==NULL)
+        return;
+
+    char* par_name = const_cast<char*>(field->parameter_name.c_str());
+    if(field->device==API_FIELD_BUS)
+        return api_set_bus_integer_data(ibus, par_name, value, toolkit_index);
+
+    DEVICE_ID did = get_device_id_of_api_field(*field, ibus, jbus, kbus, identifier);
+    NONBUS_DEVICE* device = toolkit.get_power_system_database().get_nonbus_device(did);
+    if(device!=NULL)
+        set_nonbus_device_integer_data_with_api(device, field->device_type, field->side.c_str(), par_name, value, toolkit_index);
+    else
+        show_device_not_exist_with_api(did, __FUNCTION__, toolkit_index);
+}
+
+double api_get_device_float_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_FIELD* field = get_api_field_with_field_id(toolkit, field_id, 'F', __FUNCTION__);
+    if(field==NULL)
+        return 0.0;
+
+    POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
+    char* par_name = const_cast<char*>(field->parameter_name.c_str());
+    if(field->device==API_FIELD_BUS)
+    {
+        BUS* busptr = psdb.get_bus(ibus);
+        if(busptr!=NULL)
+        {
+            switch(field->code)
+            {
+                case API_FIELD_BUS_VBASE_KV:
+                    return busptr->get_base_voltage_in_kV();
+                case API_FIELD_BUS_V_PU:
+                    return busptr->get_positive_sequence_voltage_in_pu();
+                case API_FIELD_BUS_V_KV:
+                    return busptr->get_positive_sequence_voltage_in_kV();
+                case API_FIELD_BUS_ANGLE_RAD:
+                    return busptr->get_positive_sequence_angle_in_rad();
+                case API_FIELD_BUS_ANGLE_DEG:
+                    return busptr->get_positive_sequence_angle_in_deg();
+                default:
+                    break;
+            }
+        }
+        return api_get_bus_float_data(ibus, par_name, toolkit_index);
+    }
+
+    DEVICE_ID did = get_device_id_of_api_field(*field, ibus, jbus, kbus, identifier);
+    NONBUS_DEVICE* device = psdb.get_nonbus_device(did);
+    if(device!=NULL)
+    {
+        switch(field->code)
+        {
+            case API_FIELD_SOURCE_PGEN_MW:
+                return ((SOURCE*) device)->get_p_generation_in_MW();
+            case API_FIELD_SOURCE_QGEN_MVAR:
+                return ((SOURCE*) device)->get_q_generation_in_MVar();
+            case API_FIELD_SOURCE_PMAX_MW:
+                return ((SOURCE*) device)->get_p_max_in_MW();
+            case API_FIELD_SOURCE_PMIN_MW:
+                return ((SOURCE*) device)->get_p_min_in_MW();
+            case API_FIELD_SOURCE_QMAX_MVAR:
+                return ((SOURCE*) device)->get_q_max_in_MVar();
+            case API_FIELD_SOURCE_QMIN_MVAR:
+                return ((SOURCE*) device)->get_q_min_in_MVar();
+            case API_FIELD_SOURCE_VREG_PU:
+                return ((SOURCE*) device)->get_voltage_to_regulate_in_pu();
+            case API_FIELD_LOAD_PP0_MW:
+                return ((LOAD*) device)->get_nominal_constant_power_load_in_MVA().real();
+            case API_FIELD_LOAD_QP0_MVAR:
+                return ((LOAD*) device)->get_nominal_constant_power_load_in_MVA().imag();
+            case API_FIELD_LOAD_P_MW:
+                return ((LOAD*) device)->get_actual_total_load_in_MVA().real();
+            case API_FIELD_LOAD_Q_MVAR:
+                return ((LOAD*) device)->get_actual_total_load_in_MVA().imag();
+            case API_FIELD_LINE_PSEND_MW:
+                return ((LINE*) device)->get_line_complex_power_at_sending_side_in_MVA().real();
+            case API_FIELD_LINE_QSEND_MVAR:
+                return ((LINE*) device)->get_line_complex_power_at_sending_side_in_MVA().imag();
+            case API_FIELD_LINE_PRECV_MW:
+                return ((LINE*) device)->get_line_complex_power_at_receiving_side_in_MVA().real();
+            case API_FIELD_LINE_QRECV_MVAR:
+                return ((LINE*) device)->get_line_complex_power_at_receiving_side_in_MVA().imag();
+            default:
+                return get_nonbus_device_float_data_with_api(device, field->device_type, field->side.c_str(), par_name, toolkit_index);
+        }
+    }
+    else
+    {
+        show_device_not_exist_with_api(did, __FUNCTION__, toolkit_index);
+        return 0.0;
+    }
+}
+
+void api_set_device_float_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, double value, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_FIELD* field = get_api_field_with_field_id(toolkit, field_id, 'F', __FUNCTION__);
+    if(field==NULL)
+        return;
+
+    POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
+    char* par_name = const_cast<char*>(field->parameter_name.c_str());
+    if(field->device==API_FIELD_BUS)
+    {
+        BUS* busptr = psdb.get_bus(ibus);
+        if(busptr!=NULL)
+        {
+            switch(field->code)
+            {
+                case API_FIELD_BUS_VBASE_KV:
+                    toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+                    return busptr->set_base_voltage_in_kV(value);
+                case API_FIELD_BUS_V_PU:
+                    return busptr->set_positive_sequence_voltage_in_pu(value);
+                case API_FIELD_BUS_V_KV:
+                    return busptr->set_positive_sequence_voltage_in_kV(value);
+                case API_FIELD_BUS_ANGLE_RAD:
+                    return busptr->set_positive_sequence_angle_in_rad(value);
+                case API_FIELD_BUS_ANGLE_DEG:
+                    return busptr->set_positive_sequence_angle_in_deg(value);
+                default:
+                    break;
+            }
+        }
+        return api_set_bus_float_data(ibus, par_name, value, toolkit_index);
+    }
+
+    DEVICE_ID did = get_device_id_of_api_field(*field, ibus, jbus, kbus, identifier);
+    NONBUS_DEVICE* device = psdb.get_nonbus_device(did);
+    if(device!=NULL)
+    {
+        switch(field->code)
+        {
+            case API_FIELD_SOURCE_PGEN_MW:
+                return ((SOURCE*) device)->set_p_generation_in_MW(value);
+            case API_FIELD_SOURCE_QGEN_MVAR:
+                return ((SOURCE*) device)->set_q_generation_in_MVar(value);
+            case API_FIELD_SOURCE_PMAX_MW:
+                return ((SOURCE*) device)->set_p_max_in_MW(value);
+            case API_FIELD_SOURCE_PMIN_MW:
+                return ((SOURCE*) device)->set_p_min_in_MW(value);
+            case API_FIELD_SOURCE_QMAX_MVAR:
+                return ((SOURCE*) device)->set_q_max_in_MVar(value);
+            case API_FIELD_SOURCE_QMIN_MVAR:
+                return ((SOURCE*) device)->set_q_min_in_MVar(value);
+            case API_FIELD_SOURCE_VREG_PU:
+                return ((SOURCE*) device)->set_voltage_to_regulate_in_pu(value);
+            case API_FIELD_LOAD_PP0_MW:
+            {
+                LOAD* loadptr = (LOAD*) device;
+                double q = loadptr->get_nominal_constant_power_load_in_MVA().imag();
+                return loadptr->set_nominal_constant_power_load_in_MVA(complex<double>(value, q));
+            }
+            case API_FIELD_LOAD_QP0_MVAR:
+            {
+                LOAD* loadptr = (LOAD*) device;
+                double p = loadptr->get_nominal_constant_power_load_in_MVA().real();
+                return loadptr->set_nominal_constant_power_load_in_MVA(complex<double>(p, value));
+            }
+            default:
+                return set_nonbus_device_float_data_with_api(device, field->device_type, field->side.c_str(), par_name, value, toolkit_index);
+        }
+    }
+    else
+        show_device_not_exist_with_api(did, __FUNCTION__, toolkit_index);
+}
+
+bool api_get_device_boolean_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_FIELD* field = get_api_field_with_field_id(toolkit, field_id, 'B', __FUNCTION__);
+    if(field==NULL)
+        return false;
+
+    char* par_name = const_cast<char*>(field->parameter_name.c_str());
+    if(field->device==API_FIELD_BUS)
+        return api_get_bus_boolean_data(ibus, par_name, toolkit_index);
+
+    DEVICE_ID did = get_device_id_of_api_field(*field, ibus, jbus, kbus, identifier);
+    NONBUS_DEVICE* device = toolkit.get_power_system_database().get_nonbus_device(did);
+    if(device!=NULL)
+    {
+        switch(field->code)
+        {
+            case API_FIELD_SOURCE_STATUS:
+                return ((SOURCE*) device)->get_status();
+            case API_FIELD_LOAD_STATUS:
+                return ((LOAD*) device)->get_status();
+            case API_FIELD_LINE_STATUS_SEND:
+                return ((LINE*) device)->get_sending_side_breaker_status();
+            case API_FIELD_LINE_STATUS_RECV:
+                return ((LINE*) device)->get_receiving_side_breaker_status();
+            default:
+                return get_nonbus_device_boolean_data_with_api(device, field->device_type, field->side.c_str(), par_name, toolkit_index);
+        }
+    }
+    else
+    {
+        show_device_not_exist_with_api(did, __FUNCTION__, toolkit_index);
+        return false;
+    }
+}
+
+void api_set_device_boolean_data_with_field_id(unsigned int ibus, unsigned int jbus, unsigned int kbus, const char* identifier, unsigned int field_id, bool value, unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    STEPS_API_FIELD* field = get_api_field_with_field_id(toolkit, field_id, 'B', __FUNCTION__);
+    if(field==NULL)
+        return;
+
+    char* par_name = const_cast<char*>(field->parameter_name.c_str());
+    if(field->device==API_FIELD_BUS)
+        return api_set_bus_boolean_data(ibus, par_name, value, toolkit_index);
+
+    DEVICE_ID did = get_device_id_of_api_field(*field, ibus, jbus, kbus, identifier);
+    NONBUS_DEVICE* device = toolkit.get_power_system_database().get_nonbus_device(did);
+    if(device!=NULL)
+    {
+        switch(field->code)
+        {
+            case API_FIELD_SOURCE_STATUS:
+                toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+                return ((SOURCE*) device)->set_status(value);
+            case API_FIELD_LOAD_STATUS:
+                toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+                return ((LOAD*) device)->set_status(value);
+            case API_FIELD_LINE_STATUS_SEND:
+                toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+                return ((LINE*) device)->set_sending_side_breaker_status(value);
+            case API_FIELD_LINE_STATUS_RECV:
+                toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+                return ((LINE*) device)->set_receiving_side_breaker_status(value);
+            default:
+                return set_nonbus_device_boolean_data_with_api(device, field->device_type, field->side.c_str(), par_name, value, toolkit_index);
+        }
+    }
+    else
+        show_device_not_exist_with_api(did, __FUNCTION__, toolkit_index);
+}
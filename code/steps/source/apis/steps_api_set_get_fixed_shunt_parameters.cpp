@@ -95,6 +95,8 @@ void api_set_fixed_shunt_float_data(unsigned int bus, char* identifier, char* pa
     FIXED_SHUNT* shuntptr = psdb.get_fixed_shunt(did);
     if(shuntptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string PARAMETER_NAME = string2upper(parameter_name);
         if(PARAMETER_NAME=="P0_MW" or PARAMETER_NAME=="NOMINAL RESISTANCE SHUNT IN MW")
         {
@@ -248,6 +250,8 @@ void api_set_fixed_shunt_boolean_data(unsigned int bus, char* identifier, char*
     FIXED_SHUNT* shuntptr = psdb.get_fixed_shunt(did);
     if(shuntptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string PARAMETER_NAME = string2upper(parameter_name);
 
         if(PARAMETER_NAME=="STATUS")
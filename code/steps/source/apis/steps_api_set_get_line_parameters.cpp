@@ -49,6 +49,8 @@ void api_set_line_integer_data(unsigned int ibus, unsigned int jbus, char* ident
     LINE* lineptr = psdb.get_line(did);
     if(lineptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string PARAMETER_NAME = string2upper(parameter_name);
         if(PARAMETER_NAME=="BUS_SEND" or PARAMETER_NAME=="SENDING SIDE BUS NUMBER")
             return lineptr->set_sending_side_bus(value);
@@ -177,6 +179,8 @@ void api_set_line_float_data(unsigned int ibus, unsigned int jbus, char* identif
     LINE* lineptr = psdb.get_line(did);
     if(lineptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string PARAMETER_NAME = string2upper(parameter_name);
         if(PARAMETER_NAME=="R1_PU" or PARAMETER_NAME=="LINE R1 IN PU")
         {
@@ -394,6 +398,8 @@ void api_set_line_boolean_data(unsigned int ibus, unsigned int jbus, char* ident
     LINE* lineptr = psdb.get_line(did);
     if(lineptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string PARAMETER_NAME = string2upper(parameter_name);
 
         if(PARAMETER_NAME=="STATUS_SEND" or PARAMETER_NAME=="SENDING SIDE BREAKER STATUS")
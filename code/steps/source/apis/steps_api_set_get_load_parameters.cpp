@@ -266,7 +266,10 @@ void api_set_load_boolean_data(unsigned int bus, char* identifier, char* paramet
         string PARAMETER_NAME = string2upper(parameter_name);
 
         if(PARAMETER_NAME=="STATUS")
+        {
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             return loadptr->set_status(value);
+        }
 
         show_parameter_not_supported_for_device_with_api(PARAMETER_NAME, did, __FUNCTION__);
     }
@@ -103,7 +103,11 @@ void api_set_load_related_model_float_parameter(unsigned int bus, char* identifi
     {
         LOAD_MODEL* model = load->get_load_model();
         if(model!=NULL)
+        {
+            // source admittance of motor load is in dynamic network Y matrix
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             return model->set_model_data_with_name(PARAMETER_NAME, value);
+        }
         else
             return;
     }
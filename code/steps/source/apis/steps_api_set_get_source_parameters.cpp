@@ -191,7 +191,10 @@ void api_set_source_float_data(unsigned int bus, char* identifier, char* paramet
         string PARAMETER_NAME = string2upper(parameter_name);
 
         if(PARAMETER_NAME=="MBASE_MVA" or PARAMETER_NAME=="MBASE IN MVA")
+        {
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             return sourceptr->set_mbase_in_MVA(value);
+        }
 
         if(PARAMETER_NAME=="PGEN_MW" or PARAMETER_NAME=="ACTIVE POWER GENERATION IN MW")
             return sourceptr->set_p_generation_in_MW(value);
@@ -216,11 +219,13 @@ void api_set_source_float_data(unsigned int bus, char* identifier, char* paramet
 
         if(PARAMETER_NAME=="RSOURCE_PU" or PARAMETER_NAME=="SOURCE RESISTANCE IN PU")
         {
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             complex<double> Z = sourceptr->get_source_impedance_in_pu();
             return sourceptr->set_source_impedance_in_pu(complex<double>(value, Z.imag()));
         }
         if(PARAMETER_NAME=="XSOURCE_PU" or PARAMETER_NAME=="SOURCE REACTANCE IN PU")
         {
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             complex<double> Z = sourceptr->get_source_impedance_in_pu();
             return sourceptr->set_source_impedance_in_pu(complex<double>(Z.real(), value));
         }
@@ -387,7 +392,10 @@ void api_set_source_boolean_data(unsigned int bus, char* identifier, char* param
         string PARAMETER_NAME = string2upper(parameter_name);
 
         if(PARAMETER_NAME=="STATUS")
+        {
+            toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
             return sourceptr->set_status(value);
+        }
 
         show_parameter_not_supported_for_device_with_api(PARAMETER_NAME, sourceptr->get_device_id(), __FUNCTION__);
         return;
@@ -90,6 +90,8 @@ void api_set_transformer_integer_data(unsigned int ibus, unsigned int jbus, unsi
     TRANSFORMER* transptr = psdb.get_transformer(did);
     if(transptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string SIDE = string2upper(side);
         string PARAMETER_NAME = string2upper(parameter_name);
         string COMBINED_PARAMETER_NAME = SIDE+":"+PARAMETER_NAME;
@@ -294,6 +296,8 @@ void api_set_transformer_float_data(unsigned int ibus, unsigned int jbus, unsign
     TRANSFORMER* transptr = psdb.get_transformer(did);
     if(transptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string SIDE = string2upper(side);
         string PARAMETER_NAME = string2upper(parameter_name);
 
@@ -582,6 +586,8 @@ void api_set_transformer_boolean_data(unsigned int ibus, unsigned int jbus, unsi
     TRANSFORMER* transptr = psdb.get_transformer(did);
     if(transptr!=NULL)
     {
+        toolkit.get_network_matrix().mark_network_Y_matrix_outdated();
+
         string SIDE = string2upper(side);
         string PARAMETER_NAME = string2upper(parameter_name);
 
@@ -26,6 +26,15 @@ unsigned int api_generate_new_toolkit(char* log_fie)
     return index;
 }
 
+unsigned int api_clone_toolkit(unsigned int toolkit_index, char* log_file)
+{
+    string log_file_name = "";
+    if(log_file!=NULL)
+        log_file_name = log_file;
+    unsigned int index = clone_toolkit(toolkit_index, log_file_name);
+    return index;
+}
+
 void api_delete_toolkit(unsigned int toolkit_index)
 {
     delete_toolkit(toolkit_index);
@@ -42,6 +51,30 @@ void api_clear_toolkit(unsigned int toolkit_index)
     toolkit.clear();
 }
 
+void api_cache_base_case(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    toolkit.cache_base_case();
+}
+
+bool api_reset_to_base_case(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    return toolkit.reset_to_base_case();
+}
+
+void api_release_base_case(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    toolkit.release_base_case();
+}
+
+bool api_is_base_case_cached(unsigned int toolkit_index)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+    return toolkit.is_base_case_cached();
+}
+
 void api_set_toolkit_parallel_thread_number(unsigned int n, unsigned int toolkit_index)
 {
     STEPS& toolkit = get_toolkit(toolkit_index);
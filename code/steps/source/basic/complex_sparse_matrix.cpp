@@ -8,11 +8,17 @@
 #include <iomanip>
 #include <iostream>
 #include <fstream>
+#include <chrono>
 using namespace std;
 
 COMPLEX_SPARSE_MATRIX::COMPLEX_SPARSE_MATRIX()
 {
     //constructor
+    matrix_change_count = 0;
+    matrix_change_count_when_LU_factorization_is_performed = 0;
+    set_symbolic_analysis_reuse_logic(true);
+    reset_LU_statistics();
+
     update_clock_when_LU_factorization_is_performed();
     update_clock_when_matrix_is_changed();
 }
@@ -77,7 +83,8 @@ void COMPLEX_SPARSE_MATRIX::change_entry_value(int index, const complex<double>&
 
 bool COMPLEX_SPARSE_MATRIX::LU_factorization_is_performed() const
 {
-    if(get_clock_when_LU_factorization_is_performed() > get_clock_when_matrix_is_changed())
+    // clock() may not tick between change of matrix and LU factorization. use change count to check it exactly
+    if(matrix_change_count_when_LU_factorization_is_performed == matrix_change_count)
         return true;
     else
         return false;
@@ -85,11 +92,13 @@ bool COMPLEX_SPARSE_MATRIX::LU_factorization_is_performed() const
 void COMPLEX_SPARSE_MATRIX::update_clock_when_matrix_is_changed()
 {
     clock_when_matrix_is_changed = clock();
+    ++matrix_change_count;
 }
 
 void COMPLEX_SPARSE_MATRIX::update_clock_when_LU_factorization_is_performed()
 {
     clock_when_LU_factorization_is_performed = clock();
+    matrix_change_count_when_LU_factorization_is_performed = matrix_change_count;
 }
 
 clock_t COMPLEX_SPARSE_MATRIX::get_clock_when_matrix_is_changed() const
@@ -101,3 +110,76 @@ clock_t COMPLEX_SPARSE_MATRIX::get_clock_when_LU_factorization_is_performed() co
 {
     return clock_when_LU_factorization_is_performed;
 }
+
+void COMPLEX_SPARSE_MATRIX::set_symbolic_analysis_reuse_logic(bool logic)
+{
+    symbolic_analysis_reuse_enabled = logic;
+}
+
+bool COMPLEX_SPARSE_MATRIX::get_symbolic_analysis_reuse_logic() const
+{
+    return symbolic_analysis_reuse_enabled;
+}
+
+void COMPLEX_SPARSE_MATRIX::reset_LU_statistics()
+{
+    symbolic_analysis_count = 0;
+    numeric_factorization_count = 0;
+    solution_count = 0;
+    symbolic_analysis_time_in_s = 0.0;
+    numeric_factorization_time_in_s = 0.0;
+    solution_time_in_s = 0.0;
+}
+
+unsigned int COMPLEX_SPARSE_MATRIX::get_symbolic_analysis_count() const
+{
+    return symbolic_analysis_count;
+}
+
+unsigned int COMPLEX_SPARSE_MATRIX::get_numeric_factorization_count() const
+{
+    return numeric_factorization_count;
+}
+
+unsigned int COMPLEX_SPARSE_MATRIX::get_solution_count() const
+{
+    return solution_count;
+}
+
+double COMPLEX_SPARSE_MATRIX::get_symbolic_analysis_time_in_s() const
+{
+    return symbolic_analysis_time_in_s;
+}
+
+double COMPLEX_SPARSE_MATRIX::get_numeric_factorization_time_in_s() const
+{
+    return numeric_factorization_time_in_s;
+}
+
+double COMPLEX_SPARSE_MATRIX::get_solution_time_in_s() const
+{
+    return solution_time_in_s;
+}
+
+double COMPLEX_SPARSE_MATRIX::get_LU_timer_in_s() const
+{
+    return chrono::duration<double>(chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+void COMPLEX_SPARSE_MATRIX::append_symbolic_analysis_time_in_s(double time)
+{
+    ++symbolic_analysis_count;
+    symbolic_analysis_time_in_s += time;
+}
+
+void COMPLEX_SPARSE_MATRIX::append_numeric_factorization_time_in_s(double time)
+{
+    ++numeric_factorization_count;
+    numeric_factorization_time_in_s += time;
+}
+
+void COMPLEX_SPARSE_MATRIX::append_solution_time_in_s(double time)
+{
+    ++solution_count;
+    solution_time_in_s += time;
+}
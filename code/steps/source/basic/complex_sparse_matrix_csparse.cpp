@@ -7,8 +7,10 @@
 #include <sstream>
 #include <iomanip>
 #include <iostream>
+#include <cmath>
 #include <fstream>
 #include <ctime>
+#include <algorithm>
 using namespace std;
 
 COMPLEX_SPARSE_MATRIX_CSPARSE::COMPLEX_SPARSE_MATRIX_CSPARSE():COMPLEX_SPARSE_MATRIX()
@@ -50,6 +52,18 @@ COMPLEX_SPARSE_MATRIX_CSPARSE& COMPLEX_SPARSE_MATRIX_CSPARSE::operator=(const CO
 
 void COMPLEX_SPARSE_MATRIX_CSPARSE::copy_from_const_matrix(const COMPLEX_SPARSE_MATRIX_CSPARSE& matrix)
 {
+    if(is_pattern_same_as_matrix(matrix))
+    {
+        // only values are copied, and symbolic analysis of LU factorization is kept for the same pattern
+        int nz = matrix.get_matrix_entry_count();
+        copy(matrix.matrix_complex->x, matrix.matrix_complex->x+nz, matrix_complex->x);
+
+        if(LU!=NULL) LU = cxs_nfree(LU);
+
+        update_clock_when_matrix_is_changed();
+        return;
+    }
+
     clear();
 
     /* the following codes are replace on June 28, 2019 for higher performance
@@ -97,6 +111,26 @@ void COMPLEX_SPARSE_MATRIX_CSPARSE::copy_from_const_matrix(const COMPLEX_SPARSE_
     update_clock_when_matrix_is_changed();
 }
 
+bool COMPLEX_SPARSE_MATRIX_CSPARSE::is_pattern_same_as_matrix(const COMPLEX_SPARSE_MATRIX_CSPARSE& matrix) const
+{
+    if(matrix_in_triplet_form() or matrix.matrix_in_triplet_form())
+        return false;
+
+    const cxs* A = matrix_complex;
+    const cxs* B = matrix.matrix_complex;
+    if(A->m!=B->m or A->n!=B->n or A->nzmax!=B->nzmax)
+        return false;
+
+    int n = A->n;
+    int nz = A->nzmax;
+    return equal(A->p, A->p+n+1, B->p) and equal(A->i, A->i+nz, B->i);
+}
+
+void COMPLEX_SPARSE_MATRIX_CSPARSE::free_LU_factorization()
+{
+    if(LU!=NULL) LU = cxs_nfree(LU);
+    if(LU_symbolic!=NULL) LU_symbolic = cxs_sfree(LU_symbolic);
+}
 
 COMPLEX_SPARSE_MATRIX_CSPARSE::~COMPLEX_SPARSE_MATRIX_CSPARSE()
 {
@@ -174,6 +208,8 @@ void COMPLEX_SPARSE_MATRIX_CSPARSE::convert_to_triplet_form()
 {
     if(matrix_in_compressed_column_form())
     {
+        free_LU_factorization();
+
         cxs *mat_complex; // temp mat
         int *tempi; // temp index
         complex<double> *tempd; // temp value
@@ -186,7 +222,7 @@ void COMPLEX_SPARSE_MATRIX_CSPARSE::convert_to_triplet_form()
         {
             row = get_row_number_of_entry_index(k);
             col = get_column_number_of_entry_index(k);
-            cxs_entry(mat_complex, row, col, get_real_entry_value(k));
+            cxs_entry(mat_complex, row, col, get_complex_entry_value(k));
         }
         // swap
         matrix_complex->nzmax = mat_complex->nzmax;
@@ -242,6 +278,8 @@ void COMPLEX_SPARSE_MATRIX_CSPARSE::transpose()
     if(matrix_in_triplet_form()) // if in triplet format, convert to compressed format
         compress_and_merge_duplicate_entries(); // convert
 
+    free_LU_factorization();
+
     cxs *mat; // temp mat
     int *tempi; // temp index
     complex<double> *tempd; // temp value
@@ -397,14 +435,24 @@ void COMPLEX_SPARSE_MATRIX_CSPARSE::LU_factorization(int order, double tolerance
 
     char buffer[256];
 
-    cxs_nfree(LU); // free LU (csn *)
-    cxs_sfree(LU_symbolic);
+    if(LU!=NULL) LU = cxs_nfree(LU); // free LU (csn *)
     csi n, ok ;
     if (CS_CSC (matrix_complex))/* check inputs */
     {
         n = matrix_complex->n ;
-        LU_symbolic = cxs_sqr (order, matrix_complex, 0) ;              /* ordering and symbolic analysis */
+        // symbolic analysis is freed when pattern of matrix is changed. otherwise, it is reused if enabled
+        if(LU_symbolic!=NULL and not get_symbolic_analysis_reuse_logic())
+            LU_symbolic = cxs_sfree(LU_symbolic);
+        double time_start = get_LU_timer_in_s();
+        if(LU_symbolic==NULL)
+        {
+            LU_symbolic = cxs_sqr (order, matrix_complex, 0) ;              /* ordering and symbolic analysis */
+            double time_analyzed = get_LU_timer_in_s();
+            append_symbolic_analysis_time_in_s(time_analyzed-time_start);
+            time_start = time_analyzed;
+        }
         LU = cxs_lu (matrix_complex, LU_symbolic, tolerance) ;                 /* numeric LU factorization */
+        append_numeric_factorization_time_in_s(get_LU_timer_in_s()-time_start);
 
         ok = (LU_symbolic && LU) ; // check
         if(ok==1)
@@ -436,23 +484,25 @@ void COMPLEX_SPARSE_MATRIX_CSPARSE::LU_factorization(int order, double tolerance
 
 vector<complex<double> >& COMPLEX_SPARSE_MATRIX_CSPARSE::solve_Ax_eq_b(vector<complex<double> >& b)
 {
-    if(LU_factorization_is_performed())
+    if(not LU_factorization_is_performed() or LU==NULL)
+        LU_factorization(1, 1e-13);
+
+    if(LU!=NULL)
     {
+        double time_start = get_LU_timer_in_s();
+
         solve_Lx_eq_b(b);
+
         solve_xU_eq_b(b);
+
+        append_solution_time_in_s(get_LU_timer_in_s()-time_start);
     }
     else
     {
-        LU_factorization(1, 1e-13);
-        /*
-        cout<<"Div LU->L->n = "<<LU->L->n<<endl;
-        cout<<"Mul LU->L->p[n] = "<<LU->L->p[LU->L->n]<<endl;
-        cout<<"Div LU->U->n = "<<LU->U->n<<endl;
-        cout<<"Mul LU->U->p[n] = "<<LU->U->p[LU->U->n]<<endl;
-        */
-        solve_Lx_eq_b(b);
-
-        solve_xU_eq_b(b);
+        // LU factorization failed, e.g. singular matrix of island without any source
+        unsigned int n = b.size();
+        for(unsigned int i=0; i!=n; ++i)
+            b[i] = complex<double>(NAN, NAN);
     }
 
     return b;
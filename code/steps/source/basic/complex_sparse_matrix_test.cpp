@@ -7,6 +7,7 @@
 #include <iostream>
 #include <cstdio>
 #include <complex>
+#include <cmath>
 
 #ifdef ENABLE_STEPS_TEST
 using namespace std;
@@ -15,6 +16,7 @@ COMPLEX_SPARSE_MATRIX_TEST::COMPLEX_SPARSE_MATRIX_TEST()
 {
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_constructor);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_add_entry);
+    TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_convert_to_triplet_form);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_set_get_matrix);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_matrix_format);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_get_matrix_size);
@@ -31,6 +33,7 @@ COMPLEX_SPARSE_MATRIX_TEST::COMPLEX_SPARSE_MATRIX_TEST()
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_get_reorder_permutation);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_slove_Ax_equal_b);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_operator_slash);
+    TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_singular_matrix);
 
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_copy_with_operator_equal);
     TEST_ADD(COMPLEX_SPARSE_MATRIX_TEST::test_copy_with_copy_constructor);
@@ -100,6 +103,56 @@ void COMPLEX_SPARSE_MATRIX_TEST::test_add_entry()
     TEST_ASSERT(mat.get_entry_value(1,1)==complex<double>(0.0, 4.0));
 
 }
+
+void COMPLEX_SPARSE_MATRIX_TEST::test_convert_to_triplet_form()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"COMPLEX_SPARSE_MATRIX_TEST");
+
+    prepare_basic_matrix();
+
+    // matrix is
+    // [1  0  0]      [0  0  0]
+    // [0  2  4]  + j [0  5  9]
+    // [1  0  1]      [0  0  2]
+
+    matrix.LU_factorization();
+
+    matrix.convert_to_triplet_form();
+    TEST_ASSERT(matrix.matrix_in_triplet_form()==true);
+
+    matrix.compress_and_merge_duplicate_entries();
+    TEST_ASSERT(matrix.get_entry_value(0,0)==complex<double>(1.0, 0.0));
+    TEST_ASSERT(matrix.get_entry_value(1,1)==complex<double>(2.0, 5.0));
+    TEST_ASSERT(matrix.get_entry_value(1,2)==complex<double>(4.0, 9.0));
+    TEST_ASSERT(matrix.get_entry_value(2,2)==complex<double>(1.0, 2.0));
+    TEST_ASSERT(matrix.get_entry_value(2,0)==complex<double>(1.0, 0.0));
+
+    // new entry is added by converting compressed matrix to triplet form
+    matrix.add_entry(0,1,complex<double>(0.0, 1.0));
+    TEST_ASSERT(matrix.matrix_in_compressed_column_form()==true);
+    TEST_ASSERT(matrix.get_entry_value(0,1)==complex<double>(0.0, 1.0));
+    TEST_ASSERT(matrix.get_entry_value(1,1)==complex<double>(2.0, 5.0));
+    TEST_ASSERT(matrix.get_entry_value(1,2)==complex<double>(4.0, 9.0));
+    TEST_ASSERT(matrix.get_entry_value(2,2)==complex<double>(1.0, 2.0));
+
+    // matrix is
+    // [1  0  0]      [0  1  0]
+    // [0  2  4]  + j [0  5  9]
+    // [1  0  1]      [0  0  2]
+    // solution to A*x = b where b=[1+j4 -3+j57 1+j8]' is
+    // [2  4+j1  3+j2]'
+    vector<complex<double> > b;
+    b.push_back(complex<double>(1.0, 4.0));
+    b.push_back(complex<double>(-3.0, 57.0));
+    b.push_back(complex<double>(1.0, 8.0));
+
+    matrix.LU_factorization();
+    vector<complex<double> > x = matrix.solve_Ax_eq_b(b);
+
+    TEST_ASSERT(abs(x[0] - complex<double>(2.0, 0.0))<FLOAT_EPSILON);
+    TEST_ASSERT(abs(x[1] - complex<double>(4.0, 1.0))<FLOAT_EPSILON);
+    TEST_ASSERT(abs(x[2] - complex<double>(3.0, 2.0))<FLOAT_EPSILON);
+}
 void COMPLEX_SPARSE_MATRIX_TEST::test_set_get_matrix()
 {
     show_test_information_for_function_of_class(__FUNCTION__,"COMPLEX_SPARSE_MATRIX_TEST");
@@ -386,6 +439,35 @@ void COMPLEX_SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_operator_slash()
     TEST_ASSERT(abs(x[2] - complex<double>(3.0, 2.0))<FLOAT_EPSILON);
 }
 
+void COMPLEX_SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_singular_matrix()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"COMPLEX_SPARSE_MATRIX_TEST");
+
+    // matrix without entry (2,2) is singular. columns 1 and 2 only have entries in row 1.
+    // LU factorization fails, and solution is NaN instead of crash.
+    matrix.add_entry(0,0,1.0);
+    matrix.add_entry(1,1,complex<double>(2.0, 5.0));
+    matrix.add_entry(1,2,complex<double>(4.0, 9.0));
+    matrix.add_entry(2,0,1.0);
+
+    matrix.compress_and_merge_duplicate_entries();
+
+    vector<complex<double> > b;
+    b.reserve(3);
+    b.push_back(2.0);
+    b.push_back(20.0);
+    b.push_back(5.0);
+
+    vector<complex<double> > x = matrix.solve_Ax_eq_b(b);
+
+    TEST_ASSERT(x.size()==3);
+    for(unsigned int i=0; i!=3; ++i)
+    {
+        TEST_ASSERT(std::isnan(x[i].real()));
+        TEST_ASSERT(std::isnan(x[i].imag()));
+    }
+}
+
 void COMPLEX_SPARSE_MATRIX_TEST::test_copy_with_operator_equal()
 {
     show_test_information_for_function_of_class(__FUNCTION__,"COMPLEX_SPARSE_MATRIX_TEST");
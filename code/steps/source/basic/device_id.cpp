@@ -14,10 +14,7 @@ DEVICE_ID::DEVICE_ID()
 }
 DEVICE_ID::DEVICE_ID(const DEVICE_ID& did)
 {
-    clear();
-    set_device_type(did.get_device_type());
-    set_device_terminal(did.get_device_terminal());
-    set_device_identifier(did.get_device_identifier());
+    copy_from_const_device_id(did);
 }
 
 DEVICE_ID::~DEVICE_ID()
@@ -320,45 +317,51 @@ DEVICE_ID& DEVICE_ID::operator= (const DEVICE_ID& device_id)
 {
     if(this==(&device_id)) return *this;
 
-    set_device_type(device_id.get_device_type());
-    set_device_terminal(device_id.get_device_terminal());
-    set_device_identifier(device_id.get_device_identifier());
+    copy_from_const_device_id(device_id);
 
     return (*this);
 }
 
+void DEVICE_ID::copy_from_const_device_id(const DEVICE_ID& device_id)
+{
+    // members of the given device id are already checked when it is built, so they are copied directly.
+    // device ids are copied by every insertion into device index map.
+    device_type = device_id.device_type;
+    device_type_code = device_id.device_type_code;
+    minimum_terminal_count = device_id.minimum_terminal_count;
+    maximum_terminal_count = device_id.maximum_terminal_count;
+    allow_identifier = device_id.allow_identifier;
+    terminal = device_id.terminal;
+    device_identifier = device_id.device_identifier;
+}
+
 bool DEVICE_ID::operator< (const DEVICE_ID& device_id) const
 {
+    // called by every lookup of device index map, so terminal and identifier are compared in place without copying.
     if(this->get_device_type_code() == device_id.get_device_type_code())
     {
-        TERMINAL this_terminal = this->get_device_terminal();
-        TERMINAL to_compare_terminal = device_id.get_device_terminal();
-
-        vector<unsigned int> this_buses = this_terminal.get_buses();
-        vector<unsigned int> to_compare_buses = to_compare_terminal.get_buses();
-
-        unsigned int this_size = this_buses.size();
-        unsigned int to_compare_size = to_compare_buses.size();
+        unsigned int this_size = terminal.get_bus_count();
+        unsigned int to_compare_size = device_id.terminal.get_bus_count();
 
         unsigned int max_size = max(this_size, to_compare_size);
 
-        this_buses.resize(max_size, 0);
-        to_compare_buses.resize(max_size, 0);
-
         int compare_sign = 0;
 
         for(unsigned int i=0; compare_sign==0 and i!=max_size; ++i)
-            compare_sign = (int)this_buses[i]-(int)to_compare_buses[i];
+            compare_sign = (int)terminal[i]-(int)device_id.terminal[i];
 
         if(compare_sign!=0)
             return compare_sign<0;
         else
         {
-            string this_identifier = this->get_device_identifier();
-            string to_compare_identifier = device_id.get_device_identifier();
-
-            compare_sign = (this_identifier<to_compare_identifier?-1:(this_identifier>to_compare_identifier?1:0));
-            return compare_sign<0;
+            if(allow_identifier and device_id.allow_identifier)
+                return device_identifier<device_id.device_identifier;
+            else
+            {
+                string this_identifier = this->get_device_identifier();
+                string to_compare_identifier = device_id.get_device_identifier();
+                return this_identifier<to_compare_identifier;
+            }
         }
     }
     else// of different types, no comparison
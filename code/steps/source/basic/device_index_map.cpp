@@ -251,9 +251,7 @@ bool DEVICE_INDEX_MAP::is_given_device_of_the_same_type_as_existing_devices_map(
 {
     map<DEVICE_ID, unsigned int>::const_iterator iter = index_map.begin();
 
-    DEVICE_ID this_device_id = iter->first;
-
-    if(this_device_id.get_device_type() == device_id.get_device_type())
+    if(iter->first.get_device_type_code() == device_id.get_device_type_code())
         return true;
     else
         return false;
@@ -7,8 +7,10 @@
 #include <sstream>
 #include <iomanip>
 #include <iostream>
+#include <cmath>
 #include <fstream>
 #include <ctime>
+#include <algorithm>
 using namespace std;
 
 SPARSE_MATRIX_CSPARSE::SPARSE_MATRIX_CSPARSE():SPARSE_MATRIX()
@@ -52,6 +54,19 @@ SPARSE_MATRIX_CSPARSE& SPARSE_MATRIX_CSPARSE::operator=(const SPARSE_MATRIX_CSPA
 
 void SPARSE_MATRIX_CSPARSE::copy_from_const_matrix(const SPARSE_MATRIX_CSPARSE& matrix)
 {
+    if(is_pattern_same_as_matrix(matrix))
+    {
+        // only values are copied, and symbolic analysis of LU factorization is kept for the same pattern
+        int nz = matrix.get_matrix_entry_count();
+        copy(matrix.matrix_real->x, matrix.matrix_real->x+nz, matrix_real->x);
+        copy(matrix.matrix_imag->x, matrix.matrix_imag->x+nz, matrix_imag->x);
+
+        if(LU!=NULL) LU = cs_nfree(LU);
+
+        update_clock_when_matrix_is_changed();
+        return;
+    }
+
     clear();
 
     /* the following codes are replace on June 28, 2019 for higher performance
@@ -100,6 +115,27 @@ void SPARSE_MATRIX_CSPARSE::copy_from_const_matrix(const SPARSE_MATRIX_CSPARSE&
 }
 
 
+bool SPARSE_MATRIX_CSPARSE::is_pattern_same_as_matrix(const SPARSE_MATRIX_CSPARSE& matrix) const
+{
+    if(matrix_in_triplet_form() or matrix.matrix_in_triplet_form())
+        return false;
+
+    const cs* A = matrix_real;
+    const cs* B = matrix.matrix_real;
+    if(A->m!=B->m or A->n!=B->n or A->nzmax!=B->nzmax)
+        return false;
+
+    int n = A->n;
+    int nz = A->nzmax;
+    return equal(A->p, A->p+n+1, B->p) and equal(A->i, A->i+nz, B->i);
+}
+
+void SPARSE_MATRIX_CSPARSE::free_LU_factorization()
+{
+    if(LU!=NULL) LU = cs_nfree(LU);
+    if(LU_symbolic!=NULL) LU_symbolic = cs_sfree(LU_symbolic);
+}
+
 SPARSE_MATRIX_CSPARSE::~SPARSE_MATRIX_CSPARSE()
 {
     // destructor
@@ -183,6 +219,8 @@ void SPARSE_MATRIX_CSPARSE::convert_to_triplet_form()
 {
     if(matrix_in_compressed_column_form())
     {
+        free_LU_factorization();
+
         cs *mat_real; // temp mat
         cs *mat_imag; // temp mat
         csi *tempi; // temp index
@@ -281,6 +319,8 @@ void SPARSE_MATRIX_CSPARSE::transpose()
     if(matrix_in_triplet_form()) // if in triplet format, convert to compressed format
         compress_and_merge_duplicate_entries(); // convert
 
+    free_LU_factorization();
+
     cs *mat; // temp mat
     csi *tempi; // temp index
     double *tempd; // temp value
@@ -454,14 +494,24 @@ void SPARSE_MATRIX_CSPARSE::LU_factorization(int order, double tolerance)
 
     char buffer[256];
 
-    cs_nfree(LU); // free LU (csn *)
-    cs_sfree(LU_symbolic);
+    if(LU!=NULL) LU = cs_nfree(LU); // free LU (csn *)
     csi n, ok ;
     if (CS_CSC (matrix_real))/* check inputs */
     {
         n = matrix_real->n ;
-        LU_symbolic = cs_sqr (order, matrix_real, 0) ;              /* ordering and symbolic analysis */
+        // symbolic analysis is freed when pattern of matrix is changed. otherwise, it is reused if enabled
+        if(LU_symbolic!=NULL and not get_symbolic_analysis_reuse_logic())
+            LU_symbolic = cs_sfree(LU_symbolic);
+        double time_start = get_LU_timer_in_s();
+        if(LU_symbolic==NULL)
+        {
+            LU_symbolic = cs_sqr (order, matrix_real, 0) ;              /* ordering and symbolic analysis */
+            double time_analyzed = get_LU_timer_in_s();
+            append_symbolic_analysis_time_in_s(time_analyzed-time_start);
+            time_start = time_analyzed;
+        }
         LU = cs_lu (matrix_real, LU_symbolic, tolerance) ;                 /* numeric LU factorization */
+        append_numeric_factorization_time_in_s(get_LU_timer_in_s()-time_start);
 
         ok = (LU_symbolic && LU) ; // check
         if(ok==1)
@@ -493,24 +543,25 @@ void SPARSE_MATRIX_CSPARSE::LU_factorization(int order, double tolerance)
 
 vector<double>& SPARSE_MATRIX_CSPARSE::solve_Ax_eq_b(vector<double>& b)
 {
-    if(LU_factorization_is_performed())
+    if(not LU_factorization_is_performed() or LU==NULL)
+        LU_factorization(1, 1e-13);
+
+    if(LU!=NULL)
     {
+        double time_start = get_LU_timer_in_s();
+
         solve_Lx_eq_b(b);
 
         solve_xU_eq_b(b);
+
+        append_solution_time_in_s(get_LU_timer_in_s()-time_start);
     }
     else
     {
-        LU_factorization(1, 1e-13);
-        /*
-        cout<<"Div LU->L->n = "<<LU->L->n<<endl;
-        cout<<"Mul LU->L->p[n] = "<<LU->L->p[LU->L->n]<<endl;
-        cout<<"Div LU->U->n = "<<LU->U->n<<endl;
-        cout<<"Mul LU->U->p[n] = "<<LU->U->p[LU->U->n]<<endl;
-        */
-        solve_Lx_eq_b(b);
-
-        solve_xU_eq_b(b);
+        // LU factorization failed, e.g. singular matrix of island without any source
+        unsigned int n = b.size();
+        for(unsigned int i=0; i!=n; ++i)
+            b[i] = NAN;
     }
 
     return b;
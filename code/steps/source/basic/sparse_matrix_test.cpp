@@ -7,6 +7,7 @@
 #include <iostream>
 #include <cstdio>
 #include <complex>
+#include <cmath>
 
 #ifdef ENABLE_STEPS_TEST
 using namespace std;
@@ -31,6 +32,8 @@ SPARSE_MATRIX_TEST::SPARSE_MATRIX_TEST()
     TEST_ADD(SPARSE_MATRIX_TEST::test_get_reorder_permutation);
     TEST_ADD(SPARSE_MATRIX_TEST::test_slove_Ax_equal_b);
     TEST_ADD(SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_operator_slash);
+    TEST_ADD(SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_singular_matrix);
+    TEST_ADD(SPARSE_MATRIX_TEST::test_LU_factorization_with_symbolic_analysis_reused);
 
     TEST_ADD(SPARSE_MATRIX_TEST::test_copy_with_operator_equal);
     TEST_ADD(SPARSE_MATRIX_TEST::test_copy_with_copy_constructor);
@@ -383,6 +386,73 @@ void SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_operator_slash()
     TEST_ASSERT(fabs(x[2] - 3.0)<FLOAT_EPSILON);
 }
 
+void SPARSE_MATRIX_TEST::test_solve_Ax_equal_b_with_singular_matrix()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"SPARSE_MATRIX_TEST");
+
+    // matrix without entry (2,2) is singular. columns 1 and 2 only have entries in row 1.
+    // LU factorization fails, and solution is NaN instead of crash.
+    matrix.add_entry(0,0,1.0);
+    matrix.add_entry(1,1,2.0);
+    matrix.add_entry(1,2,4.0);
+    matrix.add_entry(2,0,1.0);
+
+    matrix.compress_and_merge_duplicate_entries();
+
+    vector<double> b;
+    b.reserve(3);
+    b.push_back(2.0);
+    b.push_back(20.0);
+    b.push_back(5.0);
+
+    vector<double> x = matrix.solve_Ax_eq_b(b);
+
+    TEST_ASSERT(x.size()==3);
+    for(unsigned int i=0; i!=3; ++i)
+        TEST_ASSERT(std::isnan(x[i]));
+}
+
+void SPARSE_MATRIX_TEST::test_LU_factorization_with_symbolic_analysis_reused()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"SPARSE_MATRIX_TEST");
+
+    prepare_basic_matrix();
+
+    vector<double> b;
+    b.reserve(3);
+    b.push_back(2.0);
+    b.push_back(20.0);
+    b.push_back(5.0);
+
+    matrix.set_symbolic_analysis_reuse_logic(true);
+    matrix.reset_LU_statistics();
+
+    vector<double> x = matrix.solve_Ax_eq_b(b);
+    TEST_ASSERT(fabs(x[0] - 2.0)<FLOAT_EPSILON);
+    TEST_ASSERT(fabs(x[1] - 4.0)<FLOAT_EPSILON);
+    TEST_ASSERT(fabs(x[2] - 3.0)<FLOAT_EPSILON);
+
+    // same pattern, new value. only numeric factorization is performed
+    matrix.change_entry_value(1, 1, 4.0);
+    b[0] = 2.0; b[1] = 20.0; b[2] = 5.0;
+    x = matrix.solve_Ax_eq_b(b);
+    TEST_ASSERT(fabs(x[0] - 2.0)<FLOAT_EPSILON);
+    TEST_ASSERT(fabs(x[1] - 2.0)<FLOAT_EPSILON);
+    TEST_ASSERT(fabs(x[2] - 3.0)<FLOAT_EPSILON);
+
+    TEST_ASSERT(matrix.get_symbolic_analysis_count()==1);
+    TEST_ASSERT(matrix.get_numeric_factorization_count()==2);
+    TEST_ASSERT(matrix.get_solution_count()==2);
+
+    matrix.set_symbolic_analysis_reuse_logic(false);
+    matrix.change_entry_value(1, 1, 2.0);
+    b[0] = 2.0; b[1] = 20.0; b[2] = 5.0;
+    x = matrix.solve_Ax_eq_b(b);
+    TEST_ASSERT(fabs(x[1] - 4.0)<FLOAT_EPSILON);
+    TEST_ASSERT(matrix.get_symbolic_analysis_count()==2);
+    TEST_ASSERT(matrix.get_numeric_factorization_count()==3);
+}
+
 void SPARSE_MATRIX_TEST::test_copy_with_operator_equal()
 {
     show_test_information_for_function_of_class(__FUNCTION__,"SPARSE_MATRIX_TEST");
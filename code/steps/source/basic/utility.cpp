@@ -807,6 +807,61 @@ bool is_file_exist(const string& file)
     }
 }
 
+unsigned long long get_checksum_of_data(const char* data, size_t size, unsigned long long checksum)
+{
+    // 64-bit FNV-1a hash. checksum of successive blocks is chained by passing in the former checksum.
+    for(size_t i=0; i<size; ++i)
+    {
+        checksum ^= (unsigned char)(data[i]);
+        checksum *= 1099511628211ULL;
+    }
+    return checksum;
+}
+
+unsigned long long get_checksum_of_text(const char* text, size_t size, unsigned long long checksum)
+{
+    // 64-bit FNV-1a hash of text with carriage returns skipped,
+    // so that the same checksum is got when text file is read in text or binary mode on any platform.
+    for(size_t i=0; i<size; ++i)
+    {
+        if(text[i]=='\r')
+            continue;
+        checksum ^= (unsigned char)(text[i]);
+        checksum *= 1099511628211ULL;
+    }
+    return checksum;
+}
+
+unsigned long long get_checksum_of_file(const string& file)
+{
+    // return 0 if the file does not exist
+    FILE* fid = fopen(file.c_str(),"rb");
+    if(fid==NULL)
+        return 0;
+
+    unsigned long long checksum = 14695981039346656037ULL;
+    char buffer[65536];
+    size_t n = fread(buffer, 1, 65536, fid);
+    while(n>0)
+    {
+        checksum = get_checksum_of_text(buffer, n, checksum);
+        n = fread(buffer, 1, 65536, fid);
+    }
+    fclose(fid);
+    return checksum;
+}
+
+tm get_local_time(time_t tt)
+{
+    // thread-safe version of localtime() since toolkits may run in different threads
+    tm local_time;
+    #if defined(_WIN32)
+        localtime_s(&local_time, &tt);
+    #else
+        localtime_r(&tt, &local_time);
+    #endif
+    return local_time;
+}
 
 void show_information_with_leading_time_stamp_with_default_toolkit(const string& info)
 {
@@ -897,6 +952,15 @@ unsigned int generate_new_toolkit(string log_file)
     return index;
 }
 
+unsigned int clone_toolkit(unsigned int toolkit_index, string log_file)
+{
+    STEPS& source_toolkit = get_toolkit(toolkit_index);
+    unsigned int index = generate_new_toolkit(log_file);
+    STEPS& toolkit = get_toolkit(index);
+    toolkit.copy_from_toolkit(source_toolkit);
+    return index;
+}
+
 void delete_toolkit(unsigned int toolkit_index)
 {
     mtx.lock();
@@ -2,12 +2,14 @@
 #include "header/basic/utility_test.h"
 #include "header/steps_namespace.h"
 #include "header/prepare_for_tests/prepare_models_for_test.h"
+#include "header/data_imexporter/psse_imexporter.h"
 #include <cstdlib>
 #include <cstring>
 #include <istream>
 #include <iostream>
 #include <cstdio>
 #include <cmath>
+#include <thread>
 
 #ifdef ENABLE_STEPS_TEST
 using namespace std;
@@ -47,6 +49,7 @@ UTILITY_TEST::UTILITY_TEST()
     TEST_ADD(UTILITY_TEST::test_is_file_exist);
     TEST_ADD(UTILITY_TEST::test_generate_and_delete_toolkit);
     TEST_ADD(UTILITY_TEST::test_get_toolkit);
+    TEST_ADD(UTILITY_TEST::test_run_toolkits_in_parallel_threads);
 
 
     //TEST_ADD(UTILITY_TEST::test_redirect_and_recover_stdout);
@@ -449,6 +452,60 @@ void UTILITY_TEST::test_get_toolkit()
         delete_toolkit(k);
     }
 }
+
+void run_IEEE_9_bus_fault_with_toolkit(unsigned int toolkit_index, double* voltage)
+{
+    STEPS& toolkit = get_toolkit(toolkit_index);
+
+    PSSE_IMEXPORTER importer(toolkit);
+    importer.load_powerflow_data("../../../bench/IEEE9.raw");
+    importer.load_dynamic_data("../../../bench/IEEE9.dyr");
+
+    POWERFLOW_SOLVER& powerflow_solver = toolkit.get_powerflow_solver();
+    powerflow_solver.solve_with_fast_decoupled_solution();
+
+    DYNAMICS_SIMULATOR& simulator = toolkit.get_dynamic_simulator();
+    simulator.set_bin_file_export_enable_flag(false);
+    simulator.set_csv_file_export_enable_flag(false);
+    simulator.set_json_file_export_enable_flag(false);
+    toolkit.set_dynamic_simulation_time_step_in_s(0.01);
+
+    simulator.start();
+    simulator.run_to(0.0);
+    simulator.set_bus_fault(7, complex<double>(0.0, -2e4));
+    simulator.run_to(0.1);
+    simulator.clear_bus_fault(7);
+    simulator.run_to(2.0);
+
+    POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
+    *voltage = psdb.get_bus_positive_sequence_voltage_in_pu(5);
+}
+
+void UTILITY_TEST::test_run_toolkits_in_parallel_threads()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"UTILITY_TEST");
+
+    // toolkits with different indices share no data, and can run in parallel threads
+    unsigned int n = 4;
+    vector<unsigned int> indices;
+    for(unsigned int k=0; k!=n+1; ++k)
+        indices.push_back(generate_new_toolkit());
+
+    vector<double> voltages(n+1, 0.0);
+    run_IEEE_9_bus_fault_with_toolkit(indices[n], &(voltages[n]));
+
+    vector<thread> threads;
+    for(unsigned int k=0; k!=n; ++k)
+        threads.push_back(thread(run_IEEE_9_bus_fault_with_toolkit, indices[k], &(voltages[k])));
+    for(unsigned int k=0; k!=n; ++k)
+        threads[k].join();
+
+    for(unsigned int k=0; k!=n; ++k)
+        TEST_ASSERT(voltages[k]==voltages[n]);
+
+    for(unsigned int k=0; k!=n+1; ++k)
+        delete_toolkit(indices[k]);
+}
 /*void UTILITY_TEST::test_redirect_and_close_log_file()
 {
     show_test_information_for_function_of_class(__FUNCTION__,"UTILITY_TEST");
@@ -37,6 +37,7 @@ void BPA_IMEXPORTER::load_dynamic_data_into_ram(string file)
     STEPS& toolkit = get_toolkit();
     ostringstream osstream;
     swi_data_in_ram.clear();
+    clear_data_file_checksum();
 
     ifstream swi_file(file);
 
@@ -51,11 +52,15 @@ void BPA_IMEXPORTER::load_dynamic_data_into_ram(string file)
     string buffer;
     while(getline(swi_file,buffer))
     {
+        update_data_file_checksum(buffer.c_str());
+        if(not swi_file.eof())
+            update_data_file_checksum("\n");
         if(not is_comment_line(buffer))
             swi_data_in_ram.push_back(buffer);
     }
 
     swi_file.close();
+    set_data_file_loaded_flag(true);
 
     unsigned int n = swi_data_in_ram.size();
     for(unsigned int i=0; i!=n; ++i)
@@ -136,6 +136,7 @@ void BPA_IMEXPORTER::load_powerflow_data_into_ram(string file)
 {
     STEPS& toolkit = get_toolkit();
     dat_data_in_ram.clear();
+    clear_data_file_checksum();
 
     ifstream dat_file(file);
 
@@ -150,10 +151,14 @@ void BPA_IMEXPORTER::load_powerflow_data_into_ram(string file)
     string buffer;
     while(getline(dat_file,buffer))
     {
+        update_data_file_checksum(buffer.c_str());
+        if(not dat_file.eof())
+            update_data_file_checksum("\n");
         if(not is_comment_line(buffer))
             dat_data_in_ram.push_back(buffer);
     }
     dat_file.close();
+    set_data_file_loaded_flag(dat_data_in_ram.size()!=0);
 
     //for(unsigned int i=0; i<dat_data_in_ram.size(); ++i)
     //    cout<<dat_data_in_ram[i]<<endl;
@@ -0,0 +1,1165 @@
+#include "header/data_imexporter/case_snapshot.h"
+#include "header/basic/utility.h"
+#include "header/STEPS.h"
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+
+#if defined(_WIN32)
+#else
+    #include <fcntl.h>
+    #include <unistd.h>
+    #include <sys/mman.h>
+    #include <sys/stat.h>
+#endif
+
+using namespace std;
+
+// snapshot layout: magic, version, endian marker, payload size, payload checksum, payload.
+// payload holds source files and their checksums, power system database, and dynamic model records.
+// version should be increased whenever the payload layout is changed.
+#define CASE_SNAPSHOT_MAGIC "STEPSSNP"
+#define CASE_SNAPSHOT_MAGIC_SIZE 8
+#define CASE_SNAPSHOT_VERSION 2
+#define CASE_SNAPSHOT_ENDIAN_MARKER 0x01020304
+#define CASE_SNAPSHOT_HEADER_SIZE (CASE_SNAPSHOT_MAGIC_SIZE+2*sizeof(unsigned int)+2*sizeof(unsigned long long))
+
+CASE_SNAPSHOT::CASE_SNAPSHOT(STEPS& toolkit)
+{
+    this->toolkit = (&toolkit);
+    snapshot_data = NULL;
+    snapshot_size = 0;
+    snapshot_position = 0;
+    snapshot_corrupted = false;
+}
+
+CASE_SNAPSHOT::~CASE_SNAPSHOT()
+{
+    ;
+}
+
+STEPS& CASE_SNAPSHOT::get_toolkit() const
+{
+    return *toolkit;
+}
+
+bool CASE_SNAPSHOT::save_case_snapshot(const string& file)
+{
+    ostringstream osstream;
+    STEPS& toolkit = get_toolkit();
+
+    snapshot_buffer.clear();
+
+    vector<string> files = toolkit.get_case_source_files();
+    vector<unsigned long long> checksums = toolkit.get_case_source_file_checksums();
+    unsigned int n = files.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        write_string(files[i]);
+        write_unsigned_long_long(checksums[i]);
+    }
+    save_power_system_database();
+    save_dynamic_model_records();
+
+    unsigned int version = CASE_SNAPSHOT_VERSION;
+    unsigned int endian_marker = CASE_SNAPSHOT_ENDIAN_MARKER;
+    unsigned long long payload_size = snapshot_buffer.size();
+    unsigned long long payload_checksum = get_checksum_of_data(snapshot_buffer.data(), snapshot_buffer.size());
+
+    ofstream fid(file, ios::out|ios::binary|ios::trunc);
+    if(not fid.is_open())
+    {
+        osstream<<"Error. Failed to open case snapshot file "<<file<<" to save case snapshot.";
+        toolkit.show_information_with_leading_time_stamp(osstream);
+        snapshot_buffer.clear();
+        return false;
+    }
+    fid.write(CASE_SNAPSHOT_MAGIC, CASE_SNAPSHOT_MAGIC_SIZE);
+    fid.write((const char*)(&version), sizeof(version));
+    fid.write((const char*)(&endian_marker), sizeof(endian_marker));
+    fid.write((const char*)(&payload_size), sizeof(payload_size));
+    fid.write((const char*)(&payload_checksum), sizeof(payload_checksum));
+    fid.write(snapshot_buffer.data(), snapshot_buffer.size());
+    fid.close();
+    snapshot_buffer.clear();
+
+    if(fid.fail())
+    {
+        osstream<<"Error. Failed to write case snapshot to "<<file<<".";
+        toolkit.show_information_with_leading_time_stamp(osstream);
+        return false;
+    }
+
+    osstream<<"Case snapshot is saved to "<<file<<" ("<<payload_size+CASE_SNAPSHOT_HEADER_SIZE<<" bytes).";
+    toolkit.show_information_with_leading_time_stamp(osstream);
+    return true;
+}
+
+bool CASE_SNAPSHOT::load_case_snapshot(const string& file)
+{
+    ostringstream osstream;
+    STEPS& toolkit = get_toolkit();
+
+    osstream<<"Loading case snapshot from "<<file;
+    toolkit.show_information_with_leading_time_stamp(osstream);
+
+    // the snapshot is mapped into memory and devices are set directly from the mapped payload.
+    #if defined(_WIN32)
+        ifstream fid(file, ios::in|ios::binary|ios::ate);
+        if(not fid.is_open())
+        {
+            osstream<<"Error. Case snapshot file "<<file<<" cannot be opened.";
+            toolkit.show_information_with_leading_time_stamp(osstream);
+            return false;
+        }
+        size_t size = fid.tellg();
+        vector<char> data(size);
+        fid.seekg(0);
+        if(size!=0)
+            fid.read(data.data(), size);
+        fid.close();
+        const char* mapped_data = data.data();
+    #else
+        int fd = open(file.c_str(), O_RDONLY);
+        if(fd<0)
+        {
+            osstream<<"Error. Case snapshot file "<<file<<" cannot be opened.";
+            toolkit.show_information_with_leading_time_stamp(osstream);
+            return false;
+        }
+        struct stat file_stat;
+        size_t size = 0;
+        if(fstat(fd, &file_stat)==0)
+            size = file_stat.st_size;
+        void* mapped = MAP_FAILED;
+        if(size!=0)
+            mapped = mmap(NULL, size, PROT_READ, MAP_PRIVATE, fd, 0);
+        close(fd);
+        if(mapped==MAP_FAILED)
+            size = 0;
+        const char* mapped_data = (const char*)mapped;
+    #endif
+
+    bool loaded = false;
+    unsigned int version = 0, endian_marker = 0;
+    unsigned long long payload_size = 0, payload_checksum = 0;
+    if(size>=CASE_SNAPSHOT_HEADER_SIZE)
+    {
+        const char* header = mapped_data+CASE_SNAPSHOT_MAGIC_SIZE;
+        memcpy(&version, header, sizeof(version));
+        header += sizeof(version);
+        memcpy(&endian_marker, header, sizeof(endian_marker));
+        header += sizeof(endian_marker);
+        memcpy(&payload_size, header, sizeof(payload_size));
+        header += sizeof(payload_size);
+        memcpy(&payload_checksum, header, sizeof(payload_checksum));
+    }
+
+    if(size<CASE_SNAPSHOT_HEADER_SIZE or memcmp(mapped_data, CASE_SNAPSHOT_MAGIC, CASE_SNAPSHOT_MAGIC_SIZE)!=0)
+        osstream<<"Error. "<<file<<" is not a valid STEPS case snapshot.";
+    else if(version!=CASE_SNAPSHOT_VERSION)
+        osstream<<"Error. Case snapshot "<<file<<" is of version "<<version<<", but version "<<CASE_SNAPSHOT_VERSION<<" is required. Save the snapshot again.";
+    else if(endian_marker!=CASE_SNAPSHOT_ENDIAN_MARKER)
+        osstream<<"Error. Case snapshot "<<file<<" is saved on machine of different byte order.";
+    else if(payload_size!=size-CASE_SNAPSHOT_HEADER_SIZE or
+            get_checksum_of_data(mapped_data+CASE_SNAPSHOT_HEADER_SIZE, payload_size)!=payload_checksum)
+        osstream<<"Error. Case snapshot "<<file<<" is corrupted.";
+    else
+    {
+        snapshot_data = mapped_data+CASE_SNAPSHOT_HEADER_SIZE;
+        snapshot_size = payload_size;
+        snapshot_position = 0;
+        snapshot_corrupted = false;
+
+        if(is_snapshot_stale())
+            osstream<<"Error. Case snapshot "<<file<<" is stale since its source files are changed or not found. Load source files and save the snapshot again.";
+        else
+            loaded = load_snapshot_payload();
+
+        if(snapshot_corrupted)
+            osstream<<"Error. Case snapshot "<<file<<" is corrupted.";
+        snapshot_data = NULL;
+        snapshot_size = 0;
+        snapshot_position = 0;
+    }
+
+    #if defined(_WIN32)
+    #else
+        if(size!=0)
+            munmap(mapped, size);
+    #endif
+
+    if(loaded)
+    {
+        POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
+        osstream<<"Done loading case snapshot with "<<psdb.get_bus_count()<<" buses.";
+    }
+    toolkit.show_information_with_leading_time_stamp(osstream);
+    return loaded;
+}
+
+bool CASE_SNAPSHOT::is_snapshot_stale()
+{
+    ostringstream osstream;
+    STEPS& toolkit = get_toolkit();
+
+    bool stale = false;
+    unsigned int n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        string file = read_string();
+        unsigned long long checksum = read_unsigned_long_long();
+        if(not is_file_exist(file))
+        {
+            osstream<<"Source file "<<file<<" of case snapshot is not found. It cannot be checked.";
+            toolkit.show_information_with_leading_time_stamp(osstream);
+            stale = true;
+            continue;
+        }
+        if(get_checksum_of_file(file)!=checksum)
+        {
+            osstream<<"Source file "<<file<<" is changed after case snapshot is saved.";
+            toolkit.show_information_with_leading_time_stamp(osstream);
+            stale = true;
+        }
+    }
+    return stale;
+}
+
+bool CASE_SNAPSHOT::load_snapshot_payload()
+{
+    STEPS& toolkit = get_toolkit();
+
+    snapshot_position = 0;
+    toolkit.clear_case_source_files();
+    unsigned int n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        string file = read_string();
+        unsigned long long checksum = read_unsigned_long_long();
+        toolkit.append_case_source_file(file, checksum);
+    }
+
+    toolkit.release_base_case();
+    toolkit.get_network_matrix().clear();
+    toolkit.get_dynamic_model_database().clear();
+    load_power_system_database();
+    if(not snapshot_corrupted)
+        load_dynamic_model_records();
+
+    if(snapshot_corrupted)
+    {
+        toolkit.get_power_system_database().clear();
+        toolkit.get_dynamic_model_database().clear();
+        toolkit.clear_case_source_files();
+        return false;
+    }
+    return true;
+}
+
+void CASE_SNAPSHOT::save_power_system_database()
+{
+    POWER_SYSTEM_DATABASE& psdb = get_toolkit().get_power_system_database();
+
+    write_string(psdb.get_system_name());
+    write_double(psdb.get_system_base_power_in_MVA());
+    write_string(psdb.get_case_information());
+    write_string(psdb.get_case_additional_information());
+    write_double(psdb.get_zero_impedance_threshold_in_pu());
+    write_unsigned_int(psdb.get_allowed_max_bus_number());
+
+    write_unsigned_int(psdb.get_bus_capacity());
+    write_unsigned_int(psdb.get_generator_capacity());
+    write_unsigned_int(psdb.get_wt_generator_capacity());
+    write_unsigned_int(psdb.get_pv_unit_capacity());
+    write_unsigned_int(psdb.get_load_capacity());
+    write_unsigned_int(psdb.get_fixed_shunt_capacity());
+    write_unsigned_int(psdb.get_line_capacity());
+    write_unsigned_int(psdb.get_transformer_capacity());
+    write_unsigned_int(psdb.get_hvdc_capacity());
+    write_unsigned_int(psdb.get_equivalent_device_capacity());
+    write_unsigned_int(psdb.get_energy_storage_capacity());
+    write_unsigned_int(psdb.get_area_capacity());
+    write_unsigned_int(psdb.get_zone_capacity());
+    write_unsigned_int(psdb.get_owner_capacity());
+
+    vector<BUS*> buses = psdb.get_all_buses();
+    unsigned int n = buses.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_bus(*(buses[i]));
+
+    vector<GENERATOR*> generators = psdb.get_all_generators();
+    n = generators.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_source(*(generators[i]));
+
+    vector<WT_GENERATOR*> wt_generators = psdb.get_all_wt_generators();
+    n = wt_generators.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        save_source(*(wt_generators[i]));
+        write_unsigned_int(wt_generators[i]->get_number_of_lumped_wt_generators());
+        write_double(wt_generators[i]->get_rated_power_per_wt_generator_in_MW());
+    }
+
+    vector<PV_UNIT*> pv_units = psdb.get_all_pv_units();
+    n = pv_units.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        save_source(*(pv_units[i]));
+        write_unsigned_int(pv_units[i]->get_number_of_lumped_pv_units());
+        write_double(pv_units[i]->get_rated_power_per_pv_unit_in_MW());
+    }
+
+    vector<ENERGY_STORAGE*> energy_storages = psdb.get_all_energy_storages();
+    n = energy_storages.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_source(*(energy_storages[i]));
+
+    vector<LOAD*> loads = psdb.get_all_loads();
+    n = loads.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_load(*(loads[i]));
+
+    vector<FIXED_SHUNT*> fixed_shunts = psdb.get_all_fixed_shunts();
+    n = fixed_shunts.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_fixed_shunt(*(fixed_shunts[i]));
+
+    vector<LINE*> lines = psdb.get_all_lines();
+    n = lines.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_line(*(lines[i]));
+
+    vector<TRANSFORMER*> transformers = psdb.get_all_transformers();
+    n = transformers.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_transformer(*(transformers[i]));
+
+    vector<HVDC*> hvdcs = psdb.get_all_hvdcs();
+    n = hvdcs.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_hvdc(*(hvdcs[i]));
+
+    vector<EQUIVALENT_DEVICE*> equivalent_devices = psdb.get_all_equivalent_devices();
+    n = equivalent_devices.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        save_equivalent_device(*(equivalent_devices[i]));
+
+    vector<AREA*> areas = psdb.get_all_areas();
+    n = areas.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        write_unsigned_int(areas[i]->get_area_number());
+        write_string(areas[i]->get_area_name());
+        write_unsigned_int(areas[i]->get_area_swing_bus());
+        write_double(areas[i]->get_expected_power_leaving_area_in_MW());
+        write_double(areas[i]->get_area_power_mismatch_tolerance_in_MW());
+    }
+
+    vector<ZONE*> zones = psdb.get_all_zones();
+    n = zones.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        write_unsigned_int(zones[i]->get_zone_number());
+        write_string(zones[i]->get_zone_name());
+    }
+
+    vector<OWNER*> owners = psdb.get_all_owners();
+    n = owners.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        write_unsigned_int(owners[i]->get_owner_number());
+        write_string(owners[i]->get_owner_name());
+    }
+}
+
+void CASE_SNAPSHOT::load_power_system_database()
+{
+    STEPS& toolkit = get_toolkit();
+    POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
+
+    psdb.clear();
+
+    psdb.set_system_name(read_string());
+    psdb.set_system_base_power_in_MVA(read_double());
+    psdb.set_case_information(read_string());
+    psdb.set_case_additional_information(read_string());
+    psdb.set_zero_impedance_threshold_in_pu(read_double());
+    psdb.set_allowed_max_bus_number(read_unsigned_int());
+
+    psdb.set_bus_capacity(read_unsigned_int());
+    psdb.set_generator_capacity(read_unsigned_int());
+    psdb.set_wt_generator_capacity(read_unsigned_int());
+    psdb.set_pv_unit_capacity(read_unsigned_int());
+    psdb.set_load_capacity(read_unsigned_int());
+    psdb.set_fixed_shunt_capacity(read_unsigned_int());
+    psdb.set_line_capacity(read_unsigned_int());
+    psdb.set_transformer_capacity(read_unsigned_int());
+    psdb.set_hvdc_capacity(read_unsigned_int());
+    psdb.set_equivalent_device_capacity(read_unsigned_int());
+    psdb.set_energy_storage_capacity(read_unsigned_int());
+    psdb.set_area_capacity(read_unsigned_int());
+    psdb.set_zone_capacity(read_unsigned_int());
+    psdb.set_owner_capacity(read_unsigned_int());
+
+    unsigned int n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        BUS bus(toolkit);
+        load_bus(bus);
+        psdb.append_bus(bus);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        GENERATOR generator(toolkit);
+        load_source(generator);
+        psdb.append_generator(generator);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        WT_GENERATOR wt_generator(toolkit);
+        load_source(wt_generator);
+        wt_generator.set_number_of_lumped_wt_generators(read_unsigned_int());
+        wt_generator.set_rated_power_per_wt_generator_in_MW(read_double());
+        psdb.append_wt_generator(wt_generator);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        PV_UNIT pv_unit(toolkit);
+        load_source(pv_unit);
+        pv_unit.set_number_of_lumped_pv_units(read_unsigned_int());
+        pv_unit.set_rated_power_per_pv_unit_in_MW(read_double());
+        psdb.append_pv_unit(pv_unit);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        ENERGY_STORAGE energy_storage(toolkit);
+        load_source(energy_storage);
+        psdb.append_energy_storage(energy_storage);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        LOAD load(toolkit);
+        load_load(load);
+        psdb.append_load(load);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        FIXED_SHUNT shunt(toolkit);
+        load_fixed_shunt(shunt);
+        psdb.append_fixed_shunt(shunt);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        LINE line(toolkit);
+        load_line(line);
+        psdb.append_line(line);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        TRANSFORMER trans(toolkit);
+        load_transformer(trans);
+        psdb.append_transformer(trans);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        HVDC hvdc(toolkit);
+        load_hvdc(hvdc);
+        psdb.append_hvdc(hvdc);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        EQUIVALENT_DEVICE edevice(toolkit);
+        load_equivalent_device(edevice);
+        psdb.append_equivalent_device(edevice);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        AREA area(toolkit);
+        area.set_area_number(read_unsigned_int());
+        area.set_area_name(read_string());
+        area.set_area_swing_bus(read_unsigned_int());
+        area.set_expected_power_leaving_area_in_MW(read_double());
+        area.set_area_power_mismatch_tolerance_in_MW(read_double());
+        psdb.append_area(area);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        ZONE zone(toolkit);
+        zone.set_zone_number(read_unsigned_int());
+        zone.set_zone_name(read_string());
+        psdb.append_zone(zone);
+    }
+
+    n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        OWNER owner(toolkit);
+        owner.set_owner_number(read_unsigned_int());
+        owner.set_owner_name(read_string());
+        psdb.append_owner(owner);
+    }
+
+    psdb.update_in_service_bus_count();
+}
+
+void CASE_SNAPSHOT::save_bus(const BUS& bus)
+{
+    write_unsigned_int(bus.get_bus_number());
+    write_string(bus.get_bus_name());
+    write_double(bus.get_base_voltage_in_kV());
+    write_double(bus.get_base_frequency_in_Hz());
+    write_unsigned_int(bus.get_bus_type());
+    write_unsigned_int(bus.get_area_number());
+    write_unsigned_int(bus.get_zone_number());
+    write_unsigned_int(bus.get_owner_number());
+    write_double(bus.get_positive_sequence_voltage_in_pu());
+    write_double(bus.get_positive_sequence_angle_in_rad());
+    write_double(bus.get_normal_voltage_upper_limit_in_pu());
+    write_double(bus.get_normal_voltage_lower_limit_in_pu());
+    write_double(bus.get_emergency_voltage_upper_limit_in_pu());
+    write_double(bus.get_emergency_voltage_lower_limit_in_pu());
+    write_double(bus.get_voltage_to_regulate_in_pu());
+    write_unsigned_int(bus.get_equivalent_bus_number());
+    write_fault(bus.get_fault());
+}
+
+void CASE_SNAPSHOT::load_bus(BUS& bus)
+{
+    bus.set_bus_number(read_unsigned_int());
+    bus.set_bus_name(read_string());
+    bus.set_base_voltage_in_kV(read_double());
+    bus.set_base_frequency_in_Hz(read_double());
+    bus.set_bus_type(BUS_TYPE(read_unsigned_int()));
+    bus.set_area_number(read_unsigned_int());
+    bus.set_zone_number(read_unsigned_int());
+    bus.set_owner_number(read_unsigned_int());
+    bus.set_positive_sequence_voltage_in_pu(read_double());
+    bus.set_positive_sequence_angle_in_rad(read_double());
+    bus.set_normal_voltage_upper_limit_in_pu(read_double());
+    bus.set_normal_voltage_lower_limit_in_pu(read_double());
+    bus.set_emergency_voltage_upper_limit_in_pu(read_double());
+    bus.set_emergency_voltage_lower_limit_in_pu(read_double());
+    bus.set_voltage_to_regulate_in_pu(read_double());
+    bus.set_equivalent_bus_number(read_unsigned_int());
+    FAULT fault = read_fault();
+    if(fault.is_faulted())
+        bus.set_fault(fault);
+}
+
+void CASE_SNAPSHOT::save_source(const SOURCE& source)
+{
+    write_unsigned_int(source.get_source_bus());
+    write_string(source.get_identifier());
+    write_bool(source.get_status());
+    write_double(source.get_mbase_in_MVA());
+    write_double(source.get_p_generation_in_MW());
+    write_double(source.get_q_generation_in_MVar());
+    write_double(source.get_p_max_in_MW());
+    write_double(source.get_p_min_in_MW());
+    write_double(source.get_q_max_in_MVar());
+    write_double(source.get_q_min_in_MVar());
+    write_complex(source.get_source_impedance_in_pu());
+    write_unsigned_int(source.get_bus_to_regulate());
+    write_double(source.get_voltage_to_regulate_in_pu());
+    write_ownership(source);
+}
+
+void CASE_SNAPSHOT::load_source(SOURCE& source)
+{
+    source.set_source_bus(read_unsigned_int());
+    source.set_identifier(read_string());
+    source.set_status(read_bool());
+    source.set_mbase_in_MVA(read_double());
+    source.set_p_generation_in_MW(read_double());
+    source.set_q_generation_in_MVar(read_double());
+    source.set_p_max_in_MW(read_double());
+    source.set_p_min_in_MW(read_double());
+    source.set_q_max_in_MVar(read_double());
+    source.set_q_min_in_MVar(read_double());
+    source.set_source_impedance_in_pu(read_complex());
+    source.set_bus_to_regulate(read_unsigned_int());
+    source.set_voltage_to_regulate_in_pu(read_double());
+    read_ownership(source);
+}
+
+void CASE_SNAPSHOT::save_load(const LOAD& load)
+{
+    write_unsigned_int(load.get_load_bus());
+    write_string(load.get_identifier());
+    write_bool(load.get_status());
+    write_complex(load.get_nominal_constant_power_load_in_MVA());
+    write_complex(load.get_nominal_constant_current_load_in_MVA());
+    write_complex(load.get_nominal_constant_impedance_load_in_MVA());
+    write_unsigned_int(load.get_area_number());
+    write_unsigned_int(load.get_zone_number());
+    write_unsigned_int(load.get_owner_number());
+    write_bool(load.get_flag_interruptable());
+    write_double(load.get_load_manually_scale_factor_in_pu());
+}
+
+void CASE_SNAPSHOT::load_load(LOAD& load)
+{
+    load.set_load_bus(read_unsigned_int());
+    load.set_identifier(read_string());
+    load.set_status(read_bool());
+    load.set_nominal_constant_power_load_in_MVA(read_complex());
+    load.set_nominal_constant_current_load_in_MVA(read_complex());
+    load.set_nominal_constant_impedance_load_in_MVA(read_complex());
+    load.set_area_number(read_unsigned_int());
+    load.set_zone_number(read_unsigned_int());
+    load.set_owner_number(read_unsigned_int());
+    load.set_flag_interruptable(read_bool());
+    load.set_load_manually_scale_factor_in_pu(read_double());
+}
+
+void CASE_SNAPSHOT::save_fixed_shunt(const FIXED_SHUNT& shunt)
+{
+    write_unsigned_int(shunt.get_shunt_bus());
+    write_string(shunt.get_identifier());
+    write_bool(shunt.get_status());
+    write_complex(shunt.get_nominal_impedance_shunt_in_MVA());
+}
+
+void CASE_SNAPSHOT::load_fixed_shunt(FIXED_SHUNT& shunt)
+{
+    shunt.set_shunt_bus(read_unsigned_int());
+    shunt.set_identifier(read_string());
+    shunt.set_status(read_bool());
+    shunt.set_nominal_impedance_shunt_in_MVA(read_complex());
+}
+
+void CASE_SNAPSHOT::save_line(const LINE& line)
+{
+    write_unsigned_int(line.get_sending_side_bus());
+    write_unsigned_int(line.get_receiving_side_bus());
+    write_string(line.get_identifier());
+    write_bool(line.get_sending_side_breaker_status());
+    write_bool(line.get_receiving_side_breaker_status());
+    write_complex(line.get_line_positive_sequence_z_in_pu());
+    write_complex(line.get_line_positive_sequence_y_in_pu());
+    write_complex(line.get_shunt_positive_sequence_y_at_sending_side_in_pu());
+    write_complex(line.get_shunt_positive_sequence_y_at_receiving_side_in_pu());
+    write_complex(line.get_line_zero_sequence_z_in_pu());
+    write_complex(line.get_line_zero_sequence_y_in_pu());
+    write_complex(line.get_shunt_zero_sequence_y_at_sending_side_in_pu());
+    write_complex(line.get_shunt_zero_sequence_y_at_receiving_side_in_pu());
+    write_rating(line.get_rating());
+    write_unsigned_int(line.get_meter_end_bus());
+    write_double(line.get_length());
+    write_ownership(line);
+
+    unsigned int nfault = line.get_fault_count();
+    write_unsigned_int(nfault);
+    for(unsigned int i=0; i!=nfault; ++i)
+    {
+        double location = line.get_fault_location_of_fault(i);
+        write_double(location);
+        write_fault(line.get_fault_at_location(line.get_sending_side_bus(), location));
+    }
+}
+
+void CASE_SNAPSHOT::load_line(LINE& line)
+{
+    line.set_sending_side_bus(read_unsigned_int());
+    line.set_receiving_side_bus(read_unsigned_int());
+    line.set_identifier(read_string());
+    line.set_sending_side_breaker_status(read_bool());
+    line.set_receiving_side_breaker_status(read_bool());
+    line.set_line_positive_sequence_z_in_pu(read_complex());
+    line.set_line_positive_sequence_y_in_pu(read_complex());
+    line.set_shunt_positive_sequence_y_at_sending_side_in_pu(read_complex());
+    line.set_shunt_positive_sequence_y_at_receiving_side_in_pu(read_complex());
+    line.set_line_zero_sequence_z_in_pu(read_complex());
+    line.set_line_zero_sequence_y_in_pu(read_complex());
+    line.set_shunt_zero_sequence_y_at_sending_side_in_pu(read_complex());
+    line.set_shunt_zero_sequence_y_at_receiving_side_in_pu(read_complex());
+    line.set_rating(read_rating());
+    line.set_meter_end_bus(read_unsigned_int());
+    line.set_length(read_double());
+    read_ownership(line);
+
+    unsigned int nfault = read_unsigned_int();
+    for(unsigned int i=0; i!=nfault and (not snapshot_corrupted); ++i)
+    {
+        double location = read_double();
+        FAULT fault = read_fault();
+        line.set_fault(line.get_sending_side_bus(), location, fault);
+    }
+}
+
+void CASE_SNAPSHOT::save_transformer(const TRANSFORMER& trans)
+{
+    TRANSFORMER_WINDING_SIDE sides[3] = {PRIMARY_SIDE, SECONDARY_SIDE, TERTIARY_SIDE};
+
+    write_unsigned_int(trans.get_winding_bus(PRIMARY_SIDE));
+    write_unsigned_int(trans.get_winding_bus(SECONDARY_SIDE));
+    write_unsigned_int(trans.get_winding_bus(TERTIARY_SIDE));
+    write_string(trans.get_identifier());
+    write_string(trans.get_transformer_name());
+    write_unsigned_int(trans.get_non_metered_end_bus());
+    write_complex(trans.get_magnetizing_admittance_based_on_primary_winding_bus_base_voltage_and_system_base_power_in_pu());
+
+    write_double(trans.get_winding_nominal_capacity_in_MVA(PRIMARY_SIDE, SECONDARY_SIDE));
+    write_double(trans.get_winding_nominal_capacity_in_MVA(SECONDARY_SIDE, TERTIARY_SIDE));
+    write_double(trans.get_winding_nominal_capacity_in_MVA(PRIMARY_SIDE, TERTIARY_SIDE));
+    write_complex(trans.get_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(PRIMARY_SIDE, SECONDARY_SIDE));
+    write_complex(trans.get_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(SECONDARY_SIDE, TERTIARY_SIDE));
+    write_complex(trans.get_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(PRIMARY_SIDE, TERTIARY_SIDE));
+
+    for(unsigned int i=0; i!=3; ++i)
+    {
+        TRANSFORMER_WINDING_SIDE side = sides[i];
+        write_bool(trans.get_winding_breaker_status(side));
+        write_unsigned_int(trans.get_winding_connection_type(side));
+        write_double(trans.get_winding_nominal_voltage_in_kV(side));
+        write_double(trans.get_winding_turn_ratio_based_on_winding_nominal_voltage_in_pu(side));
+        write_double(trans.get_winding_angle_shift_in_deg(side));
+        write_rating(trans.get_winding_rating_in_MVA(side));
+        write_unsigned_int(trans.get_winding_number_of_taps(side));
+        write_double(trans.get_winding_max_turn_ratio_based_on_winding_nominal_voltage_in_pu(side));
+        write_double(trans.get_winding_min_turn_ratio_based_on_winding_nominal_voltage_in_pu(side));
+        write_double(trans.get_winding_max_angle_shift_in_deg(side));
+        write_double(trans.get_winding_min_angle_shift_in_deg(side));
+        write_unsigned_int(trans.get_winding_control_mode(side));
+        write_unsigned_int(trans.get_winding_controlled_bus(side));
+        write_double(trans.get_winding_controlled_max_voltage_in_pu(side));
+        write_double(trans.get_winding_controlled_min_voltage_in_pu(side));
+        write_double(trans.get_controlled_max_reactive_power_into_winding_in_MVar(side));
+        write_double(trans.get_controlled_min_reactive_power_into_winding_in_MVar(side));
+        write_double(trans.get_controlled_max_active_power_into_winding_in_MW(side));
+        write_double(trans.get_controlled_min_active_power_into_winding_in_MW(side));
+    }
+    write_ownership(trans);
+}
+
+void CASE_SNAPSHOT::load_transformer(TRANSFORMER& trans)
+{
+    // same as assignment operator of TRANSFORMER, data of tertiary winding is only set for three winding transformer
+    TRANSFORMER_WINDING_SIDE sides[3] = {PRIMARY_SIDE, SECONDARY_SIDE, TERTIARY_SIDE};
+
+    unsigned int primary_bus = read_unsigned_int();
+    unsigned int secondary_bus = read_unsigned_int();
+    unsigned int tertiary_bus = read_unsigned_int();
+    if(primary_bus!=0)
+        trans.set_winding_bus(PRIMARY_SIDE, primary_bus);
+    if(secondary_bus!=0)
+        trans.set_winding_bus(SECONDARY_SIDE, secondary_bus);
+    trans.set_winding_bus(TERTIARY_SIDE, tertiary_bus);
+    trans.set_identifier(read_string());
+    trans.set_transformer_name(read_string());
+    unsigned int non_metered_end_bus = read_unsigned_int();
+    if(non_metered_end_bus!=0)
+        trans.set_non_metered_end_bus(non_metered_end_bus);
+    trans.set_magnetizing_admittance_based_on_primary_winding_bus_base_voltage_and_system_base_power_in_pu(read_complex());
+
+    bool is_three_winding = trans.is_three_winding_transformer();
+
+    double s12 = read_double(), s23 = read_double(), s13 = read_double();
+    complex<double> z12 = read_complex(), z23 = read_complex(), z13 = read_complex();
+    trans.set_winding_nominal_capacity_in_MVA(PRIMARY_SIDE, SECONDARY_SIDE, s12);
+    trans.set_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(PRIMARY_SIDE, SECONDARY_SIDE, z12);
+    if(is_three_winding)
+    {
+        trans.set_winding_nominal_capacity_in_MVA(SECONDARY_SIDE, TERTIARY_SIDE, s23);
+        trans.set_winding_nominal_capacity_in_MVA(PRIMARY_SIDE, TERTIARY_SIDE, s13);
+        trans.set_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(SECONDARY_SIDE, TERTIARY_SIDE, z23);
+        trans.set_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(PRIMARY_SIDE, TERTIARY_SIDE, z13);
+    }
+
+    for(unsigned int i=0; i!=3; ++i)
+    {
+        TRANSFORMER_WINDING_SIDE side = sides[i];
+        bool breaker_status = read_bool();
+        TRANSFORMER_WINDING_CONNECTION_TYPE connection_type = TRANSFORMER_WINDING_CONNECTION_TYPE(read_unsigned_int());
+        double nominal_voltage = read_double();
+        double turn_ratio = read_double();
+        double angle_shift = read_double();
+        RATING rating = read_rating();
+        unsigned int number_of_taps = read_unsigned_int();
+        double max_turn_ratio = read_double();
+        double min_turn_ratio = read_double();
+        double max_angle_shift = read_double();
+        double min_angle_shift = read_double();
+        TRANSFORMER_WINDING_CONTROL_MODE control_mode = TRANSFORMER_WINDING_CONTROL_MODE(read_unsigned_int());
+        unsigned int controlled_bus = read_unsigned_int();
+        double max_voltage = read_double();
+        double min_voltage = read_double();
+        double max_q = read_double();
+        double min_q = read_double();
+        double max_p = read_double();
+        double min_p = read_double();
+
+        trans.set_winding_breaker_status(side, breaker_status);
+        if(controlled_bus!=0)
+            trans.set_winding_controlled_bus(side, controlled_bus);
+        if(side==TERTIARY_SIDE and (not is_three_winding))
+            continue;
+
+        trans.set_winding_connection_type(side, connection_type);
+        trans.set_winding_nominal_voltage_in_kV(side, nominal_voltage);
+        trans.set_winding_turn_ratio_based_on_winding_nominal_voltage_in_pu(side, turn_ratio);
+        trans.set_winding_angle_shift_in_deg(side, angle_shift);
+        trans.set_winding_rating_in_MVA(side, rating);
+        trans.set_winding_number_of_taps(side, number_of_taps);
+        trans.set_winding_max_turn_ratio_based_on_winding_nominal_voltage_in_pu(side, max_turn_ratio);
+        trans.set_winding_min_turn_ratio_based_on_winding_nominal_voltage_in_pu(side, min_turn_ratio);
+        trans.set_winding_max_angle_shift_in_deg(side, max_angle_shift);
+        trans.set_winding_min_angle_shift_in_deg(side, min_angle_shift);
+        trans.set_winding_control_mode(side, control_mode);
+        trans.set_winding_controlled_max_voltage_in_pu(side, max_voltage);
+        trans.set_winding_controlled_min_voltage_in_pu(side, min_voltage);
+        trans.set_controlled_max_reactive_power_into_winding_in_MVar(side, max_q);
+        trans.set_controlled_min_reactive_power_into_winding_in_MVar(side, min_q);
+        trans.set_controlled_max_active_power_into_winding_in_MW(side, max_p);
+        trans.set_controlled_min_active_power_into_winding_in_MW(side, min_p);
+    }
+    read_ownership(trans);
+}
+
+void CASE_SNAPSHOT::save_hvdc(const HVDC& hvdc)
+{
+    HVDC_CONVERTER_SIDE converters[2] = {RECTIFIER, INVERTER};
+
+    write_unsigned_int(hvdc.get_converter_bus(RECTIFIER));
+    write_unsigned_int(hvdc.get_converter_bus(INVERTER));
+    write_string(hvdc.get_identifier());
+    write_string(hvdc.get_name());
+    write_bool(hvdc.get_status());
+    write_unsigned_int(hvdc.get_number_of_poles());
+    write_double(hvdc.get_line_resistance_in_ohm());
+    write_double(hvdc.get_line_inductance_in_mH());
+    write_double(hvdc.get_line_capacitance_in_uF());
+    write_double(hvdc.get_nominal_dc_power_per_pole_in_MW());
+    write_unsigned_int(hvdc.get_side_to_hold_dc_power());
+    write_double(hvdc.get_nominal_dc_current_per_pole_in_kA());
+    write_double(hvdc.get_nominal_dc_voltage_per_pole_in_kV());
+    write_double(hvdc.get_compensating_resistance_to_hold_dc_voltage_in_ohm());
+    write_double(hvdc.get_threshold_dc_voltage_for_constant_power_and_constant_current_mode_in_kV());
+    write_double(hvdc.get_current_power_margin());
+    write_unsigned_int(hvdc.get_meter_end());
+    write_double(hvdc.get_line_dc_current_in_kA());
+
+    for(unsigned int i=0; i!=2; ++i)
+    {
+        HVDC_CONVERTER_SIDE converter = converters[i];
+        write_string(hvdc.get_converter_valve_side_bus_name(converter));
+        write_double(hvdc.get_line_smooting_inductance_in_mH(converter));
+        write_double(hvdc.get_line_smooting_resistance_in_ohm(converter));
+        write_unsigned_int(hvdc.get_converter_operation_mode(converter));
+        write_unsigned_int(hvdc.get_converter_number_of_bridge(converter));
+        write_double(hvdc.get_converter_voltage_drop_per_bridge_in_kV(converter));
+        write_double(hvdc.get_converter_max_alpha_or_gamma_in_deg(converter));
+        write_double(hvdc.get_converter_min_alpha_or_gamma_in_deg(converter));
+        write_double(hvdc.get_converter_transformer_grid_side_base_voltage_in_kV(converter));
+        write_double(hvdc.get_converter_transformer_converter_side_base_voltage_in_kV(converter));
+        write_complex(hvdc.get_converter_transformer_impedance_in_ohm(converter));
+        write_complex(hvdc.get_converter_transformer_admittance_in_siemens(converter));
+        write_double(hvdc.get_converter_transformer_max_tap_in_pu(converter));
+        write_double(hvdc.get_converter_transformer_min_tap_in_pu(converter));
+        write_unsigned_int(hvdc.get_converter_transformer_number_of_taps(converter));
+        write_double(hvdc.get_converter_alpha_or_gamma_in_deg(converter));
+        write_double(hvdc.get_converter_transformer_tap_in_pu(converter));
+        write_double(hvdc.get_converter_dc_voltage_in_kV(converter));
+        write_double(hvdc.get_converter_dc_current_in_kA(converter));
+    }
+    write_ownership(hvdc);
+}
+
+void CASE_SNAPSHOT::load_hvdc(HVDC& hvdc)
+{
+    HVDC_CONVERTER_SIDE converters[2] = {RECTIFIER, INVERTER};
+
+    unsigned int rectifier_bus = read_unsigned_int();
+    unsigned int inverter_bus = read_unsigned_int();
+    if(rectifier_bus!=0)
+        hvdc.set_converter_bus(RECTIFIER, rectifier_bus);
+    if(inverter_bus!=0)
+        hvdc.set_converter_bus(INVERTER, inverter_bus);
+    hvdc.set_identifier(read_string());
+    hvdc.set_name(read_string());
+    hvdc.set_status(read_bool());
+    hvdc.set_number_of_poles(HVDC_POLE(read_unsigned_int()));
+    hvdc.set_line_resistance_in_ohm(read_double());
+    hvdc.set_line_inductance_in_mH(read_double());
+    hvdc.set_line_capacitance_in_uF(read_double());
+    hvdc.set_nominal_dc_power_per_pole_in_MW(read_double());
+    hvdc.set_side_to_hold_power(HVDC_CONVERTER_SIDE(read_unsigned_int()));
+    hvdc.set_nominal_dc_current_per_pole_in_kA(read_double());
+    hvdc.set_nominal_dc_voltage_per_pole_in_kV(read_double());
+    hvdc.set_compensating_resistance_to_hold_dc_voltage_in_ohm(read_double());
+    hvdc.set_threshold_dc_voltage_for_constant_power_and_constant_current_mode_in_kV(read_double());
+    hvdc.set_current_power_margin(read_double());
+    hvdc.set_meter_end(HVDC_CONVERTER_SIDE(read_unsigned_int()));
+    hvdc.set_line_dc_current_in_kA(read_double());
+
+    for(unsigned int i=0; i!=2; ++i)
+    {
+        HVDC_CONVERTER_SIDE converter = converters[i];
+        hvdc.set_converter_valve_side_bus_name(converter, read_string());
+        hvdc.set_line_smooting_inductance_in_mH(converter, read_double());
+        hvdc.set_line_smooting_resistance_in_ohm(converter, read_double());
+        hvdc.set_converter_operation_mode(converter, HVDC_OPERATION_MODE(read_unsigned_int()));
+        hvdc.set_converter_number_of_bridge(converter, read_unsigned_int());
+        hvdc.set_converter_voltage_drop_per_bridge_in_kV(converter, read_double());
+        hvdc.set_converter_max_alpha_or_gamma_in_deg(converter, read_double());
+        hvdc.set_converter_min_alpha_or_gamma_in_deg(converter, read_double());
+        hvdc.set_converter_transformer_grid_side_base_voltage_in_kV(converter, read_double());
+        hvdc.set_converter_transformer_converter_side_base_voltage_in_kV(converter, read_double());
+        hvdc.set_converter_transformer_impedance_in_ohm(converter, read_complex());
+        hvdc.set_converter_transformer_admittance_in_siemens(converter, read_complex());
+        hvdc.set_converter_transformer_max_tap_in_pu(converter, read_double());
+        hvdc.set_converter_transformer_min_tap_in_pu(converter, read_double());
+        hvdc.set_converter_transformer_number_of_taps(converter, read_unsigned_int());
+        hvdc.set_converter_alpha_or_gamma_in_deg(converter, read_double());
+        hvdc.set_converter_transformer_tap_in_pu(converter, read_double());
+        hvdc.set_converter_dc_voltage_in_kV(converter, read_double());
+        hvdc.set_converter_dc_current_in_kA(converter, read_double());
+    }
+    read_ownership(hvdc);
+}
+
+void CASE_SNAPSHOT::save_equivalent_device(const EQUIVALENT_DEVICE& edevice)
+{
+    write_unsigned_int(edevice.get_equivalent_device_bus());
+    write_string(edevice.get_identifier());
+    write_bool(edevice.get_status());
+    write_bool(edevice.get_equivalent_voltage_source_status());
+    write_bool(edevice.get_equivalent_load_status());
+    write_complex(edevice.get_equivalent_voltage_source_voltage_in_pu());
+    write_complex(edevice.get_equivalent_voltage_source_impedance_in_pu());
+    write_complex(edevice.get_equivalent_nominal_constant_power_load_in_MVA());
+    write_complex(edevice.get_equivalent_nominal_constant_current_load_in_MVA());
+    write_complex(edevice.get_equivalent_nominal_constant_impedance_load_in_MVA());
+}
+
+void CASE_SNAPSHOT::load_equivalent_device(EQUIVALENT_DEVICE& edevice)
+{
+    edevice.set_equivalent_device_bus(read_unsigned_int());
+    edevice.set_identifier(read_string());
+    edevice.set_status(read_bool());
+    edevice.set_equivalent_voltage_source_status(read_bool());
+    edevice.set_equivalent_load_status(read_bool());
+    edevice.set_equivalent_voltage_source_voltage_in_pu(read_complex());
+    edevice.set_equivalent_voltage_source_impedance_in_pu(read_complex());
+    edevice.set_equivalent_nominal_constant_power_load_in_MVA(read_complex());
+    edevice.set_equivalent_nominal_constant_current_load_in_MVA(read_complex());
+    edevice.set_equivalent_nominal_constant_impedance_load_in_MVA(read_complex());
+}
+
+void CASE_SNAPSHOT::save_dynamic_model_records()
+{
+    vector<string> records = get_toolkit().get_all_dynamic_model_records();
+    unsigned int n = records.size();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+        write_string(records[i]);
+}
+
+void CASE_SNAPSHOT::load_dynamic_model_records()
+{
+    unsigned int n = read_unsigned_int();
+    vector<string> records;
+    records.reserve(n);
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+        records.push_back(read_string());
+    if(not snapshot_corrupted)
+        get_toolkit().load_dynamic_model_records(records);
+}
+
+void CASE_SNAPSHOT::write_unsigned_int(unsigned int value)
+{
+    snapshot_buffer.append((const char*)(&value), sizeof(value));
+}
+
+void CASE_SNAPSHOT::write_unsigned_long_long(unsigned long long value)
+{
+    snapshot_buffer.append((const char*)(&value), sizeof(value));
+}
+
+void CASE_SNAPSHOT::write_bool(bool value)
+{
+    snapshot_buffer.push_back(value?1:0);
+}
+
+void CASE_SNAPSHOT::write_double(double value)
+{
+    snapshot_buffer.append((const char*)(&value), sizeof(value));
+}
+
+void CASE_SNAPSHOT::write_complex(const complex<double>& value)
+{
+    write_double(value.real());
+    write_double(value.imag());
+}
+
+void CASE_SNAPSHOT::write_string(const string& value)
+{
+    write_unsigned_int(value.size());
+    snapshot_buffer.append(value);
+}
+
+void CASE_SNAPSHOT::write_rating(const RATING& rating)
+{
+    write_double(rating.get_rating_A_MVA());
+    write_double(rating.get_rating_B_MVA());
+    write_double(rating.get_rating_C_MVA());
+}
+
+void CASE_SNAPSHOT::write_fault(const FAULT& fault)
+{
+    write_unsigned_int(fault.get_fault_type());
+    write_complex(fault.get_fault_shunt_in_pu());
+}
+
+void CASE_SNAPSHOT::write_ownership(const NONBUS_DEVICE& device)
+{
+    unsigned int n = device.get_owner_count();
+    write_unsigned_int(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        write_unsigned_int(device.get_owner_of_index(i));
+        write_double(device.get_fraction_of_owner_of_index(i));
+    }
+}
+
+unsigned int CASE_SNAPSHOT::read_unsigned_int()
+{
+    unsigned int value = 0;
+    if(snapshot_position+sizeof(value)>snapshot_size)
+    {
+        snapshot_corrupted = true;
+        return value;
+    }
+    memcpy(&value, snapshot_data+snapshot_position, sizeof(value));
+    snapshot_position += sizeof(value);
+    return value;
+}
+
+unsigned long long CASE_SNAPSHOT::read_unsigned_long_long()
+{
+    unsigned long long value = 0;
+    if(snapshot_position+sizeof(value)>snapshot_size)
+    {
+        snapshot_corrupted = true;
+        return value;
+    }
+    memcpy(&value, snapshot_data+snapshot_position, sizeof(value));
+    snapshot_position += sizeof(value);
+    return value;
+}
+
+bool CASE_SNAPSHOT::read_bool()
+{
+    if(snapshot_position+1>snapshot_size)
+    {
+        snapshot_corrupted = true;
+        return false;
+    }
+    bool value = (snapshot_data[snapshot_position]!=0);
+    snapshot_position += 1;
+    return value;
+}
+
+double CASE_SNAPSHOT::read_double()
+{
+    double value = 0.0;
+    if(snapshot_position+sizeof(value)>snapshot_size)
+    {
+        snapshot_corrupted = true;
+        return value;
+    }
+    memcpy(&value, snapshot_data+snapshot_position, sizeof(value));
+    snapshot_position += sizeof(value);
+    return value;
+}
+
+complex<double> CASE_SNAPSHOT::read_complex()
+{
+    double real = read_double();
+    double imag = read_double();
+    return complex<double>(real, imag);
+}
+
+string CASE_SNAPSHOT::read_string()
+{
+    unsigned int n = read_unsigned_int();
+    if(snapshot_position+n>snapshot_size)
+    {
+        snapshot_corrupted = true;
+        return "";
+    }
+    string value(snapshot_data+snapshot_position, n);
+    snapshot_position += n;
+    return value;
+}
+
+RATING CASE_SNAPSHOT::read_rating()
+{
+    RATING rating;
+    rating.set_rating_A_MVA(read_double());
+    rating.set_rating_B_MVA(read_double());
+    rating.set_rating_C_MVA(read_double());
+    return rating;
+}
+
+FAULT CASE_SNAPSHOT::read_fault()
+{
+    FAULT fault;
+    fault.set_fault_type(FAULT_TYPE(read_unsigned_int()));
+    fault.set_fault_shunt_in_pu(read_complex());
+    return fault;
+}
+
+void CASE_SNAPSHOT::read_ownership(NONBUS_DEVICE& device)
+{
+    OWNERSHIP ownership;
+    unsigned int n = read_unsigned_int();
+    for(unsigned int i=0; i!=n and (not snapshot_corrupted); ++i)
+    {
+        unsigned int owner = read_unsigned_int();
+        double fraction = read_double();
+        ownership.append_owner_and_its_fraction(owner, fraction);
+    }
+    device.set_ownership(ownership);
+}
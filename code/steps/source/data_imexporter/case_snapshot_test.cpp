@@ -0,0 +1,274 @@
+#ifdef _MSC_VER
+	#pragma warning (disable: 4290)
+#endif
+#include "cpptest.h"
+#include "header/basic/test_macro.h"
+#include "header/data_imexporter/case_snapshot_test.h"
+#include "header/apis/steps_api.h"
+#include "header/basic/utility.h"
+#include "header/steps_namespace.h"
+#include "header/meter/meter_setter.h"
+
+#include <cstdlib>
+#include <cstring>
+#include <istream>
+#include <iostream>
+#include <fstream>
+#include <cstdio>
+#include <map>
+
+#ifdef ENABLE_STEPS_TEST
+using namespace std;
+
+CASE_SNAPSHOT_TEST::CASE_SNAPSHOT_TEST()
+{
+    TEST_ADD(CASE_SNAPSHOT_TEST::test_record_case_source_files);
+    TEST_ADD(CASE_SNAPSHOT_TEST::test_save_and_load_case_snapshot);
+    TEST_ADD(CASE_SNAPSHOT_TEST::test_run_dynamic_simulation_with_loaded_case_snapshot);
+    TEST_ADD(CASE_SNAPSHOT_TEST::test_reject_stale_case_snapshot);
+    TEST_ADD(CASE_SNAPSHOT_TEST::test_reject_case_snapshot_with_missing_source_file);
+}
+
+void CASE_SNAPSHOT_TEST::setup()
+{
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+    psdb.set_allowed_max_bus_number(100000);
+}
+
+void CASE_SNAPSHOT_TEST::tear_down()
+{
+    default_toolkit.clear();
+
+    show_test_end_information();
+}
+
+void CASE_SNAPSHOT_TEST::copy_file(const string& source, const string& destination)
+{
+    ifstream fin(source, ios::in|ios::binary);
+    ofstream fout(destination, ios::out|ios::binary|ios::trunc);
+    fout<<fin.rdbuf();
+}
+
+void CASE_SNAPSHOT_TEST::test_record_case_source_files()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"CASE_SNAPSHOT_TEST");
+
+    char raw_file[] = "../../../bench/ieee39.raw";
+    char dyr_file[] = "../../../bench/IEEE39.dyr";
+    char missing_file[] = "../../../bench/not_existing_file.dyr";
+    char file_type[] = "PSSE";
+
+    api_load_powerflow_data_from_file(raw_file, file_type);
+    vector<string> files = default_toolkit.get_case_source_files();
+    vector<unsigned long long> checksums = default_toolkit.get_case_source_file_checksums();
+    TEST_ASSERT(files.size()==1);
+    TEST_ASSERT(checksums.size()==1);
+    TEST_ASSERT(files[0]==raw_file);
+    TEST_ASSERT(checksums[0]==get_checksum_of_file(raw_file));
+
+    api_load_dynamic_data_from_file(dyr_file, file_type);
+    files = default_toolkit.get_case_source_files();
+    checksums = default_toolkit.get_case_source_file_checksums();
+    TEST_ASSERT(files.size()==2);
+    TEST_ASSERT(files[1]==dyr_file);
+    TEST_ASSERT(checksums[1]==get_checksum_of_file(dyr_file));
+
+    api_load_dynamic_data_from_file(missing_file, file_type);
+    files = default_toolkit.get_case_source_files();
+    TEST_ASSERT(files.size()==2);
+
+    api_load_powerflow_data_from_file(raw_file, file_type);
+    files = default_toolkit.get_case_source_files();
+    TEST_ASSERT(files.size()==1);
+    TEST_ASSERT(files[0]==raw_file);
+}
+
+void CASE_SNAPSHOT_TEST::test_save_and_load_case_snapshot()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"CASE_SNAPSHOT_TEST");
+
+    char raw_file[] = "../../../bench/ieee39.raw";
+    char dyr_file[] = "../../../bench/IEEE39.dyr";
+    char file_type[] = "PSSE";
+    string snapshot_file = "test_log/case_snapshot_ieee39.snp";
+
+    api_load_powerflow_data_from_file(raw_file, file_type);
+    api_load_dynamic_data_from_file(dyr_file, file_type);
+
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+    psdb.get_bus(30)->set_equivalent_bus_number(2);
+    unsigned int nbus = psdb.get_bus_count();
+    unsigned int ngen = psdb.get_generator_count();
+    unsigned int nwtgen = psdb.get_wt_generator_count();
+    unsigned int nload = psdb.get_load_count();
+    unsigned int nline = psdb.get_line_count();
+    unsigned int ntrans = psdb.get_transformer_count();
+    double v = psdb.get_bus_positive_sequence_voltage_in_pu(30);
+    DEVICE_ID did = get_generator_device_id(30, "1");
+    GENERATOR* gen = psdb.get_generator(did);
+    double pgen = gen->get_p_generation_in_MW();
+    string gen_model = gen->get_sync_generator_model()->get_model_name();
+    string exciter_model = gen->get_exciter_model()->get_model_name();
+    vector<string> files = default_toolkit.get_case_source_files();
+    vector<unsigned long long> checksums = default_toolkit.get_case_source_file_checksums();
+
+    CASE_SNAPSHOT snapshot(default_toolkit);
+    TEST_ASSERT(snapshot.save_case_snapshot(snapshot_file)==true);
+
+    POWERFLOW_SOLVER& powerflow_solver = default_toolkit.get_powerflow_solver();
+    powerflow_solver.set_allowed_max_active_power_imbalance_in_MW(0.00001);
+    powerflow_solver.set_allowed_max_reactive_power_imbalance_in_MVar(0.00001);
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    TEST_ASSERT(powerflow_solver.is_converged()==true);
+    vector<BUS*> buses = psdb.get_all_buses();
+    map<unsigned int, double> voltages, angles;
+    for(unsigned int i=0; i!=nbus; ++i)
+    {
+        voltages[buses[i]->get_bus_number()] = buses[i]->get_positive_sequence_voltage_in_pu();
+        angles[buses[i]->get_bus_number()] = buses[i]->get_positive_sequence_angle_in_deg();
+    }
+
+    default_toolkit.clear();
+    TEST_ASSERT(psdb.get_bus_count()==0);
+
+    TEST_ASSERT(snapshot.load_case_snapshot(snapshot_file)==true);
+    TEST_ASSERT(psdb.get_bus_count()==nbus);
+    TEST_ASSERT(psdb.get_generator_count()==ngen);
+    TEST_ASSERT(psdb.get_wt_generator_count()==nwtgen);
+    TEST_ASSERT(psdb.get_load_count()==nload);
+    TEST_ASSERT(psdb.get_line_count()==nline);
+    TEST_ASSERT(psdb.get_transformer_count()==ntrans);
+    TEST_ASSERT(psdb.get_bus_positive_sequence_voltage_in_pu(30)==v);
+    TEST_ASSERT(psdb.get_bus(30)->get_equivalent_bus_number()==2);
+    gen = psdb.get_generator(did);
+    TEST_ASSERT(gen!=NULL);
+    TEST_ASSERT(gen->get_p_generation_in_MW()==pgen);
+    TEST_ASSERT(gen->get_sync_generator_model()!=NULL);
+    TEST_ASSERT(gen->get_sync_generator_model()->get_model_name()==gen_model);
+    TEST_ASSERT(gen->get_exciter_model()!=NULL);
+    TEST_ASSERT(gen->get_exciter_model()->get_model_name()==exciter_model);
+    TEST_ASSERT(default_toolkit.get_case_source_files()==files);
+    TEST_ASSERT(default_toolkit.get_case_source_file_checksums()==checksums);
+
+    powerflow_solver.set_allowed_max_active_power_imbalance_in_MW(0.00001);
+    powerflow_solver.set_allowed_max_reactive_power_imbalance_in_MVar(0.00001);
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    TEST_ASSERT(powerflow_solver.is_converged()==true);
+    buses = psdb.get_all_buses();
+    TEST_ASSERT(buses.size()==nbus);
+    for(unsigned int i=0; i!=nbus; ++i)
+    {
+        unsigned int bus = buses[i]->get_bus_number();
+        TEST_ASSERT(voltages.count(bus)==1);
+        TEST_ASSERT(fabs(buses[i]->get_positive_sequence_voltage_in_pu()-voltages[bus])<1e-8);
+        TEST_ASSERT(fabs(buses[i]->get_positive_sequence_angle_in_deg()-angles[bus])<1e-6);
+    }
+}
+
+void CASE_SNAPSHOT_TEST::test_run_dynamic_simulation_with_loaded_case_snapshot()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"CASE_SNAPSHOT_TEST");
+
+    char raw_file[] = "../../../bench/IEEE9.raw";
+    char dyr_file[] = "../../../bench/IEEE9.dyr";
+    char file_type[] = "PSSE";
+    string snapshot_file = "test_log/case_snapshot_ieee9.snp";
+
+    api_load_powerflow_data_from_file(raw_file, file_type);
+    api_load_dynamic_data_from_file(dyr_file, file_type);
+
+    POWERFLOW_SOLVER& powerflow_solver = default_toolkit.get_powerflow_solver();
+    powerflow_solver.set_allowed_max_active_power_imbalance_in_MW(0.00001);
+    powerflow_solver.set_allowed_max_reactive_power_imbalance_in_MVar(0.00001);
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    TEST_ASSERT(powerflow_solver.is_converged()==true);
+
+    CASE_SNAPSHOT snapshot(default_toolkit);
+    TEST_ASSERT(snapshot.save_case_snapshot(snapshot_file)==true);
+
+    DYNAMICS_SIMULATOR& simulator = default_toolkit.get_dynamic_simulator();
+    DEVICE_ID did = get_generator_device_id(2, "1");
+    vector<double> angles[2];
+    for(unsigned int run=0; run!=2; ++run)
+    {
+        if(run==1)
+        {
+            default_toolkit.clear();
+            TEST_ASSERT(snapshot.load_case_snapshot(snapshot_file)==true);
+        }
+
+        METER_SETTER setter(default_toolkit);
+        METER meter = setter.prepare_generator_rotor_angle_in_deg_meter(did);
+        TEST_ASSERT(meter.is_valid()==true);
+
+        simulator.set_csv_file_export_enable_flag(false);
+        simulator.set_output_file("");
+        simulator.start();
+        simulator.run_to(0.1);
+        simulator.set_bus_fault(7, complex<double>(0.0, -2e5));
+        simulator.run_to(0.2);
+        simulator.clear_bus_fault(7);
+        while(simulator.get_dynamic_simulation_time_in_s()<1.0-FLOAT_EPSILON)
+        {
+            simulator.run_a_step();
+            angles[run].push_back(meter.get_meter_value());
+        }
+        simulator.stop();
+    }
+
+    TEST_ASSERT(angles[0].size()!=0);
+    TEST_ASSERT(angles[0].size()==angles[1].size());
+    unsigned int n = angles[0].size();
+    for(unsigned int i=0; i!=n; ++i)
+        TEST_ASSERT(fabs(angles[0][i]-angles[1][i])<1e-6);
+}
+
+void CASE_SNAPSHOT_TEST::test_reject_stale_case_snapshot()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"CASE_SNAPSHOT_TEST");
+
+    char raw_file[] = "test_log/case_snapshot_stale_ieee39.raw";
+    char file_type[] = "PSSE";
+    string snapshot_file = "test_log/case_snapshot_stale_ieee39.snp";
+
+    copy_file("../../../bench/ieee39.raw", raw_file);
+    api_load_powerflow_data_from_file(raw_file, file_type);
+
+    CASE_SNAPSHOT snapshot(default_toolkit);
+    TEST_ASSERT(snapshot.save_case_snapshot(snapshot_file)==true);
+    TEST_ASSERT(snapshot.load_case_snapshot(snapshot_file)==true);
+
+    ofstream fout(raw_file, ios::out|ios::app);
+    fout<<"changed after snapshot is saved\n";
+    fout.close();
+
+    default_toolkit.clear();
+    TEST_ASSERT(snapshot.load_case_snapshot(snapshot_file)==false);
+    TEST_ASSERT(default_toolkit.get_power_system_database().get_bus_count()==0);
+
+    copy_file("../../../bench/ieee39.raw", raw_file);
+    TEST_ASSERT(snapshot.load_case_snapshot(snapshot_file)==true);
+}
+
+void CASE_SNAPSHOT_TEST::test_reject_case_snapshot_with_missing_source_file()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"CASE_SNAPSHOT_TEST");
+
+    char raw_file[] = "test_log/case_snapshot_missing_ieee39.raw";
+    char file_type[] = "PSSE";
+    string snapshot_file = "test_log/case_snapshot_missing_ieee39.snp";
+
+    copy_file("../../../bench/ieee39.raw", raw_file);
+    api_load_powerflow_data_from_file(raw_file, file_type);
+
+    CASE_SNAPSHOT snapshot(default_toolkit);
+    TEST_ASSERT(snapshot.save_case_snapshot(snapshot_file)==true);
+
+    remove(raw_file);
+
+    default_toolkit.clear();
+    TEST_ASSERT(snapshot.load_case_snapshot(snapshot_file)==false);
+    TEST_ASSERT(default_toolkit.get_power_system_database().get_bus_count()==0);
+}
+
+#endif
@@ -2,6 +2,7 @@
 #include "header/STEPS.h"
 #include "header/basic/utility.h"
 #include <cstdio>
+#include <cstring>
 #include <iostream>
 
 using namespace std;
@@ -14,6 +15,7 @@ DATA_IMEXPORTER::DATA_IMEXPORTER(STEPS& toolkit)
     set_export_zero_impedance_line_logic(true);
     set_export_zero_impedance_line_logic(true);
     set_powerflow_data_save_mode(SAVE_TO_KEEP_ORIGINAL_BUS_ORDER);
+    clear_data_file_checksum();
 }
 
 DATA_IMEXPORTER::~DATA_IMEXPORTER()
@@ -25,6 +27,45 @@ STEPS& DATA_IMEXPORTER::get_toolkit() const
 {
     return *toolkit;
 }
+
+void DATA_IMEXPORTER::clear_data_file_checksum()
+{
+    data_file_checksum = get_checksum_of_text("", 0);
+    data_file_loaded = false;
+}
+
+void DATA_IMEXPORTER::update_data_file_checksum(const char* data)
+{
+    // checksum of data file is updated with every line when the file is read, so that the file is not read again
+    data_file_checksum = get_checksum_of_text(data, strlen(data), data_file_checksum);
+}
+
+void DATA_IMEXPORTER::update_data_file_checksum_with_rest_of_file(FILE* fid)
+{
+    // called if reading of data file is stopped before the end of file
+    char buffer[4096];
+    size_t n = fread(buffer, 1, 4096, fid);
+    while(n>0)
+    {
+        data_file_checksum = get_checksum_of_text(buffer, n, data_file_checksum);
+        n = fread(buffer, 1, 4096, fid);
+    }
+}
+
+void DATA_IMEXPORTER::set_data_file_loaded_flag(bool flag)
+{
+    data_file_loaded = flag;
+}
+
+unsigned long long DATA_IMEXPORTER::get_data_file_checksum() const
+{
+    return data_file_checksum;
+}
+
+bool DATA_IMEXPORTER::is_data_file_loaded() const
+{
+    return data_file_loaded;
+}
 void DATA_IMEXPORTER::set_base_frequency_in_Hz(double fbase)
 {
     base_frequency_in_Hz = fbase;
@@ -43,6 +43,7 @@ void PSSE_IMEXPORTER::load_dynamic_data_into_ram(string file)
     ostringstream osstream;
 
     dyr_data_in_ram.clear();
+    clear_data_file_checksum();
 
     FILE* fid = fopen(file.c_str(),"rt");
     if(fid == NULL)
@@ -69,6 +70,7 @@ void PSSE_IMEXPORTER::load_dynamic_data_into_ram(string file)
             }
             break;
         }
+        update_data_file_checksum(buffer);
         sbuffer = buffer;
         size_t index_of_slash = sbuffer.find('/');
         if(index_of_slash==string::npos)
@@ -90,6 +92,7 @@ void PSSE_IMEXPORTER::load_dynamic_data_into_ram(string file)
         }
     }
     fclose(fid);
+    set_data_file_loaded_flag(true);
 
     //for(unsigned int i=0; i<dyr_data_in_ram.size(); ++i)
     //    cout<<dyr_data_in_ram[i]<<endl;
@@ -94,6 +94,7 @@ void PSSE_IMEXPORTER::load_powerflow_data_into_ram(string file)
     STEPS& toolkit = get_toolkit();
 
     raw_data_in_ram.clear();
+    clear_data_file_checksum();
 
     FILE* fid = fopen(file.c_str(),"rt");
     if(fid == NULL)
@@ -115,6 +116,7 @@ void PSSE_IMEXPORTER::load_powerflow_data_into_ram(string file)
         fclose(fid);
         return;
     }
+    update_data_file_checksum(buffer);
     sbuffer = trim_psse_comment(buffer);
     sbuffer = trim_string(sbuffer);
     data_of_one_type.push_back(sbuffer);
@@ -130,6 +132,7 @@ void PSSE_IMEXPORTER::load_powerflow_data_into_ram(string file)
             fclose(fid);
             return;
         }
+        update_data_file_checksum(buffer);
         sbuffer = trim_psse_comment(buffer);
         sbuffer = trim_string(sbuffer);
         data_of_one_type.push_back(sbuffer);
@@ -149,6 +152,7 @@ void PSSE_IMEXPORTER::load_powerflow_data_into_ram(string file)
             }
             break;
         }
+        update_data_file_checksum(buffer);
         sbuffer = trim_psse_comment(buffer);
         sbuffer = trim_string(sbuffer);
         if(sbuffer.size()!=0)
@@ -166,7 +170,9 @@ void PSSE_IMEXPORTER::load_powerflow_data_into_ram(string file)
         else
             break;
     }
+    update_data_file_checksum_with_rest_of_file(fid);
     fclose(fid);
+    set_data_file_loaded_flag(raw_data_in_ram.size()!=0);
 }
 
 string PSSE_IMEXPORTER::trim_psse_comment(string str)
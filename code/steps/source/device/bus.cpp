@@ -431,6 +431,11 @@ complex<double> BUS::get_positive_sequence_complex_voltage_in_pu() const
     return positive_sequence_voltage_in_pu*positive_sequence_Euler_complex_number;
 }
 
+complex<double> BUS::get_positive_sequence_Euler_complex_number() const
+{
+    return positive_sequence_Euler_complex_number;
+}
+
 complex<double> BUS::get_positive_sequence_complex_voltage_in_kV() const
 {
     return base_voltage_in_kV*positive_sequence_voltage_in_pu*positive_sequence_Euler_complex_number;
@@ -632,7 +637,12 @@ void BUS::copy_from_const_bus(const BUS& bus)
     set_owner_number(bus.get_owner_number());
     set_positive_sequence_voltage_in_pu(bus.get_positive_sequence_voltage_in_pu());
     set_positive_sequence_angle_in_rad(bus.get_positive_sequence_angle_in_rad());
+    set_normal_voltage_upper_limit_in_pu(bus.get_normal_voltage_upper_limit_in_pu());
+    set_normal_voltage_lower_limit_in_pu(bus.get_normal_voltage_lower_limit_in_pu());
+    set_emergency_voltage_upper_limit_in_pu(bus.get_emergency_voltage_upper_limit_in_pu());
+    set_emergency_voltage_lower_limit_in_pu(bus.get_emergency_voltage_lower_limit_in_pu());
     set_voltage_to_regulate_in_pu(bus.get_voltage_to_regulate_in_pu());
+    set_equivalent_bus_number(bus.get_equivalent_bus_number());
 
     if(bus.is_faulted())
     {
@@ -524,6 +524,11 @@ void BUS_TEST::test_copy_with_operator_equal()
     bus.set_bus_name("mybus");
     bus.set_bus_type(PV_TYPE);
     bus.set_positive_sequence_voltage_in_pu(1.12);
+    bus.set_normal_voltage_upper_limit_in_pu(1.05);
+    bus.set_normal_voltage_lower_limit_in_pu(0.95);
+    bus.set_emergency_voltage_upper_limit_in_pu(1.15);
+    bus.set_emergency_voltage_lower_limit_in_pu(0.85);
+    bus.set_equivalent_bus_number(1);
     FAULT fault;
     fault.set_fault_type(SINGLE_PHASE_GROUNDED_FAULT);
     fault.set_fault_shunt_in_pu(complex<double>(0.0, -2e10));
@@ -534,6 +539,11 @@ void BUS_TEST::test_copy_with_operator_equal()
     TEST_ASSERT(newbus.get_bus_name()=="mybus");
     TEST_ASSERT(newbus.get_bus_type()==PV_TYPE);
     TEST_ASSERT(newbus.get_positive_sequence_voltage_in_pu()==1.12);
+    TEST_ASSERT(newbus.get_normal_voltage_upper_limit_in_pu()==1.05);
+    TEST_ASSERT(newbus.get_normal_voltage_lower_limit_in_pu()==0.95);
+    TEST_ASSERT(newbus.get_emergency_voltage_upper_limit_in_pu()==1.15);
+    TEST_ASSERT(newbus.get_emergency_voltage_lower_limit_in_pu()==0.85);
+    TEST_ASSERT(newbus.get_equivalent_bus_number()==1);
     TEST_ASSERT(newbus.is_faulted()==true);
     fault = newbus.get_fault();
     TEST_ASSERT(fault.get_fault_type()==SINGLE_PHASE_GROUNDED_FAULT);
@@ -18,8 +18,6 @@ FIXED_SHUNT::~FIXED_SHUNT()
 
 void FIXED_SHUNT::set_shunt_bus(unsigned int shunt_bus)
 {
-    ostringstream osstream;
-
     if(shunt_bus!=0)
     {
         STEPS& toolkit = get_toolkit();
@@ -31,6 +29,7 @@ void FIXED_SHUNT::set_shunt_bus(unsigned int shunt_bus)
         }
         else
         {
+            ostringstream osstream;
             osstream<<"Bus "<<shunt_bus<<" does not exist in the power system database '"<<psdb.get_system_name()<<"' for setting up fixed shunt."<<endl
                     <<"0 will be set to indicate invalid fixed shunt.";
             toolkit.show_information_with_leading_time_stamp(osstream);
@@ -39,6 +38,7 @@ void FIXED_SHUNT::set_shunt_bus(unsigned int shunt_bus)
     }
     else
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up fixed shunt bus."<<endl
                 <<"0 will be set to indicate invalid fixed shunt.";
         STEPS& toolkit = get_toolkit();
@@ -31,7 +31,6 @@ string HVDC::get_converter_side_name(HVDC_CONVERTER_SIDE converter) const
 
 void HVDC::set_converter_bus(HVDC_CONVERTER_SIDE converter, const unsigned int bus)
 {
-    ostringstream osstream;
     string converter_name = get_converter_side_name(converter);
 
     if(bus!=0)
@@ -46,6 +45,7 @@ void HVDC::set_converter_bus(HVDC_CONVERTER_SIDE converter, const unsigned int b
         }
         else
         {
+            ostringstream osstream;
             osstream<<"Bus "<<bus<<" does not exist for setting up "<<converter_name<<" side bus of hvdc link."<<endl
                     <<"0 will be set to indicate invalid hvdc link.";
             toolkit.show_information_with_leading_time_stamp(osstream);
@@ -54,6 +54,7 @@ void HVDC::set_converter_bus(HVDC_CONVERTER_SIDE converter, const unsigned int b
     }
     else
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up "<<converter_name<<" bus of hvdc link."<<endl
                 <<"0 will be set to indicate invalid hvdc link.";
         STEPS& toolkit = get_toolkit();
@@ -263,7 +264,6 @@ void HVDC::set_meter_end(const HVDC_CONVERTER_SIDE converter)
 
 void HVDC::set_converter_operation_mode(HVDC_CONVERTER_SIDE converter, const HVDC_OPERATION_MODE mode)
 {
-    ostringstream osstream;
     string converter_name = get_converter_side_name(converter);
 
     if(converter==RECTIFIER)
@@ -272,6 +272,7 @@ void HVDC::set_converter_operation_mode(HVDC_CONVERTER_SIDE converter, const HVD
             operation_mode[converter] = mode;
         else
         {
+            ostringstream osstream;
             osstream<<"Warning. Neither INVERTER_CONSTANT_VOLTAGE nor INVERTER_CONSTANT_GAMMA is allowed for setting HVDC "<<converter_name<<" operation mode of "<<get_device_name()<<endl
               <<"RECTIFIER_CONSTANT_POWER mode will be set automatically.";
             STEPS& toolkit = get_toolkit();
@@ -285,6 +286,7 @@ void HVDC::set_converter_operation_mode(HVDC_CONVERTER_SIDE converter, const HVD
             operation_mode[converter] = mode;
         else
         {
+            ostringstream osstream;
             osstream<<"Warning. Neither INVERTER_CONSTANT_VOLTAGE nor INVERTER_CONSTANT_GAMMA is allowed for setting HVDC "<<converter_name<<" operation mode of "<<get_device_name()<<endl
                     <<"INVERTER_CONSTANT_VOLTAGE mode will be set automatically.";
             STEPS& toolkit = get_toolkit();
@@ -18,7 +18,6 @@ LINE::~LINE()
 
 void LINE::set_sending_side_bus(unsigned int bus)
 {
-    ostringstream osstream;
     STEPS& toolkit = get_toolkit();
     if(bus!=0)
     {
@@ -30,6 +29,7 @@ void LINE::set_sending_side_bus(unsigned int bus)
         }
         else
         {
+            ostringstream osstream;
             osstream<<"Warning. Bus "<<bus<<" does not exist for setting up sending side bus of line."<<endl
               <<"0 will be set to indicate invalid transmission line.";
             toolkit.show_information_with_leading_time_stamp(osstream);
@@ -38,6 +38,7 @@ void LINE::set_sending_side_bus(unsigned int bus)
     }
     else
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up sending side bus of line."<<endl
           <<"0 will be set to indicate invalid transmission line.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -47,7 +48,6 @@ void LINE::set_sending_side_bus(unsigned int bus)
 
 void LINE::set_receiving_side_bus(unsigned int bus)
 {
-    ostringstream osstream;
     STEPS& toolkit = get_toolkit();
     if(bus!=0)
     {
@@ -59,6 +59,7 @@ void LINE::set_receiving_side_bus(unsigned int bus)
         }
         else
         {
+            ostringstream osstream;
             osstream<<"Warning. Bus "<<bus<<" does not exist for setting up receiving side bus of line."<<endl
                     <<"0 will be set to indicate invalid transmission line.";
             toolkit.show_information_with_leading_time_stamp(osstream);
@@ -68,6 +69,7 @@ void LINE::set_receiving_side_bus(unsigned int bus)
     }
     else
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up receiving side bus of line."<<endl
                 <<"0 will be set to indicate invalid transmission line.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -25,7 +25,6 @@ LOAD::~LOAD()
 
 void LOAD::set_load_bus(unsigned int load_bus)
 {
-    ostringstream osstream;
     STEPS& toolkit = get_toolkit();
 
     if(load_bus!=0)
@@ -34,6 +33,7 @@ void LOAD::set_load_bus(unsigned int load_bus)
 
         if(not psdb.is_bus_exist(load_bus))
         {
+            ostringstream osstream;
             osstream<<"Bus "<<load_bus<<" does not exist for setting up load."<<endl
               <<"0 will be set to indicate invalid load.";
             toolkit.show_information_with_leading_time_stamp(osstream);
@@ -46,6 +46,7 @@ void LOAD::set_load_bus(unsigned int load_bus)
     }
     else
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up load bus."<<endl
           <<"0 will be set to indicate invalid load.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -20,11 +20,10 @@ SOURCE::~SOURCE()
 
 void SOURCE::set_source_bus(unsigned int bus)
 {
-    ostringstream osstream;
-
     STEPS& toolkit = get_toolkit();
     if(bus==0)
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up source bus."<<endl
           <<"0 will be set to indicate invalid source.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -35,6 +34,7 @@ void SOURCE::set_source_bus(unsigned int bus)
     POWER_SYSTEM_DATABASE& psdb = toolkit.get_power_system_database();
     if(not psdb.is_bus_exist(bus))
     {
+        ostringstream osstream;
         osstream<<"Bus "<<bus<<" does not exist for setting up power source."<<endl
           <<"0 will be set to indicate invalid power source.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -81,7 +81,6 @@ void TRANSFORMER::set_magnetizing_admittance_based_on_primary_winding_bus_base_v
 
 void TRANSFORMER::set_winding_bus(TRANSFORMER_WINDING_SIDE winding, unsigned int bus)
 {
-    ostringstream osstream;
     if(bus==0 and winding==TERTIARY_SIDE)
     {
         winding_bus[winding] = 0;
@@ -91,6 +90,7 @@ void TRANSFORMER::set_winding_bus(TRANSFORMER_WINDING_SIDE winding, unsigned int
     STEPS& toolkit = get_toolkit();
     if(bus==0 and winding!=TERTIARY_SIDE)
     {
+        ostringstream osstream;
         osstream<<"Warning. Zero bus number (0) is not allowed for setting up "<<get_winding_name(winding)<<" winding bus of transformer."<<endl
           <<"0 will be set to indicate invalid transformer.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -102,6 +102,7 @@ void TRANSFORMER::set_winding_bus(TRANSFORMER_WINDING_SIDE winding, unsigned int
 
     if(not psdb.is_bus_exist(bus))
     {
+        ostringstream osstream;
         osstream<<"Bus "<<bus<<" does not exist in power system database '"<<psdb.get_system_name()<<"' for setting up "<<get_winding_name(winding)<<" winding bus of transformer."<<endl
           <<"0 will be set to indicate invalid transformer.";
         toolkit.show_information_with_leading_time_stamp(osstream);
@@ -144,7 +145,6 @@ void TRANSFORMER::set_winding_nominal_voltage_in_kV(TRANSFORMER_WINDING_SIDE win
 
 void TRANSFORMER::set_winding_nominal_capacity_in_MVA(TRANSFORMER_WINDING_SIDE winding1, TRANSFORMER_WINDING_SIDE winding2, double s)
 {
-    ostringstream osstream;
     STEPS& toolkit = get_toolkit();
     if(winding1!=winding2)
     {
@@ -168,6 +168,7 @@ void TRANSFORMER::set_winding_nominal_capacity_in_MVA(TRANSFORMER_WINDING_SIDE w
     }
     else
     {
+        ostringstream osstream;
         osstream<<"Warning. The same windings ("<<get_winding_name(winding1)<<") are not allowed to set winding nominal capacity.";
         toolkit.show_information_with_leading_time_stamp(osstream);
         return;
@@ -176,7 +177,6 @@ void TRANSFORMER::set_winding_nominal_capacity_in_MVA(TRANSFORMER_WINDING_SIDE w
 
 void TRANSFORMER::set_leakage_impedance_between_windings_based_on_winding_nominals_in_pu(TRANSFORMER_WINDING_SIDE winding1, TRANSFORMER_WINDING_SIDE winding2, complex<double> z)
 {
-    ostringstream osstream;
     if(winding1!=winding2)
     {
         if(winding1>winding2)
@@ -189,6 +189,7 @@ void TRANSFORMER::set_leakage_impedance_between_windings_based_on_winding_nomina
         if(z==0.0)
         {
             STEPS& toolkit = get_toolkit();
+            ostringstream osstream;
             osstream<<"Warning. The leakage impedance between "<<get_winding_name(winding1)<<" and "<<get_winding_name(winding2)<<" windings is zero for "<<get_device_name()<<endl
                     <<"Correction is required. Check original data.\n"
                     <<"Impedance will be set as 0.001.";
@@ -209,6 +210,7 @@ void TRANSFORMER::set_leakage_impedance_between_windings_based_on_winding_nomina
     else
     {
         STEPS& toolkit = get_toolkit();
+        ostringstream osstream;
         osstream<<"Warning. The same windings ("<<get_winding_name(winding1)<<") are not allowed to set winding leakage impedance.";
         toolkit.show_information_with_leading_time_stamp(osstream);
         return;
@@ -262,8 +264,6 @@ void TRANSFORMER::set_winding_control_mode(TRANSFORMER_WINDING_SIDE winding, TRA
 
 void TRANSFORMER::set_winding_controlled_bus(TRANSFORMER_WINDING_SIDE winding, unsigned int bus)
 {
-    ostringstream osstream;
-
     unsigned int winding_bus = get_winding_bus(winding);
 
     if(bus==0 or bus==winding_bus)
@@ -276,6 +276,7 @@ void TRANSFORMER::set_winding_controlled_bus(TRANSFORMER_WINDING_SIDE winding, u
             winding_controlled_bus[winding] = bus;
         else
         {
+            ostringstream osstream;
             osstream<<"Bus "<<bus<<" does not exist in power system database '"<<psdb.get_system_name()<<"' for setting up controlled bus by "
               <<get_winding_name(winding)<<" winding of "<<get_device_name()<<endl
               <<get_winding_name(winding)<<" winding controlled bus will be set automatically as "<<get_winding_name(winding)<<" winding bus "<<winding_bus<<".";
@@ -408,6 +408,28 @@ void DYNAMIC_MODEL_DATABASE::check_device_model_minimum_time_constants()
     toolkit->show_information_with_leading_time_stamp(osstream);
 }
 
+void DYNAMIC_MODEL_DATABASE::save_model_warehouse(vector<char>& buffer) const
+{
+    buffer.resize(occupied_warehouse_capacity);
+    if(occupied_warehouse_capacity!=0)
+        memcpy((void*)(&buffer[0]), model_warehouse, occupied_warehouse_capacity);
+}
+
+bool DYNAMIC_MODEL_DATABASE::restore_model_warehouse(const vector<char>& buffer)
+{
+    if(buffer.size()!=occupied_warehouse_capacity)
+    {
+        ostringstream osstream;
+        osstream<<"Error. Size of model warehouse to restore ("<<buffer.size()<<"B) is different from current size ("<<occupied_warehouse_capacity<<"B).\n"
+                <<"Dynamic models may have been changed after saving. No model will be restored.";
+        toolkit->show_information_with_leading_time_stamp(osstream);
+        return false;
+    }
+    if(occupied_warehouse_capacity!=0)
+        memcpy((void*)model_warehouse, &buffer[0], occupied_warehouse_capacity);
+    return true;
+}
+
 unsigned int DYNAMIC_MODEL_DATABASE::get_memory_usage_in_bytes()
 {
     ostringstream osstream;
@@ -54,8 +54,7 @@ void ESTR0::clear()
 
 void ESTR0::copy_from_const_model(const ESTR0& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     active_lead_lag_1.set_toolkit(toolkit);
     active_lead_lag_2.set_toolkit(toolkit);
     active_pid_block.set_toolkit(toolkit);
@@ -29,14 +29,32 @@ ARXL::~ARXL()
 
 void ARXL::copy_from_constant_model(const ARXL& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
 
-    p_meters = model.get_P_meters();
+    // meters are rebuilt with toolkit of this model, which may differ from that of the copied model
+    STEPS& toolkit = get_toolkit();
+    vector<METER> meters = model.get_P_meters();
+    unsigned int n = meters.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        METER meter(toolkit);
+        meter.set_device_id(meters[i].get_device_id());
+        meter.set_meter_type(meters[i].get_meter_type());
+        meter.set_meter_side_bus(meters[i].get_meter_side_bus());
+        p_meters.push_back(meter);
+    }
+    meters = model.get_Q_meters();
+    n = meters.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        METER meter(toolkit);
+        meter.set_device_id(meters[i].get_device_id());
+        meter.set_meter_type(meters[i].get_meter_type());
+        meter.set_meter_side_bus(meters[i].get_meter_side_bus());
+        q_meters.push_back(meter);
+    }
     p_delays = model.get_P_delays();
     p_coefficients = model.get_P_coefficients();
-    q_meters = model.get_Q_meters();
     q_delays = model.get_Q_delays();
     q_coefficients = model.get_Q_coefficients();
 }
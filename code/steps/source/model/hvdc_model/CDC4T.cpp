@@ -32,8 +32,7 @@ CDC4T& CDC4T::operator=(const CDC4T& model)
 
 void CDC4T::copy_from_const_model(const CDC4T& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     inverter_dc_voltage_sensor.set_toolkit(toolkit);
     dc_current_sensor.set_toolkit(toolkit);
 
@@ -35,8 +35,7 @@ CDC6T& CDC6T::operator=(const CDC6T& model)
 
 void CDC6T::copy_from_const_model(const CDC6T& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     inverter_dc_voltage_sensor.set_toolkit(toolkit);
     dc_current_sensor.set_toolkit(toolkit);
     rectifier_dc_voltage_sensor.set_toolkit(toolkit);
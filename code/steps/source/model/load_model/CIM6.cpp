@@ -38,8 +38,7 @@ CIM6& CIM6::operator=(const CIM6& model)
 
 void CIM6::copy_from_const_model(const CIM6& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     speed_block.set_toolkit(toolkit);
     transient_block_x_axis.set_toolkit(toolkit);
     subtransient_block_x_axis.set_toolkit(toolkit);
@@ -20,8 +20,6 @@ void IEEL::clear()
 
 void IEEL::copy_from_const_model(const IEEL& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
 
     //this->set_power_system_database(model.toolkit.get_power_system_database());
@@ -51,8 +51,7 @@ void PUFLS::clear()
 
 void PUFLS::copy_from_const_model(const PUFLS& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     frequency_sensor.set_toolkit(toolkit);
 
     clear();
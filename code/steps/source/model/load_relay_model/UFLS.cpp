@@ -40,8 +40,7 @@ void UFLS::clear()
 }
 void UFLS::copy_from_const_model(const UFLS& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     frequency_sensor.set_toolkit(toolkit);
 
     clear();
@@ -40,8 +40,7 @@ void UVLS::clear()
 }
 void UVLS::copy_from_const_model(const UVLS& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     voltage_sensor.set_toolkit(toolkit);
 
     clear();
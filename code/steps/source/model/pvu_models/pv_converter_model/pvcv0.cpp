@@ -38,8 +38,7 @@ void PVCV0::clear()
 
 void PVCV0::copy_from_const_model(const PVCV0& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     active_current_commander.set_toolkit(toolkit);
     LVPL_voltage_sensor.set_toolkit(toolkit);
     reactive_voltage_commander.set_toolkit(toolkit);
@@ -35,8 +35,7 @@ void PVGU1::clear()
 
 void PVGU1::copy_from_const_model(const PVGU1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     active_current_commander.set_toolkit(toolkit);
     LVPL_voltage_sensor.set_toolkit(toolkit);
     reactive_voltage_commander.set_toolkit(toolkit);
@@ -20,8 +20,6 @@ void FILEIRRAD::clear()
 
 void FILEIRRAD::copy_from_const_model(const FILEIRRAD& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
 }
 
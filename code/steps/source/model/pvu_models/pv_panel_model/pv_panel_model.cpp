@@ -31,7 +31,6 @@ PV_PANEL_MODEL& PV_PANEL_MODEL::operator=(const PV_PANEL_MODEL& model)
 
 void PV_PANEL_MODEL::copy_from_const_model(const PV_PANEL_MODEL& model)
 {
-    set_toolkit(model.get_toolkit());
 }
 
 string PV_PANEL_MODEL::get_model_type() const
@@ -31,8 +31,6 @@ PVP0& PVP0::operator=(const PVP0& model)
 
 void PVP0::copy_from_const_model(const PVP0& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
     PV_PANEL_MODEL::copy_from_const_model(model);
 }
@@ -20,8 +20,6 @@ void COMP::clear()
 
 void COMP::copy_from_const_model(const COMP& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
     //this->set_power_system_database(model.toolkit.get_power_system_database());
     //this->set_device_id(model.get_device_id());
@@ -20,8 +20,6 @@ void PSASPVC::clear()
 
 void PSASPVC::copy_from_const_model(const PSASPVC& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
     //this->set_power_system_database(model.toolkit.get_power_system_database());
     //this->set_device_id(model.get_device_id());
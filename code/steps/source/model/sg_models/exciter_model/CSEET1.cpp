@@ -107,8 +107,7 @@ CSEET1& CSEET1::operator=(const CSEET1& model)
 }
 void CSEET1::copy_from_const_model(const CSEET1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     serial_tuner1_lead_lag.set_toolkit(toolkit);
     serial_tuner1_pi.set_toolkit(toolkit);
@@ -59,8 +59,7 @@ void CSEET2::clear()
 }
 void CSEET2::copy_from_const_model(const CSEET2& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     serial_tuner1_lead_lag.set_toolkit(toolkit);
     serial_tuner1_pi.set_toolkit(toolkit);
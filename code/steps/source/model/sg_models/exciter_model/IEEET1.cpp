@@ -28,8 +28,7 @@ void IEEET1::clear()
 
 void IEEET1::copy_from_const_model(const IEEET1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     regulator.set_toolkit(toolkit);
     feedbacker.set_toolkit(toolkit);
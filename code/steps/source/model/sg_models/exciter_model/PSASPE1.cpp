@@ -28,8 +28,7 @@ void PSASPE1::clear()
 }
 void PSASPE1::copy_from_const_model(const PSASPE1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     regulator.set_toolkit(toolkit);
     feedbacker.set_toolkit(toolkit);
@@ -29,8 +29,7 @@ void PSASPE13::clear()
 }
 void PSASPE13::copy_from_const_model(const PSASPE13& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     tuner.set_toolkit(toolkit);
     regulator.set_toolkit(toolkit);
@@ -29,8 +29,7 @@ void PSASPE14::clear()
 
 void PSASPE14::copy_from_const_model(const PSASPE14& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     regulator.set_toolkit(toolkit);
     regulator_pi.set_toolkit(toolkit);
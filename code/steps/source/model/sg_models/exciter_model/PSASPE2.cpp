@@ -34,8 +34,7 @@ void PSASPE2::clear()
 }
 void PSASPE2::copy_from_const_model(const PSASPE2& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     tuner1_lead_lag.set_toolkit(toolkit);
     tuner1_pi.set_toolkit(toolkit);
@@ -27,8 +27,7 @@ void SEXS::clear()
 
 void SEXS::copy_from_const_model(const SEXS& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     phase_tuner.set_toolkit(toolkit);
     exciter.set_toolkit(toolkit);
 
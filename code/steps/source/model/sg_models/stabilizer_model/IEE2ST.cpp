@@ -27,8 +27,7 @@ void IEE2ST::clear()
 
 void IEE2ST::copy_from_const_model(const IEE2ST& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor_1.set_toolkit(toolkit);
     sensor_2.set_toolkit(toolkit);
     filter.set_toolkit(toolkit);
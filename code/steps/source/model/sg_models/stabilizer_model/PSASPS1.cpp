@@ -30,8 +30,7 @@ void PSASPS1::clear()
 
 void PSASPS1::copy_from_const_model(const PSASPS1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     dedc_block.set_toolkit(toolkit);
     phase_tuner_1.set_toolkit(toolkit);
     phase_tuner_2.set_toolkit(toolkit);
@@ -28,8 +28,7 @@ void PSASPS2::clear()
 
 void PSASPS2::copy_from_const_model(const PSASPS2& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor_w.set_toolkit(toolkit);
     sensor_p.set_toolkit(toolkit);
     sensor_t.set_toolkit(toolkit);
@@ -26,8 +26,7 @@ void PSASPS3::clear()
 
 void PSASPS3::copy_from_const_model(const PSASPS3& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     dedc_block_1.set_toolkit(toolkit);
     dedc_block_2.set_toolkit(toolkit);
     phase_tuner_1.set_toolkit(toolkit);
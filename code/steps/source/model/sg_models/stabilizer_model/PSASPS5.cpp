@@ -26,8 +26,7 @@ void PSASPS5::clear()
 
 void PSASPS5::copy_from_const_model(const PSASPS5& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor_1.set_toolkit(toolkit);
     sensor_2.set_toolkit(toolkit);
     dedc_block_1.set_toolkit(toolkit);
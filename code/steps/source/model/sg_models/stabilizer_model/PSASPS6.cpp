@@ -37,8 +37,7 @@ void PSASPS6::clear()
 
 void PSASPS6::copy_from_const_model(const PSASPS6& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     speed_sensor.set_toolkit(toolkit);
     pelec_sensor.set_toolkit(toolkit);
     speed_dedc_block_1.set_toolkit(toolkit);
@@ -23,8 +23,7 @@ void PSASPS8::clear()
 
 void PSASPS8::copy_from_const_model(const PSASPS8& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     sensor.set_toolkit(toolkit);
     phase_tuner_1.set_toolkit(toolkit);
     phase_tuner_2.set_toolkit(toolkit);
@@ -20,8 +20,7 @@ void GENCLS::clear()
 }
 void GENCLS::copy_from_const_model(const GENCLS& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     set_blocks_toolkit(toolkit);
 
     clear();
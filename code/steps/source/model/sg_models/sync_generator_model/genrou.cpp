@@ -19,8 +19,7 @@ void GENROU::clear()
 }
 void GENROU::copy_from_const_model(const GENROU& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     set_blocks_toolkit(toolkit);
 
     clear();
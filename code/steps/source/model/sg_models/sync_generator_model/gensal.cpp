@@ -21,8 +21,7 @@ void GENSAL::clear()
 
 void GENSAL::copy_from_const_model(const GENSAL& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     set_blocks_toolkit(toolkit);
 
     clear();
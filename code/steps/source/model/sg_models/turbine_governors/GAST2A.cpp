@@ -65,8 +65,7 @@ void GAST2A::clear()
 }
 void GAST2A::copy_from_const_model(const GAST2A& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     gas_governor_droop.set_toolkit(toolkit);
     gas_governor_iso.set_toolkit(toolkit);
     gas_fuel_control.set_toolkit(toolkit);
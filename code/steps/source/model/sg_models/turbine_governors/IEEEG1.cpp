@@ -39,8 +39,7 @@ void IEEEG1::clear()
 }
 void IEEEG1::copy_from_const_model(const IEEEG1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     droop.set_toolkit(toolkit);
     servo_motor.set_toolkit(toolkit);
     delayer1.set_toolkit(toolkit);
@@ -50,8 +50,7 @@ void IEEEG1SB::clear()
 }
 void IEEEG1SB::copy_from_const_model(const IEEEG1SB& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     droop.set_toolkit(toolkit);
     servo_motor.set_toolkit(toolkit);
     delayer1.set_toolkit(toolkit);
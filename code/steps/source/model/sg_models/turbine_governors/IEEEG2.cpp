@@ -28,8 +28,7 @@ void IEEEG2::clear()
 }
 void IEEEG2::copy_from_const_model(const IEEEG2& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     droop.set_toolkit(toolkit);
     tuner.set_toolkit(toolkit);
     water_hammer.set_toolkit(toolkit);
@@ -32,8 +32,7 @@ void IEEEG3::clear()
 }
 void IEEEG3::copy_from_const_model(const IEEEG3& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     governor.set_toolkit(toolkit);
     servo_motor.set_toolkit(toolkit);
     feedbacker.set_toolkit(toolkit);
@@ -30,8 +30,7 @@ void IEESGO::clear()
 
 void IEESGO::copy_from_const_model(const IEESGO& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     governor_tuner.set_toolkit(toolkit);
     governor.set_toolkit(toolkit);
     high_pressure_turbine.set_toolkit(toolkit);
@@ -23,8 +23,7 @@ void TGOV1::clear()
 
 void TGOV1::copy_from_const_model(const TGOV1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     governor.set_toolkit(toolkit);
     turbine.set_toolkit(toolkit);
     damping.set_toolkit(toolkit);
@@ -95,8 +95,7 @@ void URCSCT::clear()
 }
 void URCSCT::copy_from_const_model(const URCSCT& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     gas_governor_droop.set_toolkit(toolkit);
     gas_governor_iso.set_toolkit(toolkit);
     gas_valve_positioner.set_toolkit(toolkit);
@@ -38,8 +38,7 @@ void LCFB1::clear()
 
 void LCFB1::copy_from_const_model(const LCFB1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     Pelec_sensor.set_toolkit(toolkit);
     error_integrator.set_toolkit(toolkit);
 
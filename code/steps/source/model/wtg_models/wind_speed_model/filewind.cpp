@@ -45,8 +45,6 @@ void FILEWIND::clear_wind_data()
 
 void FILEWIND::copy_from_const_model(const FILEWIND& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
     set_wind_speed_serial_file(model.get_wind_speed_serial_file());
     load_wind_speed_from_file();
@@ -44,8 +44,6 @@ void AERD0::clear()
 
 void AERD0::copy_from_const_model(const AERD0& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
 
     WT_AERODYNAMIC_MODEL::copy_from_const_model(model);
@@ -38,8 +38,6 @@ AERDF& AERDF::operator=(const AERDF& model)
 
 void AERDF::copy_from_const_model(const AERDF& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
     WT_AERODYNAMIC_MODEL::copy_from_const_model(model);
     set_Cp_file(model.get_Cp_file());
@@ -52,8 +52,6 @@ WT_AERODYNAMIC_MODEL& WT_AERODYNAMIC_MODEL::operator=(const WT_AERODYNAMIC_MODEL
 
 void WT_AERODYNAMIC_MODEL::copy_from_const_model(const WT_AERODYNAMIC_MODEL& model)
 {
-    set_toolkit(model.get_toolkit());
-
     set_number_of_pole_pairs(model.get_number_of_pole_pairs());
     set_generator_to_turbine_gear_ratio(model.get_generator_to_turbine_gear_ratio());
     set_gear_efficiency(model.get_gear_efficiency());
@@ -64,8 +64,7 @@ void WT3E1::clear()
 
 void WT3E1::copy_from_const_model(const WT3E1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     voltage_sensor.set_toolkit(toolkit);
     voltage_regulator_first_order_block.set_toolkit(toolkit);
     voltage_regulator_integrator.set_toolkit(toolkit);
@@ -42,8 +42,7 @@ void WT3G1::clear()
 
 void WT3G1::copy_from_const_model(const WT3G1& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     active_current_commander.set_toolkit(toolkit);
     reactive_voltage_commander.set_toolkit(toolkit);
     PLL_frequency_integrator.set_toolkit(toolkit);
@@ -43,8 +43,7 @@ void WT3P0::clear()
 
 void WT3P0::copy_from_const_model(const WT3P0& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     speed_reference_sensor.set_toolkit(toolkit);
     speed_controller.set_toolkit(toolkit);
     frequency_sensor.set_toolkit(toolkit);
@@ -28,8 +28,6 @@ void WTRLY0::clear()
 
 void WTRLY0::copy_from_const_model(const WTRLY0& model)
 {
-    set_toolkit(model.get_toolkit());
-
     clear();
 
     for(unsigned int i=0; i<STEPS_MAX_RELAY_COUNT; ++i)
@@ -22,8 +22,7 @@ void WT3T0::clear()
 
 void WT3T0::copy_from_const_model(const WT3T0& model)
 {
-    STEPS& toolkit = model.get_toolkit();
-    set_toolkit(toolkit);
+    STEPS& toolkit = get_toolkit();
     shaft_twist_block.set_toolkit(toolkit);
     turbine_inertia_block.set_toolkit(toolkit);
     generator_inertia_block.set_toolkit(toolkit);
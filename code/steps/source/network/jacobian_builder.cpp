@@ -156,27 +156,13 @@ void JACOBIAN_BUILDER::update_jacobian_delta_p_over_angle()
         unsigned int ibus;
         for(unsigned int jbus = 0; jbus!=nbus; ++jbus)
         {
+            // separate jacobians are built with the same pattern of Y matrix, so entries are changed with entry index of Y matrix
             k_end = Y.get_starting_index_of_column(jbus+1);
             for(int k=k_start; k!=k_end; ++k)
             {
                 ibus = Y.get_row_number_of_entry_index(k);
-                if(ibus<=jbus)
-                {
-                    if(ibus<jbus)
-                    {
-                        der = get_jacobian_delta_p_over_angle_of_internal_bus(ibus,jbus);
-                        jacobian_delta_p_over_angle.change_entry_value(ibus,jbus, der);
-                        der = get_jacobian_delta_p_over_angle_of_internal_bus(jbus,ibus);
-                        jacobian_delta_p_over_angle.change_entry_value(jbus,ibus, der);
-                    }
-                    else
-                    {
-                        der = get_jacobian_delta_p_over_angle_of_internal_bus(jbus,jbus);
-                        jacobian_delta_p_over_angle.change_entry_value(jbus,jbus, der);
-                    }
-                }
-                else
-                    break;
+                der = get_jacobian_delta_p_over_angle_of_internal_bus(ibus,jbus);
+                jacobian_delta_p_over_angle.change_real_entry_value(k, der);
             }
             k_start = k_end;
         }
@@ -221,27 +207,13 @@ void JACOBIAN_BUILDER::update_jacobian_delta_p_over_voltage()
         unsigned int ibus;
         for(unsigned int jbus = 0; jbus!=nbus; ++jbus)
         {
+            // separate jacobians are built with the same pattern of Y matrix, so entries are changed with entry index of Y matrix
             k_end = Y.get_starting_index_of_column(jbus+1);
             for(int k=k_start; k!=k_end; ++k)
             {
                 ibus = Y.get_row_number_of_entry_index(k);
-                if(ibus<=jbus)
-                {
-                    if(ibus<jbus)
-                    {
-                        der = get_jacobian_delta_p_over_voltage_of_internal_bus(ibus,jbus);
-                        jacobian_delta_p_over_voltage.change_entry_value(ibus,jbus, der);
-                        der = get_jacobian_delta_p_over_voltage_of_internal_bus(jbus,ibus);
-                        jacobian_delta_p_over_voltage.change_entry_value(jbus,ibus, der);
-                    }
-                    else
-                    {
-                        der = get_jacobian_delta_p_over_voltage_of_internal_bus(jbus,jbus);
-                        jacobian_delta_p_over_voltage.change_entry_value(jbus,jbus, der);
-                    }
-                }
-                else
-                    break;
+                der = get_jacobian_delta_p_over_voltage_of_internal_bus(ibus,jbus);
+                jacobian_delta_p_over_voltage.change_real_entry_value(k, der);
             }
             k_start = k_end;
         }
@@ -288,27 +260,13 @@ void JACOBIAN_BUILDER::update_jacobian_delta_q_over_angle()
         unsigned int ibus;
         for(unsigned int jbus = 0; jbus!=nbus; ++jbus)
         {
+            // separate jacobians are built with the same pattern of Y matrix, so entries are changed with entry index of Y matrix
             k_end = Y.get_starting_index_of_column(jbus+1);
             for(int k=k_start; k!=k_end; ++k)
             {
                 ibus = Y.get_row_number_of_entry_index(k);
-                if(ibus<=jbus)
-                {
-                    if(ibus<jbus)
-                    {
-                        der = get_jacobian_delta_q_over_angle_of_internal_bus(ibus,jbus);
-                        jacobian_delta_q_over_angle.change_entry_value(ibus,jbus, der);
-                        der = get_jacobian_delta_q_over_angle_of_internal_bus(jbus,ibus);
-                        jacobian_delta_q_over_angle.change_entry_value(jbus,ibus, der);
-                    }
-                    else
-                    {
-                        der = get_jacobian_delta_q_over_angle_of_internal_bus(jbus,jbus);
-                        jacobian_delta_q_over_angle.change_entry_value(jbus,jbus, der);
-                    }
-                }
-                else//>
-                    break;
+                der = get_jacobian_delta_q_over_angle_of_internal_bus(ibus,jbus);
+                jacobian_delta_q_over_angle.change_real_entry_value(k, der);
             }
             k_start = k_end;
         }
@@ -354,27 +312,13 @@ void JACOBIAN_BUILDER::update_jacobian_delta_q_over_voltage()
         unsigned int ibus;
         for(unsigned int jbus = 0; jbus!=nbus; ++jbus)
         {
+            // separate jacobians are built with the same pattern of Y matrix, so entries are changed with entry index of Y matrix
             k_end = Y.get_starting_index_of_column(jbus+1);
             for(int k=k_start; k!=k_end; ++k)
             {
                 ibus = Y.get_row_number_of_entry_index(k);
-                if(ibus<=jbus)
-                {
-                    if(ibus<jbus)
-                    {
-                        der = get_jacobian_delta_q_over_voltage_of_internal_bus(ibus,jbus);
-                        jacobian_delta_q_over_voltage.change_entry_value(ibus,jbus, der);
-                        der = get_jacobian_delta_q_over_voltage_of_internal_bus(jbus,ibus);
-                        jacobian_delta_q_over_voltage.change_entry_value(jbus,ibus, der);
-                    }
-                    else
-                    {
-                        der = get_jacobian_delta_q_over_voltage_of_internal_bus(jbus,jbus);
-                        jacobian_delta_q_over_voltage.change_entry_value(jbus,jbus, der);
-                    }
-                }
-                else//>
-                    break;
+                der = get_jacobian_delta_q_over_voltage_of_internal_bus(ibus,jbus);
+                jacobian_delta_q_over_voltage.change_real_entry_value(k, der);
             }
             k_start = k_end;
         }
@@ -1034,7 +978,7 @@ STEPS_SPARSE_MATRIX JACOBIAN_BUILDER::get_decoupled_B_jacobian_with_P_equation_i
     }
 
 
-    static STEPS_SPARSE_MATRIX B_jacobian;
+    STEPS_SPARSE_MATRIX B_jacobian;
 
     B_jacobian.clear();
 
@@ -1133,7 +1077,7 @@ STEPS_SPARSE_MATRIX JACOBIAN_BUILDER::get_decoupled_B_jacobian_with_Q_equation_i
     }
 
 
-    static STEPS_SPARSE_MATRIX B_jacobian;
+    STEPS_SPARSE_MATRIX B_jacobian;
 
     B_jacobian.clear();
 
@@ -4,6 +4,7 @@
 #include <fstream>
 #include <iostream>
 #include <set>
+#include <algorithm>
 using namespace std;
 
 class SUBLINE
@@ -22,6 +23,7 @@ class SUBLINE
 NETWORK_MATRIX::NETWORK_MATRIX(STEPS& toolkit)
 {
     this->toolkit = (&toolkit);
+    network_Y_matrix_build_count = 0;
     clear();
 }
 
@@ -54,6 +56,8 @@ void NETWORK_MATRIX::clear()
     this_Y_matrix_pointer = NULL;
     this_Z_matrix_pointer = NULL;
     this_jacobian.clear();
+
+    ++network_Y_matrix_build_count;
 }
 
 void NETWORK_MATRIX::build_network_Y_matrix()
@@ -69,6 +73,8 @@ void NETWORK_MATRIX::build_network_Y_matrix()
     add_fixed_shunts_to_network();
 
     network_Y1_matrix.compress_and_merge_duplicate_entries();
+
+    ++network_Y_matrix_build_count;
 }
 
 STEPS_COMPLEX_SPARSE_MATRIX& NETWORK_MATRIX::get_network_Y_matrix()
@@ -151,6 +157,8 @@ void NETWORK_MATRIX::build_dynamic_network_Y_matrix()
     add_motor_loads_to_dynamic_network();
 
     network_Y1_matrix.compress_and_merge_duplicate_entries();
+
+    ++network_Y_matrix_build_count;
 }
 
 STEPS_COMPLEX_SPARSE_MATRIX& NETWORK_MATRIX::get_dynamic_network_Y_matrix()
@@ -403,6 +411,70 @@ complex<double> NETWORK_MATRIX::get_mutual_impedance_between_physical_bus_from_t
     return z;
 }
 
+vector<complex<double> > NETWORK_MATRIX::get_network_Z_columns_of_physical_buses_from_this_Y_matrix(const vector<unsigned int>& buses)
+{
+    // columns are solved one by one with the same LU factors, and stored column by column.
+    // column j is the voltage of all internal buses when unit current is injected into buses[j]
+    vector<complex<double> > Z;
+
+    int n = this_Y_matrix_pointer->get_matrix_size();
+    if(n==0 or not this_Y_matrix_pointer->matrix_in_compressed_column_form() or
+       this_Y_matrix_pointer->get_starting_index_of_column(n)==0)
+    {
+        ostringstream osstream;
+        osstream<<"Network Y matrix is not built. No column of network Z matrix will be returned.";
+        toolkit->show_information_with_leading_time_stamp(osstream);
+        return Z;
+    }
+
+    build_this_jacobian_for_getting_impedance_from_this_Y_matrix();
+
+    unsigned int ncol = buses.size();
+    Z.resize(n*ncol, complex<double>(0.0, 0.0));
+
+    int n2 = n+n;
+    vector<double> I(n2, 0.0);
+    for(unsigned int j=0; j!=ncol; ++j)
+    {
+        unsigned int col = get_internal_bus_number_of_physical_bus(buses[j]);
+        unsigned int k_start = j*n;
+        if(col==INDEX_NOT_EXIST)
+        {
+            ostringstream osstream;
+            osstream<<"Bus "<<buses[j]<<" is not in network matrix. NAN will be returned for its column of network Z matrix.";
+            toolkit->show_information_with_leading_time_stamp(osstream);
+            for(int i=0; i<n; ++i)
+                Z[k_start+i] = complex<double>(NAN, NAN);
+            continue;
+        }
+
+        fill(I.begin(), I.end(), 0.0);
+        I[col] = 1.0;
+        this_jacobian.solve_Ax_eq_b(I);
+        for(int i=0; i<n; ++i)
+            Z[k_start+i] = complex<double>(I[i], I[i+n]);
+    }
+    return Z;
+}
+
+vector<complex<double> > NETWORK_MATRIX::get_positive_sequence_network_Z_columns_of_physical_buses(const vector<unsigned int>& buses)
+{
+    set_this_Y_and_Z_matrix_as(get_positive_sequence_network_Y_matrix());
+    return get_network_Z_columns_of_physical_buses_from_this_Y_matrix(buses);
+}
+
+vector<complex<double> > NETWORK_MATRIX::get_negative_sequence_network_Z_columns_of_physical_buses(const vector<unsigned int>& buses)
+{
+    set_this_Y_and_Z_matrix_as(get_negative_sequence_network_Y_matrix());
+    return get_network_Z_columns_of_physical_buses_from_this_Y_matrix(buses);
+}
+
+vector<complex<double> > NETWORK_MATRIX::get_zero_sequence_network_Z_columns_of_physical_buses(const vector<unsigned int>& buses)
+{
+    set_this_Y_and_Z_matrix_as(get_zero_sequence_network_Y_matrix());
+    return get_network_Z_columns_of_physical_buses_from_this_Y_matrix(buses);
+}
+
 complex<double> NETWORK_MATRIX::get_positive_sequence_self_impedance_of_physical_bus(unsigned int bus)
 {
     set_this_Y_and_Z_matrix_as(network_Y1_matrix);
@@ -2265,23 +2337,18 @@ void NETWORK_MATRIX::add_bus_fault_to_dynamic_network()
 
     unsigned int n = buses.size();
 
-    BUS* bus;
-
     for(unsigned int i = 0; i!=n; ++i)
+        add_bus_fault_to_dynamic_network(*(buses[i]));
+}
+
+void NETWORK_MATRIX::add_bus_fault_to_dynamic_network(const BUS& bus)
+{
+    if(bus.get_bus_type()!=OUT_OF_SERVICE and bus.is_faulted())
     {
-        bus = buses[i];
-        if(bus->get_bus_type()!=OUT_OF_SERVICE)
-        {
-            if(not bus->is_faulted())
-                continue;
-            else
-            {
-                FAULT fault = bus->get_fault();
-                complex<double> y = fault.get_fault_shunt_in_pu();
-                unsigned int j = inphno.get_internal_bus_number_of_physical_bus_number(bus->get_bus_number());
-                this_Y_matrix_pointer->add_entry(j,j, y);
-            }
-        }
+        FAULT fault = bus.get_fault();
+        complex<double> y = fault.get_fault_shunt_in_pu();
+        unsigned int j = inphno.get_internal_bus_number_of_physical_bus_number(bus.get_bus_number());
+        this_Y_matrix_pointer->add_entry(j,j, y);
     }
 }
 
@@ -2596,6 +2663,121 @@ void NETWORK_MATRIX::add_motor_load_to_dynamic_network(const LOAD& load)
     }
 }
 
+bool NETWORK_MATRIX::add_device_to_dynamic_network(const DEVICE_ID& did)
+{
+    POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
+    string device_type = did.get_device_type();
+    if(device_type=="BUS")
+    {
+        BUS* bus = psdb.get_bus(did);
+        if(bus==NULL) return false;
+        add_bus_fault_to_dynamic_network(*bus);
+        return true;
+    }
+    if(device_type=="LINE")
+    {
+        LINE* line = psdb.get_line(did);
+        if(line==NULL) return false;
+        if(not line->is_faulted())
+            add_line_to_network(*line);
+        else
+            add_faulted_line_to_dynamic_network(*line);
+        return true;
+    }
+    if(device_type=="TRANSFORMER")
+    {
+        TRANSFORMER* trans = psdb.get_transformer(did);
+        if(trans==NULL) return false;
+        add_transformer_to_network(*trans);
+        return true;
+    }
+    if(device_type=="FIXED SHUNT")
+    {
+        FIXED_SHUNT* shunt = psdb.get_fixed_shunt(did);
+        if(shunt==NULL) return false;
+        add_fixed_shunt_to_network(*shunt);
+        return true;
+    }
+    if(device_type=="GENERATOR")
+    {
+        GENERATOR* gen = psdb.get_generator(did);
+        if(gen==NULL) return false;
+        add_generator_to_dynamic_network(*gen);
+        return true;
+    }
+    if(device_type=="WT GENERATOR")
+    {
+        WT_GENERATOR* gen = psdb.get_wt_generator(did);
+        if(gen==NULL) return false;
+        add_wt_generator_to_dynamic_network(*gen);
+        return true;
+    }
+    if(device_type=="LOAD")
+    {
+        LOAD* load = psdb.get_load(did);
+        if(load==NULL) return false;
+        add_motor_load_to_dynamic_network(*load);
+        return true;
+    }
+    return false;
+}
+
+bool NETWORK_MATRIX::add_device_to_dynamic_network_Y_matrix(const DEVICE_ID& did)
+{
+    return update_dynamic_network_Y_matrix_with_device(did, 1.0);
+}
+
+bool NETWORK_MATRIX::remove_device_from_dynamic_network_Y_matrix(const DEVICE_ID& did)
+{
+    return update_dynamic_network_Y_matrix_with_device(did, -1.0);
+}
+
+bool NETWORK_MATRIX::update_dynamic_network_Y_matrix_with_device(const DEVICE_ID& did, double scale)
+{
+    // entries of the device are added to the built Y matrix in place, so pattern of Y matrix is kept.
+    // false is returned if Y matrix is not built, or the device brings new entries. network Y matrix should be rebuilt then.
+    if(inphno.empty() or network_Y1_matrix.matrix_in_triplet_form())
+        return false;
+
+    STEPS_COMPLEX_SPARSE_MATRIX delta_Y;
+    this_Y_matrix_pointer = &delta_Y;
+    bool device_ok = add_device_to_dynamic_network(did);
+    set_this_Y_and_Z_matrix_as(network_Y1_matrix);
+    if(not device_ok)
+        return false;
+
+    delta_Y.compress_and_merge_duplicate_entries();
+
+    vector<int> index;
+    vector<complex<double> > value;
+    int n = delta_Y.get_matrix_size();
+    int k_start = 0;
+    for(int col=0; col!=n; ++col)
+    {
+        int k_end = delta_Y.get_starting_index_of_column(col+1);
+        for(int k=k_start; k!=k_end; ++k)
+        {
+            int row = delta_Y.get_row_number_of_entry_index(k);
+            int i = network_Y1_matrix.get_entry_index(row, col);
+            if(i==INDEX_NOT_EXIST)
+                return false;
+            index.push_back(i);
+            value.push_back(delta_Y.get_entry_value(k));
+        }
+        k_start = k_end;
+    }
+
+    n = index.size();
+    for(int k=0; k!=n; ++k)
+    {
+        int i = index[k];
+        network_Y1_matrix.change_entry_value(i, network_Y1_matrix.get_entry_value(i)+scale*value[k]);
+    }
+
+    ++network_Y_matrix_build_count;
+    return true;
+}
+
 void NETWORK_MATRIX::optimize_network_ordering()
 {
     initialize_physical_internal_bus_pair();
@@ -2611,6 +2793,19 @@ void NETWORK_MATRIX::optimize_network_ordering()
     }
 }
 
+unsigned int NETWORK_MATRIX::get_network_Y_matrix_build_count() const
+{
+    // count is increased whenever network Y matrix or bus ordering is changed, so users can tell if they are changed since last check
+    return network_Y_matrix_build_count;
+}
+
+void NETWORK_MATRIX::mark_network_Y_matrix_outdated()
+{
+    // called when branches, fixed shunts or buses are changed outside the matrix.
+    // count is increased so that matrices and bus ordering built before are no longer reused
+    ++network_Y_matrix_build_count;
+}
+
 bool NETWORK_MATRIX::is_condition_ok() const
 {
     return true;
@@ -2646,6 +2841,7 @@ void NETWORK_MATRIX::reorder_physical_internal_bus_pair()
 {
     vector<unsigned int> permutation = network_Y1_matrix.get_reorder_permutation();
     inphno.update_with_new_internal_bus_permutation(permutation);
+    ++network_Y_matrix_build_count;
     ostringstream osstream;
     osstream<<"Network internal bus numbers are optimized.";
     toolkit->show_information_with_leading_time_stamp(osstream);
@@ -2806,10 +3002,13 @@ vector< vector<unsigned int> > NETWORK_MATRIX::get_islands_with_internal_bus_num
             bus_searched_flag[first_bus_in_new_island] = true;
 
             int searching_bus=0;
+            int n = network_Y1_matrix.get_matrix_size();
             unsigned int nbus_in_island = this_island.size();
             for(unsigned int i=0; i!=nbus_in_island; ++i)
             {
                 searching_bus = this_island[i];
+                if(searching_bus>=n) // isolated bus out of matrix
+                    continue;
                 int k_start = network_Y1_matrix.get_starting_index_of_column(searching_bus);
                 int k_end = network_Y1_matrix.get_starting_index_of_column(searching_bus+1);
                 int row_bus;
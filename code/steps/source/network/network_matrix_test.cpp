@@ -21,8 +21,10 @@ NETWORK_MATRIX_TEST::NETWORK_MATRIX_TEST()
     TEST_ADD(NETWORK_MATRIX_TEST::test_optimize_network_ordering);
     TEST_ADD(NETWORK_MATRIX_TEST::test_check_network_connectivity);
     TEST_ADD(NETWORK_MATRIX_TEST::test_get_islands);
+    TEST_ADD(NETWORK_MATRIX_TEST::test_get_islands_with_isolated_bus_out_of_matrix);
     TEST_ADD(NETWORK_MATRIX_TEST::test_save_network_Y_matrix_to_file);
     TEST_ADD(NETWORK_MATRIX_TEST::test_build_network_with_bus_out_of_service);
+    TEST_ADD(NETWORK_MATRIX_TEST::test_update_dynamic_network_Y_matrix_incrementally);
 }
 
 void NETWORK_MATRIX_TEST::setup()
@@ -343,6 +345,60 @@ void NETWORK_MATRIX_TEST::test_get_islands()
     }
 }
 
+void NETWORK_MATRIX_TEST::test_get_islands_with_isolated_bus_out_of_matrix()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"NETWORK_MATRIX_TEST");
+
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    network_matrix->build_network_Y_matrix();
+    unsigned int nbus = psdb.get_in_service_bus_count();
+    TEST_ASSERT(network_matrix->get_network_Y_matrix().get_matrix_size()==(int)nbus);
+
+    // isolate bus 9 with the last internal number. it has no entry in Y matrix,
+    // so it is out of the matrix, while it is still a bus to search.
+    // bus 3 is only connected to bus 9, so it is isolated too.
+    unsigned int bus = 9;
+    TEST_ASSERT(network_matrix->get_internal_bus_number_of_physical_bus(bus)==nbus-1);
+    vector<LINE*> lines = psdb.get_lines_connecting_to_bus(bus);
+    for(unsigned int i=0; i!=lines.size(); ++i)
+    {
+        lines[i]->set_sending_side_breaker_status(false);
+        lines[i]->set_receiving_side_breaker_status(false);
+    }
+    vector<TRANSFORMER*> transformers = psdb.get_transformers_connecting_to_bus(bus);
+    for(unsigned int i=0; i!=transformers.size(); ++i)
+    {
+        transformers[i]->set_winding_breaker_status(PRIMARY_SIDE, false);
+        transformers[i]->set_winding_breaker_status(SECONDARY_SIDE, false);
+        transformers[i]->set_winding_breaker_status(TERTIARY_SIDE, false);
+    }
+    vector<FIXED_SHUNT*> shunts = psdb.get_fixed_shunts_connecting_to_bus(bus);
+    for(unsigned int i=0; i!=shunts.size(); ++i)
+        shunts[i]->set_status(false);
+
+    network_matrix->build_network_Y_matrix();
+    TEST_ASSERT(network_matrix->get_network_Y_matrix().get_matrix_size()<(int)nbus);
+
+    vector< vector<unsigned int> > islands = network_matrix->get_islands_with_physical_bus_number();
+    TEST_ASSERT(islands.size()==3);
+
+    bool bus_9_isolated = false;
+    bool bus_3_isolated = false;
+    unsigned int nbus_in_islands = 0;
+    for(unsigned int i=0; i!=islands.size(); ++i)
+    {
+        nbus_in_islands += islands[i].size();
+        if(islands[i].size()==1 and islands[i][0]==9)
+            bus_9_isolated = true;
+        if(islands[i].size()==1 and islands[i][0]==3)
+            bus_3_isolated = true;
+    }
+    TEST_ASSERT(bus_9_isolated);
+    TEST_ASSERT(bus_3_isolated);
+    TEST_ASSERT(nbus_in_islands==nbus);
+}
+
 void NETWORK_MATRIX_TEST::test_save_network_Y_matrix_to_file()
 {
     show_test_information_for_function_of_class(__FUNCTION__,"NETWORK_MATRIX_TEST");
@@ -370,4 +426,79 @@ void NETWORK_MATRIX_TEST::test_build_network_with_bus_out_of_service()
     network_matrix->check_network_connectivity();
 }
 
+void NETWORK_MATRIX_TEST::test_update_dynamic_network_Y_matrix_incrementally()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"NETWORK_MATRIX_TEST");
+
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    network_matrix->build_dynamic_network_Y_matrix();
+    unsigned int build_count = network_matrix->get_network_Y_matrix_build_count();
+
+    DEVICE_ID did;
+    did.set_device_type("LINE");
+    did.set_device_identifier("1");
+    TERMINAL terminal;
+    terminal.append_bus(4);
+    terminal.append_bus(5);
+    did.set_device_terminal(terminal);
+
+    LINE* line = psdb.get_line(did);
+
+    TEST_ASSERT(network_matrix->remove_device_from_dynamic_network_Y_matrix(did)==true);
+    line->set_sending_side_breaker_status(false);
+    TEST_ASSERT(network_matrix->add_device_to_dynamic_network_Y_matrix(did)==true);
+    TEST_ASSERT(network_matrix->get_network_Y_matrix_build_count()!=build_count);
+    check_dynamic_network_Y_matrix_with_rebuilt_matrix();
+
+    FAULT fault;
+    fault.set_fault_type(THREE_PHASES_FAULT);
+    fault.set_fault_shunt_in_pu(complex<double>(0.0, -2e8));
+
+    BUS* bus = psdb.get_bus(7);
+    TEST_ASSERT(network_matrix->remove_device_from_dynamic_network_Y_matrix(bus->get_device_id())==true);
+    bus->set_fault(fault);
+    TEST_ASSERT(network_matrix->add_device_to_dynamic_network_Y_matrix(bus->get_device_id())==true);
+    check_dynamic_network_Y_matrix_with_rebuilt_matrix();
+
+    TEST_ASSERT(network_matrix->remove_device_from_dynamic_network_Y_matrix(bus->get_device_id())==true);
+    bus->clear_fault();
+    TEST_ASSERT(network_matrix->add_device_to_dynamic_network_Y_matrix(bus->get_device_id())==true);
+    check_dynamic_network_Y_matrix_with_rebuilt_matrix();
+
+    TEST_ASSERT(network_matrix->remove_device_from_dynamic_network_Y_matrix(did)==true);
+    line->set_sending_side_breaker_status(true);
+    TEST_ASSERT(network_matrix->add_device_to_dynamic_network_Y_matrix(did)==true);
+    check_dynamic_network_Y_matrix_with_rebuilt_matrix();
+}
+
+void NETWORK_MATRIX_TEST::check_dynamic_network_Y_matrix_with_rebuilt_matrix()
+{
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    NETWORK_MATRIX rebuilt_matrix(default_toolkit);
+    rebuilt_matrix.build_dynamic_network_Y_matrix();
+
+    STEPS_COMPLEX_SPARSE_MATRIX& Y = network_matrix->get_dynamic_network_Y_matrix();
+    STEPS_COMPLEX_SPARSE_MATRIX& Y_rebuilt = rebuilt_matrix.get_dynamic_network_Y_matrix();
+
+    vector<BUS*> buses = psdb.get_all_buses();
+    unsigned int n = buses.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        unsigned int ibus = buses[i]->get_bus_number();
+        for(unsigned int j=0; j!=n; ++j)
+        {
+            unsigned int jbus = buses[j]->get_bus_number();
+            int index = Y.get_entry_index(network_matrix->get_internal_bus_number_of_physical_bus(ibus),
+                                          network_matrix->get_internal_bus_number_of_physical_bus(jbus));
+            int index_rebuilt = Y_rebuilt.get_entry_index(rebuilt_matrix.get_internal_bus_number_of_physical_bus(ibus),
+                                                          rebuilt_matrix.get_internal_bus_number_of_physical_bus(jbus));
+            complex<double> y = (index!=INDEX_NOT_EXIST?Y.get_entry_value(index):0.0);
+            complex<double> y_rebuilt = (index_rebuilt!=INDEX_NOT_EXIST?Y_rebuilt.get_entry_value(index_rebuilt):0.0);
+            TEST_ASSERT(abs(y-y_rebuilt)<=1e-6*max(1.0, abs(y_rebuilt)));
+        }
+    }
+}
+
 #endif
@@ -376,11 +376,11 @@ string POWER_SYSTEM_DATABASE::get_case_additional_information() const
 void POWER_SYSTEM_DATABASE::append_bus(BUS& bus)
 {
     bus.set_toolkit(*toolkit);
-
-    ostringstream osstream;
+    toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
 
     if(not bus.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid bus "<<bus.get_bus_number()<<" due to either 0 bus number of 0 base voltage.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -390,6 +390,7 @@ void POWER_SYSTEM_DATABASE::append_bus(BUS& bus)
 
     if(not this->is_bus_in_allowed_range(bus_number))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus number "<<bus_number<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<bus.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Bus will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -398,6 +399,7 @@ void POWER_SYSTEM_DATABASE::append_bus(BUS& bus)
 
     if(this->is_bus_exist(bus_number))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<bus_number<<" already exists in power system database '"<<get_system_name()<<"': Bus."<<endl
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -406,6 +408,7 @@ void POWER_SYSTEM_DATABASE::append_bus(BUS& bus)
 
     if(Bus.capacity()==Bus.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Bus.capacity()<<") reached when appending bus to power system database "<<get_system_name()<<"."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -424,10 +427,9 @@ void POWER_SYSTEM_DATABASE::append_generator(GENERATOR& generator)
 {
     generator.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not generator.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid generator to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -437,6 +439,7 @@ void POWER_SYSTEM_DATABASE::append_generator(GENERATOR& generator)
 
     if(not this->is_bus_in_allowed_range(generator_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus number "<<generator_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<generator.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Generator will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -453,6 +456,7 @@ void POWER_SYSTEM_DATABASE::append_generator(GENERATOR& generator)
 
     if(this->is_generator_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<generator.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Generator."<<endl
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -461,6 +465,7 @@ void POWER_SYSTEM_DATABASE::append_generator(GENERATOR& generator)
 
     if(Generator.capacity()==Generator.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Generator.capacity()<<") reached when appending generator to power system database "<<get_system_name()<<"."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -476,10 +481,9 @@ void POWER_SYSTEM_DATABASE::append_wt_generator(WT_GENERATOR& wt_generator)
 {
     wt_generator.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not wt_generator.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid wt generator to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -489,6 +493,7 @@ void POWER_SYSTEM_DATABASE::append_wt_generator(WT_GENERATOR& wt_generator)
 
     if(not this->is_bus_in_allowed_range(wt_generator_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<wt_generator_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<wt_generator.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"WT generator will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -505,6 +510,7 @@ void POWER_SYSTEM_DATABASE::append_wt_generator(WT_GENERATOR& wt_generator)
 
     if(this->is_wt_generator_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<wt_generator.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': WT_Generator."<<endl
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -513,6 +519,7 @@ void POWER_SYSTEM_DATABASE::append_wt_generator(WT_GENERATOR& wt_generator)
 
     if(WT_Generator.capacity()==WT_Generator.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<WT_Generator.capacity()<<") reached when appending WT generator to power system database "<<get_system_name()<<"."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -528,10 +535,9 @@ void POWER_SYSTEM_DATABASE::append_pv_unit(PV_UNIT& pv_unit)
 {
     pv_unit.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not pv_unit.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid pv unit to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -541,6 +547,7 @@ void POWER_SYSTEM_DATABASE::append_pv_unit(PV_UNIT& pv_unit)
 
     if(not this->is_bus_in_allowed_range(pv_unit_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<pv_unit_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<pv_unit.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"PV unit will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -557,6 +564,7 @@ void POWER_SYSTEM_DATABASE::append_pv_unit(PV_UNIT& pv_unit)
 
     if(this->is_pv_unit_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<pv_unit.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': PV_Unit."<<endl
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -565,6 +573,7 @@ void POWER_SYSTEM_DATABASE::append_pv_unit(PV_UNIT& pv_unit)
 
     if(PV_Unit.capacity()==PV_Unit.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<PV_Unit.capacity()<<") reached when appending PV Unit to power system database "<<get_system_name()<<"."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -580,10 +589,9 @@ void POWER_SYSTEM_DATABASE::append_energy_storage(ENERGY_STORAGE& estorage)
 {
     estorage.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not estorage.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid energy storage to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -593,6 +601,7 @@ void POWER_SYSTEM_DATABASE::append_energy_storage(ENERGY_STORAGE& estorage)
 
     if(not this->is_bus_in_allowed_range(bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<estorage.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Energy storage will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -609,6 +618,7 @@ void POWER_SYSTEM_DATABASE::append_energy_storage(ENERGY_STORAGE& estorage)
 
     if(this->is_energy_storage_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<estorage.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Energy_storage.\n"
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -617,6 +627,7 @@ void POWER_SYSTEM_DATABASE::append_energy_storage(ENERGY_STORAGE& estorage)
 
     if(Energy_storage.capacity()==Energy_storage.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Energy_storage.capacity()<<") reached when appending energy storage to power system database '"<<get_system_name()<<"'."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -632,10 +643,9 @@ void POWER_SYSTEM_DATABASE::append_load(LOAD& load)
 {
     load.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not load.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid load to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -645,6 +655,7 @@ void POWER_SYSTEM_DATABASE::append_load(LOAD& load)
 
     if(not this->is_bus_in_allowed_range(load_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<load_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<load.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Load will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -661,6 +672,7 @@ void POWER_SYSTEM_DATABASE::append_load(LOAD& load)
 
     if(is_load_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<load.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Load."<<endl
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -669,6 +681,7 @@ void POWER_SYSTEM_DATABASE::append_load(LOAD& load)
 
     if(Load.capacity()==Load.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Load.capacity()<<") reached when appending load to power system database "<<get_system_name()<<"."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -683,11 +696,11 @@ void POWER_SYSTEM_DATABASE::append_load(LOAD& load)
 void POWER_SYSTEM_DATABASE::append_line(LINE& line)
 {
     line.set_toolkit(*toolkit);
-
-    ostringstream osstream;
+    toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
 
     if(not line.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid line to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -698,6 +711,7 @@ void POWER_SYSTEM_DATABASE::append_line(LINE& line)
 
     if(not this->is_bus_in_allowed_range(sending_side_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<sending_side_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<line.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Line will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -705,6 +719,7 @@ void POWER_SYSTEM_DATABASE::append_line(LINE& line)
     }
     if(not this->is_bus_in_allowed_range(receiving_side_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<receiving_side_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<line.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Line will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -722,6 +737,7 @@ void POWER_SYSTEM_DATABASE::append_line(LINE& line)
 
     if(this->is_line_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<line.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Line."<<endl
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -730,6 +746,7 @@ void POWER_SYSTEM_DATABASE::append_line(LINE& line)
 
     if(Line.capacity()==Line.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Line.capacity()<<") reached when appending line to power system database '"<<get_system_name()<<"'."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -744,10 +761,11 @@ void POWER_SYSTEM_DATABASE::append_line(LINE& line)
 void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
 {
     transformer.set_toolkit(*toolkit);
-    ostringstream osstream;
+    toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
 
     if(not transformer.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid transformer to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -759,6 +777,7 @@ void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
 
     if(not is_bus_in_allowed_range(primary_winding_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<primary_winding_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<transformer.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Transformer will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -766,6 +785,7 @@ void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
     }
     if(not is_bus_in_allowed_range(secondary_winding_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<secondary_winding_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<transformer.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Transformer will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -773,6 +793,7 @@ void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
     }
     if(not(is_bus_in_allowed_range(tertiary_winding_bus) or tertiary_winding_bus==0))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<tertiary_winding_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<transformer.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Transformer will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -791,6 +812,7 @@ void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
 
     if(is_transformer_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<transformer.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"':Transformer.\n"
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -799,6 +821,7 @@ void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
 
     if(Transformer.capacity()==Transformer.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Transformer.capacity()<<") reached when appending transformer to power system database '"<<get_system_name()<<"'."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -813,11 +836,11 @@ void POWER_SYSTEM_DATABASE::append_transformer(TRANSFORMER& transformer)
 void POWER_SYSTEM_DATABASE::append_fixed_shunt(FIXED_SHUNT& shunt)
 {
     shunt.set_toolkit(*toolkit);
-
-    ostringstream osstream;
+    toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
 
     if(not shunt.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid fixed shunt to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -827,6 +850,7 @@ void POWER_SYSTEM_DATABASE::append_fixed_shunt(FIXED_SHUNT& shunt)
 
     if(not this->is_bus_in_allowed_range(shunt_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<shunt_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<shunt.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Fixed shunt will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -843,6 +867,7 @@ void POWER_SYSTEM_DATABASE::append_fixed_shunt(FIXED_SHUNT& shunt)
 
     if(this->is_fixed_shunt_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<shunt.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Fixed_shunt.\n"
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -851,6 +876,7 @@ void POWER_SYSTEM_DATABASE::append_fixed_shunt(FIXED_SHUNT& shunt)
 
     if(Fixed_shunt.capacity()==Fixed_shunt.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Fixed_shunt.capacity()<<") reached when appending fixed shunt to power system database '"<<get_system_name()<<"'."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -866,10 +892,9 @@ void POWER_SYSTEM_DATABASE::append_hvdc(HVDC& hvdc)
 {
     hvdc.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not hvdc.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid hvdc to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -880,6 +905,7 @@ void POWER_SYSTEM_DATABASE::append_hvdc(HVDC& hvdc)
 
     if(not this->is_bus_in_allowed_range(rec_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<rec_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<hvdc.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Hvdc will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -887,6 +913,7 @@ void POWER_SYSTEM_DATABASE::append_hvdc(HVDC& hvdc)
     }
     if(not this->is_bus_in_allowed_range(inv_bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<inv_bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<hvdc.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Hvdc will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -904,6 +931,7 @@ void POWER_SYSTEM_DATABASE::append_hvdc(HVDC& hvdc)
 
     if(this->is_hvdc_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<hvdc.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Hvdc.\n"
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -912,6 +940,7 @@ void POWER_SYSTEM_DATABASE::append_hvdc(HVDC& hvdc)
 
     if(Hvdc.capacity()==Hvdc.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Hvdc.capacity()<<") reached when appending Hvdc to power system database '"<<get_system_name()<<"'."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -927,10 +956,9 @@ void POWER_SYSTEM_DATABASE::append_equivalent_device(EQUIVALENT_DEVICE& edevice)
 {
     edevice.set_toolkit(*toolkit);
 
-    ostringstream osstream;
-
     if(not edevice.is_valid())
     {
+        ostringstream osstream;
         osstream<<"Warning. Failed to append invalid equivalent device to power system database '"<<get_system_name()<<"'.";
         toolkit->show_information_with_leading_time_stamp(osstream);
         return;
@@ -940,6 +968,7 @@ void POWER_SYSTEM_DATABASE::append_equivalent_device(EQUIVALENT_DEVICE& edevice)
 
     if(not this->is_bus_in_allowed_range(bus))
     {
+        ostringstream osstream;
         osstream<<"Warning. Bus "<<bus<<" is not in the allowed range [1, "<<get_allowed_max_bus_number()<<"] when appending "<<edevice.get_device_name()<<" to power system database '"<<get_system_name()<<"'."<<endl
           <<"Equivalent device will not be appended into the database.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -956,6 +985,7 @@ void POWER_SYSTEM_DATABASE::append_equivalent_device(EQUIVALENT_DEVICE& edevice)
 
     if(this->is_equivalent_device_exist(device_id))
     {
+        ostringstream osstream;
         osstream<<"Warning. "<<edevice.get_device_name()<<" already exists in power system database '"<<get_system_name()<<"': Equivalent_device.\n"
           <<"Duplicate copy is not allowed.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -964,6 +994,7 @@ void POWER_SYSTEM_DATABASE::append_equivalent_device(EQUIVALENT_DEVICE& edevice)
 
     if(Equivalent_device.capacity()==Equivalent_device.size())
     {
+        ostringstream osstream;
         osstream<<"Warning. Capacity limit ("<<Equivalent_device.capacity()<<") reached when appending equivalent device to power system database '"<<get_system_name()<<"'."<<endl
           <<"Increase capacity by modified steps_config.json.";
         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -1057,6 +1088,192 @@ void POWER_SYSTEM_DATABASE::append_owner(OWNER& owner)
 }
 
 
+void POWER_SYSTEM_DATABASE::copy_from_power_system_database(POWER_SYSTEM_DATABASE& psdb)
+{
+    if(this==(&psdb)) return;
+
+    clear();
+
+    set_system_name(psdb.get_system_name());
+    set_system_base_power_in_MVA(psdb.get_system_base_power_in_MVA());
+    set_case_information(psdb.get_case_information());
+    set_case_additional_information(psdb.get_case_additional_information());
+    set_zero_impedance_threshold_in_pu(psdb.get_zero_impedance_threshold_in_pu());
+    set_allowed_max_bus_number(psdb.get_allowed_max_bus_number());
+
+    set_bus_capacity(psdb.get_bus_capacity());
+    set_generator_capacity(psdb.get_generator_capacity());
+    set_wt_generator_capacity(psdb.get_wt_generator_capacity());
+    set_pv_unit_capacity(psdb.get_pv_unit_capacity());
+    set_load_capacity(psdb.get_load_capacity());
+    set_fixed_shunt_capacity(psdb.get_fixed_shunt_capacity());
+    set_line_capacity(psdb.get_line_capacity());
+    set_transformer_capacity(psdb.get_transformer_capacity());
+    set_hvdc_capacity(psdb.get_hvdc_capacity());
+    set_equivalent_device_capacity(psdb.get_equivalent_device_capacity());
+    set_energy_storage_capacity(psdb.get_energy_storage_capacity());
+    set_area_capacity(psdb.get_area_capacity());
+    set_zone_capacity(psdb.get_zone_capacity());
+    set_owner_capacity(psdb.get_owner_capacity());
+
+    // buses are copied first so that bus pointers of other devices can be resolved in this database.
+    // assignment operator of device resolves bus pointers with toolkit of the right-hand device,
+    // so device is first copied from the source database and then re-assigned with this toolkit.
+
+    vector<BUS*> buses = psdb.get_all_buses();
+    for(unsigned int i=0; i!=buses.size(); ++i)
+    {
+        BUS bus(*toolkit);
+        bus = *(buses[i]);
+        append_bus(bus);
+    }
+
+    vector<GENERATOR*> generators = psdb.get_all_generators();
+    for(unsigned int i=0; i!=generators.size(); ++i)
+    {
+        GENERATOR source_generator(*toolkit);
+        source_generator = *(generators[i]);
+        source_generator.set_toolkit(*toolkit);
+        GENERATOR generator(*toolkit);
+        generator = source_generator;
+        append_generator(generator);
+    }
+
+    vector<WT_GENERATOR*> wt_generators = psdb.get_all_wt_generators();
+    for(unsigned int i=0; i!=wt_generators.size(); ++i)
+    {
+        WT_GENERATOR source_wt_generator(*toolkit);
+        source_wt_generator = *(wt_generators[i]);
+        source_wt_generator.set_toolkit(*toolkit);
+        WT_GENERATOR wt_generator(*toolkit);
+        wt_generator = source_wt_generator;
+        append_wt_generator(wt_generator);
+    }
+
+    vector<PV_UNIT*> pv_units = psdb.get_all_pv_units();
+    for(unsigned int i=0; i!=pv_units.size(); ++i)
+    {
+        PV_UNIT source_pv_unit(*toolkit);
+        source_pv_unit = *(pv_units[i]);
+        source_pv_unit.set_toolkit(*toolkit);
+        PV_UNIT pv_unit(*toolkit);
+        pv_unit = source_pv_unit;
+        append_pv_unit(pv_unit);
+    }
+
+    vector<ENERGY_STORAGE*> energy_storages = psdb.get_all_energy_storages();
+    for(unsigned int i=0; i!=energy_storages.size(); ++i)
+    {
+        ENERGY_STORAGE source_energy_storage(*toolkit);
+        source_energy_storage = *(energy_storages[i]);
+        source_energy_storage.set_toolkit(*toolkit);
+        ENERGY_STORAGE energy_storage(*toolkit);
+        energy_storage = source_energy_storage;
+        append_energy_storage(energy_storage);
+    }
+
+    vector<LOAD*> loads = psdb.get_all_loads();
+    for(unsigned int i=0; i!=loads.size(); ++i)
+    {
+        LOAD source_load(*toolkit);
+        source_load = *(loads[i]);
+        source_load.set_toolkit(*toolkit);
+        LOAD load(*toolkit);
+        load = source_load;
+        append_load(load);
+    }
+
+    vector<FIXED_SHUNT*> fixed_shunts = psdb.get_all_fixed_shunts();
+    for(unsigned int i=0; i!=fixed_shunts.size(); ++i)
+    {
+        FIXED_SHUNT source_fixed_shunt(*toolkit);
+        source_fixed_shunt = *(fixed_shunts[i]);
+        source_fixed_shunt.set_toolkit(*toolkit);
+        FIXED_SHUNT fixed_shunt(*toolkit);
+        fixed_shunt = source_fixed_shunt;
+        append_fixed_shunt(fixed_shunt);
+    }
+
+    vector<LINE*> lines = psdb.get_all_lines();
+    for(unsigned int i=0; i!=lines.size(); ++i)
+    {
+        LINE source_line(*toolkit);
+        source_line = *(lines[i]);
+        source_line.set_toolkit(*toolkit);
+        LINE line(*toolkit);
+        line = source_line;
+        append_line(line);
+    }
+
+    vector<TRANSFORMER*> transformers = psdb.get_all_transformers();
+    for(unsigned int i=0; i!=transformers.size(); ++i)
+    {
+        TRANSFORMER source_transformer(*toolkit);
+        source_transformer = *(transformers[i]);
+        source_transformer.set_toolkit(*toolkit);
+        TRANSFORMER transformer(*toolkit);
+        transformer = source_transformer;
+        append_transformer(transformer);
+    }
+
+    vector<HVDC*> hvdcs = psdb.get_all_hvdcs();
+    for(unsigned int i=0; i!=hvdcs.size(); ++i)
+    {
+        HVDC source_hvdc(*toolkit);
+        source_hvdc = *(hvdcs[i]);
+        source_hvdc.set_toolkit(*toolkit);
+        HVDC hvdc(*toolkit);
+        hvdc = source_hvdc;
+        append_hvdc(hvdc);
+    }
+
+    vector<EQUIVALENT_DEVICE*> equivalent_devices = psdb.get_all_equivalent_devices();
+    for(unsigned int i=0; i!=equivalent_devices.size(); ++i)
+    {
+        EQUIVALENT_DEVICE source_equivalent_device(*toolkit);
+        source_equivalent_device = *(equivalent_devices[i]);
+        source_equivalent_device.set_toolkit(*toolkit);
+        EQUIVALENT_DEVICE equivalent_device(*toolkit);
+        equivalent_device = source_equivalent_device;
+        append_equivalent_device(equivalent_device);
+    }
+
+    vector<AREA*> areas = psdb.get_all_areas();
+    for(unsigned int i=0; i!=areas.size(); ++i)
+    {
+        AREA source_area(*toolkit);
+        source_area = *(areas[i]);
+        source_area.set_toolkit(*toolkit);
+        AREA area(*toolkit);
+        area = source_area;
+        append_area(area);
+    }
+
+    vector<ZONE*> zones = psdb.get_all_zones();
+    for(unsigned int i=0; i!=zones.size(); ++i)
+    {
+        ZONE source_zone(*toolkit);
+        source_zone = *(zones[i]);
+        source_zone.set_toolkit(*toolkit);
+        ZONE zone(*toolkit);
+        zone = source_zone;
+        append_zone(zone);
+    }
+
+    vector<OWNER*> owners = psdb.get_all_owners();
+    for(unsigned int i=0; i!=owners.size(); ++i)
+    {
+        OWNER source_owner(*toolkit);
+        source_owner = *(owners[i]);
+        source_owner.set_toolkit(*toolkit);
+        OWNER owner(*toolkit);
+        owner = source_owner;
+        append_owner(owner);
+    }
+
+    update_in_service_bus_count();
+}
+
 void POWER_SYSTEM_DATABASE::update_device_id(const DEVICE_ID& did_old, const DEVICE_ID& did_new)
 {
     ostringstream osstream;
@@ -3658,6 +3875,281 @@ unsigned int POWER_SYSTEM_DATABASE::get_equivalent_bus_of_bus(unsigned int bus)
         return 0;
 }
 
+void POWER_SYSTEM_DATABASE::save_device_state(DEVICE_STATE_STRUCT& state)
+{
+    vector<BUS*> buses = get_all_buses();
+    unsigned int n = buses.size();
+    state.bus_types.resize(n);
+    state.bus_voltages_in_pu.resize(n);
+    state.bus_angles_in_rad.resize(n);
+    state.bus_faults.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        BUS* bus = buses[i];
+        state.bus_types[i] = bus->get_bus_type();
+        state.bus_voltages_in_pu[i] = bus->get_positive_sequence_voltage_in_pu();
+        state.bus_angles_in_rad[i] = bus->get_positive_sequence_angle_in_rad();
+        state.bus_faults[i] = bus->get_fault();
+    }
+
+    vector<SOURCE*> sources = get_all_sources();
+    n = sources.size();
+    state.source_status.resize(n);
+    state.source_mbase_in_MVA.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        state.source_status[i] = sources[i]->get_status();
+        state.source_mbase_in_MVA[i] = sources[i]->get_mbase_in_MVA();
+    }
+
+    // partial trip of lumped units changes both the unit count and MBASE
+    vector<WT_GENERATOR*> wt_generators = get_all_wt_generators();
+    n = wt_generators.size();
+    state.wt_generator_lumped_count.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+        state.wt_generator_lumped_count[i] = wt_generators[i]->get_number_of_lumped_wt_generators();
+
+    vector<PV_UNIT*> pv_units = get_all_pv_units();
+    n = pv_units.size();
+    state.pv_unit_lumped_count.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+        state.pv_unit_lumped_count[i] = pv_units[i]->get_number_of_lumped_pv_units();
+
+    vector<LOAD*> loads = get_all_loads();
+    n = loads.size();
+    state.load_status.resize(n);
+    state.load_scale_in_pu.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        state.load_status[i] = loads[i]->get_status();
+        state.load_scale_in_pu[i] = loads[i]->get_load_manually_scale_factor_in_pu();
+    }
+
+    vector<FIXED_SHUNT*> shunts = get_all_fixed_shunts();
+    n = shunts.size();
+    state.fixed_shunt_status.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+        state.fixed_shunt_status[i] = shunts[i]->get_status();
+
+    vector<LINE*> lines = get_all_lines();
+    n = lines.size();
+    state.line_breaker_status.resize(2*n);
+    state.line_faults.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        LINE* line = lines[i];
+        state.line_breaker_status[2*i] = line->get_sending_side_breaker_status();
+        state.line_breaker_status[2*i+1] = line->get_receiving_side_breaker_status();
+
+        map<double,FAULT>& faults = state.line_faults[i];
+        faults.clear();
+        unsigned int nfault = line->get_fault_count();
+        unsigned int sending_bus = line->get_sending_side_bus();
+        for(unsigned int j=0; j!=nfault; ++j)
+        {
+            double location = line->get_fault_location_of_fault(j);
+            faults[location] = line->get_fault_at_location(sending_bus, location);
+        }
+    }
+
+    vector<TRANSFORMER*> transformers = get_all_transformers();
+    n = transformers.size();
+    state.transformer_breaker_status.resize(3*n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        state.transformer_breaker_status[3*i] = transformers[i]->get_winding_breaker_status(PRIMARY_SIDE);
+        state.transformer_breaker_status[3*i+1] = transformers[i]->get_winding_breaker_status(SECONDARY_SIDE);
+        state.transformer_breaker_status[3*i+2] = transformers[i]->get_winding_breaker_status(TERTIARY_SIDE);
+    }
+
+    vector<HVDC*> hvdcs = get_all_hvdcs();
+    n = hvdcs.size();
+    state.hvdc_status.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+        state.hvdc_status[i] = hvdcs[i]->get_status();
+
+    vector<EQUIVALENT_DEVICE*> edevices = get_all_equivalent_devices();
+    n = edevices.size();
+    state.equivalent_device_status.resize(n);
+    for(unsigned int i=0; i!=n; ++i)
+        state.equivalent_device_status[i] = edevices[i]->get_status();
+}
+
+bool POWER_SYSTEM_DATABASE::is_device_state_applicable(const DEVICE_STATE_STRUCT& state)
+{
+    // device state is stored by device order, so it only applies if no device is added or removed.
+    return get_bus_count()==state.bus_types.size() and get_source_count()==state.source_status.size() and
+           get_wt_generator_count()==state.wt_generator_lumped_count.size() and get_pv_unit_count()==state.pv_unit_lumped_count.size() and
+           get_load_count()==state.load_status.size() and get_fixed_shunt_count()==state.fixed_shunt_status.size() and
+           get_line_count()==state.line_faults.size() and 3*get_transformer_count()==state.transformer_breaker_status.size() and
+           get_hvdc_count()==state.hvdc_status.size() and get_equivalent_device_count()==state.equivalent_device_status.size();
+}
+
+unsigned int POWER_SYSTEM_DATABASE::restore_device_state(const DEVICE_STATE_STRUCT& state, bool& bus_type_changed)
+{
+    // voltages are always written back, while status, scale and fault of
+    // devices are only touched if they are changed.
+    // the number of changed devices is returned.
+    unsigned int changed_device_count = 0;
+    bus_type_changed = false;
+
+    vector<BUS*> buses = get_all_buses();
+    unsigned int n = buses.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        BUS* bus = buses[i];
+        if(bus->get_bus_type()!=state.bus_types[i])
+        {
+            bus->set_bus_type(state.bus_types[i]);
+            bus_type_changed = true;
+            ++changed_device_count;
+        }
+        bus->set_positive_sequence_voltage_in_pu(state.bus_voltages_in_pu[i]);
+        bus->set_positive_sequence_angle_in_rad(state.bus_angles_in_rad[i]);
+        if(bus->is_faulted() or state.bus_faults[i].is_faulted())
+        {
+            if(state.bus_faults[i].is_faulted())
+                bus->set_fault(state.bus_faults[i]);
+            else
+                bus->clear_fault();
+            ++changed_device_count;
+        }
+    }
+
+    vector<SOURCE*> sources = get_all_sources();
+    n = sources.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        SOURCE* source = sources[i];
+        if(source->get_status()!=state.source_status[i])
+        {
+            source->set_status(state.source_status[i]);
+            ++changed_device_count;
+        }
+        if(source->get_mbase_in_MVA()!=state.source_mbase_in_MVA[i])
+        {
+            source->set_mbase_in_MVA(state.source_mbase_in_MVA[i]);
+            ++changed_device_count;
+        }
+    }
+
+    vector<WT_GENERATOR*> wt_generators = get_all_wt_generators();
+    n = wt_generators.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        if(wt_generators[i]->get_number_of_lumped_wt_generators()!=state.wt_generator_lumped_count[i])
+            wt_generators[i]->set_number_of_lumped_wt_generators(state.wt_generator_lumped_count[i]);
+    }
+
+    vector<PV_UNIT*> pv_units = get_all_pv_units();
+    n = pv_units.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        if(pv_units[i]->get_number_of_lumped_pv_units()!=state.pv_unit_lumped_count[i])
+            pv_units[i]->set_number_of_lumped_pv_units(state.pv_unit_lumped_count[i]);
+    }
+
+    vector<LOAD*> loads = get_all_loads();
+    n = loads.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        LOAD* load = loads[i];
+        if(load->get_status()!=state.load_status[i] or
+           load->get_load_manually_scale_factor_in_pu()!=state.load_scale_in_pu[i])
+        {
+            load->set_status(state.load_status[i]);
+            load->set_load_manually_scale_factor_in_pu(state.load_scale_in_pu[i]);
+            ++changed_device_count;
+        }
+    }
+
+    vector<FIXED_SHUNT*> shunts = get_all_fixed_shunts();
+    n = shunts.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        if(shunts[i]->get_status()!=state.fixed_shunt_status[i])
+        {
+            shunts[i]->set_status(state.fixed_shunt_status[i]);
+            ++changed_device_count;
+        }
+    }
+
+    vector<LINE*> lines = get_all_lines();
+    n = lines.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        LINE* line = lines[i];
+        bool changed = false;
+        if(line->get_sending_side_breaker_status()!=state.line_breaker_status[2*i])
+        {
+            line->set_sending_side_breaker_status(state.line_breaker_status[2*i]);
+            changed = true;
+        }
+        if(line->get_receiving_side_breaker_status()!=state.line_breaker_status[2*i+1])
+        {
+            line->set_receiving_side_breaker_status(state.line_breaker_status[2*i+1]);
+            changed = true;
+        }
+        const map<double,FAULT>& faults = state.line_faults[i];
+        if(line->is_faulted() or faults.size()!=0)
+        {
+            line->clear_all_faults();
+            unsigned int sending_bus = line->get_sending_side_bus();
+            for(map<double,FAULT>::const_iterator iter=faults.begin(); iter!=faults.end(); ++iter)
+                line->set_fault(sending_bus, iter->first, iter->second);
+            changed = true;
+        }
+        if(changed)
+            ++changed_device_count;
+    }
+
+    vector<TRANSFORMER*> transformers = get_all_transformers();
+    n = transformers.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        TRANSFORMER* transformer = transformers[i];
+        bool changed = false;
+        for(unsigned int j=0; j!=3; ++j)
+        {
+            TRANSFORMER_WINDING_SIDE winding = (j==0?PRIMARY_SIDE:(j==1?SECONDARY_SIDE:TERTIARY_SIDE));
+            if(transformer->get_winding_breaker_status(winding)!=state.transformer_breaker_status[3*i+j])
+            {
+                transformer->set_winding_breaker_status(winding, state.transformer_breaker_status[3*i+j]);
+                changed = true;
+            }
+        }
+        if(changed)
+            ++changed_device_count;
+    }
+
+    vector<HVDC*> hvdcs = get_all_hvdcs();
+    n = hvdcs.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        if(hvdcs[i]->get_status()!=state.hvdc_status[i])
+        {
+            hvdcs[i]->set_status(state.hvdc_status[i]);
+            ++changed_device_count;
+        }
+    }
+
+    vector<EQUIVALENT_DEVICE*> edevices = get_all_equivalent_devices();
+    n = edevices.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        if(edevices[i]->get_status()!=state.equivalent_device_status[i])
+        {
+            edevices[i]->set_status(state.equivalent_device_status[i]);
+            ++changed_device_count;
+        }
+    }
+
+    if(bus_type_changed)
+        update_in_service_bus_count();
+
+    return changed_device_count;
+}
+
 unsigned int POWER_SYSTEM_DATABASE::get_generator_count() const
 {
     return Generator.size();
@@ -4841,6 +5333,8 @@ void POWER_SYSTEM_DATABASE::clear_bus(unsigned int bus)
 {
     if(is_bus_exist(bus))
     {
+        toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
+
         clear_sources_connecting_to_bus(bus);
         clear_loads_connecting_to_bus(bus);
         clear_lines_connecting_to_bus(bus);
@@ -5085,6 +5579,8 @@ void POWER_SYSTEM_DATABASE::clear_line(const DEVICE_ID& device_id)
 {
     if(is_line_exist(device_id))
     {
+        toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
+
         unsigned int current_index = get_line_index(device_id);
 
         vector<LINE>::iterator iter_line = Line.begin();
@@ -5131,6 +5627,8 @@ void POWER_SYSTEM_DATABASE::clear_transformer(const DEVICE_ID& device_id)
 {
     if(is_transformer_exist(device_id))
     {
+        toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
+
         unsigned int current_index = get_transformer_index(device_id);
 
         vector<TRANSFORMER>::iterator iter_transformer = Transformer.begin();
@@ -5178,6 +5676,8 @@ void POWER_SYSTEM_DATABASE::clear_fixed_shunt(const DEVICE_ID& device_id)
 {
     if(is_fixed_shunt_exist(device_id))
     {
+        toolkit->get_network_matrix().mark_network_Y_matrix_outdated();
+
         unsigned int current_index = get_fixed_shunt_index(device_id);
 
         vector<FIXED_SHUNT>::iterator iter_fs = Fixed_shunt.begin();
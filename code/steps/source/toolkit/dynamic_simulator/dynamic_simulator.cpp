@@ -6,6 +6,7 @@
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
+#include <cmath>
 #include <istream>
 #include <iostream>
 #include <ctime>
@@ -52,6 +53,12 @@ void DYNAMICS_SIMULATOR::clear()
     set_csv_file_export_enable_flag(true);
     set_json_file_export_enable_flag(false);
 
+    set_meter_buffer_capacity(0);
+    set_meter_buffer_ring_logic(false);
+
+    early_stop_flag = false;
+    release_all_dynamic_states();
+
     set_dynamic_simulation_time_in_s(0.0);
 
     set_max_DAE_iteration(100);
@@ -66,8 +73,14 @@ void DYNAMICS_SIMULATOR::clear()
     set_automatic_iteration_accelerator_tune_logic(false);
     set_rotor_angle_stability_surveillance_flag(false);
     set_rotor_angle_stability_threshold_in_deg(360.0);
+    set_network_matrix_incremental_update_logic(true);
+    set_symbolic_analysis_reuse_logic(true);
     generators_in_islands.clear();
     flag_rotor_angle_stable = true;
+
+    set_network_matrix_update_as_required();
+    network_Y_matrix_build_count_of_dynamic_network = 0;
+    network_Y_matrix_build_count_of_jacobian = 0;
 }
 
 void DYNAMICS_SIMULATOR::set_dynamic_simulation_time_step_in_s(double delt)
@@ -213,6 +226,17 @@ void DYNAMICS_SIMULATOR::set_rotor_angle_stability_surveillance_flag(bool flag)
     this->flag_rotor_angle_stability_surveillance = flag;
 }
 
+void DYNAMICS_SIMULATOR::set_network_matrix_incremental_update_logic(bool logic)
+{
+    network_matrix_incremental_update_enabled = logic;
+}
+
+void DYNAMICS_SIMULATOR::set_symbolic_analysis_reuse_logic(bool logic)
+{
+    symbolic_analysis_reuse_enabled = logic;
+    jacobian.set_symbolic_analysis_reuse_logic(logic);
+}
+
 void DYNAMICS_SIMULATOR::set_rotor_angle_stability_threshold_in_deg(double angle_th)
 {
     if(angle_th<0.0) angle_th = - angle_th;
@@ -289,6 +313,39 @@ double DYNAMICS_SIMULATOR::get_rotor_angle_stability_threshold_in_deg() const
     return this->rotor_angle_stability_threshold_in_deg;
 }
 
+bool DYNAMICS_SIMULATOR::get_network_matrix_incremental_update_logic() const
+{
+    return network_matrix_incremental_update_enabled;
+}
+
+bool DYNAMICS_SIMULATOR::get_symbolic_analysis_reuse_logic() const
+{
+    return symbolic_analysis_reuse_enabled;
+}
+
+void DYNAMICS_SIMULATOR::copy_settings_from_dynamic_simulator(const DYNAMICS_SIMULATOR& simulator)
+{
+    if(this==(&simulator)) return;
+
+    set_dynamic_simulation_time_step_in_s(simulator.get_dynamic_simulation_time_step_in_s());
+    set_max_DAE_iteration(simulator.get_max_DAE_iteration());
+    set_min_DAE_iteration(simulator.get_min_DAE_iteration());
+    set_max_network_iteration(simulator.get_max_network_iteration());
+    set_max_update_iteration(simulator.get_max_update_iteration());
+    set_max_event_update_iteration(simulator.get_max_event_update_iteration());
+    set_max_network_solution_divergent_threshold(simulator.get_max_network_solution_divergent_threshold());
+    set_allowed_max_power_imbalance_in_MVA(simulator.get_allowed_max_power_imbalance_in_MVA());
+    set_iteration_accelerator(simulator.get_iteration_accelerator());
+    set_non_divergent_solution_logic(simulator.get_non_divergent_solution_logic());
+    set_automatic_iteration_accelerator_tune_logic(simulator.get_automatic_iteration_accelerator_tune_logic());
+    set_rotor_angle_stability_surveillance_flag(simulator.get_rotor_angle_stability_surveillance_flag());
+    set_rotor_angle_stability_threshold_in_deg(simulator.get_rotor_angle_stability_threshold_in_deg());
+    set_network_matrix_incremental_update_logic(simulator.get_network_matrix_incremental_update_logic());
+    set_symbolic_analysis_reuse_logic(simulator.get_symbolic_analysis_reuse_logic());
+    set_meter_buffer_capacity(simulator.get_meter_buffer_capacity());
+    set_meter_buffer_ring_logic(simulator.get_meter_buffer_ring_logic());
+}
+
 void DYNAMICS_SIMULATOR::show_dynamic_simulator_configuration() const
 {
     ostringstream osstream;
@@ -305,9 +362,12 @@ void DYNAMICS_SIMULATOR::show_dynamic_simulator_configuration() const
             <<"Network solution accelerator: "<<get_iteration_accelerator()<<"\n"
             <<"Rotor angle stability surveillance: "<<(get_rotor_angle_stability_surveillance_flag()?"Enabled":"Disabled")<<"\n"
             <<"Rotor angle stability threshold: "<<get_rotor_angle_stability_threshold_in_deg()<<" deg\n"
+            <<"Network matrix incremental update: "<<(get_network_matrix_incremental_update_logic()?"Enabled":"Disabled")<<"\n"
+            <<"Symbolic analysis reuse: "<<(get_symbolic_analysis_reuse_logic()?"Enabled":"Disabled")<<"\n"
             <<"CSV export: "<<(is_csv_file_export_enabled()?"Enabled":"Disabled")<<"\n"
             <<"BIN export: "<<(is_bin_file_export_enabled()?"Enabled":"Disabled")<<"\n"
             <<"JSON export: "<<(is_json_file_export_enabled()?"Enabled":"Disabled")<<"\n"
+            <<"Meter buffer capacity: "<<get_meter_buffer_capacity()<<(get_meter_buffer_ring_logic()?" (ring)":"")<<"\n"
             <<"Output file name: "<<get_output_file()<<"\n";
 
     unsigned int n = meters.size();
@@ -341,7 +401,8 @@ unsigned int DYNAMICS_SIMULATOR::get_memory_usage_in_bytes()
            jacobian.get_memory_usage_in_bytes()+
 
            meters.capacity()*sizeof(METER)+
-           meter_values.capacity()*sizeof(double);
+           meter_values.capacity()*sizeof(double)+
+           meter_buffer.capacity()*sizeof(double);
 }
 
 void DYNAMICS_SIMULATOR::set_network_matrix_update_as_unrequired()
@@ -359,6 +420,85 @@ bool DYNAMICS_SIMULATOR::is_network_matrix_update_required() const
     return network_matrix_update_required;
 }
 
+void DYNAMICS_SIMULATOR::update_network_dynamic_matrix()
+{
+    NETWORK_MATRIX& network_matrix = get_network_matrix();
+    unsigned int build_count = network_matrix.get_network_Y_matrix_build_count();
+    if(is_network_matrix_update_required() or build_count!=network_Y_matrix_build_count_of_dynamic_network)
+    {
+        network_matrix.build_dynamic_network_Y_matrix();
+        build_jacobian();
+        network_Y_matrix_build_count_of_dynamic_network = network_matrix.get_network_Y_matrix_build_count();
+        set_network_matrix_update_as_unrequired();
+    }
+    else
+    {
+        if(build_count!=network_Y_matrix_build_count_of_jacobian)
+        {
+            // only values are changed by events. pattern and symbolic analysis of jacobian are kept
+            jacobian = network_matrix.get_dynamic_network_Y_matrix();
+            network_Y_matrix_build_count_of_jacobian = build_count;
+        }
+    }
+}
+
+void DYNAMICS_SIMULATOR::reset_LU_statistics()
+{
+    jacobian.reset_LU_statistics();
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_LU_symbolic_analysis_count() const
+{
+    return jacobian.get_symbolic_analysis_count();
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_LU_numeric_factorization_count() const
+{
+    return jacobian.get_numeric_factorization_count();
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_LU_solution_count() const
+{
+    return jacobian.get_solution_count();
+}
+
+double DYNAMICS_SIMULATOR::get_LU_symbolic_analysis_time_in_s() const
+{
+    return jacobian.get_symbolic_analysis_time_in_s();
+}
+
+double DYNAMICS_SIMULATOR::get_LU_numeric_factorization_time_in_s() const
+{
+    return jacobian.get_numeric_factorization_time_in_s();
+}
+
+double DYNAMICS_SIMULATOR::get_LU_solution_time_in_s() const
+{
+    return jacobian.get_solution_time_in_s();
+}
+
+void DYNAMICS_SIMULATOR::remove_device_from_network_dynamic_matrix(const DEVICE_ID& did)
+{
+    NETWORK_MATRIX& network_matrix = get_network_matrix();
+    if(get_network_matrix_incremental_update_logic() and not is_network_matrix_update_required() and
+       network_matrix.get_network_Y_matrix_build_count()==network_Y_matrix_build_count_of_dynamic_network and
+       network_matrix.remove_device_from_dynamic_network_Y_matrix(did))
+        network_Y_matrix_build_count_of_dynamic_network = network_matrix.get_network_Y_matrix_build_count();
+    else
+        set_network_matrix_update_as_required();
+}
+
+void DYNAMICS_SIMULATOR::add_device_to_network_dynamic_matrix(const DEVICE_ID& did)
+{
+    NETWORK_MATRIX& network_matrix = get_network_matrix();
+    if(get_network_matrix_incremental_update_logic() and not is_network_matrix_update_required() and
+       network_matrix.get_network_Y_matrix_build_count()==network_Y_matrix_build_count_of_dynamic_network and
+       network_matrix.add_device_to_dynamic_network_Y_matrix(did))
+        network_Y_matrix_build_count_of_dynamic_network = network_matrix.get_network_Y_matrix_build_count();
+    else
+        set_network_matrix_update_as_required();
+}
+
 void DYNAMICS_SIMULATOR::append_meter(const METER& meter)
 {
     if(meter.is_valid())
@@ -1577,6 +1717,7 @@ void DYNAMICS_SIMULATOR::clear_meters()
 {
     meters.clear();
     meter_values.clear();
+    clear_meter_stop_conditions();
 }
 
 void DYNAMICS_SIMULATOR::set_output_file(string filename)
@@ -1589,6 +1730,79 @@ string DYNAMICS_SIMULATOR::get_output_file() const
     return output_filename;
 }
 
+void DYNAMICS_SIMULATOR::set_meter_buffer_capacity(unsigned int capacity)
+{
+    meter_buffer_capacity = capacity;
+    meter_buffer_column_count = 0;
+    meter_buffer_stored_count = 0;
+    meter_buffer.clear();
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_meter_buffer_capacity() const
+{
+    return meter_buffer_capacity;
+}
+
+void DYNAMICS_SIMULATOR::set_meter_buffer_ring_logic(bool logic)
+{
+    meter_buffer_ring_enabled = logic;
+}
+
+bool DYNAMICS_SIMULATOR::get_meter_buffer_ring_logic() const
+{
+    return meter_buffer_ring_enabled;
+}
+
+const double* DYNAMICS_SIMULATOR::get_meter_buffer() const
+{
+    if(meter_buffer.size()!=0)
+        return meter_buffer.data();
+    else
+        return NULL;
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_meter_buffer_column_count() const
+{
+    return meter_buffer_column_count;
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_meter_buffer_stored_count() const
+{
+    return meter_buffer_stored_count;
+}
+
+void DYNAMICS_SIMULATOR::allocate_meter_buffer()
+{
+    meter_buffer_stored_count = 0;
+    unsigned int n = meters.size();
+    if(meter_buffer_capacity!=0 and n!=0)
+    {
+        meter_buffer_column_count = n+1;
+        meter_buffer.assign(size_t(meter_buffer_capacity)*meter_buffer_column_count, 0.0);
+    }
+    else
+    {
+        meter_buffer_column_count = 0;
+        meter_buffer.clear();
+    }
+}
+
+void DYNAMICS_SIMULATOR::save_meter_values_to_buffer()
+{
+    unsigned int n = meters.size();
+    if(meter_buffer_column_count!=n+1)
+        return;
+    if(meter_buffer_stored_count>=meter_buffer_capacity and (not get_meter_buffer_ring_logic()))
+        return;
+
+    size_t row = meter_buffer_stored_count%meter_buffer_capacity;
+    double* data = meter_buffer.data()+row*meter_buffer_column_count;
+    data[0] = TIME;
+    for(unsigned int i=0; i!=n; ++i)
+        data[i+1] = meter_values[i];
+    ++meter_buffer_stored_count;
+}
+
 void DYNAMICS_SIMULATOR::open_meter_output_files()
 {
     ostringstream osstream;
@@ -1651,11 +1865,11 @@ void DYNAMICS_SIMULATOR::open_meter_output_files()
         return;
 
         time_t tt = time(NULL);
-        tm* local_time= localtime(&tt);
+        tm local_time = get_local_time(tt);
 
         char time_stamp[60];
-        snprintf(time_stamp, 60, "dynamic_result_%d-%02d-%02d~%02d:%02d:%02d", local_time->tm_year + 1900, local_time->tm_mon + 1,
-                local_time->tm_mday, local_time->tm_hour, local_time->tm_min, local_time->tm_sec);
+        snprintf(time_stamp, 60, "dynamic_result_%d-%02d-%02d~%02d:%02d:%02d", local_time.tm_year + 1900, local_time.tm_mon + 1,
+                local_time.tm_mday, local_time.tm_hour, local_time.tm_min, local_time.tm_sec);
         output_filename = string(time_stamp);
 
         osstream<<"Meter output filename is not properly set. Meters will be automatically exported to the following file:"<<endl
@@ -1747,18 +1961,18 @@ void DYNAMICS_SIMULATOR::save_meter_information()
 
             if(is_bin_file_export_enabled() and bin_output_file.is_open())
             {
-                unsigned int bin_version=0;
+                unsigned int bin_version=1;
                 bin_output_file.write((char *)(&bin_version), sizeof(bin_version));
 
                 time_t tt = time(NULL);
-                tm* local_time= localtime(&tt);
+                tm local_time = get_local_time(tt);
 
-                unsigned int year = local_time->tm_year + 1900;
-                unsigned int month = local_time->tm_mon + 1;
-                unsigned int day = local_time->tm_mday;
-                unsigned int hour = local_time->tm_hour;
-                unsigned int minute = local_time->tm_min;
-                unsigned int second = local_time->tm_sec;
+                unsigned int year = local_time.tm_year + 1900;
+                unsigned int month = local_time.tm_mon + 1;
+                unsigned int day = local_time.tm_mday;
+                unsigned int hour = local_time.tm_hour;
+                unsigned int minute = local_time.tm_min;
+                unsigned int second = local_time.tm_sec;
 
                 bin_output_file.write((char *)(&year), sizeof(year));
                 bin_output_file.write((char *)(&month), sizeof(month));
@@ -1770,7 +1984,7 @@ void DYNAMICS_SIMULATOR::save_meter_information()
                 unsigned int float_size=sizeof(float);
                 bin_output_file.write((char *)(&float_size), sizeof(float_size));
 
-                unsigned int m = 4+n;
+                unsigned int m = 8+n;
                 bin_output_file.write((char *)(&m), sizeof(m));
                 string meter_names ="";
 
@@ -1802,7 +2016,7 @@ void DYNAMICS_SIMULATOR::save_meter_information()
 void DYNAMICS_SIMULATOR::save_meter_values()
 {
     unsigned int n = meters.size();
-    if(n!=0 and (csv_output_file.is_open() or json_output_file.is_open() or bin_output_file.is_open()))
+    if(n!=0 and (meter_buffer.size()!=0 or csv_output_file.is_open() or json_output_file.is_open() or bin_output_file.is_open()))
     {
         //get_bus_current_mismatch();
         //calculate_bus_power_mismatch_in_MVA();
@@ -1816,6 +2030,9 @@ void DYNAMICS_SIMULATOR::save_meter_values()
 
         update_all_meters_value();
 
+        if(meter_buffer.size()!=0)
+            save_meter_values_to_buffer();
+
         if(is_bin_file_export_enabled() and bin_output_file.is_open())
         {
             float fvalue=0.0;
@@ -1827,10 +2044,10 @@ void DYNAMICS_SIMULATOR::save_meter_values()
             bin_output_file.write(fdata, sizeof(float));
 
             ivalue = ITER_DAE;
-            bin_output_file.write(fdata, sizeof(int));
+            bin_output_file.write(idata, sizeof(int));
 
             ivalue = ITER_NET;
-            bin_output_file.write(fdata, sizeof(int));
+            bin_output_file.write(idata, sizeof(int));
 
             fvalue = max_power_mismatch_MVA;
             bin_output_file.write(fdata, sizeof(float));
@@ -1949,11 +2166,11 @@ void DYNAMICS_SIMULATOR::start()
 {
     microseconds_elapse_of_differential_equations_in_a_step = 0;
     microseconds_elapse_of_network_solution_in_a_step = 0;
+    reset_LU_statistics();
 
     toolkit->update_device_thread_number();
 
     POWERFLOW_SOLVER& pf_solver = toolkit->get_powerflow_solver();
-    NETWORK_MATRIX& network_matrix = get_network_matrix();
 
     detailed_log_enabled = toolkit->is_detailed_log_enabled();
 
@@ -1975,9 +2192,13 @@ void DYNAMICS_SIMULATOR::start()
 
 
     meter_values.resize(meters.size(), 0.0);
+    allocate_meter_buffer();
 
     TIME = -2.0*DELT;
     flag_rotor_angle_stable = true;
+    early_stop_flag = false;
+    for(unsigned int i=0; i!=meter_stop_conditions.size(); ++i)
+        meter_stop_conditions[i].violated = false;
 
     optimize_network_ordering();
 
@@ -1986,8 +2207,8 @@ void DYNAMICS_SIMULATOR::start()
     run_all_models(INITIALIZE_MODE);
     run_bus_frequency_blocks(INITIALIZE_MODE);
 
-    network_matrix.build_dynamic_network_Y_matrix();
-    build_jacobian();
+    set_network_matrix_update_as_required();
+    update_network_dynamic_matrix();
 
     //const SPARSE_MATRIX& Y = network_matrix.get_dynamic_network_Y_matrix();
     //Y.report_brief();
@@ -2093,25 +2314,261 @@ double DYNAMICS_SIMULATOR::get_system_max_angle_difference_in_deg()
     return max_angle-min_angle;
 }
 
-void DYNAMICS_SIMULATOR::run_to(double time)
+void DYNAMICS_SIMULATOR::add_meter_stop_condition(unsigned int meter_index, double lower_limit, double upper_limit, double duration_in_s)
 {
-    NETWORK_MATRIX& network_matrix = toolkit->get_network_matrix();
+    ostringstream osstream;
+    if(meter_index>=meters.size())
+    {
+        osstream<<"Meter index "<<meter_index<<" exceeds meter count "<<meters.size()<<". No meter stop condition will be added.";
+        toolkit->show_information_with_leading_time_stamp(osstream);
+        return;
+    }
+    METER_STOP_CONDITION_STRUCT condition;
+    condition.meter_index = meter_index;
+    condition.lower_limit = lower_limit;
+    condition.upper_limit = upper_limit;
+    condition.duration_in_s = duration_in_s;
+    condition.violated = false;
+    condition.violation_start_time_in_s = 0.0;
+    meter_stop_conditions.push_back(condition);
+}
 
-    network_matrix.build_dynamic_network_Y_matrix();
-    build_jacobian();
+void DYNAMICS_SIMULATOR::clear_meter_stop_conditions()
+{
+    meter_stop_conditions.clear();
+}
 
-    update_with_event();
-    if(get_rotor_angle_stability_surveillance_flag()==false)
+unsigned int DYNAMICS_SIMULATOR::get_meter_stop_condition_count() const
+{
+    return meter_stop_conditions.size();
+}
+
+bool DYNAMICS_SIMULATOR::get_early_stop_flag() const
+{
+    return early_stop_flag;
+}
+
+bool DYNAMICS_SIMULATOR::is_meter_stop_condition_met()
+{
+    unsigned int n = meter_stop_conditions.size();
+    unsigned int nmeter = meters.size();
+    for(unsigned int i=0; i!=n; ++i)
     {
-        while(TIME<=time-DOUBLE_EPSILON)
-            run_a_step();
+        METER_STOP_CONDITION_STRUCT& condition = meter_stop_conditions[i];
+        if(condition.meter_index>=nmeter)
+            continue;
+
+        double value = meters[condition.meter_index].get_meter_value();
+        if(std::isnan(value) or value<condition.lower_limit or value>condition.upper_limit)
+        {
+            if(not condition.violated)
+            {
+                condition.violated = true;
+                condition.violation_start_time_in_s = TIME;
+            }
+            if(TIME-condition.violation_start_time_in_s>=condition.duration_in_s-DOUBLE_EPSILON)
+            {
+                ostringstream osstream;
+                osstream<<"At time "<<TIME<<"s, "
+                        <<"meter "<<meters[condition.meter_index].get_meter_name()<<" is "<<value
+                        <<", out of ["<<condition.lower_limit<<", "<<condition.upper_limit<<"] for "<<TIME-condition.violation_start_time_in_s<<"s."<<endl
+                        <<"No further simulation will be performed.";
+                toolkit->show_information_with_leading_time_stamp(osstream);
+                return true;
+            }
+        }
+        else
+            condition.violated = false;
     }
-    else
+    return false;
+}
+
+unsigned int DYNAMICS_SIMULATOR::save_dynamic_state()
+{
+    ostringstream osstream;
+    if(internal_bus_pointers.size()==0)
+    {
+        osstream<<"Error. Dynamic simulation is not started. No dynamic state will be saved.";
+        toolkit->show_information_with_leading_time_stamp(osstream);
+        return INDEX_NOT_EXIST;
+    }
+
+    unsigned int handle = dynamic_states.size();
+    for(unsigned int i=0; i!=dynamic_states.size(); ++i)
     {
-        while(TIME<=time-DOUBLE_EPSILON)
+        if(not dynamic_states[i].in_use)
         {
-            run_a_step();
+            handle = i;
+            break;
+        }
+    }
+    if(handle==dynamic_states.size())
+        dynamic_states.push_back(DYNAMIC_STATE_STRUCT());
+
+    DYNAMIC_STATE_STRUCT& state = dynamic_states[handle];
+    state.in_use = true;
+    state.time_in_s = TIME;
+    state.time_step_in_s = DELT;
+    state.rotor_angle_stable = flag_rotor_angle_stable;
+    state.iteration_accelerator = alpha;
+
+    DYNAMIC_MODEL_DATABASE& dmdb = toolkit->get_dynamic_model_database();
+    dmdb.save_model_warehouse(state.model_warehouse);
 
+    POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
+    psdb.save_device_state(state.device_state);
+
+    vector<BUS*> buses = psdb.get_all_buses();
+    unsigned int n = buses.size();
+    state.bus_Euler_complex_numbers.resize(n);
+    state.bus_frequency_models.clear();
+    state.bus_frequency_models.reserve(n);
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        state.bus_Euler_complex_numbers[i] = buses[i]->get_positive_sequence_Euler_complex_number();
+        state.bus_frequency_models.push_back(*(buses[i]->get_bus_frequency_model()));
+    }
+    state.internal_bus_complex_voltage_in_pu = internal_bus_complex_voltage_in_pu;
+
+    state.meter_values = meter_values;
+    state.meter_buffer = meter_buffer;
+    state.meter_buffer_stored_count = meter_buffer_stored_count;
+    n = meter_stop_conditions.size();
+    state.meter_stop_condition_violated.clear();
+    state.meter_stop_condition_violation_start_time_in_s.clear();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        state.meter_stop_condition_violated.push_back(meter_stop_conditions[i].violated);
+        state.meter_stop_condition_violation_start_time_in_s.push_back(meter_stop_conditions[i].violation_start_time_in_s);
+    }
+
+    osstream<<"Dynamic state "<<handle<<" is saved at time "<<TIME<<" s.";
+    toolkit->show_information_with_leading_time_stamp(osstream);
+    return handle;
+}
+
+bool DYNAMICS_SIMULATOR::restore_dynamic_state(unsigned int handle)
+{
+    ostringstream osstream;
+    if(handle>=dynamic_states.size() or (not dynamic_states[handle].in_use))
+    {
+        osstream<<"Error. Dynamic state "<<handle<<" does not exist. No dynamic state will be restored.";
+        toolkit->show_information_with_leading_time_stamp(osstream);
+        return false;
+    }
+
+    DYNAMIC_STATE_STRUCT& state = dynamic_states[handle];
+    POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
+
+    if(not psdb.is_device_state_applicable(state.device_state) or
+       meter_values.size()!=state.meter_values.size() or meter_stop_conditions.size()!=state.meter_stop_condition_violated.size())
+    {
+        osstream<<"Error. Devices or meters are changed after dynamic state "<<handle<<" is saved. No dynamic state will be restored.";
+        toolkit->show_information_with_leading_time_stamp(osstream);
+        return false;
+    }
+
+    DYNAMIC_MODEL_DATABASE& dmdb = toolkit->get_dynamic_model_database();
+    if(not dmdb.restore_model_warehouse(state.model_warehouse))
+        return false;
+
+    TIME = state.time_in_s;
+    DELT = state.time_step_in_s;
+    flag_rotor_angle_stable = state.rotor_angle_stable;
+    alpha = state.iteration_accelerator;
+    early_stop_flag = false;
+
+    bool bus_type_changed = false;
+    psdb.restore_device_state(state.device_state, bus_type_changed);
+
+    vector<BUS*> buses = psdb.get_all_buses();
+    unsigned int n = buses.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        BUS* bus = buses[i];
+        bus->set_positive_sequence_angle_in_rad(state.device_state.bus_angles_in_rad[i], state.bus_Euler_complex_numbers[i]);
+        *(bus->get_bus_frequency_model()) = state.bus_frequency_models[i];
+    }
+
+    meter_values = state.meter_values;
+    meter_buffer = state.meter_buffer;
+    meter_buffer_stored_count = state.meter_buffer_stored_count;
+    n = meter_stop_conditions.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        meter_stop_conditions[i].violated = state.meter_stop_condition_violated[i];
+        meter_stop_conditions[i].violation_start_time_in_s = state.meter_stop_condition_violation_start_time_in_s[i];
+    }
+
+    if(bus_type_changed)
+    {
+        in_service_buses = psdb.get_all_in_service_buses();
+        optimize_network_ordering();
+    }
+    if(internal_bus_complex_voltage_in_pu.size()==state.internal_bus_complex_voltage_in_pu.size())
+        internal_bus_complex_voltage_in_pu = state.internal_bus_complex_voltage_in_pu;
+    else
+        initialize_internal_bus_voltage_vector();
+
+    generators_in_islands.clear();
+    if(get_rotor_angle_stability_surveillance_flag()==true)
+        update_generators_in_islands();
+
+    set_network_matrix_update_as_required();
+
+    osstream<<"Dynamic state "<<handle<<" is restored. Dynamic simulation time is reset to "<<TIME<<" s.";
+    toolkit->show_information_with_leading_time_stamp(osstream);
+    return true;
+}
+
+void DYNAMICS_SIMULATOR::release_dynamic_state(unsigned int handle)
+{
+    if(handle<dynamic_states.size())
+    {
+        dynamic_states[handle] = DYNAMIC_STATE_STRUCT();
+        dynamic_states[handle].in_use = false;
+    }
+}
+
+void DYNAMICS_SIMULATOR::release_all_dynamic_states()
+{
+    dynamic_states.clear();
+}
+
+unsigned int DYNAMICS_SIMULATOR::get_dynamic_state_count() const
+{
+    unsigned int n = 0;
+    for(unsigned int i=0; i!=dynamic_states.size(); ++i)
+    {
+        if(dynamic_states[i].in_use)
+            ++n;
+    }
+    return n;
+}
+
+void DYNAMICS_SIMULATOR::run_to(double time)
+{
+    run_to(time, NULL, 0);
+}
+
+void DYNAMICS_SIMULATOR::run_to(double time, DYNAMIC_SIMULATION_STEP_CALLBACK callback, unsigned int callback_step_interval)
+{
+    if(not get_network_matrix_incremental_update_logic())
+        set_network_matrix_update_as_required();
+    update_network_dynamic_matrix();
+
+    update_with_event();
+
+    early_stop_flag = false;
+    if(callback_step_interval==0)
+        callback_step_interval = 1;
+    unsigned int step_count = 0;
+    while(TIME<=time-DOUBLE_EPSILON)
+    {
+        run_a_step();
+
+        if(get_rotor_angle_stability_surveillance_flag()==true)
+        {
             update_generators_in_islands();
             flag_rotor_angle_stable = is_system_angular_stable();
             if(flag_rotor_angle_stable==true)
@@ -2123,9 +2580,35 @@ void DYNAMICS_SIMULATOR::run_to(double time)
                         <<"system is detected to be unstable due to rotor angular stability surveillance logic."<<endl
                         <<"No further simulation will be performed.";
                 toolkit->show_information_with_leading_time_stamp(osstream);
+                early_stop_flag = true;
                 break;
             }
         }
+
+        if(meter_stop_conditions.size()!=0 and is_meter_stop_condition_met())
+        {
+            early_stop_flag = true;
+            break;
+        }
+
+        if(callback!=NULL)
+        {
+            ++step_count;
+            if(step_count>=callback_step_interval)
+            {
+                step_count = 0;
+                if(callback(TIME))
+                {
+                    ostringstream osstream;
+                    osstream<<"At time "<<TIME<<"s, "
+                            <<"dynamic simulation is stopped by step callback."<<endl
+                            <<"No further simulation will be performed.";
+                    toolkit->show_information_with_leading_time_stamp(osstream);
+                    early_stop_flag = true;
+                    break;
+                }
+            }
+        }
     }
 }
 
@@ -2145,12 +2628,7 @@ void DYNAMICS_SIMULATOR::run_a_step()
     update_equivalent_devices_buffer();
     update_equivalent_devices_output();
 
-    if(is_network_matrix_update_required())
-    {
-        NETWORK_MATRIX& network = get_network_matrix();
-        network.build_dynamic_network_Y_matrix();
-        set_network_matrix_update_as_unrequired();
-    }
+    update_network_dynamic_matrix();
     //bool network_converged = false;
     //bool DAE_converged = false;
     ITER_DAE = 0;
@@ -3456,6 +3934,7 @@ void DYNAMICS_SIMULATOR::build_jacobian()
 
     jacobian = Y;
     jacobian.compress_and_merge_duplicate_entries();
+    network_Y_matrix_build_count_of_jacobian = network_matrix.get_network_Y_matrix_build_count();
     return;
 
     unsigned int nbus = Y.get_matrix_size();
@@ -3774,7 +4253,9 @@ void DYNAMICS_SIMULATOR::set_bus_fault(unsigned int bus, const complex<double>&
                    <<"Fault shunt is"<<fault_shunt<<" pu.";
             toolkit->show_information_with_leading_time_stamp(osstream);
 
+            remove_device_from_network_dynamic_matrix(busptr->get_device_id());
             busptr->set_fault(fault);
+            add_device_to_network_dynamic_matrix(busptr->get_device_id());
             guess_bus_voltage_with_bus_fault_set(bus, fault);
 
             //network_matrix.build_dynamic_network_Y_matrix();
@@ -3809,7 +4290,9 @@ void DYNAMICS_SIMULATOR::clear_bus_fault(unsigned int bus)
         toolkit->show_information_with_leading_time_stamp(osstream);
 
         FAULT fault = busptr->get_fault();
+        remove_device_from_network_dynamic_matrix(busptr->get_device_id());
         busptr->clear_fault();
+        add_device_to_network_dynamic_matrix(busptr->get_device_id());
         guess_bus_voltage_with_bus_fault_cleared(bus, fault);
 
         //network_matrix.build_dynamic_network_Y_matrix();
@@ -3877,7 +4360,9 @@ void DYNAMICS_SIMULATOR::set_line_fault(const DEVICE_ID& line_id, unsigned int s
                         toolkit->show_information_with_leading_time_stamp(osstream);
 
 
+                        remove_device_from_network_dynamic_matrix(line_id);
                         lineptr->set_fault(side_bus,location, fault);
+                        add_device_to_network_dynamic_matrix(line_id);
                         guess_bus_voltage_with_line_fault_set(line_id, side_bus, location, fault);
 
                         //network_matrix.build_dynamic_network_Y_matrix();
@@ -3940,7 +4425,9 @@ void DYNAMICS_SIMULATOR::clear_line_fault(const DEVICE_ID& line_id, unsigned int
                     toolkit->show_information_with_leading_time_stamp(osstream);
 
                     FAULT fault = lineptr->get_fault_at_location(side_bus, location);
+                    remove_device_from_network_dynamic_matrix(line_id);
                     lineptr->clear_fault_at_location(side_bus, location);
+                    add_device_to_network_dynamic_matrix(line_id);
                     guess_bus_voltage_with_line_fault_cleared(line_id, side_bus, location, fault);
 
                     //network_matrix.build_dynamic_network_Y_matrix();
@@ -4031,7 +4518,9 @@ void DYNAMICS_SIMULATOR::trip_line_breaker(const DEVICE_ID& line_id, unsigned in
             {
                 if(lineptr->get_sending_side_breaker_status()==true)
                 {
+                    remove_device_from_network_dynamic_matrix(line_id);
                     lineptr->set_sending_side_breaker_status(false);
+                    add_device_to_network_dynamic_matrix(line_id);
                     //network_matrix.build_dynamic_network_Y_matrix();
                     //build_jacobian();
 
@@ -4045,7 +4534,9 @@ void DYNAMICS_SIMULATOR::trip_line_breaker(const DEVICE_ID& line_id, unsigned in
                 {
                     if(lineptr->get_receiving_side_breaker_status()==true)
                     {
+                        remove_device_from_network_dynamic_matrix(line_id);
                         lineptr->set_receiving_side_breaker_status(false);
+                        add_device_to_network_dynamic_matrix(line_id);
                         //network_matrix.build_dynamic_network_Y_matrix();
                         //build_jacobian();
 
@@ -4125,7 +4616,9 @@ void DYNAMICS_SIMULATOR::close_line_breaker(const DEVICE_ID& line_id, unsigned i
             {
                 if(lineptr->get_sending_side_breaker_status()==false)
                 {
+                    remove_device_from_network_dynamic_matrix(line_id);
                     lineptr->set_sending_side_breaker_status(true);
+                    add_device_to_network_dynamic_matrix(line_id);
                     //network_matrix.build_dynamic_network_Y_matrix();
                     //build_jacobian();
                     osstream<<lineptr->get_device_name()<<" breaker at sending side (bus "<<lineptr->get_sending_side_bus()<<") is closed at time "<<TIME<<" s.";
@@ -4138,7 +4631,9 @@ void DYNAMICS_SIMULATOR::close_line_breaker(const DEVICE_ID& line_id, unsigned i
                 {
                     if(lineptr->get_receiving_side_breaker_status()==false)
                     {
+                        remove_device_from_network_dynamic_matrix(line_id);
                         lineptr->set_receiving_side_breaker_status(true);
+                        add_device_to_network_dynamic_matrix(line_id);
                         //network_matrix.build_dynamic_network_Y_matrix();
                         //build_jacobian();
                         osstream<<lineptr->get_device_name()<<" breaker at receiving side (bus "<<lineptr->get_sending_side_bus()<<") is closed at time "<<TIME<<" s.";
@@ -4229,7 +4724,9 @@ void DYNAMICS_SIMULATOR::trip_transformer_breaker(const DEVICE_ID& trans_id, uns
             {
                 if(transptr->get_winding_breaker_status(PRIMARY_SIDE)==true)
                 {
+                    remove_device_from_network_dynamic_matrix(trans_id);
                     transptr->set_winding_breaker_status(PRIMARY_SIDE, false);
+                    add_device_to_network_dynamic_matrix(trans_id);
                     //network_matrix.build_dynamic_network_Y_matrix();
                     //build_jacobian();
 
@@ -4243,7 +4740,9 @@ void DYNAMICS_SIMULATOR::trip_transformer_breaker(const DEVICE_ID& trans_id, uns
                 {
                     if(transptr->get_winding_breaker_status(SECONDARY_SIDE)==true)
                     {
+                        remove_device_from_network_dynamic_matrix(trans_id);
                         transptr->set_winding_breaker_status(SECONDARY_SIDE, false);
+                        add_device_to_network_dynamic_matrix(trans_id);
                         //network_matrix.build_dynamic_network_Y_matrix();
                         //build_jacobian();
 
@@ -4257,7 +4756,9 @@ void DYNAMICS_SIMULATOR::trip_transformer_breaker(const DEVICE_ID& trans_id, uns
                     {
                         if(transptr->get_winding_breaker_status(TERTIARY_SIDE)==true)
                         {
+                            remove_device_from_network_dynamic_matrix(trans_id);
                             transptr->set_winding_breaker_status(TERTIARY_SIDE, false);
+                            add_device_to_network_dynamic_matrix(trans_id);
                             //network_matrix.build_dynamic_network_Y_matrix();
                             //build_jacobian();
 
@@ -4352,7 +4853,9 @@ void DYNAMICS_SIMULATOR::close_transformer_breaker(const DEVICE_ID& trans_id, un
             {
                 if(transptr->get_winding_breaker_status(PRIMARY_SIDE)==false)
                 {
+                    remove_device_from_network_dynamic_matrix(trans_id);
                     transptr->set_winding_breaker_status(PRIMARY_SIDE, true);
+                    add_device_to_network_dynamic_matrix(trans_id);
                     //network_matrix.build_dynamic_network_Y_matrix();
                     //build_jacobian();
                     osstream<<transptr->get_device_name()<<" breaker at primary side (bus "<<side_bus<<") is closed at time "<<TIME<<" s.";
@@ -4365,7 +4868,9 @@ void DYNAMICS_SIMULATOR::close_transformer_breaker(const DEVICE_ID& trans_id, un
                 {
                     if(transptr->get_winding_breaker_status(SECONDARY_SIDE)==false)
                     {
+                        remove_device_from_network_dynamic_matrix(trans_id);
                         transptr->set_winding_breaker_status(SECONDARY_SIDE, true);
+                        add_device_to_network_dynamic_matrix(trans_id);
                         //network_matrix.build_dynamic_network_Y_matrix();
                         //build_jacobian();
                         osstream<<transptr->get_device_name()<<" breaker at secondary side (bus "<<side_bus<<") is closed at time "<<TIME<<" s.";
@@ -4378,7 +4883,9 @@ void DYNAMICS_SIMULATOR::close_transformer_breaker(const DEVICE_ID& trans_id, un
                     {
                         if(transptr->get_winding_breaker_status(TERTIARY_SIDE)==false)
                         {
+                            remove_device_from_network_dynamic_matrix(trans_id);
                             transptr->set_winding_breaker_status(TERTIARY_SIDE, true);
+                            add_device_to_network_dynamic_matrix(trans_id);
                             //network_matrix.build_dynamic_network_Y_matrix();
                             //build_jacobian();
                             osstream<<transptr->get_device_name()<<" breaker at secondary side (bus "<<side_bus<<") is closed at time "<<TIME<<" s.";
@@ -4418,7 +4925,9 @@ void DYNAMICS_SIMULATOR::trip_generator(const DEVICE_ID& gen_id)
 
             if(generator->get_status()==true)
             {
+                remove_device_from_network_dynamic_matrix(gen_id);
                 generator->set_status(false);
+                add_device_to_network_dynamic_matrix(gen_id);
 
                 //network_matrix.build_dynamic_network_Y_matrix();
                 //build_jacobian();
@@ -4469,7 +4978,9 @@ void DYNAMICS_SIMULATOR::shed_generator(const DEVICE_ID& gen_id,double percent)
                     osstream<<generator->get_device_name()<<" is shed by "<<percent*100.0<<"% at time "<<TIME<<" s."<<endl
                             <<"MBASE is changed from "<<mbase<<" MVA to ";
 
+                    remove_device_from_network_dynamic_matrix(gen_id);
                     generator->set_mbase_in_MVA(mbase*(1.0-percent));
+                    add_device_to_network_dynamic_matrix(gen_id);
                     osstream<<generator->get_mbase_in_MVA()<<" MVA.";
                     toolkit->show_information_with_leading_time_stamp(osstream);
                 }
@@ -4516,16 +5027,20 @@ void DYNAMICS_SIMULATOR::trip_wt_generator(const DEVICE_ID& gen_id, unsigned int
                     unsigned int N = generator->get_number_of_lumped_wt_generators();
                     if(n<N)
                     {
+                        remove_device_from_network_dynamic_matrix(gen_id);
                         generator->set_number_of_lumped_wt_generators(N-n);
                         double mbase = generator->get_mbase_in_MVA();
                         generator->set_mbase_in_MVA(mbase/N*(N-n));
+                        add_device_to_network_dynamic_matrix(gen_id);
 
                         osstream<<n<<" individual generators of "<<generator->get_device_name()<<" are tripped at time "<<TIME<<" s.";
                         toolkit->show_information_with_leading_time_stamp(osstream);
                     }
                     else
                     {
+                        remove_device_from_network_dynamic_matrix(gen_id);
                         generator->set_status(false);
+                        add_device_to_network_dynamic_matrix(gen_id);
 
                         osstream<<"All individual generators of "<<generator->get_device_name()<<" are tripped at time "<<TIME<<" s.";
                         toolkit->show_information_with_leading_time_stamp(osstream);
@@ -4584,7 +5099,9 @@ void DYNAMICS_SIMULATOR::shed_wt_generator(const DEVICE_ID& gen_id,double percen
                     osstream<<generator->get_device_name()<<" is shed by "<<percent*100.0<<"% at time "<<TIME<<" s."<<endl
                             <<"MBASE is changed from "<<mbase<<" MVA to ";
 
+                    remove_device_from_network_dynamic_matrix(gen_id);
                     generator->set_mbase_in_MVA(mbase*(1.0-percent));
+                    add_device_to_network_dynamic_matrix(gen_id);
                     osstream<<generator->get_mbase_in_MVA()<<" MVA.";
                     toolkit->show_information_with_leading_time_stamp(osstream);
                 }
@@ -4625,7 +5142,9 @@ void DYNAMICS_SIMULATOR::trip_load(const DEVICE_ID& load_id)
 
             if(load->get_status()==true)
             {
+                remove_device_from_network_dynamic_matrix(load_id);
                 load->set_status(false);
+                add_device_to_network_dynamic_matrix(load_id);
 
                 //network_matrix.build_dynamic_network_Y_matrix();
                 //build_jacobian();
@@ -4663,8 +5182,10 @@ void DYNAMICS_SIMULATOR::close_load(const DEVICE_ID& load_id)
 
             if(load->get_status()==false)
             {
+                remove_device_from_network_dynamic_matrix(load_id);
                 load->set_status(true);
                 load->get_load_model()->initialize_to_start();
+                add_device_to_network_dynamic_matrix(load_id);
 
                 //network_matrix.build_dynamic_network_Y_matrix();
                 //build_jacobian();
@@ -4706,7 +5227,9 @@ void DYNAMICS_SIMULATOR::scale_load(const DEVICE_ID& load_id, double percent)
                 {
                     osstream<<load->get_device_name()<<" is manually scaled "<<(percent>0.0?"up":"down")<<" by "<<percent*100.0<<"% at time "<<TIME<<" s."<<endl;
                     double scale = load->get_load_manually_scale_factor_in_pu();
+                    remove_device_from_network_dynamic_matrix(load_id);
                     load->set_load_manually_scale_factor_in_pu(scale+percent);
+                    add_device_to_network_dynamic_matrix(load_id);
                     osstream<<"Load manual scale is changed from "<<scale<<" to "<<scale+percent<<".";
                     toolkit->show_information_with_leading_time_stamp(osstream);
                 }
@@ -4774,7 +5297,9 @@ void DYNAMICS_SIMULATOR::trip_fixed_shunt(const DEVICE_ID& shunt_id)
 
             if(shunt->get_status()==true)
             {
+                remove_device_from_network_dynamic_matrix(shunt_id);
                 shunt->set_status(false);
+                add_device_to_network_dynamic_matrix(shunt_id);
 
                 //network_matrix.build_dynamic_network_Y_matrix();
                 //build_jacobian();
@@ -4812,7 +5337,9 @@ void DYNAMICS_SIMULATOR::close_fixed_shunt(const DEVICE_ID& shunt_id)
 
             if(shunt->get_status()==false)
             {
+                remove_device_from_network_dynamic_matrix(shunt_id);
                 shunt->set_status(true);
+                add_device_to_network_dynamic_matrix(shunt_id);
 
                 //network_matrix.build_dynamic_network_Y_matrix();
                 //build_jacobian();
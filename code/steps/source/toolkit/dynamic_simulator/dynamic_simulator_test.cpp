@@ -52,6 +52,10 @@ DYNAMICS_SIMULATOR_TEST::DYNAMICS_SIMULATOR_TEST()
     TEST_ADD(DYNAMICS_SIMULATOR_TEST::test_run_SD_133_bus_model);
 
     TEST_ADD(DYNAMICS_SIMULATOR_TEST::test_run_bench_shandong_100_bus_model_with_dc_GENROU_CDC4T);
+
+    TEST_ADD(DYNAMICS_SIMULATOR_TEST::test_save_and_restore_dynamic_state);
+    TEST_ADD(DYNAMICS_SIMULATOR_TEST::test_reset_to_base_case_with_partially_tripped_wt_generator);
+    TEST_ADD(DYNAMICS_SIMULATOR_TEST::test_restore_dynamic_state_with_partially_tripped_wt_generator);
 }
 
 void DYNAMICS_SIMULATOR_TEST::setup()
@@ -1015,4 +1019,156 @@ void DYNAMICS_SIMULATOR_TEST::test_run_IEEE_9_bus_model_with_all_WT3_models()
     default_toolkit.close_log_file();
 }
 
+
+void DYNAMICS_SIMULATOR_TEST::test_save_and_restore_dynamic_state()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"DYNAMICS_SIMULATOR_TEST");
+
+    DYNAMICS_SIMULATOR& simulator = default_toolkit.get_dynamic_simulator();
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    PSSE_IMEXPORTER importer(default_toolkit);
+    importer.load_powerflow_data("../../../bench/IEEE9.raw");
+    importer.load_dynamic_data("../../../bench/IEEE9.dyr");
+
+    POWERFLOW_SOLVER& powerflow_solver = default_toolkit.get_powerflow_solver();
+    powerflow_solver.set_max_iteration(30);
+    powerflow_solver.set_allowed_max_active_power_imbalance_in_MW(0.00001);
+    powerflow_solver.set_allowed_max_reactive_power_imbalance_in_MVar(0.00001);
+    powerflow_solver.set_flat_start_logic(false);
+    powerflow_solver.solve_with_fast_decoupled_solution();
+
+    simulator.set_csv_file_export_enable_flag(false);
+    simulator.set_output_file("");
+    simulator.start();
+    simulator.run_to(0.5);
+
+    TEST_ASSERT(simulator.get_dynamic_state_count()==0);
+    unsigned int handle = simulator.save_dynamic_state();
+    TEST_ASSERT(handle!=INDEX_NOT_EXIST);
+    TEST_ASSERT(simulator.get_dynamic_state_count()==1);
+
+    DEVICE_ID did = get_generator_device_id(2, "1");
+    GENERATOR* gen = psdb.get_generator(did);
+    SYNC_GENERATOR_MODEL* gen_model = gen->get_sync_generator_model();
+
+    vector<double> angles[2], voltages[2];
+    for(unsigned int run=0; run!=2; ++run)
+    {
+        if(run==1)
+        {
+            TEST_ASSERT(simulator.restore_dynamic_state(handle)==true);
+            TEST_ASSERT(fabs(simulator.get_dynamic_simulation_time_in_s()-0.5)<FLOAT_EPSILON);
+            TEST_ASSERT(psdb.get_bus(7)->is_faulted()==false);
+        }
+
+        simulator.set_bus_fault(7, complex<double>(0.0, -2e5));
+        simulator.run_to(0.6);
+        simulator.clear_bus_fault(7);
+        while(simulator.get_dynamic_simulation_time_in_s()<2.0-FLOAT_EPSILON)
+        {
+            simulator.run_a_step();
+            angles[run].push_back(gen_model->get_rotor_angle_in_deg());
+            voltages[run].push_back(psdb.get_bus_positive_sequence_voltage_in_pu(7));
+        }
+    }
+
+    TEST_ASSERT(angles[0].size()!=0);
+    TEST_ASSERT(angles[0].size()==angles[1].size());
+    unsigned int n = angles[0].size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        TEST_ASSERT(fabs(angles[0][i]-angles[1][i])<1e-6);
+        TEST_ASSERT(fabs(voltages[0][i]-voltages[1][i])<1e-6);
+    }
+
+    TEST_ASSERT(simulator.restore_dynamic_state(handle+1)==false);
+    simulator.release_dynamic_state(handle);
+    TEST_ASSERT(simulator.get_dynamic_state_count()==0);
+    TEST_ASSERT(simulator.restore_dynamic_state(handle)==false);
+}
+
+void DYNAMICS_SIMULATOR_TEST::test_reset_to_base_case_with_partially_tripped_wt_generator()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"DYNAMICS_SIMULATOR_TEST");
+
+    DYNAMICS_SIMULATOR& simulator = default_toolkit.get_dynamic_simulator();
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    PSSE_IMEXPORTER importer(default_toolkit);
+    importer.load_powerflow_data("../../../bench/ieee39.raw");
+    importer.load_dynamic_data("../../../bench/IEEE39.dyr");
+
+    POWERFLOW_SOLVER& powerflow_solver = default_toolkit.get_powerflow_solver();
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    default_toolkit.cache_base_case();
+
+    DEVICE_ID did = get_wt_generator_device_id(36, "1");
+    WT_GENERATOR* gen = psdb.get_wt_generator(did);
+    unsigned int N = gen->get_number_of_lumped_wt_generators();
+    double mbase = gen->get_mbase_in_MVA();
+    TEST_ASSERT(N>2);
+
+    simulator.set_csv_file_export_enable_flag(false);
+    simulator.set_output_file("");
+    for(unsigned int run=0; run!=2; ++run)
+    {
+        simulator.start();
+        simulator.run_to(0.1);
+        simulator.trip_wt_generator(did, 2);
+        TEST_ASSERT(gen->get_number_of_lumped_wt_generators()==N-2);
+        TEST_ASSERT(fabs(gen->get_mbase_in_MVA()-mbase/N*(N-2))<FLOAT_EPSILON);
+        simulator.run_to(0.2);
+        simulator.stop();
+
+        TEST_ASSERT(default_toolkit.reset_to_base_case()==true);
+        TEST_ASSERT(gen->get_number_of_lumped_wt_generators()==N);
+        TEST_ASSERT(fabs(gen->get_mbase_in_MVA()-mbase)<FLOAT_EPSILON);
+    }
+}
+
+void DYNAMICS_SIMULATOR_TEST::test_restore_dynamic_state_with_partially_tripped_wt_generator()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"DYNAMICS_SIMULATOR_TEST");
+
+    DYNAMICS_SIMULATOR& simulator = default_toolkit.get_dynamic_simulator();
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    PSSE_IMEXPORTER importer(default_toolkit);
+    importer.load_powerflow_data("../../../bench/ieee39.raw");
+    importer.load_dynamic_data("../../../bench/IEEE39.dyr");
+
+    POWERFLOW_SOLVER& powerflow_solver = default_toolkit.get_powerflow_solver();
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+
+    DEVICE_ID did = get_wt_generator_device_id(36, "1");
+    WT_GENERATOR* gen = psdb.get_wt_generator(did);
+    unsigned int N = gen->get_number_of_lumped_wt_generators();
+    double mbase = gen->get_mbase_in_MVA();
+    TEST_ASSERT(N>2);
+
+    simulator.set_csv_file_export_enable_flag(false);
+    simulator.set_output_file("");
+    simulator.start();
+    simulator.run_to(0.1);
+    unsigned int handle = simulator.save_dynamic_state();
+    TEST_ASSERT(handle!=INDEX_NOT_EXIST);
+
+    // the same partial trip is applied after restoring, so unit count and MBASE are the same in both runs
+    for(unsigned int run=0; run!=2; ++run)
+    {
+        simulator.trip_wt_generator(did, 2);
+        TEST_ASSERT(gen->get_number_of_lumped_wt_generators()==N-2);
+        TEST_ASSERT(fabs(gen->get_mbase_in_MVA()-mbase/N*(N-2))<FLOAT_EPSILON);
+        simulator.run_to(0.2);
+
+        TEST_ASSERT(simulator.restore_dynamic_state(handle)==true);
+        TEST_ASSERT(fabs(simulator.get_dynamic_simulation_time_in_s()-0.1)<FLOAT_EPSILON);
+        TEST_ASSERT(gen->get_number_of_lumped_wt_generators()==N);
+        TEST_ASSERT(fabs(gen->get_mbase_in_MVA()-mbase)<FLOAT_EPSILON);
+    }
+
+    simulator.release_dynamic_state(handle);
+}
+
 #endif
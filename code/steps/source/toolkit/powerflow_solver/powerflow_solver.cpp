@@ -7,6 +7,7 @@
 #include <istream>
 #include <iostream>
 #include <fstream>
+#include <algorithm>
 using namespace std;
 
 #define ENABLE_OPENMP_FOR_POWERFLOW_SOLVER
@@ -36,6 +37,7 @@ void POWERFLOW_SOLVER::clear()
     set_non_divergent_solution_logic(true);
     set_var_limit_check_logic(true);
     set_export_jacobian_matrix_step_by_step_logic(false);
+    set_symbolic_analysis_reuse_logic(true);
     set_allowed_max_active_power_imbalance_in_MW(0.001);
     set_allowed_max_reactive_power_imbalance_in_MVar(0.001);
     set_maximum_voltage_change_in_pu(999.0);
@@ -56,6 +58,11 @@ void POWERFLOW_SOLVER::clear()
     S_mismatch.clear();
     P_mismatch.clear();
     Q_mismatch.clear();
+
+    clear_buses_with_changed_injection();
+
+    network_Y_matrix_build_count_of_NR_solution = 0;
+    network_Y_matrix_build_count_of_PQ_solution = 0;
 }
 
 NETWORK_MATRIX& POWERFLOW_SOLVER::get_network_matrix()
@@ -63,6 +70,21 @@ NETWORK_MATRIX& POWERFLOW_SOLVER::get_network_matrix()
     return toolkit->get_network_matrix();
 }
 
+void POWERFLOW_SOLVER::append_bus_with_changed_injection(unsigned int bus)
+{
+    buses_with_changed_injection.push_back(bus);
+}
+
+void POWERFLOW_SOLVER::clear_buses_with_changed_injection()
+{
+    buses_with_changed_injection.clear();
+}
+
+vector<unsigned int> POWERFLOW_SOLVER::get_buses_with_changed_injection() const
+{
+    return buses_with_changed_injection;
+}
+
 void POWERFLOW_SOLVER::set_max_iteration(unsigned int iteration)
 {
     this->max_iteration = iteration;
@@ -145,6 +167,14 @@ void POWERFLOW_SOLVER::set_export_jacobian_matrix_step_by_step_logic(bool flag)
     export_jacobian_matrix_step_by_step = flag;
 }
 
+void POWERFLOW_SOLVER::set_symbolic_analysis_reuse_logic(bool logic)
+{
+    symbolic_analysis_reuse_enabled = logic;
+    jacobian.set_symbolic_analysis_reuse_logic(logic);
+    BP.set_symbolic_analysis_reuse_logic(logic);
+    BQ.set_symbolic_analysis_reuse_logic(logic);
+}
+
 double POWERFLOW_SOLVER::get_allowed_max_active_power_imbalance_in_MW() const
 {
     return P_threshold_in_MW;
@@ -200,6 +230,45 @@ bool POWERFLOW_SOLVER::get_export_jacobian_matrix_step_by_step_logic() const
     return export_jacobian_matrix_step_by_step;
 }
 
+bool POWERFLOW_SOLVER::get_symbolic_analysis_reuse_logic() const
+{
+    return symbolic_analysis_reuse_enabled;
+}
+
+void POWERFLOW_SOLVER::copy_from_powerflow_solver(POWERFLOW_SOLVER& solver)
+{
+    if(this==(&solver)) return;
+
+    set_max_iteration(solver.get_max_iteration());
+    set_allowed_max_active_power_imbalance_in_MW(solver.get_allowed_max_active_power_imbalance_in_MW());
+    set_allowed_max_reactive_power_imbalance_in_MVar(solver.get_allowed_max_reactive_power_imbalance_in_MVar());
+    set_maximum_voltage_change_in_pu(solver.get_maximum_voltage_change_in_pu());
+    set_maximum_angle_change_in_deg(solver.get_maximum_angle_change_in_deg());
+    set_flat_start_logic(solver.get_flat_start_logic());
+    set_transformer_tap_adjustment_logic(solver.get_transformer_tap_adjustment_logic());
+    set_iteration_accelerator(solver.get_iteration_accelerator());
+    set_non_divergent_solution_logic(solver.get_non_divergent_solution_logic());
+    set_var_limit_check_logic(solver.get_var_limit_check_logic());
+    set_symbolic_analysis_reuse_logic(solver.get_symbolic_analysis_reuse_logic());
+
+    POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
+    if(psdb.get_bus_count()!=0)
+    {
+        // bus voltages are copied as is. initialize solver without flat start to keep them.
+        bool flat_start_logic = get_flat_start_logic();
+        set_flat_start_logic(false);
+        initialize_powerflow_solver();
+        set_flat_start_logic(flat_start_logic);
+
+        NETWORK_MATRIX& network_matrix = get_network_matrix();
+        network_matrix.build_network_Y_matrix();
+        update_P_and_Q_equation_internal_buses();
+
+        iteration_count = solver.get_iteration_count();
+        set_convergence_flag(solver.get_convergence_flag());
+    }
+}
+
 void POWERFLOW_SOLVER::show_powerflow_solver_configuration() const
 {
     ostringstream osstream;
@@ -216,7 +285,8 @@ void POWERFLOW_SOLVER::show_powerflow_solver_configuration() const
             <<"Non-divergent solution: "<<(get_non_divergent_solution_logic()?"Enabled":"Disabled")<<"\n"
             <<"Var limit check: "<<(get_var_limit_check_logic()?"Enabled":"Disabled")<<"\n"
             <<"Network ordering optimization: "<<toolkit->is_optimize_network_enabled()<<"\n"
-            <<"Export jacobian matrix step by step: "<<(get_export_jacobian_matrix_step_by_step_logic()?"Enabled":"Disabled");
+            <<"Export jacobian matrix step by step: "<<(get_export_jacobian_matrix_step_by_step_logic()?"Enabled":"Disabled")<<"\n"
+            <<"Symbolic analysis reuse: "<<(get_symbolic_analysis_reuse_logic()?"Enabled":"Disabled");
     toolkit->show_information_with_leading_time_stamp(osstream);
 }
 
@@ -229,17 +299,23 @@ void POWERFLOW_SOLVER::solve_with_full_Newton_Raphson_solution()
         snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Start solve powerflow with Full Newton Raphson solution.");
         toolkit->show_information_with_leading_time_stamp(buffer);
 
-        initialize_powerflow_solver();
+        bool network_matrix_is_reused = is_network_matrix_reusable(network_Y_matrix_build_count_of_NR_solution);
+        initialize_powerflow_solver(network_matrix_is_reused);
 
         NETWORK_MATRIX& network_matrix = get_network_matrix();
 
         double max_P_mismatch_in_MW, max_Q_mismatch_in_MW;
         vector<double> bus_delta_voltage_angle;
 
-        network_matrix.build_network_Y_matrix();
+        if(not network_matrix_is_reused)
+            network_matrix.build_network_Y_matrix();
 
         update_P_and_Q_equation_internal_buses();
-        jacobian_builder->build_seprate_jacobians();
+        if(not network_matrix_is_reused)
+        {
+            jacobian_builder->build_seprate_jacobians();
+            network_Y_matrix_build_count_of_NR_solution = network_matrix.get_network_Y_matrix_build_count();
+        }
 
         while(true)
         {
@@ -321,16 +397,21 @@ void POWERFLOW_SOLVER::solve_with_fast_decoupled_solution()
         snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Start solve powerflow with Fast Decoupled solution.");
         toolkit->show_information_with_leading_time_stamp(buffer);
 
-        initialize_powerflow_solver();
+        bool network_matrix_is_reused = is_network_matrix_reusable(network_Y_matrix_build_count_of_PQ_solution);
+        initialize_powerflow_solver(network_matrix_is_reused);
 
         NETWORK_MATRIX& network_matrix = get_network_matrix();
 
         double max_P_mismatch_in_MW, max_Q_mismatch_in_MW;
         vector<double> bus_delta_voltage, bus_delta_angle;
 
-        network_matrix.build_network_Y_matrix();
+        if(not network_matrix_is_reused)
+        {
+            network_matrix.build_network_Y_matrix();
 
-        network_matrix.build_decoupled_network_B_matrix();
+            network_matrix.build_decoupled_network_B_matrix();
+            network_Y_matrix_build_count_of_PQ_solution = network_matrix.get_network_Y_matrix_build_count();
+        }
         //const SPARSE_MATRIX& Y = network_matrix.get_network_Y_matrix();
         //cout<<"Y matrix identity is: "<<get_sparse_matrix_identity(Y)<<endl;
 
@@ -463,7 +544,7 @@ void POWERFLOW_SOLVER::solve_with_modified_Gaussian_Seidel_solution()
 }
 
 
-void POWERFLOW_SOLVER::initialize_powerflow_solver()
+void POWERFLOW_SOLVER::initialize_powerflow_solver(bool network_matrix_is_reused)
 {
     char buffer[STEPS_MAX_TEMP_CHAR_BUFFER_SIZE];
     snprintf(buffer, STEPS_MAX_TEMP_CHAR_BUFFER_SIZE, "Initializing powerflow solver.");
@@ -481,12 +562,19 @@ void POWERFLOW_SOLVER::initialize_powerflow_solver()
 
     prepare_devices_for_solution();
 
+    // if network is changed since last solution, buses with changed injection are not the only changes. all buses are initialized
+    if(not network_matrix_is_reused)
+        clear_buses_with_changed_injection();
+
     initialize_bus_type();
     initialize_bus_voltage_to_regulate();
     initialize_bus_voltage();
-    optimize_bus_numbers();
+    clear_buses_with_changed_injection();
+    if(not network_matrix_is_reused)
+        optimize_bus_numbers();
     iteration_count = 0;
     set_convergence_flag(false);
+    reset_LU_statistics();
 
     unsigned int n_bus = psdb.get_bus_count();
     S_mismatch.reserve(n_bus*2);
@@ -497,6 +585,16 @@ void POWERFLOW_SOLVER::initialize_powerflow_solver()
     toolkit->show_information_with_leading_time_stamp(buffer);
 }
 
+bool POWERFLOW_SOLVER::is_network_matrix_reusable(unsigned int network_Y_matrix_build_count) const
+{
+    // if only injections at some buses are changed since last solution, network matrix and bus ordering of last solution are still valid
+    if(get_flat_start_logic()==true or buses_with_changed_injection.size()==0)
+        return false;
+
+    NETWORK_MATRIX& network_matrix = toolkit->get_network_matrix();
+    return network_Y_matrix_build_count!=0 and network_Y_matrix_build_count==network_matrix.get_network_Y_matrix_build_count();
+}
+
 void POWERFLOW_SOLVER::prepare_devices_for_solution()
 {
     POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
@@ -517,6 +615,45 @@ void POWERFLOW_SOLVER::prepare_devices_for_solution()
     e_devices = psdb.get_all_equivalent_devices();
 }
 
+vector<BUS*> POWERFLOW_SOLVER::get_buses_to_initialize()
+{
+    // if only injections at some buses are changed since last solution, only these buses need to be initialized
+    if(get_flat_start_logic()==true or buses_with_changed_injection.size()==0)
+        return buses;
+
+    POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
+    vector<unsigned int> changed_buses = buses_with_changed_injection;
+    sort(changed_buses.begin(), changed_buses.end());
+    changed_buses.erase(unique(changed_buses.begin(), changed_buses.end()), changed_buses.end());
+
+    vector<BUS*> buses_to_initialize;
+    unsigned int n = changed_buses.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        BUS* busptr = psdb.get_bus(changed_buses[i]);
+        if(busptr!=NULL)
+            buses_to_initialize.push_back(busptr);
+    }
+    return buses_to_initialize;
+}
+
+vector<SOURCE*> POWERFLOW_SOLVER::get_sources_to_initialize()
+{
+    if(get_flat_start_logic()==true or buses_with_changed_injection.size()==0)
+        return sources;
+
+    POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
+    vector<BUS*> buses_to_initialize = get_buses_to_initialize();
+    vector<SOURCE*> sources_to_initialize;
+    unsigned int n = buses_to_initialize.size();
+    for(unsigned int i=0; i!=n; ++i)
+    {
+        vector<SOURCE*> sources_at_bus = psdb.get_sources_connecting_to_bus(buses_to_initialize[i]->get_bus_number());
+        sources_to_initialize.insert(sources_to_initialize.end(), sources_at_bus.begin(), sources_at_bus.end());
+    }
+    return sources_to_initialize;
+}
+
 void POWERFLOW_SOLVER::initialize_bus_type()
 {
     POWER_SYSTEM_DATABASE& psdb = toolkit->get_power_system_database();
@@ -539,16 +676,18 @@ void POWERFLOW_SOLVER::initialize_bus_type()
         }
     }
 
+    vector<BUS*> buses_to_initialize = get_buses_to_initialize();
+    nbus = buses_to_initialize.size();
     #ifdef ENABLE_OPENMP_FOR_POWERFLOW_SOLVER
         set_openmp_number_of_threads(toolkit->get_thread_number());
         #pragma omp parallel for schedule(static)
     #endif // ENABLE_OPENMP_FOR_POWERFLOW_SOLVER
     for(unsigned int i=0; i<nbus; ++i)
     {
-        BUS_TYPE btype = buses[i]->get_bus_type();
+        BUS_TYPE btype = buses_to_initialize[i]->get_bus_type();
         if(btype==PV_TYPE)
         {
-            vector<SOURCE*> sources = psdb.get_sources_connecting_to_bus(buses[i]->get_bus_number());
+            vector<SOURCE*> sources = psdb.get_sources_connecting_to_bus(buses_to_initialize[i]->get_bus_number());
             unsigned int nsource = sources.size();
             unsigned int n_inservice = 0;
             for(unsigned int j=0; j!=nsource; ++j)
@@ -559,7 +698,7 @@ void POWERFLOW_SOLVER::initialize_bus_type()
             if(n_inservice!=0)
                 ;
             else
-                buses[i]->set_bus_type(PQ_TYPE);
+                buses_to_initialize[i]->set_bus_type(PQ_TYPE);
         }
     }
 }
@@ -567,6 +706,7 @@ void POWERFLOW_SOLVER::initialize_bus_type()
 void POWERFLOW_SOLVER::initialize_bus_voltage_to_regulate()
 {
     //vector<SOURCE*> sources = psdb.get_all_sources();
+    vector<SOURCE*> sources = get_sources_to_initialize();
     unsigned int nsource = sources.size();
     #ifdef ENABLE_OPENMP_FOR_POWERFLOW_SOLVER
         set_openmp_number_of_threads(toolkit->get_thread_number());
@@ -589,6 +729,7 @@ void POWERFLOW_SOLVER::initialize_bus_voltage_to_regulate()
         }
     }
     //vector<BUS*> buses = psdb.get_all_buses();
+    vector<BUS*> buses = get_buses_to_initialize();
     unsigned int nbus = buses.size();
     #ifdef ENABLE_OPENMP_FOR_POWERFLOW_SOLVER
         set_openmp_number_of_threads(toolkit->get_thread_number());
@@ -2288,12 +2429,12 @@ void POWERFLOW_SOLVER::save_powerflow_result_to_file(const string& filename) con
     if(file.is_open())
     {
         time_t tt = time(NULL);
-        tm* local_time= localtime(&tt);
+        tm local_time = get_local_time(tt);
 
         char time_stamp[40];
         char buffer[1000];
-        snprintf(time_stamp,40, "%d-%02d-%02d %02d:%02d:%02d", local_time->tm_year + 1900, local_time->tm_mon + 1,
-                local_time->tm_mday, local_time->tm_hour, local_time->tm_min, local_time->tm_sec);
+        snprintf(time_stamp,40, "%d-%02d-%02d %02d:%02d:%02d", local_time.tm_year + 1900, local_time.tm_mon + 1,
+                local_time.tm_mday, local_time.tm_hour, local_time.tm_min, local_time.tm_sec);
 
         file<<"% Powerflow result exported at "<<time_stamp<<endl;
         snprintf(buffer, 1000, "%s", (psdb.get_case_information()).c_str());
@@ -2469,12 +2610,12 @@ void POWERFLOW_SOLVER::save_extended_powerflow_result_to_file(const string& file
     if(file.is_open())
     {
         time_t tt = time(NULL);
-        tm* local_time= localtime(&tt);
+        tm local_time = get_local_time(tt);
 
         char time_stamp[40];
         char buffer[1000];
-        snprintf(time_stamp,40, "%d-%02d-%02d %02d:%02d:%02d", local_time->tm_year + 1900, local_time->tm_mon + 1,
-                local_time->tm_mday, local_time->tm_hour, local_time->tm_min, local_time->tm_sec);
+        snprintf(time_stamp,40, "%d-%02d-%02d %02d:%02d:%02d", local_time.tm_year + 1900, local_time.tm_mon + 1,
+                local_time.tm_mday, local_time.tm_hour, local_time.tm_min, local_time.tm_sec);
 
         file<<"% Powerflow result exported at "<<time_stamp<<endl;
         snprintf(buffer, 1000, "%s", (psdb.get_case_information()).c_str());
@@ -2677,6 +2818,32 @@ void POWERFLOW_SOLVER::save_jacobian_matrix_to_file(const string& filename)
     jacobian_builder->save_jacobian_matrix_to_file(filename);
 }
 
+void POWERFLOW_SOLVER::build_jacobian_matrix()
+{
+    // jacobian is built with current bus voltage, and P and Q equation buses of the latest solution
+    if(jacobian_builder->is_network_matrix_set())
+    {
+        jacobian_builder->build_seprate_jacobians();
+        jacobian = jacobian_builder->get_full_coupled_jacobian_with_P_and_Q_equation_internal_buses(internal_P_equation_buses,
+                                                                                                   internal_Q_equation_buses);
+    }
+}
+
+STEPS_SPARSE_MATRIX& POWERFLOW_SOLVER::get_jacobian_matrix()
+{
+    return jacobian;
+}
+
+vector<unsigned int> POWERFLOW_SOLVER::get_internal_P_equation_buses() const
+{
+    return internal_P_equation_buses;
+}
+
+vector<unsigned int> POWERFLOW_SOLVER::get_internal_Q_equation_buses() const
+{
+    return internal_Q_equation_buses;
+}
+
 void POWERFLOW_SOLVER::save_bus_powerflow_result_to_file(const string& filename) const
 {
     ostringstream osstream;
@@ -2709,6 +2876,43 @@ unsigned int POWERFLOW_SOLVER::get_iteration_count() const
     return iteration_count;
 }
 
+void POWERFLOW_SOLVER::reset_LU_statistics()
+{
+    jacobian.reset_LU_statistics();
+    BP.reset_LU_statistics();
+    BQ.reset_LU_statistics();
+}
+
+unsigned int POWERFLOW_SOLVER::get_LU_symbolic_analysis_count() const
+{
+    return jacobian.get_symbolic_analysis_count()+BP.get_symbolic_analysis_count()+BQ.get_symbolic_analysis_count();
+}
+
+unsigned int POWERFLOW_SOLVER::get_LU_numeric_factorization_count() const
+{
+    return jacobian.get_numeric_factorization_count()+BP.get_numeric_factorization_count()+BQ.get_numeric_factorization_count();
+}
+
+unsigned int POWERFLOW_SOLVER::get_LU_solution_count() const
+{
+    return jacobian.get_solution_count()+BP.get_solution_count()+BQ.get_solution_count();
+}
+
+double POWERFLOW_SOLVER::get_LU_symbolic_analysis_time_in_s() const
+{
+    return jacobian.get_symbolic_analysis_time_in_s()+BP.get_symbolic_analysis_time_in_s()+BQ.get_symbolic_analysis_time_in_s();
+}
+
+double POWERFLOW_SOLVER::get_LU_numeric_factorization_time_in_s() const
+{
+    return jacobian.get_numeric_factorization_time_in_s()+BP.get_numeric_factorization_time_in_s()+BQ.get_numeric_factorization_time_in_s();
+}
+
+double POWERFLOW_SOLVER::get_LU_solution_time_in_s() const
+{
+    return jacobian.get_solution_time_in_s()+BP.get_solution_time_in_s()+BQ.get_solution_time_in_s();
+}
+
 unsigned int POWERFLOW_SOLVER::get_memory_usage_in_bytes()
 {
     return jacobian.get_memory_usage_in_bytes()+
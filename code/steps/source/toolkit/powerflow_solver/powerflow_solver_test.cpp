@@ -5,6 +5,7 @@
 #include "header/steps_namespace.h"
 #include "header/data_imexporter/psse_imexporter.h"
 #include "header/data_imexporter/bpa_imexporter.h"
+#include "header/apis/steps_api.h"
 #include <cstdio>
 
 #ifdef ENABLE_STEPS_TEST
@@ -40,6 +41,7 @@ POWERFLOW_SOLVER_TEST::POWERFLOW_SOLVER_TEST()
     TEST_ADD(POWERFLOW_SOLVER_TEST::test_solve_Shandong_2000_bus_model_with_HVDC_with_fast_decoupled_solution);
 
     TEST_ADD(POWERFLOW_SOLVER_TEST::test_solve_ISO_New_England_39_bus_model_and_Shandong_2000_bus_model_with_fast_decoupled_solution);
+    TEST_ADD(POWERFLOW_SOLVER_TEST::test_solve_ISO_New_England_39_bus_model_with_changed_injection_and_line_status);
 
     TEST_ADD(POWERFLOW_SOLVER_TEST::test_solve_Shandong_benchmark_100_bus_model_with_HVDC_with_fast_decoupled_solution);
     TEST_ADD(POWERFLOW_SOLVER_TEST::test_solve_Northwest_benchmark_100_bus_model_with_HVDC_with_fast_decoupled_solution);
@@ -743,6 +745,53 @@ void POWERFLOW_SOLVER_TEST::test_solve_ISO_New_England_39_bus_model_and_Shandong
     default_toolkit.close_log_file();
 }
 
+void POWERFLOW_SOLVER_TEST::test_solve_ISO_New_England_39_bus_model_with_changed_injection_and_line_status()
+{
+    show_test_information_for_function_of_class(__FUNCTION__,"POWERFLOW_SOLVER_TEST");
+
+    POWERFLOW_SOLVER& powerflow_solver = default_toolkit.get_powerflow_solver();
+    POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
+
+    default_toolkit.open_log_file("test_log/test_solve_ISO_New_England_39_bus_model_with_changed_injection_and_line_status.txt");
+
+    psdb.set_allowed_max_bus_number(200);
+    PSSE_IMEXPORTER importer(default_toolkit);
+    importer.load_powerflow_data("../../../bench/ieee39.raw");
+
+    powerflow_solver.set_max_iteration(20);
+    powerflow_solver.set_allowed_max_active_power_imbalance_in_MW(0.00001);
+    powerflow_solver.set_allowed_max_reactive_power_imbalance_in_MVar(0.00001);
+    powerflow_solver.set_flat_start_logic(false);
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    TEST_ASSERT(powerflow_solver.is_converged());
+
+    // injection at bus 3 is marked as changed, while line 1-2 is tripped with api between two solutions.
+    // network matrix of last solution should not be reused.
+    LOAD* load = psdb.get_load(get_load_device_id(3, "1"));
+    load->set_nominal_constant_power_load_in_MVA(load->get_nominal_constant_power_load_in_MVA()*1.1);
+    powerflow_solver.append_bus_with_changed_injection(3);
+    api_set_line_boolean_data(1, 2, (char*)"1", (char*)"STATUS_SEND", false, INDEX_NOT_EXIST);
+    api_set_line_boolean_data(1, 2, (char*)"1", (char*)"STATUS_RECV", false, INDEX_NOT_EXIST);
+
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    TEST_ASSERT(powerflow_solver.is_converged());
+
+    vector<BUS*> buses = psdb.get_all_buses();
+    unsigned int n = buses.size();
+    vector<complex<double> > V(n, 0.0);
+    for(unsigned int i=0; i!=n; ++i)
+        V[i] = buses[i]->get_positive_sequence_complex_voltage_in_pu();
+
+    powerflow_solver.set_flat_start_logic(true);
+    powerflow_solver.solve_with_full_Newton_Raphson_solution();
+    TEST_ASSERT(powerflow_solver.is_converged());
+
+    for(unsigned int i=0; i!=n; ++i)
+        TEST_ASSERT(abs(V[i]-buses[i]->get_positive_sequence_complex_voltage_in_pu())<1e-6);
+
+    default_toolkit.close_log_file();
+}
+
 void POWERFLOW_SOLVER_TEST::check_Arthur_R_Bergen_3_bus_model_powerflow_result()
 {
     POWER_SYSTEM_DATABASE& psdb = default_toolkit.get_power_system_database();
@@ -10,6 +10,8 @@ class CCT():
         self.__fault_device = None
         self.__simulation_time_step = 0.01
         self.__simulation_time_span = 10.0
+        self.__fault_state = None
+        self.__base_case_loaded = False
 
     def __del__(self):
         self.__simulator.clear_package()
@@ -26,19 +28,25 @@ class CCT():
             """)
     def set_powerflow_file(self, raw_file):
         self.__raw_file = raw_file
+        self.__fault_state = None
+        self.__base_case_loaded = False
         return
     
     def set_dynamic_file(self, dyr_file):
         self.__dyr_file = dyr_file
+        self.__fault_state = None
+        self.__base_case_loaded = False
         return
     
     def set_fault(self, fault_type, fault_device):
         self.__fault_type = fault_type
         self.__fault_device = fault_device
+        self.__fault_state = None
         return
     
     def set_simulation_time_step(self, step):
         self.__simulation_time_step = step
+        self.__fault_state = None
         return
 
     def set_simulation_time_span(self, span):
@@ -102,43 +110,53 @@ class CCT():
         
     def run_simulation(self, ct, export=False):
         sim = self.__simulator
-        sim.clear_package()
-        
-        raw_file = self.get_powerflow_file()
-        sim.load_powerflow_data(raw_file,"PSSE")
-        sim.solve_powerflow("PQ")
-        
-        dyr_file = self.get_dynamic_file()
-        sim.load_dynamic_data(dyr_file,"PSSE")
-        
-        sim.set_dynamic_simulator_parameter('b','ANGLE STABILITY SURVILLIANCE LOGIC', True)
-        sim.set_dynamic_simulator_parameter('d','ANGLE STABILITY THRESHOLD IN DEG', 360.0)
-        
-        sim.set_dynamic_simulation_time_step(self.__simulation_time_step)
-        
-        
         ftype = self.get_fault_type()
         fdevice = self.get_fault_device()
-        
-        if export:
-            sim.prepare_meters("ALL")
-            filename = "CCT_"+ftype+"_"
-            if ftype == "BUS":
-                filename += str(fdevice)+"_"
+        if export or self.__fault_state is None:
+            # files are loaded only once. later simulations start from the cached base case.
+            if not self.__base_case_loaded:
+                sim.clear_package()
+            
+                raw_file = self.get_powerflow_file()
+                sim.load_powerflow_data(raw_file,"PSSE")
+                sim.solve_powerflow("PQ")
+            
+                dyr_file = self.get_dynamic_file()
+                sim.load_dynamic_data(dyr_file,"PSSE")
+                sim.cache_base_case()
+                self.__base_case_loaded = True
             else:
-                for d in fdevice:
-                    filename = filename + str(d)+"_"
-            filename = filename+str(ct)
-            sim.set_dynamic_simulator_output_file(filename)
+                sim.reset_to_base_case()
+                sim.clear_meters()
+        
+            sim.set_dynamic_simulator_parameter('b','ANGLE STABILITY SURVEILLANCE LOGIC', True)
+            sim.set_dynamic_simulator_parameter('d','ANGLE STABILITY THRESHOLD IN DEG', 360.0)
+        
+            sim.set_dynamic_simulation_time_step(self.__simulation_time_step)
+        
+            if export:
+                sim.prepare_meters("ALL")
+                filename = "CCT_"+ftype+"_"
+                if ftype == "BUS":
+                    filename += str(fdevice)+"_"
+                else:
+                    for d in fdevice:
+                        filename = filename + str(d)+"_"
+                filename = filename+str(ct)
+                sim.set_dynamic_simulator_output_file(filename)
             
-        sim.start_dynamic_simulation()
-        sim.run_dynamic_simulation_to_time(0.0)
+            sim.start_dynamic_simulation()
+            sim.run_dynamic_simulation_to_time(0.0)
         
-        if ftype == "BUS":
-            sim.set_bus_fault(fdevice, "THREE PHASE FAULT", (0.0, -2e4))
-        elif ftype == "LINE":
-            sim.set_line_fault(fdevice, "THREE PHASE FAULT", 0.0, (0.0, -2e4))
-            
+            if ftype == "BUS":
+                sim.set_bus_fault(fdevice, "THREE PHASE FAULT", (0.0, -2e4))
+            elif ftype == "LINE":
+                sim.set_line_fault(fdevice, "THREE PHASE FAULT", 0.0, (0.0, -2e4))
+            # pre-fault simulation is identical for all clearing time. branch from the fault instant.
+            self.__fault_state = None if export else sim.save_dynamic_state()
+        else:
+            sim.restore_dynamic_state(self.__fault_state)
+
         sim.run_dynamic_simulation_to_time(ct)
         
         if ftype == "BUS":
@@ -1,13 +1,20 @@
 #coding=utf-8
 import time
-from multiprocessing import Pool, Process
-import func
-   
-if __name__ =='__main__':   
-    processes = []
-    for i in range(1,10):
-        p = Process(target=func.run, args=(i,))
-        processes.append(p)
-        p.start()
-    for p in processes: # wait all processes to finish before execute new codes
-        p.join()
+from stepspy import run_batch
+
+if __name__ =='__main__':
+    case = {"powerflow_file": "IEEE9.raw", "dynamic_file": "IEEE9.dyr",
+            "settings": [("set_allowed_maximum_bus_number", (10000,))],
+            "meters": [("prepare_bus_meter", (bus, "VOLTAGE IN PU")) for bus in range(1,10)],
+            "time_step": 0.005, "end_time": 10.0, "angle_threshold": 360.0}
+
+    scenarios = []
+    for fault_bus in range(1,10):
+        scenarios.append({"name": "bus_"+str(fault_bus)+"_fault",
+                          "events": [(0.0, "set_bus_fault", (fault_bus, "THREE PHASE FAULT", (0.0, -1e6))),
+                                     (0.1, "clear_bus_fault", (fault_bus, "THREE PHASE FAULT"))]})
+
+    clock_start = time.time()
+    for result in run_batch(case, scenarios, worker_count=4, timeout=60.0):
+        print(result["name"], "stable" if result["stable"] else "unstable", result["end_time"], result["elapsed_time"], result["error"])
+    print("all scenarios are finished in", time.time()-clock_start, "s")
@@ -0,0 +1,75 @@
+#coding=utf-8
+import os
+import stepspy
+
+bench = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "bench")
+
+def simulate_bus_fault(toolkit, bus):
+    toolkit.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+    toolkit.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+    toolkit.set_dynamic_simulation_time_step(0.01)
+    toolkit.prepare_bus_meter(bus, "VOLTAGE IN PU")
+    toolkit.prepare_generator_meter((2, "1"), "ROTOR ANGLE IN DEG")
+    toolkit.set_meter_buffer_capacity(1000)
+    toolkit.start_dynamic_simulation()
+    toolkit.run_dynamic_simulation_to_time(0.5)
+    toolkit.set_bus_fault(bus, "THREE PHASE FAULT", (0.0, -2e4))
+    toolkit.run_dynamic_simulation_to_time(0.6)
+    toolkit.clear_bus_fault(bus, "THREE PHASE FAULT")
+    toolkit.run_dynamic_simulation_to_time(2.0)
+    t, values = toolkit.get_meter_buffer()
+    return values.copy(), toolkit.is_system_angular_stable()
+
+if __name__ =='__main__':
+    simulator = stepspy.STEPS(is_default=False, log_file="test_run_many.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "IEEE9.raw"), "PSS/E")
+    simulator.load_dynamic_data(os.path.join(bench, "IEEE9.dyr"), "PSS/E")
+    simulator.solve_powerflow("NR")
+
+    buses = simulator.get_all_buses()
+    functions = [lambda toolkit, bus=bus: simulate_bus_fault(toolkit, bus) for bus in buses]
+    parallel_results = simulator.run_many(functions, thread_number=4, log_file="test_run_many.log")
+
+    assert len(parallel_results)==len(buses)
+    for bus, parallel_result in zip(buses, parallel_results):
+        serial_result = simulate_bus_fault(simulator.clone("test_run_many.log"), bus)
+        assert parallel_result[1]==serial_result[1]
+        assert parallel_result[0].shape==serial_result[0].shape
+        assert abs(parallel_result[0]-serial_result[0]).max()<1e-9
+    print("results of run_many() are the same as serial simulations of", len(buses), "bus faults")
+
+    original_result = simulate_bus_fault(simulator, buses[0])
+    assert original_result[1]==parallel_results[0][1]
+    assert abs(original_result[0]-parallel_results[0][0]).max()<1e-9
+    print("results of clone are the same as simulation of the toolkit")
+
+    source = stepspy.STEPS(is_default=False, log_file="test_run_many.log")
+    source.set_allowed_maximum_bus_number(10000)
+    source.load_powerflow_data(os.path.join(bench, "ieee39_sd133.raw"), "PSS/E")
+    source.load_dynamic_data(os.path.join(bench, "ieee39_sd133.dyr"), "PSS/E")
+    source.clone("test_run_many.log").save_dynamic_data("clone_dynamic_data.dyr", "PSS/E")
+    source.save_dynamic_data("source_dynamic_data.dyr", "PSS/E")
+    with open("source_dynamic_data.dyr") as source_file, open("clone_dynamic_data.dyr") as clone_file:
+        assert source_file.read()==clone_file.read()
+    os.remove("source_dynamic_data.dyr")
+    os.remove("clone_dynamic_data.dyr")
+    print("dynamic models of clone are the same as the toolkit")
+
+    def set_fast_math(toolkit):
+        toolkit.set_toolkit_bool_data("USE STEPS FAST MATH LOGIC", True)
+        return toolkit.get_toolkit_bool_data("USE STEPS FAST MATH LOGIC")
+    assert simulator.run_many([set_fast_math]*2, thread_number=2, log_file="test_run_many.log")==[False, False]
+    assert not simulator.get_toolkit_bool_data("USE STEPS FAST MATH LOGIC")
+    simulator.set_toolkit_bool_data("USE STEPS FAST MATH LOGIC", True)
+    assert simulator.get_toolkit_bool_data("USE STEPS FAST MATH LOGIC")
+    simulator.set_toolkit_bool_data("USE STEPS FAST MATH LOGIC", False)
+    print("fast math logic shared by all toolkits is not changed in run_many()")
+
+    def raise_error(toolkit):
+        raise ValueError("raised in clone")
+    try:
+        simulator.run_many([lambda toolkit: 1, raise_error], thread_number=2, log_file="test_run_many.log")
+        assert False
+    except ValueError:
+        print("exception raised in clone is raised by run_many()")
@@ -0,0 +1,74 @@
+#coding=utf-8
+import os
+import numpy
+import stepspy
+
+bench = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "bench")
+fault_time, clearing_time, simulation_time, angle_threshold = 0.5, 0.2, 3.0, 180.0
+
+def simulate_line_fault(toolkit, line):
+    generators = toolkit.get_all_generators()
+    buses = toolkit.get_all_buses()
+    toolkit.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+    toolkit.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+    toolkit.set_dynamic_simulator_parameter("b", "ANGLE STABILITY SURVEILLANCE LOGIC", True)
+    toolkit.set_dynamic_simulator_parameter("d", "ANGLE STABILITY THRESHOLD IN DEG", angle_threshold)
+    for generator in generators:
+        toolkit.prepare_generator_meter(generator, "ROTOR ANGLE IN DEG")
+    for bus in buses:
+        toolkit.prepare_bus_meter(bus, "VOLTAGE IN PU")
+    toolkit.set_meter_buffer_capacity(10000)
+    toolkit.start_dynamic_simulation()
+    toolkit.run_dynamic_simulation_to_time(fault_time)
+    toolkit.set_line_fault(line, "THREE PHASE FAULT", 0.0, (0.0, -2e4))
+    toolkit.run_dynamic_simulation_to_time(fault_time+clearing_time)
+    if not toolkit.get_dynamic_simulation_early_stop_flag():
+        toolkit.clear_line_fault(line, "THREE PHASE FAULT", 0.0)
+        toolkit.trip_line(line)
+        toolkit.run_dynamic_simulation_to_time(simulation_time)
+    t, values = toolkit.get_meter_buffer()
+    angles = values[t>=fault_time, :len(generators)]
+    voltages = values[t>fault_time+clearing_time+0.5*toolkit.get_dynamic_simulation_time_step(), len(generators):]
+    max_angle_difference = float(numpy.max(numpy.max(angles, axis=1)-numpy.min(angles, axis=1)))
+    return toolkit.is_system_angular_stable(), max_angle_difference, float(numpy.min(voltages)), toolkit.get_dynamic_simulation_time()
+
+if __name__ =='__main__':
+    simulator = stepspy.STEPS(is_default=False, log_file="test_screen_contingencies.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "IEEE9.raw"), "PSS/E")
+    simulator.load_dynamic_data(os.path.join(bench, "IEEE9.dyr"), "PSS/E")
+    simulator.solve_powerflow("NR")
+    simulator.set_dynamic_simulation_time_step(0.01)
+
+    lines = simulator.get_all_lines()
+    results = simulator.screen_contingencies("LINE FAULT", fault_time=fault_time, clearing_time=clearing_time, simulation_time=simulation_time,
+                                             angle_threshold=angle_threshold, rank=False, thread_number=4, log_file="test_screen_contingencies.log")
+    assert [result["contingency"] for result in results]==[(line,) for line in lines]
+    for line, result in zip(lines, results):
+        stable, max_angle_difference, min_voltage, end_time = simulate_line_fault(simulator.clone("test_screen_contingencies.log"), line)
+        assert result["stable"]==stable
+        assert abs(result["max_angle_difference"]-max_angle_difference)<1e-9
+        assert abs(result["min_voltage"]-min_voltage)<1e-9
+        assert abs(result["end_time"]-end_time)<1e-9
+        assert result["pruned"]==False
+    print("results of screen_contingencies() are the same as serial simulations of", len(lines), "line faults")
+
+    ranked_results = simulator.screen_contingencies("LINE FAULT", fault_time=fault_time, clearing_time=clearing_time, simulation_time=simulation_time,
+                                                    angle_threshold=angle_threshold, thread_number=4, log_file="test_screen_contingencies.log")
+    assert sorted(result["contingency"] for result in ranked_results)==sorted(result["contingency"] for result in results)
+    stables = [result["stable"] for result in ranked_results]
+    assert stables==sorted(stables)
+    stable_angles = [result["max_angle_difference"] for result in ranked_results if result["stable"]]
+    assert stable_angles==sorted(stable_angles, reverse=True)
+    print("results of screen_contingencies() are ranked by severity")
+
+    pruned_results = simulator.screen_contingencies("LINE FAULT", fault_time=fault_time, clearing_time=clearing_time, simulation_time=simulation_time,
+                                                    angle_threshold=angle_threshold, prune_time=0.5, rank=False, thread_number=4, log_file="test_screen_contingencies.log")
+    for result, pruned_result in zip(results, pruned_results):
+        assert pruned_result["contingency"]==result["contingency"]
+        if pruned_result["pruned"]:
+            assert result["stable"]
+            assert pruned_result["end_time"]<simulation_time
+        else:
+            assert pruned_result["stable"]==result["stable"]
+    print(sum(result["pruned"] for result in pruned_results), "benign line faults are pruned")
@@ -0,0 +1,57 @@
+#coding=utf-8
+import os
+import numpy
+import stepspy
+
+bench = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "bench")
+fault_time, simulation_time, angle_threshold, tolerance = 0.5, 3.0, 180.0, 0.01
+
+def is_stable_with_clearing_time(toolkit, fault, clearing_time):
+    toolkit.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+    toolkit.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+    toolkit.set_dynamic_simulator_parameter("b", "ANGLE STABILITY SURVEILLANCE LOGIC", True)
+    toolkit.set_dynamic_simulator_parameter("d", "ANGLE STABILITY THRESHOLD IN DEG", angle_threshold)
+    toolkit.start_dynamic_simulation()
+    toolkit.run_dynamic_simulation_to_time(fault_time)
+    if isinstance(fault, tuple):
+        toolkit.set_line_fault(fault, "THREE PHASE FAULT", 0.0, (0.0, -2e4))
+    else:
+        toolkit.set_bus_fault(fault, "THREE PHASE FAULT", (0.0, -2e4))
+    toolkit.run_dynamic_simulation_to_time(fault_time+clearing_time)
+    if not toolkit.get_dynamic_simulation_early_stop_flag():
+        if isinstance(fault, tuple):
+            toolkit.clear_line_fault(fault, "THREE PHASE FAULT", 0.0)
+            toolkit.trip_line(fault)
+        else:
+            toolkit.clear_bus_fault(fault, "THREE PHASE FAULT")
+        toolkit.run_dynamic_simulation_to_time(simulation_time)
+    if not toolkit.is_system_angular_stable():
+        return False
+    return not numpy.isnan(toolkit.get_device_data_array("BUS", "D", "VOLTAGE IN PU")).any()
+
+if __name__ =='__main__':
+    simulator = stepspy.STEPS(is_default=False, log_file="test_search_cct.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "IEEE9.raw"), "PSS/E")
+    simulator.load_dynamic_data(os.path.join(bench, "IEEE9.dyr"), "PSS/E")
+    simulator.solve_powerflow("NR")
+    simulator.set_dynamic_simulation_time_step(0.01)
+
+    faults = [7, (5, 7, "1")]
+    for sections in (1, 4):
+        results = simulator.search_cct(faults, fault_time=fault_time, simulation_time=simulation_time, angle_threshold=angle_threshold,
+                                       tolerance=tolerance, sections=sections, log_file="test_search_cct.log")
+        assert [result["fault"] for result in results]==faults
+        for result in results:
+            fault, cct, unstable_clearing_time = result["fault"], result["cct"], result["unstable_clearing_time"]
+            assert cct is not None and unstable_clearing_time is not None
+            assert 0.0<unstable_clearing_time-cct<=tolerance
+            assert is_stable_with_clearing_time(simulator.clone("test_search_cct.log"), fault, cct)
+            assert not is_stable_with_clearing_time(simulator.clone("test_search_cct.log"), fault, unstable_clearing_time)
+            print("cct of fault", fault, "with", sections, "sections is in", (cct, unstable_clearing_time), "as serial simulations confirm")
+
+    result = simulator.search_cct(7, fault_time=fault_time, simulation_time=simulation_time, angle_threshold=angle_threshold,
+                                  max_clearing_time=0.05, tolerance=tolerance, sections=2, log_file="test_search_cct.log")
+    assert result["cct"]==0.05 and result["unstable_clearing_time"] is None and result["simulation_count"]==2
+    assert is_stable_with_clearing_time(simulator.clone("test_search_cct.log"), 7, 0.05)
+    print("fault 7 is stable with max clearing time 0.05")
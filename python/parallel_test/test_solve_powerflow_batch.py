@@ -0,0 +1,57 @@
+#coding=utf-8
+import os
+import numpy
+import stepspy
+
+bench = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "bench")
+
+def solve_scenario(toolkit, loads, generators, change):
+    toolkit.set_powerflow_solver_parameter("b", "FLAT START LOGIC", False)
+    for i, load in enumerate(loads):
+        toolkit.set_load_data(load, "D", "PP0_MW", toolkit.get_load_data(load, "D", "PP0_MW")+change[i].real)
+        toolkit.set_load_data(load, "D", "QP0_MVAR", toolkit.get_load_data(load, "D", "QP0_MVAR")+change[i].imag)
+    for i, generator in enumerate(generators):
+        toolkit.set_generator_data(generator, "D", "PGEN_MW", toolkit.get_generator_data(generator, "D", "PGEN_MW")+change[len(loads)+i].real)
+        toolkit.set_generator_data(generator, "D", "QGEN_MVAR", toolkit.get_generator_data(generator, "D", "QGEN_MVAR")+change[len(loads)+i].imag)
+    toolkit.solve_powerflow("NR")
+    v, angle = toolkit.get_device_data_array("BUS", "D", ["VOLTAGE IN PU", "ANGLE IN DEG"])
+    return v, angle, toolkit.is_powerflow_converged()
+
+if __name__ =='__main__':
+    simulator = stepspy.STEPS(is_default=False, log_file="test_solve_powerflow_batch.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "ieee39.raw"), "PSS/E")
+    simulator.set_powerflow_solver_parameter("d", "MAX ACTIVE POWER IMBALANCE IN MW", 1e-6)
+    simulator.set_powerflow_solver_parameter("d", "MAX REACTIVE POWER IMBALANCE IN MVAR", 1e-6)
+    simulator.solve_powerflow("NR")
+    base_v, base_angle = simulator.get_device_data_array("BUS", "D", ["VOLTAGE IN PU", "ANGLE IN DEG"])
+
+    loads = simulator.get_all_loads()[:10]
+    generators = [generator for generator in simulator.get_all_generators() if generator[0]!=39][:3]
+    rng = numpy.random.RandomState(0)
+    scenarios = rng.normal(0.0, 20.0, (12, len(loads)+len(generators)))+1j*rng.normal(0.0, 5.0, (12, len(loads)+len(generators)))
+
+    serial_results = [solve_scenario(simulator.clone("test_solve_powerflow_batch.log"), loads, generators, change) for change in scenarios]
+    serial_v = numpy.array([result[0] for result in serial_results])
+    serial_angle = numpy.array([result[1] for result in serial_results])
+    assert all(result[2] for result in serial_results)
+
+    for warm_start in ("previous", "base"):
+        for thread_number in (1, 3):
+            v, angle, converged = simulator.solve_powerflow_batch(scenarios, loads=loads, generators=generators, method="NR", warm_start=warm_start,
+                                                                 thread_number=thread_number, log_file="test_solve_powerflow_batch.log")
+            assert converged.all()
+            assert abs(v-serial_v).max()<1e-6
+            assert abs(angle-serial_angle).max()<1e-4
+            restored_v, restored_angle = simulator.get_device_data_array("BUS", "D", ["VOLTAGE IN PU", "ANGLE IN DEG"])
+            assert abs(restored_v-base_v).max()<1e-9 and abs(restored_angle-base_angle).max()<1e-9
+            print("solve_powerflow_batch() with", warm_start, "warm start and", thread_number, "threads matches serial solutions of", len(scenarios), "scenarios")
+
+    buses = [39, 1, 16]
+    v, angle, converged = simulator.solve_powerflow_batch(scenarios, loads=loads, generators=generators, buses=buses, log_file="test_solve_powerflow_batch.log")
+    columns = [simulator.get_all_buses().index(bus) for bus in buses]
+    assert abs(v-serial_v[:, columns]).max()<1e-6
+    print("solve_powerflow_batch() returns voltages of selected buses")
+
+    assert simulator.solve_powerflow_batch(scenarios[:, :-1], loads=loads, generators=generators) is None
+    print("solve_powerflow_batch() rejects scenarios with mismatched columns")
@@ -8,6 +8,7 @@ __date__ = "April 22, 2020"
 __version__ = "1.0.0"
 
 from .stepspy import STEPS
-from .pouch import POUCH, POUCH_CSV, POUCH_STEPS
+from .pouch import POUCH, POUCH_CSV, POUCH_STEPS, POUCH_STEPS_MEMMAP, POUCH_STEPS_DIAGNOSTICS, iter_chunks
+from .batch import run_batch
 name = 'stepspy'
-__all__ = ['STEPS', 'POUCH', 'POUCH_CSV', 'POUCH_STEPS']
+__all__ = ['STEPS', 'POUCH', 'POUCH_CSV', 'POUCH_STEPS', 'POUCH_STEPS_MEMMAP', 'POUCH_STEPS_DIAGNOSTICS', 'iter_chunks', 'run_batch']
@@ -0,0 +1,200 @@
+#coding=utf-8
+import time
+import collections
+import multiprocessing
+
+from .stepspy import STEPS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# base case toolkit loaded once in each worker process
+__base_case = None
+__base_case_settings = None
+__base_case_error = None
+
+# seconds allowed for a scenario beyond timeout before its worker is killed
+__TIMEOUT_GRACE = 1.0
+
+def __call_steps_method(simulator, method, args):
+    if isinstance(args, dict):
+        return getattr(simulator, method)(**args)
+    else:
+        return getattr(simulator, method)(*args)
+
+def __initialize_worker(case):
+    # exceptions are kept and reported by each scenario. if raised here, pool keeps respawning workers
+    global __base_case, __base_case_settings, __base_case_error
+    __base_case_settings = case
+    try:
+        simulator = STEPS(is_default=False, log_file=case.get("log_file", ""))
+        for method, args in case.get("settings", []):
+            __call_steps_method(simulator, method, args)
+        simulator.load_powerflow_data(case["powerflow_file"], case.get("powerflow_type", "PSS/E"))
+        simulator.solve_powerflow(case.get("powerflow_method", "NR"))
+        simulator.load_dynamic_data(case["dynamic_file"], case.get("dynamic_type", "PSS/E"))
+        __base_case = simulator
+    except Exception as e:
+        __base_case_error = "failed to load base case: "+repr(e)
+
+def __get_initial_result(index, scenario):
+    return {"index": index, "name": scenario.get("name", str(index)),
+            "stable": None, "end_time": None, "timed_out": False, "envelopes": None,
+            "elapsed_time": 0.0, "error": None}
+
+def __get_meter_envelopes(simulator):
+    if numpy is None:
+        return None
+    dy_time, dy_value = simulator.get_meter_buffer(copy=False)
+    envelopes = {}
+    for i, name in enumerate(simulator.get_meter_names()):
+        if len(dy_time)==0:
+            envelopes[name] = (float("nan"), float("nan"))
+        else:
+            envelopes[name] = (float(numpy.nanmin(dy_value[:,i])), float(numpy.nanmax(dy_value[:,i])))
+    return envelopes
+
+def __run_scenario(task):
+    index, scenario, timeout = task
+    case = __base_case_settings
+    result = __get_initial_result(index, scenario)
+    if __base_case_error is not None:
+        result["error"] = __base_case_error
+        return result
+    clock_start = time.time()
+    simulator = None
+    try:
+        simulator = __base_case.clone(case.get("log_file", ""))
+
+        changes = scenario.get("changes", [])
+        for method, args in changes:
+            __call_steps_method(simulator, method, args)
+        if len(changes)!=0 and scenario.get("solve_powerflow", True):
+            simulator.solve_powerflow(case.get("powerflow_method", "NR"))
+
+        time_step = case.get("time_step", 0.01)
+        end_time = scenario.get("end_time", case.get("end_time", 5.0))
+        simulator.set_dynamic_simulation_time_step(time_step)
+        simulator.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+        simulator.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+        simulator.set_dynamic_simulator_parameter("b", "JSON EXPORT LOGIC", False)
+        angle_threshold = case.get("angle_threshold", None)
+        if angle_threshold is not None:
+            simulator.set_dynamic_simulator_parameter("b", "ANGLE STABILITY SURVEILLANCE LOGIC", True)
+            simulator.set_dynamic_simulator_parameter("d", "ANGLE STABILITY THRESHOLD IN DEG", angle_threshold)
+        for method, args in case.get("meters", []):
+            __call_steps_method(simulator, method, args)
+        simulator.set_meter_buffer_capacity(int(end_time/time_step)+10, ring=True)
+
+        def is_timed_out(t):
+            if timeout is not None and time.time()-clock_start>timeout:
+                result["timed_out"] = True
+                return True
+            return False
+
+        simulator.start_dynamic_simulation()
+        events = sorted(scenario.get("events", []), key=lambda event: event[0])
+        stopped = False
+        for event_time, method, args in events:
+            simulator.run_dynamic_simulation_to_time(event_time, callback=is_timed_out)
+            if simulator.get_dynamic_simulation_early_stop_flag():
+                stopped = True
+                break
+            __call_steps_method(simulator, method, args)
+        if not stopped:
+            simulator.run_dynamic_simulation_to_time(end_time, callback=is_timed_out)
+
+        result["stable"] = simulator.is_system_angular_stable()
+        result["end_time"] = simulator.get_dynamic_simulation_time()
+        result["envelopes"] = __get_meter_envelopes(simulator)
+        simulator.stop_dynamic_simulation()
+    except Exception as e:
+        result["error"] = repr(e)
+    del simulator
+    result["elapsed_time"] = time.time()-clock_start
+    return result
+
+def run_batch(case, scenarios, worker_count=None, timeout=None):
+    """
+    Usage:
+        for result in run_batch(case, scenarios, worker_count=None, timeout=None):
+            ...
+        case: dict of base case with keys:
+            "powerflow_file", "dynamic_file": powerflow and dynamic data files
+            "powerflow_type", "dynamic_type": file types of data files. Default is "PSS/E"
+            "powerflow_method": powerflow solution method. Default is "NR"
+            "settings": list of (method, args) of STEPS calls before loading data, e.g. [("set_allowed_maximum_bus_number", (10000,))]
+            "meters": list of (method, args) of STEPS calls to prepare meters, e.g. [("prepare_bus_meter", (16, "VOLTAGE IN PU"))]
+            "time_step", "end_time": simulation time step and end time in second. Default is 0.01 and 5.0
+            "angle_threshold": rotor angle stability threshold in deg. If None, rotor angle stability surveillance is disabled
+            "log_file": log file of toolkits in workers. Default is "" for stdout
+        scenarios: list of dict of scenario with keys:
+            "name": name of scenario. Default is index of scenario in scenarios
+            "changes": list of (method, args) of STEPS calls before simulation, e.g. [("scale_all_loads", (0.05,))]
+            "solve_powerflow": logic of solving powerflow again after changes. Default is True
+            "events": list of (time, method, args) of STEPS calls during simulation, e.g. [(0.0, "set_bus_fault", (16, "THREE PHASE FAULT", (0.0, -2e4)))]
+            "end_time": simulation end time in second. Default is "end_time" of case
+        worker_count: count of worker processes. If None, count of CPUs is used
+        timeout: maximum wall-clock time of each scenario in second. If None, no timeout
+        result: dict of result of one scenario with keys:
+            "index", "name": index and name of scenario
+            "stable": logic of rotor angle stability. Always True if "angle_threshold" of case is None
+            "end_time": simulation time when simulation ends
+            "timed_out": logic of stopping simulation due to timeout
+            "envelopes": dict of (min, max) of each meter. None if numpy is missing
+            "elapsed_time": wall-clock time of scenario in second
+            "error": string of exception in scenario, or None
+    Tips:
+        Each worker loads the base case once, and simulates each scenario on a clone of the base case.
+        Results are yielded as soon as scenarios finish, not in the order of scenarios.
+        args of method can be tuple of positional arguments, or dict of keyword arguments.
+        Timeout is checked every simulation step. Simulation stops with "timed_out" being True, and results till then are returned.
+        Timeout is also enforced by the pool. If a scenario is not returned in timeout plus 1 second, e.g. stuck in powerflow or crashed worker,
+        the pool is terminated, the scenario is returned with "timed_out" being True and "error", and unfinished scenarios are run again in a new pool.
+        If the base case cannot be loaded in workers, every scenario is returned with "error" of the failure.
+        Meter output files are disabled in workers. Meter values are kept in memory for envelopes.
+    """
+    if worker_count is None:
+        worker_count = multiprocessing.cpu_count()
+    tasks = collections.deque([(index, scenario, timeout) for index, scenario in enumerate(scenarios)])
+    while len(tasks)!=0:
+        pool = multiprocessing.Pool(processes=worker_count, initializer=__initialize_worker, initargs=(case,))
+        # at most worker_count scenarios are submitted, so each of them starts running once submitted
+        running = []
+        killed = None
+        try:
+            while killed is None and (len(tasks)!=0 or len(running)!=0):
+                while len(tasks)!=0 and len(running)<worker_count:
+                    task = tasks.popleft()
+                    running.append((task, pool.apply_async(__run_scenario, (task,)), time.time()))
+
+                finished = [item for item in running if item[1].ready()]
+                for item in finished:
+                    running.remove(item)
+                    yield item[1].get()
+                if len(finished)!=0:
+                    continue
+
+                task, async_result, submit_time = running[0]
+                wait_time = 0.1
+                if timeout is not None:
+                    wait_time = min(wait_time, max(submit_time+timeout+__TIMEOUT_GRACE-time.time(), 0.0))
+                try:
+                    async_result.get(wait_time)
+                except multiprocessing.TimeoutError:
+                    if timeout is not None and time.time()>=submit_time+timeout+__TIMEOUT_GRACE:
+                        killed = running.pop(0)
+                        tasks.extendleft(reversed([item[0] for item in running]))
+        finally:
+            pool.terminate()
+            pool.join()
+
+        if killed is not None:
+            task, async_result, submit_time = killed
+            result = __get_initial_result(task[0], task[1])
+            result["timed_out"] = True
+            result["elapsed_time"] = time.time()-submit_time
+            result["error"] = "scenario is not returned in {} s. worker is killed.".format(timeout+__TIMEOUT_GRACE)
+            yield result
@@ -5,6 +5,9 @@ import os
 libsteps_version = "0.12.0"
 libsteps_date = "2020/4/22"
 
+# type of per-step callback of dynamic simulation: bool callback(double time). return True to stop simulation
+DYNAMIC_SIMULATION_STEP_CALLBACK = CFUNCTYPE(c_bool, c_double)
+
 def get_base_library():
     dirname, filename = os.path.split(os.path.abspath(__file__))
     dirname = dirname.replace('\\','/')
@@ -32,6 +35,7 @@ def get_base_library():
 def load_library():
     library = get_base_library()
     if library is not None:
+        # cdll (not pydll) releases the GIL during every call, so toolkits can run in parallel threads
         libsteps = cdll.LoadLibrary(library)
     else:
         return None
@@ -45,6 +49,9 @@ def load_library():
     libsteps.api_generate_new_toolkit.restype = c_uint
     libsteps.api_generate_new_toolkit.argtypes = None
     
+    libsteps.api_clone_toolkit.restype = c_uint
+    libsteps.api_clone_toolkit.argtypes = (c_uint, c_char_p)
+    
     libsteps.api_delete_toolkit.restype = None
     libsteps.api_delete_toolkit.argtypes = (c_uint, )
     
@@ -54,6 +61,18 @@ def load_library():
     libsteps.api_clear_toolkit.restype = None
     libsteps.api_clear_toolkit.argtypes = (c_uint, )
     
+    libsteps.api_cache_base_case.restype = None
+    libsteps.api_cache_base_case.argtypes = (c_uint, )
+    
+    libsteps.api_reset_to_base_case.restype = c_bool
+    libsteps.api_reset_to_base_case.argtypes = (c_uint, )
+    
+    libsteps.api_release_base_case.restype = None
+    libsteps.api_release_base_case.argtypes = (c_uint, )
+    
+    libsteps.api_is_base_case_cached.restype = c_bool
+    libsteps.api_is_base_case_cached.argtypes = (c_uint, )
+    
     libsteps.api_set_toolkit_parallel_thread_number.restype = None
     libsteps.api_set_toolkit_parallel_thread_number.argtypes = (c_uint, c_uint)
     
@@ -96,6 +115,12 @@ def load_library():
     libsteps.api_save_dynamic_data_to_file.restype = None
     libsteps.api_save_dynamic_data_to_file.argtypes = (c_char_p, c_char_p, c_uint)
     
+    libsteps.api_save_case_snapshot.restype = c_bool
+    libsteps.api_save_case_snapshot.argtypes = (c_char_p, c_uint)
+    
+    libsteps.api_load_case_snapshot.restype = c_bool
+    libsteps.api_load_case_snapshot.argtypes = (c_char_p, c_uint)
+    
     libsteps.api_check_powerflow_data.restype = None
     libsteps.api_check_powerflow_data.argtypes = (c_uint, )
     
@@ -206,6 +231,18 @@ def load_library():
     libsteps.api_goto_next_device.restype = None
     libsteps.api_goto_next_device.argtypes = (c_char_p, c_uint)
 
+    libsteps.api_get_device_search_result_count.restype = c_uint
+    libsteps.api_get_device_search_result_count.argtypes = (c_char_p, c_uint)
+
+    libsteps.api_get_device_search_result_bus_numbers.restype = None
+    libsteps.api_get_device_search_result_bus_numbers.argtypes = (c_char_p, c_char_p, POINTER(c_uint), c_uint, c_uint)
+
+    libsteps.api_get_device_search_result_identifiers.restype = c_uint
+    libsteps.api_get_device_search_result_identifiers.argtypes = (c_char_p, c_char_p, c_uint, c_uint)
+
+    libsteps.api_set_device_search_result.restype = c_uint
+    libsteps.api_set_device_search_result.argtypes = (c_char_p, POINTER(c_uint), c_char_p, c_uint, c_uint)
+
     libsteps.api_initialize_area_search.restype = None
     libsteps.api_initialize_area_search.argtypes = (c_uint, )
 
@@ -444,6 +481,30 @@ def load_library():
     libsteps.api_set_owner_string_data.restype = None
     libsteps.api_set_owner_string_data.argtypes = (c_uint, c_char_p, c_char_p, c_uint)
 
+    libsteps.api_get_device_search_result_integer_data.restype = None
+    libsteps.api_get_device_search_result_integer_data.argtypes = (c_char_p, c_char_p, c_char_p, POINTER(c_int), c_uint, c_uint)
+    libsteps.api_get_device_search_result_float_data.restype = None
+    libsteps.api_get_device_search_result_float_data.argtypes = (c_char_p, c_char_p, c_char_p, POINTER(c_double), c_uint, c_uint)
+    libsteps.api_get_device_search_result_boolean_data.restype = None
+    libsteps.api_get_device_search_result_boolean_data.argtypes = (c_char_p, c_char_p, c_char_p, POINTER(c_bool), c_uint, c_uint)
+    libsteps.api_set_device_search_result_float_data.restype = None
+    libsteps.api_set_device_search_result_float_data.argtypes = (c_char_p, c_char_p, c_char_p, POINTER(c_double), c_uint, c_bool, c_uint)
+
+    libsteps.api_get_device_field_id.restype = c_uint
+    libsteps.api_get_device_field_id.argtypes = (c_char_p, c_char_p, c_char_p, c_char_p, c_uint)
+    libsteps.api_get_device_integer_data_with_field_id.restype = c_int
+    libsteps.api_get_device_integer_data_with_field_id.argtypes = (c_uint, c_uint, c_uint, c_char_p, c_uint, c_uint)
+    libsteps.api_set_device_integer_data_with_field_id.restype = None
+    libsteps.api_set_device_integer_data_with_field_id.argtypes = (c_uint, c_uint, c_uint, c_char_p, c_uint, c_int, c_uint)
+    libsteps.api_get_device_float_data_with_field_id.restype = c_double
+    libsteps.api_get_device_float_data_with_field_id.argtypes = (c_uint, c_uint, c_uint, c_char_p, c_uint, c_uint)
+    libsteps.api_set_device_float_data_with_field_id.restype = None
+    libsteps.api_set_device_float_data_with_field_id.argtypes = (c_uint, c_uint, c_uint, c_char_p, c_uint, c_double, c_uint)
+    libsteps.api_get_device_boolean_data_with_field_id.restype = c_bool
+    libsteps.api_get_device_boolean_data_with_field_id.argtypes = (c_uint, c_uint, c_uint, c_char_p, c_uint, c_uint)
+    libsteps.api_set_device_boolean_data_with_field_id.restype = None
+    libsteps.api_set_device_boolean_data_with_field_id.argtypes = (c_uint, c_uint, c_uint, c_char_p, c_uint, c_bool, c_uint)
+
     libsteps.api_set_dynamic_model.restype = None
     libsteps.api_set_dynamic_model.argtypes = (c_char_p, c_char_p, c_uint)
     
@@ -544,6 +605,9 @@ def load_library():
     libsteps.api_save_jacobian_matrix.restype = None
     libsteps.api_save_jacobian_matrix.argtypes = (c_char_p, c_uint)
 
+    libsteps.api_build_jacobian_matrix.restype = None
+    libsteps.api_build_jacobian_matrix.argtypes = (c_uint, )
+
     libsteps.api_build_network_Y_matrix.restype = None
     libsteps.api_build_network_Y_matrix.argtypes = (c_uint, )
     libsteps.api_build_decoupled_network_B_matrix.restype = None
@@ -565,6 +629,21 @@ def load_library():
     libsteps.api_save_network_Z_matrix.restype = None
     libsteps.api_save_network_Z_matrix.argtypes = (c_char_p, c_uint)
 
+    libsteps.api_get_network_matrix_size.restype = c_uint
+    libsteps.api_get_network_matrix_size.argtypes = (c_char_p, c_uint)
+
+    libsteps.api_get_network_matrix_entry_count.restype = c_uint
+    libsteps.api_get_network_matrix_entry_count.argtypes = (c_char_p, c_uint)
+
+    libsteps.api_get_network_matrix_in_compressed_column_form.restype = None
+    libsteps.api_get_network_matrix_in_compressed_column_form.argtypes = (c_char_p, POINTER(c_int), POINTER(c_int), POINTER(c_double), POINTER(c_double), c_uint, c_uint, c_uint)
+
+    libsteps.api_get_network_matrix_bus_numbers.restype = None
+    libsteps.api_get_network_matrix_bus_numbers.argtypes = (c_char_p, POINTER(c_uint), c_uint, c_uint)
+
+    libsteps.api_get_network_Z_columns.restype = None
+    libsteps.api_get_network_Z_columns.argtypes = (c_char_p, POINTER(c_uint), c_uint, POINTER(c_double), POINTER(c_double), c_uint, c_uint)
+
     libsteps.api_get_dynamic_simulator_integer_parameter.restype = (c_uint)
     libsteps.api_get_dynamic_simulator_integer_parameter.argtypes = (c_char_p, c_uint)
     libsteps.api_get_dynamic_simulator_float_parameter.restype = (c_double)
@@ -643,16 +722,47 @@ def load_library():
     libsteps.api_prepare_equivalent_device_related_meter.restype = None
     libsteps.api_prepare_equivalent_device_related_meter.argtypes = (c_uint, c_char_p, c_char_p, c_char_p, c_uint)
 
+    libsteps.api_get_meter_count.restype = c_uint
+    libsteps.api_get_meter_count.argtypes = (c_uint, )
+    libsteps.api_get_meter_name.restype = c_char_p
+    libsteps.api_get_meter_name.argtypes = (c_uint, c_uint)
+    libsteps.api_get_meter_buffer.restype = POINTER(c_double)
+    libsteps.api_get_meter_buffer.argtypes = (c_uint, )
+    libsteps.api_get_meter_buffer_column_count.restype = c_uint
+    libsteps.api_get_meter_buffer_column_count.argtypes = (c_uint, )
+    libsteps.api_get_meter_buffer_stored_count.restype = c_uint
+    libsteps.api_get_meter_buffer_stored_count.argtypes = (c_uint, )
+
     libsteps.api_start_dynamic_simulation.restype = None
     libsteps.api_start_dynamic_simulation.argtypes = (c_uint, )
     libsteps.api_stop_dynamic_simulation.restype = None
     libsteps.api_stop_dynamic_simulation.argtypes = (c_uint, )
     libsteps.api_run_simulation_to_time.restype = None
     libsteps.api_run_simulation_to_time.argtypes = (c_double, c_uint)
+    libsteps.api_run_simulation_to_time_with_callback.restype = None
+    libsteps.api_run_simulation_to_time_with_callback.argtypes = (c_double, DYNAMIC_SIMULATION_STEP_CALLBACK, c_uint, c_uint)
     libsteps.api_run_a_step.restype = None
     libsteps.api_run_a_step.argtypes = (c_uint, )
     libsteps.api_get_system_angular_stable_flag.restype = c_bool
     libsteps.api_get_system_angular_stable_flag.argtypes = (c_uint, )
+    libsteps.api_get_dynamic_simulation_early_stop_flag.restype = c_bool
+    libsteps.api_get_dynamic_simulation_early_stop_flag.argtypes = (c_uint, )
+
+    libsteps.api_add_meter_stop_condition.restype = None
+    libsteps.api_add_meter_stop_condition.argtypes = (c_uint, c_double, c_double, c_double, c_uint)
+    libsteps.api_clear_meter_stop_conditions.restype = None
+    libsteps.api_clear_meter_stop_conditions.argtypes = (c_uint, )
+    libsteps.api_get_meter_stop_condition_count.restype = c_uint
+    libsteps.api_get_meter_stop_condition_count.argtypes = (c_uint, )
+
+    libsteps.api_save_dynamic_state.restype = c_uint
+    libsteps.api_save_dynamic_state.argtypes = (c_uint, )
+    libsteps.api_restore_dynamic_state.restype = c_bool
+    libsteps.api_restore_dynamic_state.argtypes = (c_uint, c_uint)
+    libsteps.api_release_dynamic_state.restype = None
+    libsteps.api_release_dynamic_state.argtypes = (c_uint, c_uint)
+    libsteps.api_get_dynamic_state_count.restype = c_uint
+    libsteps.api_get_dynamic_state_count.argtypes = (c_uint, )
 
     libsteps.api_set_bus_fault.restype = None
     libsteps.api_set_bus_fault.argtypes = (c_uint, c_char_p, c_double, c_double, c_uint)
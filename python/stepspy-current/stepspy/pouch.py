@@ -2,6 +2,7 @@
 import time
 import struct
 import csv
+import itertools
 import os.path
 import math
 
@@ -10,6 +11,26 @@ try:
 except ImportError:
     print("pouch is dependent on module numpy which is missing. please install numpy before use pouch")
 
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+# rows parsed in each chunk when reading csv file
+CSV_CHUNK_ROWS = 10000
+
+# columns written before meter values in each time point of STEPS bin file, by bin file version.
+# 'f' is float of float_size in bin file header, 'i' is 4-byte int.
+STEPS_BIN_DIAGNOSTIC_LAYOUTS = {0: [("TIME", 'f')],
+                                1: [("TIME", 'f'),
+                                    ("DAE INTEGRATION", 'i'),
+                                    ("NETWORK INTEGRATION", 'i'),
+                                    ("MISMATCH IN MVA", 'f'),
+                                    ("MISMATCH BUS", 'i'),
+                                    ("D TIME ELAPSE IN MS", 'f'),
+                                    ("A TIME ELAPSE IN MS", 'f'),
+                                    ("TOTAL TIME ELAPSE IN MS", 'f')]}
+
 def __is_filename_ends_with(filename, surfix):
     filename = filename.upper()
     surfix = surfix.upper()
@@ -42,19 +63,22 @@ def POUCH(file_name, type, save_or_not=False, show_log=True):
     print("Power System Simulator type invalid")
     return numpy.array([]), numpy.array([]), []
         
-def POUCH_CSV(file_name, show_log=True):
+def POUCH_CSV(file_name, show_log=True, usecols=None, dtype=None):
     """
     Usage:
-        dy_time, dy_value, dy_channel = POUCH_CSV(file_name, show_log=True)
+        dy_time, dy_value, dy_channel = POUCH_CSV(file_name, show_log=True, usecols=None, dtype=None)
         file_name: csv file ending with '.csv'. the first line of the csv file should be channels' name quoted by '"'
-        save_or_not: logic. True for saving to csv file, False for ignoring saving
         show_log: logic. True for showing log, False for diabling log
+        usecols: list of channel names to read. If None, all channels are read
+        dtype: numpy float type of returned values, e.g., numpy.float32. If None, numpy.float64 is used
         dy_time: numpy array of simulation time
-        dy_value: numpy array of values of all channels
-        dy_channel: list of name of all channels
+        dy_value: numpy array of values of all channels, or of channels in usecols
+        dy_channel: list of name of all channels, or usecols
+    Tips:
+        The csv file is parsed in chunks of CSV_CHUNK_ROWS rows with pandas if it is installed, or with numpy otherwise.
     """
     if show_log==True:
-        info  = "CSV File Conversion Program V1.2.1 (2019/07/05)\n"
+        info  = "CSV File Conversion Program V1.3.0 (2026/10/17)\n"
         info += "Supports: Common CSV files with header, or Power Factory 15.1\n"
         info += "Changgang Li (lichgang@sdu.ed.cn)"
 
@@ -65,43 +89,94 @@ def POUCH_CSV(file_name, show_log=True):
         print(info)
         return numpy.array([]), numpy.array([]), []
         
-    dy_time = []
-    dy_value = []
-    dy_channel = []
-    
     if not __is_filename_ends_with(file_name, '.csv'):
         info = '**** '+file_name+' is not ending with .csv. Please check CSV file name.'
         print(info)
-        return numpy.array(dy_time), numpy.array(dy_value), dy_channel
+        return numpy.array([]), numpy.array([]), []
 
-    start_time = time.clock()
-    
+    if dtype is None:
+        dtype = numpy.float64
+
+    start_time = time.time()
+
+    n_rows = __get_csv_row_count(file_name)
     with open(file_name, 'rt') as fid:
-        data = fid.readline()
-        data = data[0:-1] # remove the last \n char
-        data = data.replace('"','')
-        channels = data.split(',')
-        for i in range(len(channels)):
-            channel = channels[i]
-            channel = channel.strip('"')
-            channel = channel.strip()
-            channels[i] = channel
-        
-        dy_channel = channels[1:len(channels)+1]
-        
-        reader = csv.reader(fid, quoting=csv.QUOTE_NONNUMERIC)
-        for data in reader:
-            dy_time.append(data[0])
-            dy_value.append(data[1:len(data)+1])
+        dy_channel = __read_csv_header(fid)
+        index = [0]
+        if usecols is not None:
+            channel_index = __get_channel_index(dy_channel, usecols)
+            if channel_index is None:
+                return numpy.array([]), numpy.array([]), []
+            index.extend([i+1 for i in channel_index])
+            dy_channel = [dy_channel[i] for i in channel_index]
+        else:
+            index.extend(range(1, len(dy_channel)+1))
+
+        data = numpy.empty((n_rows, len(index)), dtype=dtype)
+        n_rows = 0
+        for chunk in __iter_csv_chunks(fid, index, dtype, CSV_CHUNK_ROWS):
+            data[n_rows:n_rows+len(chunk)] = chunk
+            n_rows += len(chunk)
+        data = data[:n_rows]
     if show_log==True:
-        end_time = time.clock()
+        end_time = time.time()
         time_elapsed = end_time - start_time
         
         info = 'Conversion finished in '+str(float(int(time_elapsed*1000.0))*0.001)+'s'
         print(info)
 
-    return numpy.array(dy_time), (numpy.array(dy_value)), dy_channel
-        
+    return data[:,0], data[:,1:], dy_channel
+
+def __read_csv_header(fid):
+    """
+    Read the first line of csv file, and return list of name of all channels except time.
+    """
+    data = fid.readline()
+    data = data[0:-1] # remove the last \n char
+    data = data.replace('"','')
+    channels = data.split(',')
+    for i in range(len(channels)):
+        channel = channels[i]
+        channel = channel.strip('"')
+        channel = channel.strip()
+        channels[i] = channel
+    return channels[1:len(channels)+1]
+
+def __get_csv_row_count(file_name):
+    """
+    Count lines of csv file except the header. It is the upper limit of time point count.
+    """
+    n_rows = 0
+    last = b'\n'
+    with open(file_name, 'rb') as fid:
+        while True:
+            data = fid.read(1<<24)
+            if len(data)==0:
+                break
+            n_rows += data.count(b'\n')
+            last = data[-1:]
+    if last!=b'\n':
+        n_rows += 1
+    return max(n_rows-1, 0)
+
+def __iter_csv_chunks(fid, index, dtype, rows):
+    """
+    Parse csv file from current position of fid in chunks of rows lines.
+    Yield 2D numpy array of columns in index for each chunk.
+    """
+    if pandas is not None:
+        reader = pandas.read_csv(fid, header=None, usecols=sorted(set(index)), dtype=dtype, engine='c', chunksize=rows, skipinitialspace=True, float_precision='round_trip')
+        for frame in reader:
+            yield frame[index].to_numpy(dtype=dtype)
+    else:
+        while True:
+            lines = list(itertools.islice(fid, rows))
+            if len(lines)==0:
+                break
+            data = numpy.loadtxt(lines, delimiter=',', usecols=index, dtype=dtype, ndmin=2)
+            if len(data)!=0:
+                yield data
+
 def POUCH_STEPS(file_name, save_or_not=False, show_log=True):
     """
     Usage:
@@ -133,7 +208,7 @@ def POUCH_STEPS(file_name, save_or_not=False, show_log=True):
         print(info)
         return numpy.array(dy_time), numpy.array(dy_value), dy_channel
 
-    start_time = time.clock()
+    start_time = time.time()
     
     fid = open(file_name, 'rb')
     steps_bin_version = fid.read(4)
@@ -141,15 +216,18 @@ def POUCH_STEPS(file_name, save_or_not=False, show_log=True):
     steps_bin_version = steps_bin_version[0]
     fid.close()
     
-    if steps_bin_version==0:
-        dy_time, dy_value, dy_channel = __POUCH_STEPS_0(file_name, show_log)
+    if steps_bin_version in STEPS_BIN_DIAGNOSTIC_LAYOUTS:
+        dy_time, dy_value, dy_channel = __POUCH_STEPS_BIN(file_name, show_log)
+    else:
+        info = '**** STEPS bin file version '+str(steps_bin_version)+' is not supported.'
+        print(info)
         
     if save_or_not == True:
         file_name = file_name+'.csv'
         __save_data(file_name, dy_time, dy_value, dy_channel)
         
         
-    end_time = time.clock()
+    end_time = time.time()
     time_elapsed = end_time - start_time
     if show_log==True:
         info = 'Conversion finished in '+str(float(int(time_elapsed*1000.0))*0.001)+'s'
@@ -157,57 +235,225 @@ def POUCH_STEPS(file_name, save_or_not=False, show_log=True):
     
     return dy_time, dy_value, dy_channel
 
-def __POUCH_STEPS_0(file_name, show_log=True):
-    dy_time = []
-    dy_value = []
-    dy_channel = []
-    
-    with open(file_name, 'rb') as fid:
-        steps_bin_version = fid.read(4) # get STEPS version
-        steps_bin_version = struct.unpack('I', steps_bin_version)
-        steps_bin_version = steps_bin_version[0]
-        
-        case_time = fid.read(4*6) # get case time
-        case_time = struct.unpack('6I', case_time)
-        case_year = case_time[0]
-        case_month = case_time[1]
-        case_day = case_time[2]
-        case_hour = case_time[3]
-        case_minute = case_time[4]
-        case_second = case_time[5]
-        print(case_time)
-        print(case_year, case_month, case_day, case_hour, case_minute, case_second)
-        
-        float_size = fid.read(4) # get float size
-        float_size = struct.unpack('I',float_size)
-        float_size = float_size[0]
-        
-        n_channels = fid.read(4) # get 4 bytes: channel count
-        n_channels = struct.unpack('I',n_channels)
-        n_channels = n_channels[0]
-        n_channel_bytes = fid.read(4) # get 4 bytes: channel name bytes count
-        n_channel_bytes = struct.unpack('I',n_channel_bytes)
-        n_channel_bytes = n_channel_bytes[0]
-
-        channels = fid.read(n_channel_bytes) # bytes of channel names
-        channels = channels.decode("cp936")
-        channels = channels.strip()
-
-        channels = channels.split('\n')
-        for i in range(1,n_channels):
-            dy_channel.append(channels[i])
-        
-        while True: # loop for each time point
-            data = fid.read(n_channels*float_size) # get values
-            if len(data)<n_channels*float_size:
-                break
-            if float_size==4:
-                data = struct.unpack('f'*n_channels, data)
+def POUCH_STEPS_MEMMAP(file_name, channels=None, show_log=True):
+    """
+    Usage:
+        dy_time, dy_value, dy_channel = POUCH_STEPS_MEMMAP(file_name, channels=None, show_log=True)
+        file_name: STEPS binary file ending with '.bin'
+        channels: list of channel names to select. If None, all channels are returned
+        show_log: logic. True for showing log, False for diabling log
+        dy_time: numpy memmap view of simulation time
+        dy_value: numpy memmap view of values of all channels if channels is None, or numpy array of values of selected channels
+        dy_channel: list of name of returned channels
+    Tips:
+        The bin file is memory-mapped. Nothing is read until dy_time or dy_value is sliced.
+        Values are returned in the float type of the bin file without upcasting, i.e., float32 for STEPS bin file.
+        Incomplete time point at the end of file is ignored, so the file can be read while simulation is running.
+        Solver diagnostics are not included in dy_channel. Use POUCH_STEPS_DIAGNOSTICS() to get them.
+    """
+    if show_log==True:
+        info  = "STEPS Bin File Memory-mapped Reader V0.2.0 (2026/10/17)\n"
+        info += "Supports: STEPS bin file version "+", ".join([str(v) for v in sorted(STEPS_BIN_DIAGNOSTIC_LAYOUTS)])
+        print(info)
+
+    data = __open_steps_bin(file_name)
+    if data is None:
+        return numpy.array([]), numpy.array([]), []
+    data, dy_channel, invalid_fields = data
+
+    dy_time = data["TIME"]
+    dy_value = data["METER"]
+    if channels is not None:
+        index = __get_channel_index(dy_channel, channels)
+        if index is None:
+            return numpy.array([]), numpy.array([]), []
+        dy_value = dy_value[:,index]
+        dy_channel = [dy_channel[i] for i in index]
+    return dy_time, dy_value, dy_channel
+
+def POUCH_STEPS_DIAGNOSTICS(file_name, show_log=True):
+    """
+    Usage:
+        dy_time, dy_diagnostics = POUCH_STEPS_DIAGNOSTICS(file_name, show_log=True)
+        file_name: STEPS binary file ending with '.bin'
+        show_log: logic. True for showing log, False for diabling log
+        dy_time: numpy memmap view of simulation time
+        dy_diagnostics: dict of numpy memmap views of solver diagnostics of each time point. keys are:
+            "DAE INTEGRATION", "NETWORK INTEGRATION": iteration count of DAE integration and network solution
+            "MISMATCH IN MVA", "MISMATCH BUS": maximum power mismatch and the bus with it
+            "D TIME ELAPSE IN MS", "A TIME ELAPSE IN MS", "TOTAL TIME ELAPSE IN MS": time elapsed in differential equations, network solution, and the whole step
+    Tips:
+        Only diagnostics written in the bin file are returned. Bin file of old STEPS only has TIME, and empty dict is returned.
+        Bin file version 0 of STEPS with solver diagnostics did not save iteration counts correctly. They are returned as -1.
+    """
+    if show_log==True:
+        info  = "STEPS Bin File Diagnostics Reader V0.1.0 (2026/10/17)\n"
+        info += "Supports: STEPS bin file version "+", ".join([str(v) for v in sorted(STEPS_BIN_DIAGNOSTIC_LAYOUTS)])
+        print(info)
+
+    data = __open_steps_bin(file_name)
+    if data is None:
+        return numpy.array([]), {}
+    data, dy_channel, invalid_fields = data
+
+    dy_time = data["TIME"]
+    dy_diagnostics = {}
+    for name in data.dtype.names:
+        if name in ("TIME", "METER"):
+            continue
+        if name in invalid_fields:
+            dy_diagnostics[name] = numpy.full(len(data), -1, dtype=data.dtype[name])
+        else:
+            dy_diagnostics[name] = data[name]
+    return dy_time, dy_diagnostics
+
+def iter_chunks(file_name, rows=CSV_CHUNK_ROWS, channels=None, dtype=None):
+    """
+    Usage:
+        for dy_time, dy_value in iter_chunks(file_name, rows=CSV_CHUNK_ROWS, channels=None, dtype=None):
+            ...
+        file_name: STEPS binary file ending with '.bin', or csv file ending with '.csv'
+        rows: maximum count of time points in each chunk
+        channels: list of channel names to read. If None, all channels are read
+        dtype: numpy float type of returned values. If None, float32 is used for bin file, and float64 is used for csv file
+        dy_time: numpy array of simulation time of time points in the chunk
+        dy_value: numpy array of values of channels of time points in the chunk, in the order of channels, or of all channels in the file if channels is None
+    Tips:
+        Only one chunk is in memory at a time, so meter output larger than memory can be processed.
+    """
+    if not os.path.exists(file_name):
+        info = '**** There is no file '+file_name+'.\n**** Please check meter output file.'
+        print(info)
+        return
+
+    if __is_filename_ends_with(file_name, '.bin'):
+        data = __open_steps_bin(file_name)
+        if data is None:
+            return
+        data, dy_channel, invalid_fields = data
+        index = None
+        if channels is not None:
+            index = __get_channel_index(dy_channel, channels)
+            if index is None:
+                return
+        for i in range(0, len(data), rows):
+            chunk = data[i:i+rows]
+            dy_time = numpy.array(chunk["TIME"], dtype=dtype)
+            if index is None:
+                dy_value = numpy.array(chunk["METER"], dtype=dtype)
             else:
-                data = struct.unpack('d'*n_channels, data)
-            t = data[0]
-            value = data[1:n_channels]
-            dy_time.append(t)
-            dy_value.append(value)        
+                dy_value = numpy.array(chunk["METER"][:,index], dtype=dtype)
+            yield dy_time, dy_value
+    elif __is_filename_ends_with(file_name, '.csv'):
+        if dtype is None:
+            dtype = numpy.float64
+        with open(file_name, 'rt') as fid:
+            dy_channel = __read_csv_header(fid)
+            index = [0]
+            if channels is not None:
+                channel_index = __get_channel_index(dy_channel, channels)
+                if channel_index is None:
+                    return
+                index.extend([i+1 for i in channel_index])
+            else:
+                index.extend(range(1, len(dy_channel)+1))
+            for chunk in __iter_csv_chunks(fid, index, dtype, rows):
+                yield chunk[:,0], chunk[:,1:]
+    else:
+        info = '**** '+file_name+' is not ending with .bin or .csv. Please check meter output file name.'
+        print(info)
+
+def __open_steps_bin(file_name):
+    """
+    Memory-map STEPS bin file with the layout of its version.
+    Return (data, channels, invalid_fields), where data is numpy structured memmap with one field for each solver diagnostic and field "METER" of all channels,
+    channels is list of name of meter channels, and invalid_fields is list of diagnostic fields which were not saved correctly.
+    Return None if the bin file does not exist or is not supported.
+    """
+    if not os.path.exists(file_name):
+        info = '**** There is no bin file '+file_name+'.\n**** Please check STEPS bin file.'
+        print(info)
+        return None
+
+    if not __is_filename_ends_with(file_name, '.bin'):
+        info = '**** '+file_name+' is not ending with .bin. Please check STEPS bin file name.'
+        print(info)
+        return None
+
+    header = __read_steps_bin_header(file_name)
+    if header is None:
+        return None
+    steps_bin_version, case_time, float_size, n_columns, names, offset = header
+
+    layout = STEPS_BIN_DIAGNOSTIC_LAYOUTS[steps_bin_version]
+    invalid_fields = []
+    if steps_bin_version==0 and len(names)==n_columns+4:
+        # version 0 files of STEPS with solver diagnostics: column count in header misses 4 diagnostics,
+        # and iteration counts were written with bytes of TIME
+        layout = STEPS_BIN_DIAGNOSTIC_LAYOUTS[1]
+        n_columns = len(names)
+        invalid_fields = ["DAE INTEGRATION", "NETWORK INTEGRATION"]
+    n_diagnostics = len(layout)
+    if n_columns<n_diagnostics or len(names)<n_columns:
+        info = '**** Header of STEPS bin file '+file_name+' is broken. '+str(n_columns)+' columns with '+str(len(names))+' names.'
+        print(info)
+        return None
+
+    float_type = numpy.float32 if float_size==4 else numpy.float64
+    types = {'f': float_type, 'i': numpy.int32}
+    fields = [(name, types[ftype]) for name, ftype in layout]
+    fields.append(("METER", float_type, (n_columns-n_diagnostics,)))
+    dtype = numpy.dtype(fields)
+
+    n_rows = (os.path.getsize(file_name)-offset)//dtype.itemsize
+    if n_rows<=0:
+        data = numpy.zeros(0, dtype=dtype)
+    else:
+        data = numpy.memmap(file_name, dtype=dtype, mode='r', offset=offset, shape=(n_rows,))
+    return data, names[n_diagnostics:n_columns], invalid_fields
+
+def __read_steps_bin_header(file_name):
+    """
+    Read header of STEPS bin file.
+    Return (steps_bin_version, case_time, float_size, n_columns, names, offset), where names includes TIME, and offset is the byte count of header.
+    Return None if the bin file version is not supported.
+    """
+    with open(file_name, 'rb') as fid:
+        steps_bin_version = struct.unpack('I', fid.read(4))[0]
+        if steps_bin_version not in STEPS_BIN_DIAGNOSTIC_LAYOUTS:
+            info = '**** STEPS bin file version '+str(steps_bin_version)+' is not supported.'
+            print(info)
+            return None
+        case_time = struct.unpack('6I', fid.read(4*6))
+        float_size = struct.unpack('I', fid.read(4))[0]
+        n_columns = struct.unpack('I', fid.read(4))[0]
+        n_name_bytes = struct.unpack('I', fid.read(4))[0]
+        names = fid.read(n_name_bytes).decode("cp936").strip().split('\n')
+        offset = 4*10+n_name_bytes
+    return steps_bin_version, case_time, float_size, n_columns, names, offset
+
+def __get_channel_index(dy_channel, channels):
+    """
+    Get column index of channels in dy_channel. Return None if any channel does not exist.
+    """
+    channel_index = {}
+    for i, channel in enumerate(dy_channel):
+        channel_index[channel] = i
+    index = []
+    for channel in channels:
+        if channel not in channel_index:
+            info = '**** Channel '+channel+' does not exist.'
+            print(info)
+            return None
+        index.append(channel_index[channel])
+    return index
+
+def __POUCH_STEPS_BIN(file_name, show_log=True):
+    data = __open_steps_bin(file_name)
+    if data is None:
+        return numpy.array([]), numpy.array([]), []
+    data, dy_channel, invalid_fields = data
 
+    dy_time = data["TIME"].astype(numpy.float64)
+    dy_value = data["METER"].astype(numpy.float64)
     return dy_time, dy_value, dy_channel
@@ -1,9 +1,44 @@
 from .libsteps import pylibsteps
-from ctypes import c_char_p
+from ctypes import c_char_p, c_uint, c_int, c_double, c_bool, POINTER, create_string_buffer
 import platform
 import os
+import threading
+import itertools
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
 global STEPS_LIB
 
+PYTHON_VERSION = platform.python_version_tuple()[0]
+C_CHAR_P_CACHE = {}
+C_CHAR_P_CACHE_SIZE = 4096
+C_CHAR_P_CACHE_MAX_STRING_LENGTH = 128
+PARALLEL_RUN_COUNT = 0
+PARALLEL_RUN_LOCK = threading.Lock()
+
 class STEPS():
     """
     Common usage to build a simulator with STEPS:
@@ -25,6 +60,7 @@ class STEPS():
         else:
             log_file = self.__get_c_char_p_of_string(log_file)
             self.toolkit_index = STEPS_LIB.api_generate_new_toolkit(log_file)
+        self.__field_par_types = {}
         
     def __del__(self):
         """
@@ -88,15 +124,24 @@ class STEPS():
             (1) data: Python string.
         Rets:
             (1) char* pointer. If Python version is not 2 or 3, None will be returned.
-        """
-        python_version = platform.python_version_tuple()
-        python_version = python_version[0]
-        if python_version == '3':
-            return c_char_p(bytes(data, 'utf-8'))
-        elif python_version == '2':
-            return c_char_p(bytes(data))
+        Tips:
+            Short strings, such as device types and parameter names, are encoded once and cached in C_CHAR_P_CACHE, which is cleared when C_CHAR_P_CACHE_SIZE strings are cached.
+            The cached char* pointer is shared by all calls and MUST NOT be modified by STEPS kernel.
+        """
+        c_data = C_CHAR_P_CACHE.get(data)
+        if c_data is not None:
+            return c_data
+        if PYTHON_VERSION == '3':
+            c_data = c_char_p(bytes(data, 'utf-8'))
+        elif PYTHON_VERSION == '2':
+            c_data = c_char_p(bytes(data))
         else:
             return None
+        if C_CHAR_P_CACHE_SIZE>0 and len(data)<=C_CHAR_P_CACHE_MAX_STRING_LENGTH:
+            if len(C_CHAR_P_CACHE)>=C_CHAR_P_CACHE_SIZE:
+                C_CHAR_P_CACHE.clear()
+            C_CHAR_P_CACHE[data] = c_data
+        return c_data
             
     def __get_string_from_c_char_p(self, data):
         """
@@ -106,15 +151,113 @@ class STEPS():
         Rets:
             (1) Python string.
         """
-        python_version = platform.python_version_tuple()
-        python_version = python_version[0]
-        if python_version == '3':
+        if PYTHON_VERSION == '3':
             return str(data, encoding='utf-8')
-        elif python_version == '2':
+        elif PYTHON_VERSION == '2':
             return str(data)
         else:
             return None
-            
+
+    def __extract_device_id(self, did):
+        """
+        Private function to extract buses and identifier from device id of any device type.
+        Args:
+            (1) did: bus number, or tuple in the format of (bus, ickt), (ibus, jbus, ickt), or (ibus, jbus, kbus, ickt).
+        Rets:
+            (1) ibus: integer, device first bus number.
+            (2) jbus: integer, device second bus number. 0 for buses and single bus devices.
+            (3) kbus: integer, device third bus number. 0 for buses, single bus devices, and two bus devices.
+            (4) ickt: string, device identifier. Empty string for buses.
+        """
+        if not isinstance(did, (tuple, list)):
+            return did, 0, 0, ""
+        if len(did)==2:
+            return did[0], 0, 0, did[1]
+        if len(did)==3:
+            return did[0], did[1], 0, did[2]
+        return did[0], did[1], did[2], did[3]
+
+    def __get_device_search_result_columns(self, device, sides):
+        """
+        Private function to get all devices in the search buffer of STEPS kernel in bulk. The search buffer should be initialized with api_initialize_all_bus_search(), api_initialize_bus_search(), or api_initialize_device_search() before calling.
+        Args:
+            (1) device: char* pointer of device type.
+            (2) sides: tuple of strings, terminal sides of the device. Bus numbers of all devices at each side are returned with one call.
+        Rets:
+            (1) List of ctypes c_uint arrays of bus numbers, one array for each side.
+            (2) List of device identifiers. Empty list for buses.
+        """
+        global STEPS_LIB
+        n = STEPS_LIB.api_get_device_search_result_count(device, self.toolkit_index)
+        buses = []
+        for side in sides:
+            side = self.__get_c_char_p_of_string(side)
+            bus = (c_uint*n)()
+            STEPS_LIB.api_get_device_search_result_bus_numbers(device, side, bus, n, self.toolkit_index)
+            buses.append(bus)
+        identifiers = []
+        if device.value.upper()!=b"BUS" and n>0:
+            n_bytes = 8*n+1
+            ids = create_string_buffer(n_bytes)
+            n_required = STEPS_LIB.api_get_device_search_result_identifiers(device, ids, n_bytes, self.toolkit_index)
+            if n_required>n_bytes:
+                ids = create_string_buffer(n_required)
+                STEPS_LIB.api_get_device_search_result_identifiers(device, ids, n_required, self.toolkit_index)
+            identifiers = self.__get_string_from_c_char_p(ids.value).split("\n")[0:n]
+        return buses, identifiers
+
+    def __get_device_search_result(self, device, sides):
+        """
+        Private function to get all devices in the search buffer of STEPS kernel in bulk as tuple of device ids.
+        Args:
+            (1) device: char* pointer of device type.
+            (2) sides: tuple of strings, terminal sides of the device.
+        Rets:
+            (1) Tuple of device ids. Bus numbers for buses, (bus, ickt) for single bus devices, (ibus, jbus, ickt) for lines and HVDC links, and (ibus, jbus, kbus, ickt) for transformers.
+        """
+        buses, identifiers = self.__get_device_search_result_columns(device, sides)
+        if device.value.upper()==b"BUS":
+            return tuple(buses[0])
+        columns = [tuple(bus) for bus in buses]
+        columns.append(identifiers)
+        return tuple(zip(*columns))
+
+    def __set_device_search_result(self, device, devices):
+        """
+        Private function to set devices in the search buffer of STEPS kernel in bulk. Devices not in the list are removed from the search buffer.
+        Args:
+            (1) device: char* pointer of device type.
+            (2) devices: list of device ids. Bus numbers for buses, (bus, ickt) for single bus devices, (ibus, jbus, ickt) for lines and HVDC links, and (ibus, jbus, kbus, ickt) or (ibus, jbus, ickt) for transformers.
+        Rets:
+            (1) True if all devices are found, otherwise False.
+        """
+        global STEPS_LIB
+        device_type = device.value.upper()
+        n = len(devices)
+        if device_type==b"BUS":
+            buses = (c_uint*n)(*devices)
+            identifiers = ""
+        elif device_type in [b"LINE", b"HVDC"]:
+            buses = (c_uint*(2*n))()
+            identifiers = []
+            for i, did in enumerate(devices):
+                buses[i], buses[n+i], ickt = self.__extract_double_bus_device_id(did)
+                identifiers.append(str(ickt))
+        elif device_type==b"TRANSFORMER":
+            buses = (c_uint*(3*n))()
+            identifiers = []
+            for i, did in enumerate(devices):
+                buses[i], buses[n+i], buses[2*n+i], ickt = self.__extract_triple_bus_device_id(did)
+                identifiers.append(str(ickt))
+        else:
+            buses = (c_uint*n)()
+            identifiers = []
+            for i, did in enumerate(devices):
+                buses[i], ickt = self.__extract_single_bus_device_id(did)
+                identifiers.append(str(ickt))
+        identifiers = self.__get_c_char_p_of_string("\n".join(identifiers))
+        return STEPS_LIB.api_set_device_search_result(device, buses, identifiers, n, self.toolkit_index)==n
+
     def set_toolkit_log_file(self, log_file="", log_file_append_mode=False):
         """
         Set toolkit log file. The default mode is to write to new file.
@@ -180,7 +323,153 @@ class STEPS():
         global STEPS_LIB
         STEPS_LIB.api_clear_toolkit(self.toolkit_index)
         return
-    
+
+    def clone(self, log_file=""):
+        """
+        Clone the toolkit into a new toolkit in memory.
+        Args:
+            (1) log_file: string, log file name of the new toolkit. If no file is set (""), the log will be exported to stdout.
+        Rets:
+            (1) new STEPS toolkit with copy of power system database, dynamic models, and solver settings.
+        Tips:
+            Powerflow data and solved bus voltages and source outputs are copied as is. Dynamic models are copied model by model with the same model data.
+            Meters, output file, and dynamic simulation progress are not copied. Clone the toolkit before starting dynamic simulation, and call start_dynamic_simulation() on the clone.
+            Cached base case of cache_base_case() is copied as well.
+            Clones share no data with the source toolkit, and can be simulated in separate threads.
+        Example:
+            simulator.load_powerflow_data("IEEE39.raw", "PSS/E")
+            simulator.load_dynamic_data("IEEE39.dyr", "PSS/E")
+            simulator.solve_powerflow("NR")
+            clones = [simulator.clone() for i in range(4)]
+        """
+        global STEPS_LIB
+        log_file = self.__get_c_char_p_of_string(log_file)
+        toolkit = STEPS.__new__(STEPS)
+        toolkit.toolkit_index = STEPS_LIB.api_clone_toolkit(self.toolkit_index, log_file)
+        toolkit.__field_par_types = dict(self.__field_par_types)
+        return toolkit
+
+    def cache_base_case(self):
+        """
+        Cache current network state as base case in memory.
+        Args: N/A
+        Rets: N/A
+        Tips:
+            Base case includes bus types, voltages and faults, source status and outputs, load status and scale, status and faults of branches, and solved hvdc steady state.
+            Dynamic models are kept in the toolkit and are initialized again when dynamic simulation starts, so they are not cached.
+            Cache base case after loading data and solving powerflow. Calling it again replaces the cached base case.
+        Example:
+            simulator.load_powerflow_data("IEEE39.raw", "PSS/E")
+            simulator.solve_powerflow("NR")
+            simulator.load_dynamic_data("IEEE39.dyr", "PSS/E")
+            simulator.cache_base_case()
+        """
+        global STEPS_LIB
+        STEPS_LIB.api_cache_base_case(self.toolkit_index)
+        return
+
+    def reset_to_base_case(self):
+        """
+        Reset network state to base case cached by cache_base_case().
+        Args: N/A
+        Rets:
+            (1) True if base case is reset, False if base case is not cached, or devices are added or removed after caching.
+        Tips:
+            Tripped devices, faults, and scaled loads are restored. Only devices which are changed since caching are touched, and no file is read.
+            Solved powerflow of base case is restored, so dynamic simulation can be started again without solving powerflow.
+            Meters and dynamic simulator settings are not reset. Stop dynamic simulation before resetting base case.
+        Example:
+            for line in lines:
+                simulator.reset_to_base_case()
+                simulator.start_dynamic_simulation()
+                simulator.run_dynamic_simulation_to_time(1.0)
+                simulator.trip_line(line)
+                simulator.run_dynamic_simulation_to_time(5.0)
+                simulator.stop_dynamic_simulation()
+        """
+        global STEPS_LIB
+        return STEPS_LIB.api_reset_to_base_case(self.toolkit_index)
+
+    def release_base_case(self):
+        """
+        Release base case cached by cache_base_case().
+        Args: N/A
+        Rets: N/A
+        """
+        global STEPS_LIB
+        STEPS_LIB.api_release_base_case(self.toolkit_index)
+        return
+
+    def is_base_case_cached(self):
+        """
+        Check if base case is cached.
+        Args: N/A
+        Rets:
+            (1) True if base case is cached, False otherwise.
+        """
+        global STEPS_LIB
+        return STEPS_LIB.api_is_base_case_cached(self.toolkit_index)
+
+    def run_many(self, functions, thread_number=None, log_file=""):
+        """
+        Run functions in parallel threads, each with a new clone of the toolkit.
+        Args:
+            (1) functions: list of Python functions called as function(toolkit), where toolkit is a clone of the toolkit.
+            (2) thread_number: Maximum count of parallel threads. If None, count of CPUs is used.
+            (3) log_file: string, log file name of clones. If no file is set (""), the log will be exported to stdout.
+        Rets:
+            (1) list of returns of functions in the same order as functions. None if module concurrent.futures is missing.
+        Tips:
+            Toolkits with different indices share no data in STEPS kernel, and calls into STEPS kernel release the Python GIL. So powerflow solution and dynamic simulation of clones run in parallel.
+            Clones are generated one by one from the toolkit, and deleted when functions return. Do not change the toolkit before run_many() returns.
+            If any function raises exception, the exception of the first such function is raised after all functions finish.
+            "USE STEPS FAST MATH LOGIC" of set_toolkit_bool_data() is shared by all toolkits in the process, and cannot be changed before run_many() returns.
+        Example:
+            def simulate_bus_fault(toolkit, bus):
+                toolkit.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+                toolkit.start_dynamic_simulation()
+                toolkit.run_dynamic_simulation_to_time(1.0)
+                toolkit.set_bus_fault(bus, "THREE PHASE FAULT", (0.0, -2e4))
+                toolkit.run_dynamic_simulation_to_time(1.1)
+                toolkit.clear_bus_fault(bus, "THREE PHASE FAULT")
+                toolkit.run_dynamic_simulation_to_time(5.0)
+                return toolkit.is_system_angular_stable()
+            functions = [lambda toolkit, bus=bus: simulate_bus_fault(toolkit, bus) for bus in simulator.get_all_buses()]
+            stables = simulator.run_many(functions, thread_number=4)
+        """
+        if ThreadPoolExecutor is None:
+            print("run_many() is dependent on module concurrent.futures which is missing. please install futures before use it")
+            return None
+        if thread_number is None:
+            thread_number = os.cpu_count()
+        clone_lock = threading.Lock()
+        self.__begin_parallel_run()
+        try:
+            with ThreadPoolExecutor(max_workers=thread_number) as executor:
+                futures = [executor.submit(self.__run_function_with_clone, function, clone_lock, log_file) for function in functions]
+        finally:
+            self.__end_parallel_run()
+        return [future.result() for future in futures]
+
+    def __begin_parallel_run(self):
+        # process-wide settings of STEPS kernel are read by all toolkits, and are kept unchanged while toolkits run in parallel
+        global PARALLEL_RUN_COUNT
+        with PARALLEL_RUN_LOCK:
+            PARALLEL_RUN_COUNT += 1
+
+    def __end_parallel_run(self):
+        global PARALLEL_RUN_COUNT
+        with PARALLEL_RUN_LOCK:
+            PARALLEL_RUN_COUNT -= 1
+
+    def __run_function_with_clone(self, function, clone_lock, log_file):
+        with clone_lock:
+            toolkit = self.clone(log_file)
+        try:
+            return function(toolkit)
+        finally:
+            del toolkit
+
     def get_toolkit_float_data(self, dataname):
         """
         Get toolkit general float data.
@@ -305,8 +594,13 @@ class STEPS():
             (1) dataname: String of variable name.
             (2) value: Boolean value.
         Rets: N/A
+        Tips:
+            "USE STEPS FAST MATH LOGIC" is shared by all toolkits in the process. It cannot be changed when toolkits are running in parallel with run_many() or search_cct().
         """
         global STEPS_LIB
+        if dataname.upper()=="USE STEPS FAST MATH LOGIC" and PARALLEL_RUN_COUNT>0:
+            print("USE STEPS FAST MATH LOGIC is shared by all toolkits in the process, and cannot be changed when toolkits are running in parallel. Nothing will be changed.")
+            return
         dataname = self.__get_c_char_p_of_string(dataname)
         return STEPS_LIB.api_set_toolkit_bool_data(dataname, value, self.toolkit_index)
     
@@ -816,6 +1110,42 @@ class STEPS():
         ftype = self.__get_c_char_p_of_string(ftype)
         STEPS_LIB.api_save_dynamic_data_to_file(file, ftype, self.toolkit_index)
 
+    def save_case_snapshot(self, file):
+        """
+        Save binary snapshot of current powerflow and dynamic data to file.
+        Args:
+            (1) file: string, target snapshot file name.
+        Rets:
+            (1) True if snapshot is saved, False otherwise.
+        Tips:
+            Source files loaded with load_powerflow_data() and load_dynamic_data() are recorded in the snapshot with their checksums.
+            Source files are cleared when powerflow data is loaded, so only files of the current case are recorded. Files failed to load are not recorded.
+        Example:
+            simulator.load_powerflow_data("IEEE39.raw", "PSS/E")
+            simulator.load_dynamic_data("IEEE39.dyr", "PSS/E")
+            simulator.save_case_snapshot("IEEE39.snp")
+        """
+        global STEPS_LIB
+        file = self.__get_c_char_p_of_string(file)
+        return STEPS_LIB.api_save_case_snapshot(file, self.toolkit_index)
+
+    def load_case_snapshot(self, file):
+        """
+        Load powerflow and dynamic data from binary snapshot saved with save_case_snapshot(). Existing data in the toolkit is replaced.
+        Args:
+            (1) file: string, snapshot file name.
+        Rets:
+            (1) True if snapshot is loaded, False otherwise.
+        Tips:
+            Snapshot is rejected if any of its source files is changed after the snapshot is saved, or if it is saved by another version of STEPS. In that case, load the source files and save the snapshot again.
+            Snapshot is also rejected if any of its source files is not found, since it cannot be checked. Source files should be kept at the same paths as they are loaded.
+        Example:
+            ok = simulator.load_case_snapshot("IEEE39.snp")
+        """
+        global STEPS_LIB
+        file = self.__get_c_char_p_of_string(file)
+        return STEPS_LIB.api_load_case_snapshot(file, self.toolkit_index)
+
     def check_powerflow_data(self):
         """
         Check powerflow data. If any inappropriate data is set, report will be sent to log file.
@@ -1604,14 +1934,8 @@ class STEPS():
         """
         global STEPS_LIB
         STEPS_LIB.api_initialize_all_bus_search(self.toolkit_index)
-        buses = []
-        while True:
-            bus = STEPS_LIB.api_get_current_bus_number(self.toolkit_index)
-            if bus==0:
-                break
-            buses.append(int(bus))
-            STEPS_LIB.api_goto_next_bus(self.toolkit_index)
-        return tuple(buses)
+        device = self.__get_c_char_p_of_string("BUS")
+        return self.__get_device_search_result(device, ("",))
    
     def get_buses_with_constraints(self, vbase_min=0.0, vbase_max=10000000.0, v_min=0.0, v_max=10000000.0, area=0, zone=0, owner=0):
         """
@@ -1628,15 +1952,9 @@ class STEPS():
             (1) Tuple of buses satisfying all constraints. Empty tuple if no buses are satisfying the constants.
         """
         global STEPS_LIB
-        buses = []        
         STEPS_LIB.api_initialize_bus_search(vbase_min, vbase_max, v_min, v_max, area, zone, owner, self.toolkit_index)
-        while True:
-            bus = STEPS_LIB.api_get_current_bus_number(self.toolkit_index)
-            if bus==0:
-                break
-            buses.append(int(bus))
-            STEPS_LIB.api_goto_next_bus(self.toolkit_index)
-        return tuple(buses)
+        device = self.__get_c_char_p_of_string("BUS")
+        return self.__get_device_search_result(device, ("",))
                 
     def get_all_generators(self):
         """
@@ -1657,18 +1975,8 @@ class STEPS():
         global STEPS_LIB
         device = "GENERATOR"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        generators = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            generators.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(generators)
+        return self.__get_device_search_result(device, ("",))
         
     def get_all_wt_generators(self):
         """
@@ -1690,18 +1998,8 @@ class STEPS():
         global STEPS_LIB
         device = "WT GENERATOR"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        wt_generators = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            wt_generators.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(wt_generators)
+        return self.__get_device_search_result(device, ("",))
         
     def get_all_pv_units(self):
         """
@@ -1723,18 +2021,8 @@ class STEPS():
         global STEPS_LIB
         device = "PV UNIT"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        pv_units = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            pv_units.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(pv_units)
+        return self.__get_device_search_result(device, ("",))
         
     def get_all_energy_storages(self):
         """
@@ -1756,18 +2044,8 @@ class STEPS():
         global STEPS_LIB
         device = "ENERGY STORAGE"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        energy_storages = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            energy_storages.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(energy_storages)
+        return self.__get_device_search_result(device, ("",))
         
     def get_all_loads(self):
         """
@@ -1789,18 +2067,8 @@ class STEPS():
         global STEPS_LIB
         device = "LOAD"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        loads = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            loads.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(loads)
+        return self.__get_device_search_result(device, ("",))
         
     def get_all_fixed_shunts(self):
         """
@@ -1822,18 +2090,8 @@ class STEPS():
         global STEPS_LIB
         device = "FIXED SHUNT"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        fixed_shunts = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            fixed_shunts.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(fixed_shunts)
+        return self.__get_device_search_result(device, ("",))
                 
     def get_all_equivalent_devices(self):
         """
@@ -1855,18 +2113,8 @@ class STEPS():
         global STEPS_LIB
         device = "EQUIVALENT DEVICE"
         device = self.__get_c_char_p_of_string(device)
-        blank = self.__get_c_char_p_of_string("")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        equivalent_devices = []
-        while True:
-            bus = STEPS_LIB.api_get_current_device_bus_number(device, blank, self.toolkit_index)
-            if bus==0:
-                break
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            equivalent_devices.append((int(bus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(equivalent_devices)
+        return self.__get_device_search_result(device, ("",))
 
     def get_all_lines(self):
         """
@@ -1888,20 +2136,8 @@ class STEPS():
         global STEPS_LIB
         device = "LINE"
         device = self.__get_c_char_p_of_string(device)
-        send_side = self.__get_c_char_p_of_string("SEND")
-        recv_side = self.__get_c_char_p_of_string("RECEIVE")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        lines = []
-        while True:
-            ibus = STEPS_LIB.api_get_current_device_bus_number(device, send_side, self.toolkit_index)
-            if ibus==0:
-                break
-            jbus = STEPS_LIB.api_get_current_device_bus_number(device, recv_side, self.toolkit_index)
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            lines.append((int(ibus), int(jbus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(lines)
+        return self.__get_device_search_result(device, ("SEND", "RECEIVE"))
         
     def get_lines_between_buses(self, ibus, jbus):
         """
@@ -1944,22 +2180,8 @@ class STEPS():
         global STEPS_LIB
         device = "TRANSFORMER"
         device = self.__get_c_char_p_of_string(device)
-        pri_side = self.__get_c_char_p_of_string("PRIMARY")
-        sec_side = self.__get_c_char_p_of_string("SECONDARY")
-        ter_side = self.__get_c_char_p_of_string("TERTIARY")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        transformers = []
-        while True:
-            ibus = STEPS_LIB.api_get_current_device_bus_number(device, pri_side, self.toolkit_index)
-            if ibus==0:
-                break
-            jbus = STEPS_LIB.api_get_current_device_bus_number(device, sec_side, self.toolkit_index)
-            kbus = STEPS_LIB.api_get_current_device_bus_number(device, ter_side, self.toolkit_index)
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            transformers.append((int(ibus), int(jbus), int(kbus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(transformers)
+        return self.__get_device_search_result(device, ("PRIMARY", "SECONDARY", "TERTIARY"))
     
     def get_transformers_between_buses(self, ibus, jbus, kbus=0):
         """
@@ -2005,20 +2227,8 @@ class STEPS():
         global STEPS_LIB
         device = "HVDC"
         device = self.__get_c_char_p_of_string(device)
-        rec_side = self.__get_c_char_p_of_string("RECTIFIER")
-        inv_side = self.__get_c_char_p_of_string("INVERTER")
         STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
-        hvdcs = []
-        while True:
-            ibus = STEPS_LIB.api_get_current_device_bus_number(device, rec_side, self.toolkit_index)
-            if ibus==0:
-                break
-            jbus = STEPS_LIB.api_get_current_device_bus_number(device, inv_side, self.toolkit_index)
-            id = STEPS_LIB.api_get_current_device_identifier(device, self.toolkit_index)
-            id = self.__get_string_from_c_char_p(id)
-            hvdcs.append((int(ibus), int(jbus), id))
-            STEPS_LIB.api_goto_next_device(device, self.toolkit_index)
-        return tuple(hvdcs)
+        return self.__get_device_search_result(device, ("RECTIFIER", "INVERTER"))
 
     def get_hvdcs_between_buses(self, ibus, jbus):
         """
@@ -2235,6 +2445,52 @@ class STEPS():
             STEPS_LIB.api_goto_next_owner(self.toolkit_index)
         return tuple(owners)
 
+    def get_device_id_array(self, device_type, bus=0):
+        """
+        Get ids of all devices of given type in bulk as NumPy structured array. Module numpy is required.
+        Args:
+            (1) device_type: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER", "HVDC", "EQUIVALENT DEVICE"}.
+            (2) bus: bus number. Only devices connecting to the bus are returned. If bus=0, all devices of given type are returned. It is ignored for "BUS".
+        Rets:
+            (1) NumPy structured array of device ids. Fields are 'bus' for buses and single bus devices, 'ibus' and 'jbus' for lines and HVDC links, and 'ibus', 'jbus', and 'kbus' for transformers. Field 'identifier' is included for all devices except buses.
+                None if numpy is missing or device type is invalid.
+        Example:
+            lines = get_device_id_array("LINE")
+            print(lines['ibus'], lines['jbus'], lines['identifier'])
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_device_id_array() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        device_type = device_type.upper()
+        if device_type in ["BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "EQUIVALENT DEVICE"]:
+            fields, sides = ('bus',), ("",)
+        elif device_type=="LINE":
+            fields, sides = ('ibus', 'jbus'), ("SEND", "RECEIVE")
+        elif device_type=="TRANSFORMER":
+            fields, sides = ('ibus', 'jbus', 'kbus'), ("PRIMARY", "SECONDARY", "TERTIARY")
+        elif device_type=="HVDC":
+            fields, sides = ('ibus', 'jbus'), ("RECTIFIER", "INVERTER")
+        else:
+            return None
+
+        device = self.__get_c_char_p_of_string(device_type)
+        if device_type=="BUS":
+            STEPS_LIB.api_initialize_all_bus_search(self.toolkit_index)
+        else:
+            STEPS_LIB.api_initialize_device_search(device, bus, self.toolkit_index)
+        buses, identifiers = self.__get_device_search_result_columns(device, sides)
+
+        dtype = [(field, numpy.uint32) for field in fields]
+        if device_type!="BUS":
+            dtype.append(('identifier', numpy.str_, max([len(identifier) for identifier in identifiers]+[1])))
+        dids = numpy.empty(len(buses[0]), dtype=dtype)
+        for field, bus in zip(fields, buses):
+            dids[field] = numpy.ctypeslib.as_array(bus)
+        if device_type!="BUS":
+            dids['identifier'] = identifiers
+        return dids
+
     def get_bus_data(self, bus, par_type, par_name):
         """
         Get bus data.
@@ -2548,6 +2804,367 @@ class STEPS():
             return self.__get_string_from_c_char_p(STEPS_LIB.api_get_hvdc_string_data(ibus, jbus, ickt, side, par_name, self.toolkit_index))
         return None
 
+    def field_id(self, device_type, par_type, par_name, side=""):
+        """
+        Get field id of device parameter for get_device_data_with_field_id() and set_device_data_with_field_id().
+        Args:
+            (1) device_type: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER", "HVDC"}.
+            (2) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (3) par_name: String of parameter name. Parameter names are the same as get_bus_data(), get_generator_data(), etc.
+            (4) side: String of side for transformer and HVDC link. See get_transformer_data() and get_hvdc_data(). It is ignored for other devices.
+        Rets:
+            (1) Integer field id. None if device type or parameter type is invalid.
+        Tips:
+            Parameter name is resolved by STEPS kernel only once. The same field id is returned for the same parameter.
+            Field id is only valid for the simulator which returns it.
+        Example:
+            vid = field_id("BUS", "F", "VOLTAGE IN PU")
+            v = get_device_data_with_field_id(1, vid)
+        """
+        global STEPS_LIB
+        par_type = par_type.upper()
+        if par_type in ['I', 'INT', 'INTEGER']:
+            par_type = 'I'
+        elif par_type in ['F', 'D', 'FLOAT', 'DOUBLE']:
+            par_type = 'F'
+        elif par_type in ['B', 'BOOL', 'BOOLEAN']:
+            par_type = 'B'
+        else:
+            return None
+        device_type = self.__get_c_char_p_of_string(device_type)
+        side = self.__get_c_char_p_of_string(side)
+        par_name = self.__get_c_char_p_of_string(par_name)
+        fid = STEPS_LIB.api_get_device_field_id(device_type, self.__get_c_char_p_of_string(par_type), side, par_name, self.toolkit_index)
+        if fid==STEPS_LIB.api_get_const_INDEX_NOT_EXIST():
+            return None
+        self.__field_par_types[fid] = par_type
+        return fid
+
+    def get_device_data_with_field_id(self, device, field_id):
+        """
+        Get device data with field id.
+        Args:
+            (1) device: Device id. Bus number for bus, (bus, ickt) for single bus devices, (ibus, jbus, ickt) for lines and HVDC links, and (ibus, jbus, ickt) or (ibus, jbus, kbus, ickt) for transformers.
+            (2) field_id: Field id returned by field_id().
+        Rets:
+            (1) Value of parameter. None if field id is not returned by field_id() of this simulator.
+        Tips:
+            Parameter name is not parsed again. Frequently used parameters, such as bus voltage, source power, load power, line power, and device status, are retrieved directly.
+        Example:
+            pid = field_id("GENERATOR", "F", "PGEN_MW")
+            pgen = get_device_data_with_field_id((1, "1"), pid)
+        """
+        global STEPS_LIB
+        par_type = self.__field_par_types.get(field_id)
+        if par_type is None:
+            return None
+        ibus, jbus, kbus, ickt = self.__extract_device_id(device)
+        ickt = self.__get_c_char_p_of_string(ickt)
+        if par_type=='F':
+            return STEPS_LIB.api_get_device_float_data_with_field_id(ibus, jbus, kbus, ickt, field_id, self.toolkit_index)
+        if par_type=='I':
+            return STEPS_LIB.api_get_device_integer_data_with_field_id(ibus, jbus, kbus, ickt, field_id, self.toolkit_index)
+        return STEPS_LIB.api_get_device_boolean_data_with_field_id(ibus, jbus, kbus, ickt, field_id, self.toolkit_index)
+
+    def get_device_data_array(self, device_type, par_type, par_names, devices=None, side=""):
+        """
+        Get data of devices of given type in bulk as NumPy arrays. Module numpy is required.
+        Args:
+            (1) device_type: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER", "HVDC"}.
+            (2) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (3) par_names: String of parameter name, or list of parameter names.
+            (4) devices: List of device ids in the same format as get_bus_data(), get_generator_data(), etc. If None, all devices of given type are used.
+            (5) side: String of side for transformer and HVDC link. See get_transformer_data() and get_hvdc_data(). It is ignored for other devices.
+        Rets:
+            (1) NumPy array of parameter values if par_names is a string, or tuple of NumPy arrays, one for each parameter name.
+                Values are in the order of devices, or in the order of get_all_buses(), get_generators_at_bus(0), etc. if devices is None.
+                None if numpy is missing, or device type or parameter type is invalid, or any device does not exist.
+        Tips:
+            The par_type meaning: "I": integer number, "F" or "D": float number, "B": boolean data. String data is not supported.
+            Values of all devices are retrieved by STEPS kernel with one call for each parameter.
+            Devices are put into the device search buffer of STEPS kernel, which is shared with get_all_buses(), get_generators_at_bus(), etc. Search of the same device type in progress with STEPS_LIB calls is reset and has to be initialized again.
+        Example:
+            v, angle = get_device_data_array("BUS", "F", ["VOLTAGE IN PU", "ANGLE IN DEG"])
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_device_data_array() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        device_type = device_type.upper()
+        if device_type not in ["BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER", "HVDC"]:
+            return None
+        par_type = par_type.upper()
+        if par_type not in ['I', 'INT', 'INTEGER', 'F', 'D', 'FLOAT', 'DOUBLE', 'B', 'BOOL', 'BOOLEAN']:
+            return None
+
+        device = self.__get_c_char_p_of_string(device_type)
+        if devices is None:
+            if device_type=="BUS":
+                STEPS_LIB.api_initialize_all_bus_search(self.toolkit_index)
+            else:
+                STEPS_LIB.api_initialize_device_search(device, 0, self.toolkit_index)
+        elif not self.__set_device_search_result(device, devices):
+            return None
+        n = STEPS_LIB.api_get_device_search_result_count(device, self.toolkit_index)
+
+        side = self.__get_c_char_p_of_string(side.upper())
+        arrays = []
+        for par_name in ([par_names] if isinstance(par_names, str) else par_names):
+            par_name = self.__get_c_char_p_of_string(par_name)
+            if par_type in ['I', 'INT', 'INTEGER']:
+                values = numpy.zeros(n, dtype=numpy.intc)
+                STEPS_LIB.api_get_device_search_result_integer_data(device, side, par_name, values.ctypes.data_as(POINTER(c_int)), n, self.toolkit_index)
+            elif par_type in ['F', 'D', 'FLOAT', 'DOUBLE']:
+                values = numpy.zeros(n, dtype=numpy.float64)
+                STEPS_LIB.api_get_device_search_result_float_data(device, side, par_name, values.ctypes.data_as(POINTER(c_double)), n, self.toolkit_index)
+            else:
+                values = numpy.zeros(n, dtype=numpy.bool_)
+                STEPS_LIB.api_get_device_search_result_boolean_data(device, side, par_name, values.ctypes.data_as(POINTER(c_bool)), n, self.toolkit_index)
+            arrays.append(values)
+        if isinstance(par_names, str):
+            return arrays[0]
+        return tuple(arrays)
+
+    def get_bus_data_array(self, par_type, par_names, buses=None):
+        """
+        Get bus data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) buses: List of bus numbers. If None, all buses are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        Example:
+            v, angle = get_bus_data_array("F", ["VOLTAGE IN PU", "ANGLE IN DEG"])
+        """
+        return self.get_device_data_array("BUS", par_type, par_names, buses)
+
+    def get_generator_data_array(self, par_type, par_names, generators=None):
+        """
+        Get generator data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) generators: List of generator device ids in format of (bus, ickt). If None, all generators are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("GENERATOR", par_type, par_names, generators)
+
+    def get_wt_generator_data_array(self, par_type, par_names, wt_generators=None):
+        """
+        Get wind turbine generator data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) wt_generators: List of wind turbine generator device ids in format of (bus, ickt). If None, all wind turbine generators are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("WT GENERATOR", par_type, par_names, wt_generators)
+
+    def get_pv_unit_data_array(self, par_type, par_names, pv_units=None):
+        """
+        Get PV unit data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) pv_units: List of PV unit device ids in format of (bus, ickt). If None, all PV units are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("PV UNIT", par_type, par_names, pv_units)
+
+    def get_energy_storage_data_array(self, par_type, par_names, energy_storages=None):
+        """
+        Get energy storage data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) energy_storages: List of energy storage device ids in format of (bus, ickt). If None, all energy storages are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("ENERGY STORAGE", par_type, par_names, energy_storages)
+
+    def get_load_data_array(self, par_type, par_names, loads=None):
+        """
+        Get load data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) loads: List of load device ids in format of (bus, ickt). If None, all loads are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("LOAD", par_type, par_names, loads)
+
+    def get_fixed_shunt_data_array(self, par_type, par_names, fixed_shunts=None):
+        """
+        Get fixed shunt data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) fixed_shunts: List of fixed shunt device ids in format of (bus, ickt). If None, all fixed shunts are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("FIXED SHUNT", par_type, par_names, fixed_shunts)
+
+    def get_line_data_array(self, par_type, par_names, lines=None):
+        """
+        Get line data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) lines: List of line device ids in format of (ibus, jbus, ickt). If None, all lines are used.
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        return self.get_device_data_array("LINE", par_type, par_names, lines)
+
+    def get_transformer_data_array(self, par_type, par_names, transformers=None, side="TRANSFORMER"):
+        """
+        Get transformer data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) transformers: List of transformer device ids in format of (ibus, jbus, ickt) or (ibus, jbus, kbus, ickt). If None, all transformers are used.
+            (4) side: String of side. One of {"PRIMARY", "SECONDARY", "TERTIARY", "TRANSFORMER"}. Default is "TRANSFORMER".
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        Example:
+            tap = get_transformer_data_array("F", "TAP_PU", side="PRIMARY")
+        """
+        if side.upper() not in ['PRIMARY', 'SECONDARY', 'TERTIARY', 'TRANSFORMER']:
+            return None
+        return self.get_device_data_array("TRANSFORMER", par_type, par_names, transformers, side)
+
+    def get_hvdc_data_array(self, par_type, par_names, hvdcs=None, side="HVDC"):
+        """
+        Get HVDC link data in bulk as NumPy arrays. See get_device_data_array().
+        Args:
+            (1) par_type: String of parameter type. Choose one from {"I", "F", "D", "B"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) hvdcs: List of HVDC link device ids in format of (ibus, jbus, ickt). If None, all HVDC links are used.
+            (4) side: String of side. One of {"RECTIFIER", "INVERTER", "HVDC"}. Default is "HVDC".
+        Rets:
+            (1) NumPy array of parameter values, or tuple of NumPy arrays, one for each parameter name.
+        """
+        if side.upper() not in ['RECTIFIER', 'INVERTER', 'HVDC']:
+            return None
+        return self.get_device_data_array("HVDC", par_type, par_names, hvdcs, side)
+
+    def __get_dataframe_columns(self, table):
+        """
+        Private function to get columns of powerflow data table of given device type.
+        Args:
+            (1) table: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER"}.
+        Rets:
+            (1) List of columns in format of (column name, par_type, side, par_name, writable). Writable columns are loaded back by from_dataframe().
+                Empty list if table is invalid.
+        """
+        if table=="BUS":
+            return [("TYPE", "I", "", "TYPE", False), ("AREA", "I", "", "AREA", False), ("ZONE", "I", "", "ZONE", False), ("OWNER", "I", "", "OWNER", False),
+                    ("VBASE_KV", "F", "", "VBASE_KV", False), ("V_PU", "F", "", "V_PU", True), ("ANGLE_DEG", "F", "", "ANGLE_DEG", True),
+                    ("VMAX_PU", "F", "", "VMAX_PU", True), ("VMIN_PU", "F", "", "VMIN_PU", True), ("EMAX_PU", "F", "", "EMAX_PU", True), ("EMIN_PU", "F", "", "EMIN_PU", True)]
+        if table in ["GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE"]:
+            return [("STATUS", "B", "", "STATUS", True), ("BUS_REG", "I", "", "BUS_REG", False),
+                    ("MBASE_MVA", "F", "", "MBASE_MVA", True), ("PGEN_MW", "F", "", "PGEN_MW", True), ("QGEN_MVAR", "F", "", "QGEN_MVAR", True),
+                    ("PMAX_MW", "F", "", "PMAX_MW", True), ("PMIN_MW", "F", "", "PMIN_MW", True), ("QMAX_MVAR", "F", "", "QMAX_MVAR", True), ("QMIN_MVAR", "F", "", "QMIN_MVAR", True),
+                    ("VREG_PU", "F", "", "VREG_PU", True), ("RSOURCE_PU", "F", "", "RSOURCE_PU", True), ("XSOURCE_PU", "F", "", "XSOURCE_PU", True)]
+        if table=="LOAD":
+            return [("STATUS", "B", "", "STATUS", True), ("AREA", "I", "", "AREA", False), ("ZONE", "I", "", "ZONE", False), ("OWNER", "I", "", "OWNER", False),
+                    ("PP0_MW", "F", "", "PP0_MW", True), ("QP0_MVAR", "F", "", "QP0_MVAR", True), ("PI0_MW", "F", "", "PI0_MW", True),
+                    ("QI0_MVAR", "F", "", "QI0_MVAR", True), ("PZ0_MW", "F", "", "PZ0_MW", True), ("QZ0_MVAR", "F", "", "QZ0_MVAR", True),
+                    ("P_MW", "F", "", "P_MW", False), ("Q_MVAR", "F", "", "Q_MVAR", False)]
+        if table=="FIXED SHUNT":
+            return [("STATUS", "B", "", "STATUS", True), ("P0_MW", "F", "", "P0_MW", True), ("Q0_MVAR", "F", "", "Q0_MVAR", True)]
+        if table=="LINE":
+            return [("STATUS_SEND", "B", "", "STATUS_SEND", True), ("STATUS_RECV", "B", "", "STATUS_RECV", True), ("BUS_METER", "I", "", "BUS_METER", False),
+                    ("R1_PU", "F", "", "R1_PU", True), ("X1_PU", "F", "", "X1_PU", True), ("G1_PU", "F", "", "G1_PU", True), ("B1_PU", "F", "", "B1_PU", True),
+                    ("SG1_PU", "F", "", "SG1_PU", True), ("SB1_PU", "F", "", "SB1_PU", True), ("RG1_PU", "F", "", "RG1_PU", True), ("RB1_PU", "F", "", "RB1_PU", True),
+                    ("RATE_A_MVA", "F", "", "RATE_A_MVA", True), ("RATE_B_MVA", "F", "", "RATE_B_MVA", True), ("RATE_C_MVA", "F", "", "RATE_C_MVA", True),
+                    ("LENGTH", "F", "", "LENGTH", True),
+                    ("PSEND_MW", "F", "", "PSEND_MW", False), ("QSEND_MVAR", "F", "", "QSEND_MVAR", False), ("PRECV_MW", "F", "", "PRECV_MW", False),
+                    ("QRECV_MVAR", "F", "", "QRECV_MVAR", False), ("ISEND_KA", "F", "", "ISEND_KA", False), ("IRECV_KA", "F", "", "IRECV_KA", False)]
+        if table=="TRANSFORMER":
+            columns = [("SBASE_PS_MVA", "F", "TRANSFORMER", "SBASE_PS_MVA", True), ("R_PS_PU", "F", "TRANSFORMER", "R_PS_PU", True), ("X_PS_PU", "F", "TRANSFORMER", "X_PS_PU", True),
+                       ("GM_PU", "F", "TRANSFORMER", "GM_PU", True), ("BM_PU", "F", "TRANSFORMER", "BM_PU", True)]
+            for prefix, side in [("PRI_", "PRIMARY"), ("SEC_", "SECONDARY")]:
+                columns.extend([(prefix+"STATUS", "B", side, "STATUS", True),
+                                (prefix+"VN_KV", "F", side, "VN_KV", True), (prefix+"TAP_PU", "F", side, "TAP_PU", True), (prefix+"ANGLE_DEG", "F", side, "ANGLE_DEG", True),
+                                (prefix+"RATE_A_MVA", "F", side, "RATE_A_MVA", True), (prefix+"RATE_B_MVA", "F", side, "RATE_B_MVA", True), (prefix+"RATE_C_MVA", "F", side, "RATE_C_MVA", True),
+                                (prefix+"P_MW", "F", side, "P_MW", False), (prefix+"Q_MVAR", "F", side, "Q_MVAR", False), (prefix+"I_KA", "F", side, "I_KA", False)])
+            return columns
+        return []
+
+    def to_dataframe(self, table, backend="pandas"):
+        """
+        Get powerflow data and results of all devices of given type as columnar table. Module numpy is required.
+        Args:
+            (1) table: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER"}.
+            (2) backend: String of table type. Choose one from {"pandas", "arrow", "numpy"}.
+        Rets:
+            (1) pandas DataFrame if backend is "pandas", pyarrow Table if backend is "arrow", or dict of NumPy arrays if backend is "numpy".
+                None if required module is missing, or table or backend is invalid.
+        Tips:
+            Device id columns come first, as 'bus', or 'ibus', 'jbus', and 'kbus', followed by 'identifier', the same as get_device_id_array().
+            Data columns are retrieved with get_device_data_array(), one kernel call for each column. Transformer winding data are prefixed with "PRI_" and "SEC_".
+            NumPy arrays are handed to pandas and pyarrow without copy where possible.
+        Example:
+            buses = to_dataframe("BUS")
+            print(buses[buses["V_PU"]<0.95])
+        """
+        if numpy is None:
+            print("to_dataframe() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        backend = backend.lower()
+        if backend=="pandas" and pandas is None:
+            print("to_dataframe() with backend 'pandas' is dependent on module pandas which is missing. please install pandas before use it")
+            return None
+        if backend=="arrow" and pyarrow is None:
+            print("to_dataframe() with backend 'arrow' is dependent on module pyarrow which is missing. please install pyarrow before use it")
+            return None
+        if backend not in ["pandas", "arrow", "numpy"]:
+            return None
+        table = table.upper()
+        columns = self.__get_dataframe_columns(table)
+        if len(columns)==0:
+            return None
+
+        dids = self.get_device_id_array(table)
+        data = {}
+        for field in dids.dtype.names:
+            data[field] = numpy.ascontiguousarray(dids[field])
+        for column, par_type, side, par_name, writable in columns:
+            data[column] = self.get_device_data_array(table, par_type, par_name, side=side)
+
+        if backend=="pandas":
+            return pandas.DataFrame(data, copy=False)
+        if backend=="arrow":
+            return pyarrow.table(data)
+        return data
+
+    def to_dataframes(self, backend="pandas"):
+        """
+        Get powerflow data and results of the whole network as columnar tables. See to_dataframe().
+        Args:
+            (1) backend: String of table type. Choose one from {"pandas", "arrow", "numpy"}.
+        Rets:
+            (1) Dict of tables with keys "BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", and "TRANSFORMER".
+                None if required module is missing or backend is invalid.
+        Example:
+            tables = to_dataframes()
+            print(tables["LINE"][["ibus", "jbus", "PSEND_MW"]])
+        """
+        tables = {}
+        for table in ["BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER"]:
+            tables[table] = self.to_dataframe(table, backend)
+            if tables[table] is None:
+                return None
+        return tables
+
     def get_area_data(self, area, par_type, par_name):
         """
         Get area data.
@@ -2819,6 +3436,28 @@ class STEPS():
         self.set_energy_storage_data(energy_storage, "F", "PGEN_MW", s.real)
         self.set_energy_storage_data(energy_storage, "F", "QGEN_MVAR", s.imag)
         
+    def set_generator_power_array(self, generators=None, p=None, q=None, mark_changed_buses=False):
+        """
+        Set generator power in bulk with NumPy arrays. See set_device_data_array().
+        Args:
+            (1) generators: List of generator device ids in format of (bus, ickt). If None, all generators are used.
+            (2) p: Array of active power generation in MW. If None, active power is not changed.
+            (3) q: Array of reactive power generation in MVar. If None, reactive power is not changed.
+            (4) mark_changed_buses: Logic of marking buses of generators as the only buses with changed injection for the next powerflow solution.
+        Rets: N/A
+        Example:
+            set_generator_power_array([(30,"1"), (31,"1")], p=[250, 570])
+        """
+        par_names, values = [], []
+        if p is not None:
+            par_names.append("PGEN_MW")
+            values.append(p)
+        if q is not None:
+            par_names.append("QGEN_MVAR")
+            values.append(q)
+        if len(par_names)>0:
+            self.set_device_data_array("GENERATOR", par_names, values, generators, mark_changed_buses=mark_changed_buses)
+
     def set_load_data(self, load, par_type, par_name, value):
         """
         Set load data.
@@ -2876,6 +3515,32 @@ class STEPS():
             self.set_load_data(load, "F", "PZ0_MW",sz.real)
             self.set_load_data(load, "F", "QZ0_MVAR",sz.imag)
     
+    def set_load_power_array(self, loads=None, pp=None, qp=None, pi=None, qi=None, pz=None, qz=None, mark_changed_buses=False):
+        """
+        Set load power in bulk with NumPy arrays. See set_device_data_array().
+        Args:
+            (1) loads: List of load device ids in format of (bus, ickt). If None, all loads are used.
+            (2) pp: Array of constant power active load in MW.
+            (3) qp: Array of constant power reactive load in MVar.
+            (4) pi: Array of constant current active load in MW.
+            (5) qi: Array of constant current reactive load in MVar.
+            (6) pz: Array of constant impedance active load in MW.
+            (7) qz: Array of constant impedance reactive load in MVar.
+            (8) mark_changed_buses: Logic of marking buses of loads as the only buses with changed injection for the next powerflow solution.
+        Rets: N/A
+        Tips:
+            If the load component is None, the specific component is ignored.
+        Example:
+            set_load_power_array(pp=pp*1.1, qp=qp*1.1) # scale constant power part of all loads
+        """
+        par_names, values = [], []
+        for par_name, value in zip(["PP0_MW", "QP0_MVAR", "PI0_MW", "QI0_MVAR", "PZ0_MW", "QZ0_MVAR"], [pp, qp, pi, qi, pz, qz]):
+            if value is not None:
+                par_names.append(par_name)
+                values.append(value)
+        if len(par_names)>0:
+            self.set_device_data_array("LOAD", par_names, values, loads, mark_changed_buses=mark_changed_buses)
+
     def set_fixed_shunt_data(self, fixed_shunt, par_type, par_name, value):
         """
         Set fixed shunt data.
@@ -3053,6 +3718,192 @@ class STEPS():
         self.set_hvdc_data(hvdc, "F", "HVDC", "PDCN_MW", p)
         return
         
+    def set_device_data_with_field_id(self, device, field_id, value):
+        """
+        Set device data with field id.
+        Args:
+            (1) device: Device id. Bus number for bus, (bus, ickt) for single bus devices, (ibus, jbus, ickt) for lines and HVDC links, and (ibus, jbus, ickt) or (ibus, jbus, kbus, ickt) for transformers.
+            (2) field_id: Field id returned by field_id().
+            (3) value: Value of parameter.
+        Rets: N/A
+        Tips:
+            Parameter name is not parsed again. See get_device_data_with_field_id().
+            The value MUST be consistent with the parameter type of the field. Otherwise, function may malfunction and package may exist with error.
+        Example:
+            pid = field_id("GENERATOR", "F", "PGEN_MW")
+            set_device_data_with_field_id((1, "1"), pid, 100.0)
+        """
+        global STEPS_LIB
+        par_type = self.__field_par_types.get(field_id)
+        if par_type is None:
+            return
+        ibus, jbus, kbus, ickt = self.__extract_device_id(device)
+        ickt = self.__get_c_char_p_of_string(ickt)
+        if par_type=='F':
+            return STEPS_LIB.api_set_device_float_data_with_field_id(ibus, jbus, kbus, ickt, field_id, value, self.toolkit_index)
+        if par_type=='I':
+            return STEPS_LIB.api_set_device_integer_data_with_field_id(ibus, jbus, kbus, ickt, field_id, value, self.toolkit_index)
+        return STEPS_LIB.api_set_device_boolean_data_with_field_id(ibus, jbus, kbus, ickt, field_id, value, self.toolkit_index)
+
+    def set_device_data_array(self, device_type, par_names, values, devices=None, side="", mark_changed_buses=False):
+        """
+        Set float data of devices of given type in bulk with NumPy arrays. Module numpy is required.
+        Args:
+            (1) device_type: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER", "HVDC"}.
+            (2) par_names: String of parameter name, or list of parameter names.
+            (3) values: Array of parameter values if par_names is a string, or list of arrays, one for each parameter name.
+            (4) devices: List of device ids in the same format as set_bus_data(), set_generator_data(), etc. If None, all devices of given type are used.
+            (5) side: String of side for transformer and HVDC link. See set_transformer_data() and set_hvdc_data(). It is ignored for other devices.
+            (6) mark_changed_buses: Logic of marking buses of devices as the only buses with changed injection for the next powerflow solution.
+        Rets: N/A
+        Tips:
+            Values of all parameters of all devices are set by STEPS kernel with one call.
+            Devices are put into the device search buffer of STEPS kernel. Search of the same device type in progress with STEPS_LIB calls is reset and has to be initialized again.
+            If mark_changed_buses is True, bus types and voltages to regulate are only re-initialized at the marked buses when solving powerflow without flat start, and network Y matrix and bus ordering of last solution are reused.
+            Enable it only if injections of sources and loads are the only changes since last powerflow solution.
+            Buses are only marked if generation, generation limits or voltage to regulate of GENERATOR, WT GENERATOR, PV UNIT or ENERGY STORAGE, or nominal powers of LOAD are set. Only the bus connected to each device is marked.
+            If data of buses, lines, transformers or fixed shunts are set, added or removed after marking, network Y matrix is rebuilt and all buses are re-initialized in the next solution.
+        Example:
+            set_device_data_array("GENERATOR", ["PGEN_MW", "QGEN_MVAR"], [p, q])
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("set_device_data_array() is dependent on module numpy which is missing. please install numpy before use it")
+            return
+        device_type = device_type.upper()
+        if device_type not in ["BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER", "HVDC"]:
+            return
+
+        device = self.__get_c_char_p_of_string(device_type)
+        if devices is None:
+            if device_type=="BUS":
+                STEPS_LIB.api_initialize_all_bus_search(self.toolkit_index)
+            else:
+                STEPS_LIB.api_initialize_device_search(device, 0, self.toolkit_index)
+        elif not self.__set_device_search_result(device, devices):
+            return
+        n = STEPS_LIB.api_get_device_search_result_count(device, self.toolkit_index)
+
+        if isinstance(par_names, str):
+            par_names, values = [par_names], [values]
+        values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+        if values.size!=len(par_names)*n:
+            print("Size of values ({}) does not match {} parameters of {} {} devices. Nothing will be changed.".format(values.size, len(par_names), n, device_type))
+            return
+
+        side = self.__get_c_char_p_of_string(side.upper())
+        par_names = self.__get_c_char_p_of_string("\n".join(par_names))
+        STEPS_LIB.api_set_device_search_result_float_data(device, side, par_names, values.ctypes.data_as(POINTER(c_double)), n, mark_changed_buses, self.toolkit_index)
+
+    def from_dataframe(self, table, frame, mark_changed_buses=False):
+        """
+        Load modified powerflow data of devices of given type from columnar table. Module numpy is required.
+        Args:
+            (1) table: String of device type. Choose one from {"BUS", "GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE", "LOAD", "FIXED SHUNT", "LINE", "TRANSFORMER"}.
+            (2) frame: pandas DataFrame, pyarrow Table, or dict of arrays in the format of to_dataframe(). Rows may be any subset of devices.
+            (3) mark_changed_buses: Logic of marking buses of devices as the only buses with changed injection. See set_device_data_array().
+        Rets: N/A
+        Tips:
+            Devices are identified by the device id columns. Only writable columns present in the frame are loaded. Powerflow results and integer data are ignored.
+            Float columns are set with set_device_data_array(), one kernel call for each side. Boolean columns are only set for devices whose status is changed.
+            Enable mark_changed_buses only if injections of sources and loads are the only changes.
+        Example:
+            loads = to_dataframe("LOAD")
+            loads["PP0_MW"] *= 1.1
+            from_dataframe("LOAD", loads)
+        """
+        if numpy is None:
+            print("from_dataframe() is dependent on module numpy which is missing. please install numpy before use it")
+            return
+        table = table.upper()
+        columns = self.__get_dataframe_columns(table)
+        if len(columns)==0:
+            return
+
+        if hasattr(frame, "column_names"):
+            names = list(frame.column_names)
+            get_column = lambda name: frame.column(name).to_numpy()
+        else:
+            names = list(frame.keys())
+            get_column = lambda name: numpy.asarray(frame[name])
+
+        if table=="BUS":
+            devices = [int(bus) for bus in get_column("bus")]
+        else:
+            identifiers = [str(identifier) for identifier in get_column("identifier")]
+            if table=="LINE":
+                buses = [get_column("ibus"), get_column("jbus")]
+            elif table=="TRANSFORMER":
+                buses = [get_column("ibus"), get_column("jbus"), get_column("kbus") if "kbus" in names else numpy.zeros(len(identifiers), dtype=numpy.uint32)]
+            else:
+                buses = [get_column("bus")]
+            buses = [[int(bus) for bus in bus_column] for bus_column in buses]
+            devices = list(zip(*(buses+[identifiers])))
+
+        sides = []
+        for column, par_type, side, par_name, writable in columns:
+            if writable and par_type=="F" and column in names and side not in sides:
+                sides.append(side)
+        for side in sides:
+            par_names, values = [], []
+            for column, par_type, column_side, par_name, writable in columns:
+                if writable and par_type=="F" and column in names and column_side==side:
+                    par_names.append(par_name)
+                    values.append(get_column(column))
+            self.set_device_data_array(table, par_names, values, devices, side, mark_changed_buses)
+
+        for column, par_type, side, par_name, writable in columns:
+            if not (writable and par_type=="B" and column in names):
+                continue
+            values = get_column(column).astype(numpy.bool_)
+            current_values = self.get_device_data_array(table, par_type, par_name, devices, side)
+            if current_values is None:
+                continue
+            for i in numpy.flatnonzero(current_values!=values):
+                self.__set_device_data(table, devices[i], par_type, side, par_name, bool(values[i]))
+
+    def from_dataframes(self, tables, mark_changed_buses=False):
+        """
+        Load modified powerflow data of the whole network from columnar tables. See from_dataframe().
+        Args:
+            (1) tables: Dict of tables in the format of to_dataframes(). Tables may be any subset of device types.
+            (2) mark_changed_buses: Logic of marking buses of devices as the only buses with changed injection. See set_device_data_array().
+        Rets: N/A
+        Example:
+            tables = to_dataframes()
+            tables["GENERATOR"]["PGEN_MW"] *= 0.9
+            from_dataframes({"GENERATOR": tables["GENERATOR"]})
+        """
+        for table, frame in tables.items():
+            self.from_dataframe(table, frame, mark_changed_buses)
+
+    def __set_device_data(self, device_type, device, par_type, side, par_name, value):
+        """
+        Private function to set data of single device of given type with the scalar setters, such as set_bus_data(), set_generator_data(), etc.
+        Args:
+            (1) device_type: String of device type.
+            (2) device: Device id.
+            (3) par_type: String of parameter type.
+            (4) side: String of side for transformer and HVDC link. It is ignored for other devices.
+            (5) par_name: String of parameter name.
+            (6) value: Value of parameter.
+        Rets: N/A
+        """
+        if device_type=="BUS":
+            self.set_bus_data(device, par_type, par_name, value)
+        elif device_type in ["GENERATOR", "WT GENERATOR", "PV UNIT", "ENERGY STORAGE"]:
+            self.__set_source_data(device, par_type, par_name, value)
+        elif device_type=="LOAD":
+            self.set_load_data(device, par_type, par_name, value)
+        elif device_type=="FIXED SHUNT":
+            self.set_fixed_shunt_data(device, par_type, par_name, value)
+        elif device_type=="LINE":
+            self.set_line_data(device, par_type, par_name, value)
+        elif device_type=="TRANSFORMER":
+            self.set_transformer_data(device, par_type, side, par_name, value)
+        elif device_type=="HVDC":
+            self.set_hvdc_data(device, par_type, side, par_name, value)
+
     def set_area_data(self, area, par_type, par_name, value):
         """
         Set area data.
@@ -3727,6 +4578,97 @@ class STEPS():
         STEPS_LIB.api_solve_powerflow(method, self.toolkit_index)
         return
 
+    def solve_powerflow_batch(self, scenarios, loads=None, generators=None, method="NR", warm_start="previous", buses=None, thread_number=1, log_file=""):
+        """
+        Solve powerflow of a batch of load and generation scenarios. Module numpy is required.
+        Args:
+            (1) scenarios: 2D array of power changes in MVA to base case, one row for each scenario. Columns are loads followed by generators. Real array changes active power only.
+            (2) loads: List of load device ids in format of (bus, ickt). If both loads and generators are None, all loads are used in the order of get_all_loads().
+            (3) generators: List of generator device ids in format of (bus, ickt).
+            (4) method: String of powerflow solution method. Should be one of {"NR", "PQ"}.
+            (5) warm_start: String of starting point of each scenario. Choose one from {"previous", "base"}. "previous": solution of the previous scenario. "base": solution of base case.
+            (6) buses: List of buses whose voltages are returned. If None, all buses are used in the order of get_all_buses().
+            (7) thread_number: Count of parallel threads. If larger than 1, scenarios are split into thread_number chunks and solved with clones of the toolkit with run_many().
+            (8) log_file: string, log file name of clones. If no file is set (""), the log will be exported to stdout.
+        Rets:
+            (1) tuple of (v, angle, converged). v and angle are 2D arrays of bus voltage in pu and angle in deg, one row for each scenario. converged is array of convergence flag of each scenario.
+                None if numpy is missing, or warm_start is invalid, or any device does not exist, or columns of scenarios do not match loads and generators.
+        Tips:
+            Changes of loads are applied to constant power load (PP0_MW and QP0_MVAR), and changes of generators are applied to generation (PGEN_MW and QGEN_MVAR). Positive change of load reduces injection.
+            Base case is the current case. It is solved first with current solver settings, and scenarios are solved without flat start.
+            Buses of loads and generators are marked as the only buses with changed injection for each scenario. So network Y matrix, bus ordering, and symbolic LU factorization of jacobian matrix are reused.
+            Loads, generators and bus voltages are restored to solution of base case when batch is done.
+            With parallel threads, the first scenario of each chunk starts from solution of base case.
+        Example:
+            loads = simulator.get_all_loads()
+            scenarios = numpy.random.normal(0.0, 10.0, (1000, len(loads)))
+            v, angle, converged = simulator.solve_powerflow_batch(scenarios, loads=loads, method="PQ")
+        """
+        if numpy is None:
+            print("solve_powerflow_batch() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if warm_start not in ["previous", "base"]:
+            return None
+        if loads is None and generators is None:
+            n_load, n_generator = len(self.get_all_loads()), 0
+        else:
+            loads = [] if loads is None else loads
+            generators = [] if generators is None else generators
+            n_load, n_generator = len(loads), len(generators)
+
+        scenarios = numpy.atleast_2d(scenarios)
+        if scenarios.shape[1]!=n_load+n_generator:
+            print("Columns of scenarios ({}) do not match {} loads and {} generators. Nothing will be solved.".format(scenarios.shape[1], n_load, n_generator))
+            return None
+        n_scenario = scenarios.shape[0]
+
+        if thread_number>1 and n_scenario>1:
+            chunks = numpy.array_split(numpy.arange(n_scenario), min(thread_number, n_scenario))
+            functions = [lambda toolkit, rows=rows: toolkit.solve_powerflow_batch(scenarios[rows], loads, generators, method, warm_start, buses) for rows in chunks]
+            results = self.run_many(functions, thread_number, log_file)
+            if results is None or any(result is None for result in results):
+                return None
+            return tuple(numpy.concatenate([result[i] for result in results]) for i in range(3))
+
+        load_data = self.get_device_data_array("LOAD", "D", ["PP0_MW", "QP0_MVAR"], loads) if n_load>0 else ()
+        generator_data = self.get_device_data_array("GENERATOR", "D", ["PGEN_MW", "QGEN_MVAR"], generators) if n_generator>0 else ()
+        if load_data is None or generator_data is None:
+            return None
+        if buses is not None and self.get_device_data_array("BUS", "D", "VOLTAGE IN PU", buses) is None:
+            return None
+
+        self.solve_powerflow(method)
+        if n_load>0:
+            load_p, load_q = load_data
+        if n_generator>0:
+            generator_p, generator_q = self.get_device_data_array("GENERATOR", "D", ["PGEN_MW", "QGEN_MVAR"], generators)
+        bus_v, bus_angle = self.get_device_data_array("BUS", "D", ["VOLTAGE IN PU", "ANGLE IN DEG"])
+        flat_start_logic = self.get_powerflow_solver_parameter("b", "FLAT START LOGIC")
+        self.set_powerflow_solver_parameter("b", "FLAT START LOGIC", False)
+
+        n_bus = len(bus_v) if buses is None else len(buses)
+        v = numpy.zeros((n_scenario, n_bus))
+        angle = numpy.zeros((n_scenario, n_bus))
+        converged = numpy.zeros(n_scenario, dtype=numpy.bool_)
+        for i, change in enumerate(scenarios):
+            if warm_start=="base" and i>0:
+                self.set_device_data_array("BUS", ["VOLTAGE IN PU", "ANGLE IN DEG"], [bus_v, bus_angle])
+            if n_load>0:
+                self.set_device_data_array("LOAD", ["PP0_MW", "QP0_MVAR"], [load_p+change[:n_load].real, load_q+change[:n_load].imag], loads, mark_changed_buses=True)
+            if n_generator>0:
+                self.set_device_data_array("GENERATOR", ["PGEN_MW", "QGEN_MVAR"], [generator_p+change[n_load:].real, generator_q+change[n_load:].imag], generators, mark_changed_buses=True)
+            self.solve_powerflow(method)
+            v[i], angle[i] = self.get_device_data_array("BUS", "D", ["VOLTAGE IN PU", "ANGLE IN DEG"], buses)
+            converged[i] = self.is_powerflow_converged()
+
+        if n_load>0:
+            self.set_device_data_array("LOAD", ["PP0_MW", "QP0_MVAR"], [load_p, load_q], loads)
+        if n_generator>0:
+            self.set_device_data_array("GENERATOR", ["PGEN_MW", "QGEN_MVAR"], [generator_p, generator_q], generators)
+        self.set_device_data_array("BUS", ["VOLTAGE IN PU", "ANGLE IN DEG"], [bus_v, bus_angle])
+        self.set_powerflow_solver_parameter("b", "FLAT START LOGIC", flat_start_logic)
+        return v, angle, converged
+
     def is_powerflow_converged(self):
         """
         Check if powerflow is converged or not.
@@ -3737,6 +4679,36 @@ class STEPS():
         global STEPS_LIB
         return STEPS_LIB.api_is_powerflow_converged(self.toolkit_index)
     
+    def get_sparse_solver_statistics(self, solver="powerflow"):
+        """
+        Get statistics of sparse LU solution of powerflow solver or dynamic simulator.
+        Args:
+            (1) solver: String of solver. Should be one of {"powerflow", "dynamic"}. Default is "powerflow".
+        Rets:
+            (1) Dictionary of statistics with keys: "symbolic analysis count", "numeric factorization count", "solution count",
+                "symbolic analysis time in s", "numeric factorization time in s", "solution time in s".
+        Tips:
+            Statistics of powerflow solver are reset when powerflow solution starts, and those of dynamic simulator are reset when dynamic simulation starts.
+            Symbolic analysis is reused as long as sparsity pattern of matrix is unchanged. It can be disabled by setting boolean parameter "SYMBOLIC ANALYSIS REUSE LOGIC" of powerflow solver or dynamic simulator to False.
+            If solver is not supported, None is returned.
+        Example:
+            simulator.solve_powerflow("NR")
+            stat = simulator.get_sparse_solver_statistics("powerflow")
+            print(stat["numeric factorization time in s"])
+        """
+        solver = solver.upper()
+        if solver in ["POWERFLOW", "PF"]:
+            get_parameter = self.get_powerflow_solver_parameter
+        elif solver in ["DYNAMIC", "DYNAMICS", "DYN"]:
+            get_parameter = self.get_dynamic_simulator_parameter
+        else:
+            return None
+        stat = {}
+        for par in ["symbolic analysis", "numeric factorization", "solution"]:
+            stat[par+" count"] = get_parameter("I", "LU "+par+" count")
+            stat[par+" time in s"] = get_parameter("F", "LU "+par+" time in s")
+        return stat
+    
     def get_powerflow_loss(self):
         """
         Get active power loss of solved powerflow.
@@ -3935,8 +4907,203 @@ class STEPS():
         file = self.__get_c_char_p_of_string(file)
         STEPS_LIB.api_save_network_Z_matrix(file, self.toolkit_index)
         return
+
+    def __get_network_matrix(self, matrix_type):
+        """
+        Private function to get network matrix from STEPS kernel in compressed sparse column (CSC) form.
+        Args:
+            (1) matrix_type: String of matrix type. Should be one of {"NETWORK Y", "DECOUPLED BP", "DECOUPLED BQ", "DC B", "DYNAMIC Y", "JACOBIAN"}.
+        Rets:
+            (1) scipy.sparse.csc_matrix if scipy is available, otherwise tuple (data, indices, indptr) of NumPy arrays.
+            (2) NumPy array of physical bus numbers of rows and columns. For "JACOBIAN", P equation buses are followed by Q equation buses.
+        """
+        global STEPS_LIB
+        is_complex = matrix_type in ("NETWORK Y", "DYNAMIC Y")
+        matrix_type = self.__get_c_char_p_of_string(matrix_type)
+        n = STEPS_LIB.api_get_network_matrix_size(matrix_type, self.toolkit_index)
+        nnz = STEPS_LIB.api_get_network_matrix_entry_count(matrix_type, self.toolkit_index)
+
+        indptr = numpy.zeros(n+1, dtype=numpy.intc)
+        indices = numpy.zeros(nnz, dtype=numpy.intc)
+        real = numpy.zeros(nnz, dtype=numpy.float64)
+        imag = numpy.zeros(nnz, dtype=numpy.float64)
+        buses = numpy.zeros(n, dtype=numpy.uintc)
+        if n>0:
+            STEPS_LIB.api_get_network_matrix_in_compressed_column_form(matrix_type, indptr.ctypes.data_as(POINTER(c_int)), indices.ctypes.data_as(POINTER(c_int)),
+                                                                       real.ctypes.data_as(POINTER(c_double)), imag.ctypes.data_as(POINTER(c_double)) if is_complex else None,
+                                                                       n, nnz, self.toolkit_index)
+            STEPS_LIB.api_get_network_matrix_bus_numbers(matrix_type, buses.ctypes.data_as(POINTER(c_uint)), n, self.toolkit_index)
+        data = real+1j*imag if is_complex else real
+        if scipy is not None:
+            return scipy.sparse.csc_matrix((data, indices, indptr), shape=(n, n)), buses
+        else:
+            return (data, indices, indptr), buses
+
+    def get_network_Y_matrix(self, rebuild=True):
+        """
+        Get network complex Y matrix for powerflow solution in compressed sparse column (CSC) form. Module numpy is required. Module scipy is optional.
+        Args:
+            (1) rebuild: Logic of rebuilding the matrix before getting it. Default is True.
+        Rets:
+            (1) Y matrix. scipy.sparse.csc_matrix if scipy is available, otherwise tuple (data, indices, indptr) of NumPy arrays.
+            (2) NumPy array of physical bus numbers of rows and columns. The i-th row and column are of bus buses[i].
+            None if numpy is missing.
+        Tips:
+            Entries are copied from STEPS kernel in bulk without saving to file.
+            Tuple (data, indices, indptr) can be passed to scipy.sparse.csc_matrix() with shape (n, n).
+        Example:
+            Y, buses = simulator.get_network_Y_matrix()
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_network_Y_matrix() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if rebuild:
+            STEPS_LIB.api_build_network_Y_matrix(self.toolkit_index)
+        return self.__get_network_matrix("NETWORK Y")
+
+    def get_decoupled_network_B_matrix(self, rebuild=True):
+        """
+        Get network real B' and B" matrix for decoupled powerflow solution in compressed sparse column (CSC) form. Module numpy is required. Module scipy is optional.
+        Args:
+            (1) rebuild: Logic of rebuilding the matrix before getting it. Default is True.
+        Rets:
+            (1) B' matrix. scipy.sparse.csc_matrix if scipy is available, otherwise tuple (data, indices, indptr) of NumPy arrays.
+            (2) B" matrix in the same form as B' matrix.
+            (3) NumPy array of physical bus numbers of rows and columns.
+            None if numpy is missing.
+        Example:
+            BP, BQ, buses = simulator.get_decoupled_network_B_matrix()
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_decoupled_network_B_matrix() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if rebuild:
+            STEPS_LIB.api_build_decoupled_network_B_matrix(self.toolkit_index)
+        BP, buses = self.__get_network_matrix("DECOUPLED BP")
+        BQ, buses = self.__get_network_matrix("DECOUPLED BQ")
+        return BP, BQ, buses
+
+    def get_dc_network_B_matrix(self, rebuild=True):
+        """
+        Get network real B matrix for DC powerflow solution in compressed sparse column (CSC) form. Module numpy is required. Module scipy is optional.
+        Args:
+            (1) rebuild: Logic of rebuilding the matrix before getting it. Default is True.
+        Rets:
+            (1) B matrix. scipy.sparse.csc_matrix if scipy is available, otherwise tuple (data, indices, indptr) of NumPy arrays.
+            (2) NumPy array of physical bus numbers of rows and columns.
+            None if numpy is missing.
+        Example:
+            B, buses = simulator.get_dc_network_B_matrix()
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_dc_network_B_matrix() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if rebuild:
+            STEPS_LIB.api_build_dc_network_B_matrix(self.toolkit_index)
+        return self.__get_network_matrix("DC B")
+
+    def get_dynamic_network_Y_matrix(self, rebuild=True):
+        """
+        Get network complex Y matrix for dynamic simulation in compressed sparse column (CSC) form. Module numpy is required. Module scipy is optional.
+        Args:
+            (1) rebuild: Logic of rebuilding the matrix before getting it. Default is True.
+        Rets:
+            (1) Y matrix. scipy.sparse.csc_matrix if scipy is available, otherwise tuple (data, indices, indptr) of NumPy arrays.
+            (2) NumPy array of physical bus numbers of rows and columns.
+            None if numpy is missing.
+        Tips:
+            The faults and source impedance are included in the Y matrix.
+            During dynamic simulation, use rebuild=False to get the Y matrix currently used by the dynamic simulator.
+            Network Y matrix for powerflow and dynamic simulation share the same storage. The matrix built last is returned if rebuild=False.
+        Example:
+            Y, buses = simulator.get_dynamic_network_Y_matrix(rebuild=False)
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_dynamic_network_Y_matrix() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if rebuild:
+            STEPS_LIB.api_build_dynamic_network_Y_matrix(self.toolkit_index)
+        return self.__get_network_matrix("DYNAMIC Y")
+
+    def get_jacobian_matrix(self, rebuild=True):
+        """
+        Get full coupled jacobian matrix of Newton-Raphson powerflow solution in compressed sparse column (CSC) form. Module numpy is required. Module scipy is optional.
+        Args:
+            (1) rebuild: Logic of rebuilding the matrix with current bus voltage before getting it. Default is True.
+        Rets:
+            (1) Jacobian matrix. scipy.sparse.csc_matrix if scipy is available, otherwise tuple (data, indices, indptr) of NumPy arrays.
+            (2) NumPy array of physical bus numbers of P equation buses.
+            (3) NumPy array of physical bus numbers of Q equation buses.
+            None if numpy is missing.
+        Tips:
+            Powerflow should be solved before getting jacobian matrix. P and Q equation buses of the latest powerflow solution are used.
+            Rows are active power equations of P equation buses followed by reactive power equations of Q equation buses.
+            Columns are voltage angles of P equation buses followed by voltage magnitudes of Q equation buses.
+            Entries are partial derivatives of bus power mismatch (specified power minus power into network) in pu, with respect to voltage angle in rad and voltage magnitude in pu.
+            If rebuild=False, jacobian matrix of the last Newton-Raphson iteration is returned.
+        Example:
+            J, P_buses, Q_buses = simulator.get_jacobian_matrix()
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_jacobian_matrix() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if rebuild:
+            STEPS_LIB.api_build_jacobian_matrix(self.toolkit_index)
+        J, buses = self.__get_network_matrix("JACOBIAN")
+        nP = STEPS_LIB.api_get_powerflow_solver_integer_parameter(self.__get_c_char_p_of_string("P EQUATION BUS COUNT"), self.toolkit_index)
+        return J, buses[:nP], buses[nP:]
         
         
+    def get_network_Z_columns(self, buses, sequence="POSITIVE", rebuild=True):
+        """
+        Get selected columns of sequence network complex Z matrix as dense NumPy array. Module numpy is required.
+        Args:
+            (1) buses: Bus number or list of bus numbers of columns to get.
+            (2) sequence: String of network sequence. Only "POSITIVE" is supported. Default is "POSITIVE".
+            (3) rebuild: Logic of rebuilding the sequence network Y matrix before solving. Default is True.
+        Rets:
+            (1) Complex NumPy array of shape (n, len(buses)). Column j is the bus voltage in pu when 1.0 pu current is injected into bus buses[j].
+            (2) NumPy array of physical bus numbers of rows. The i-th row is of bus rows[i].
+            None if numpy is missing.
+        Tips:
+            Only the selected columns are solved with LU factors of the Y matrix, which is factorized once for all columns. Full Z matrix is not built.
+            Positive sequence network Y matrix is the network Y matrix for dynamic simulation, including source impedance and faults.
+            Negative and zero sequence network Y matrix are not built by STEPS kernel yet. ValueError is raised for "NEGATIVE" and "ZERO".
+            Columns of buses not in network are NAN.
+        Example:
+            Z, rows = simulator.get_network_Z_columns([1, 2, 3])
+            Z, rows = simulator.get_network_Z_columns(1, sequence="POSITIVE")
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_network_Z_columns() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        sequence = sequence.upper()
+        if sequence!="POSITIVE":
+            raise ValueError("get_network_Z_columns() only supports POSITIVE sequence network. {} is given.".format(sequence))
+        if rebuild:
+            STEPS_LIB.api_build_dynamic_network_Y_matrix(self.toolkit_index)
+
+        buses = numpy.ascontiguousarray(numpy.atleast_1d(buses), dtype=numpy.uintc)
+        ncol = len(buses)
+        matrix_type = self.__get_c_char_p_of_string(sequence+" SEQUENCE Y")
+        n = STEPS_LIB.api_get_network_matrix_size(matrix_type, self.toolkit_index)
+        rows = numpy.zeros(n, dtype=numpy.uintc)
+        real = numpy.zeros((ncol, n), dtype=numpy.float64)
+        imag = numpy.zeros((ncol, n), dtype=numpy.float64)
+        if n>0:
+            STEPS_LIB.api_get_network_matrix_bus_numbers(matrix_type, rows.ctypes.data_as(POINTER(c_uint)), n, self.toolkit_index)
+        if n>0 and ncol>0:
+            sequence = self.__get_c_char_p_of_string(sequence)
+            STEPS_LIB.api_get_network_Z_columns(sequence, buses.ctypes.data_as(POINTER(c_uint)), ncol,
+                                                real.ctypes.data_as(POINTER(c_double)), imag.ctypes.data_as(POINTER(c_double)), n, self.toolkit_index)
+        return (real+1j*imag).T, rows
+
     def get_dynamic_simulator_parameter(self, par_type, par_name):
         """
         Get dynamic simulator configuration parameter.
@@ -3948,6 +5115,7 @@ class STEPS():
         Tips:
             The par_type meaning: "I": integer number, "F" or "D": float number, "S": string, "B": boolean data.
             The type of given parameter MUST be consistent with the given parameter type. Otherwise, 0, 0.0, "", or False will be returned.
+            Boolean parameter "NETWORK MATRIX INCREMENTAL UPDATE LOGIC" is True by default. See set_dynamic_simulator_parameter().
         """
         global STEPS_LIB
         par_type = par_type.upper()
@@ -3975,6 +5143,9 @@ class STEPS():
         Tips:
             The par_type meaning: "I": integer number, "F" or "D": float number, "S": string, "B": boolean data.
             The type of given parameter MUST be consistent with the given parameter type. Otherwise, nothing will be changed
+            Boolean parameter "NETWORK MATRIX INCREMENTAL UPDATE LOGIC" is True by default, and network Y matrix is only updated with devices switched by events, e.g. faults, line trips and generator trips.
+            Network Y matrix is rebuilt if data changing network Y matrix, e.g. status, MBASE and source impedance of generators, status of loads, and impedance of lines, transformers and fixed shunts, is changed with set_xxx_data().
+            If it is set as False, network Y matrix is rebuilt at every run_dynamic_simulation_to_time().
         """
         global STEPS_LIB
         par_type = par_type.upper()
@@ -4333,6 +5504,90 @@ class STEPS():
         STEPS_LIB.api_prepare_equivalent_device_related_meter(bus, ickt, meter_type, var_name, self.toolkit_index)
         return
 
+    def get_meter_count(self):
+        """
+        Get count of meters in the current simulator.
+        Args: N/A
+        Rets:
+            (1) Integer of meter count.
+        """
+        global STEPS_LIB
+        return STEPS_LIB.api_get_meter_count(self.toolkit_index)
+
+    def get_meter_names(self):
+        """
+        Get names of all meters in the current simulator.
+        Args: N/A
+        Rets:
+            (1) List of meter names, in the order of columns of meter values in output files and meter buffer.
+        """
+        global STEPS_LIB
+        names = []
+        for i in range(STEPS_LIB.api_get_meter_count(self.toolkit_index)):
+            names.append(self.__get_string_from_c_char_p(STEPS_LIB.api_get_meter_name(i, self.toolkit_index)))
+        return names
+
+    def set_meter_buffer_capacity(self, capacity, ring=False):
+        """
+        Set capacity of in-memory meter buffer of dynamic simulator.
+        Args:
+            (1) capacity: Maximum count of time points stored in meter buffer. 0 to disable meter buffer.
+            (2) ring: Logic of ring buffer. If True, the oldest time point is overwritten when buffer is full. If False, time points are no longer stored when buffer is full.
+        Rets: N/A
+        Tips:
+            Meter buffer is allocated when start_dynamic_simulation() is called. Meter values are stored in buffer at every time step no matter whether file export is enabled.
+            To simulate without disk I/O, disable all file exports with set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False), etc.
+        """
+        global STEPS_LIB
+        STEPS_LIB.api_set_dynamic_simulator_boolean_parameter(self.__get_c_char_p_of_string("METER BUFFER RING LOGIC"), ring, self.toolkit_index)
+        STEPS_LIB.api_set_dynamic_simulator_integer_parameter(self.__get_c_char_p_of_string("METER BUFFER CAPACITY"), capacity, self.toolkit_index)
+        return
+
+    def get_meter_buffer(self, ordered=True, copy=True):
+        """
+        Get meter values stored in in-memory meter buffer of dynamic simulator. Module numpy is required.
+        Args:
+            (1) ordered: Logic of ordering time points in time for ring buffer. It is ignored if ring buffer is not wrapped around.
+            (2) copy: Logic of copying meter values out of buffer in STEPS kernel. If False, read-only views of the buffer are returned.
+        Rets:
+            (1) NumPy array of simulation time of stored time points.
+            (2) 2D NumPy array of meter values of stored time points, one column for each meter in the order of get_meter_names().
+            None if numpy is missing.
+        Tips:
+            By default, the returned arrays are copies, and are safe to use after the buffer is released.
+            If copy is False, the returned arrays are read-only views of buffer in STEPS kernel without copy, and are updated in place as simulation goes on.
+            Views are backed by memory owned by STEPS kernel, which is released when start_dynamic_simulation() or set_meter_buffer_capacity() is called again, or the toolkit is deleted. Accessing views after that reads freed memory. Use views only for immediate reductions, e.g. numpy.max().
+            If ring buffer is wrapped around, the arrays are copies ordered in time if ordered is True whatever copy is, or the whole buffer in storage order if ordered is False.
+            Meter buffer is disabled by default. Enable it with set_meter_buffer_capacity() before start_dynamic_simulation().
+        Example:
+            simulator.set_meter_buffer_capacity(10000)
+            simulator.start_dynamic_simulation()
+            simulator.run_dynamic_simulation_to_time(1.0)
+            t, values = simulator.get_meter_buffer()
+            max_values = simulator.get_meter_buffer(copy=False)[1].max(axis=0)
+        """
+        global STEPS_LIB
+        if numpy is None:
+            print("get_meter_buffer() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        ncol = STEPS_LIB.api_get_meter_buffer_column_count(self.toolkit_index)
+        pointer = STEPS_LIB.api_get_meter_buffer(self.toolkit_index)
+        if ncol==0 or not pointer:
+            return numpy.zeros(0), numpy.zeros((0, max(ncol-1, 0)))
+
+        capacity = int(STEPS_LIB.api_get_dynamic_simulator_integer_parameter(self.__get_c_char_p_of_string("METER BUFFER CAPACITY"), self.toolkit_index))
+        count = STEPS_LIB.api_get_meter_buffer_stored_count(self.toolkit_index)
+        data = numpy.ctypeslib.as_array(pointer, shape=(capacity, ncol))
+        data.flags.writeable = False
+        if count>capacity and ordered:
+            start = count%capacity
+            data = numpy.concatenate((data[start:], data[:start]))
+        else:
+            data = data[:count]
+            if copy:
+                data = data.copy()
+        return data[:,0], data[:,1:]
+
     def start_dynamic_simulation(self):
         """
         Start dynamic simulation. Dynamic initialization is performed.
@@ -4353,17 +5608,134 @@ class STEPS():
         STEPS_LIB.api_stop_dynamic_simulation(self.toolkit_index)
         return
 
-    def run_dynamic_simulation_to_time(self, time):
+    def run_dynamic_simulation_to_time(self, time, callback=None, callback_step_interval=1):
         """
         Run dynamic simulation to time.
         Args:
             (1) time: Time in second.
+            (2) callback: Python function called as callback(simulation_time) every callback_step_interval steps. Simulation is stopped if it returns True. If None, no callback is called.
+            (3) callback_step_interval: Integer of step count between two calls of callback.
         Rets: N/A
         Tips:
             The input time is the time when the dynamic simulation is paused. For example, if the current dynamic simulation time returned from get_dynamic_simulation_time() is 1.0s, and the returned time of get_dynamic_simulation_time() will become 1.5s after run_dynamic_simulation_to_time(1.5) is called.
+            Simulation is also stopped before time if rotor angle stability surveillance detects instability, or any meter stop condition added with add_meter_stop_condition() is met.
+            Call get_dynamic_simulation_early_stop_flag() to check if simulation is stopped before time.
+            Exceptions raised in callback are printed and treated as returning False.
+        Example:
+            def check(t):
+                return min(simulator.get_device_data_array("BUS", "F", "VOLTAGE IN PU"))<0.5
+            simulator.run_dynamic_simulation_to_time(5.0, callback=check, callback_step_interval=10)
+        """
+        global STEPS_LIB
+        if callback is None:
+            STEPS_LIB.api_run_simulation_to_time(time, self.toolkit_index)
+        else:
+            step_callback = pylibsteps.DYNAMIC_SIMULATION_STEP_CALLBACK(lambda t: bool(callback(t)))
+            STEPS_LIB.api_run_simulation_to_time_with_callback(time, step_callback, callback_step_interval, self.toolkit_index)
+        return
+
+    def get_dynamic_simulation_early_stop_flag(self):
+        """
+        Check if the last run_dynamic_simulation_to_time() is stopped before the given time.
+        Args: N/A
+        Rets:
+            (1) flag: True if simulation is stopped by rotor angle stability surveillance, meter stop condition, or callback. False if simulation reaches the given time.
+        """
+        global STEPS_LIB
+        return STEPS_LIB.api_get_dynamic_simulation_early_stop_flag(self.toolkit_index)
+
+    def add_meter_stop_condition(self, meter, lower_limit=None, upper_limit=None, duration=0.0):
+        """
+        Add condition on meter to stop dynamic simulation.
+        Args:
+            (1) meter: String of meter name, or integer of meter index in get_meter_names().
+            (2) lower_limit: Lower limit of meter value. If None, no lower limit.
+            (3) upper_limit: Upper limit of meter value. If None, no upper limit.
+            (4) duration: Time in second. Simulation is stopped if meter value is out of limits for the duration continuously.
+        Rets:
+            (1) True if condition is added, False if meter does not exist.
+        Tips:
+            Meters MUST be prepared before conditions are added. Conditions are removed when meters are cleared.
+            NaN meter value is treated as out of limits.
+            Conditions are checked every step in run_dynamic_simulation_to_time().
+        Example:
+            add_meter_stop_condition("VOLTAGE IN PU @ BUS 16", lower_limit=0.7, duration=0.5)
+            add_meter_stop_condition("FREQUENCY IN HZ @ BUS 39", lower_limit=49.0, upper_limit=51.0)
+        """
+        global STEPS_LIB
+        if isinstance(meter, str):
+            names = self.get_meter_names()
+            if meter not in names:
+                return False
+            meter = names.index(meter)
+        if meter<0 or meter>=STEPS_LIB.api_get_meter_count(self.toolkit_index):
+            return False
+        if lower_limit is None:
+            lower_limit = -float("inf")
+        if upper_limit is None:
+            upper_limit = float("inf")
+        STEPS_LIB.api_add_meter_stop_condition(meter, lower_limit, upper_limit, duration, self.toolkit_index)
+        return True
+
+    def clear_meter_stop_conditions(self):
+        """
+        Clear all meter stop conditions.
+        Args: N/A
+        Rets: N/A
+        """
+        global STEPS_LIB
+        STEPS_LIB.api_clear_meter_stop_conditions(self.toolkit_index)
+        return
+
+    def save_dynamic_state(self):
+        """
+        Save current dynamic state in memory.
+        Args: N/A
+        Rets:
+            (1) handle: Integer handle of saved dynamic state, or None if dynamic simulation is not started.
+        Tips:
+            Saved dynamic state includes simulation time, states of all dynamic models, bus voltages and frequency, faults and status of devices, and meter buffer.
+            Dynamic simulation MUST be started before saving dynamic state. All saved dynamic states are released when the toolkit is cleared.
+            Call release_dynamic_state() to release memory of dynamic state which is no longer needed.
+        Example:
+            simulator.start_dynamic_simulation()
+            simulator.set_bus_fault(16, "three phase fault", [0.0, -2e4])
+            handle = simulator.save_dynamic_state()
+            for ct in [0.1, 0.2, 0.3]:
+                simulator.restore_dynamic_state(handle)
+                simulator.run_dynamic_simulation_to_time(ct)
+                simulator.clear_bus_fault(16, "three phase fault")
+                simulator.run_dynamic_simulation_to_time(5.0)
+        """
+        global STEPS_LIB
+        handle = STEPS_LIB.api_save_dynamic_state(self.toolkit_index)
+        if handle==STEPS_LIB.api_get_const_INDEX_NOT_EXIST():
+            return None
+        return handle
+
+    def restore_dynamic_state(self, handle):
+        """
+        Restore dynamic state saved by save_dynamic_state().
+        Args:
+            (1) handle: Integer handle of saved dynamic state.
+        Rets:
+            (1) True if dynamic state is restored, False if handle does not exist, or devices, dynamic models, or meters are changed after saving.
+        Tips:
+            Dynamic simulation time is reset to the time when the state is saved. The saved state is kept and can be restored for multiple times.
+            Exported csv/json/bin files are NOT rewound. Use meter buffer if meter values of each branch are required.
         """
         global STEPS_LIB
-        STEPS_LIB.api_run_simulation_to_time(time, self.toolkit_index)
+        return STEPS_LIB.api_restore_dynamic_state(handle, self.toolkit_index)
+
+    def release_dynamic_state(self, handle):
+        """
+        Release dynamic state saved by save_dynamic_state().
+        Args:
+            (1) handle: Integer handle of saved dynamic state.
+        Rets: N/A
+        """
+        global STEPS_LIB
+        STEPS_LIB.api_release_dynamic_state(handle, self.toolkit_index)
         return
 
     def run_a_step(self):
@@ -4832,6 +6204,295 @@ class STEPS():
         STEPS_LIB.api_manually_unblock_hvdc(ibus, jbus, ickt, self.toolkit_index)
         return
 
+    def screen_contingencies(self, kind, k=1, devices=None, fault_shunt=(0.0, -2e4), fault_time=1.0, clearing_time=0.1, simulation_time=5.0, angle_threshold=180.0, prune_time=None, prune_angle=None, rank=True, thread_number=None, log_file=""):
+        """
+        Screen N-k contingencies with dynamic simulation in parallel threads. Module numpy is required.
+        Args:
+            (1) kind: String of contingency kind, one of {"LINE FAULT", "LINE TRIP", "GENERATOR TRIP", "HVDC BLOCK"}.
+            (2) k: Count of devices in each contingency. All combinations of k devices are screened.
+            (3) devices: List of candidate devices. If None, all lines, generators, or HVDC links are candidates.
+            (4) fault_shunt: Complex per unit fault shunt in the form of (g+jb) for "LINE FAULT".
+            (5) fault_time: Time in second when contingency is applied.
+            (6) clearing_time: Fault duration in second for "LINE FAULT". Faulted lines are tripped when fault is cleared.
+            (7) simulation_time: Time in second when simulation of each contingency ends.
+            (8) angle_threshold: Rotor angle difference threshold in deg of rotor angle stability surveillance.
+            (9) prune_time: Time in second after fault clearing to check if contingency is benign. If None, no contingency is pruned.
+            (10) prune_angle: Rotor angle difference in deg below which contingency is benign. If None, half of angle_threshold is used.
+            (11) rank: Logic of ranking results by severity. If False, results are in the order of contingencies.
+            (12) thread_number: Maximum count of parallel threads. If None, count of CPUs is used.
+            (13) log_file: string, log file name of clones. If no file is set (""), the log will be exported to stdout.
+        Rets:
+            (1) List of dict of result of each contingency with keys:
+                "contingency": tuple of devices in contingency
+                "stable": logic of rotor angle stability
+                "instability_time": time in second when instability is detected. None if stable
+                "max_angle_difference": maximum rotor angle difference in deg among all generators in service, regardless of islands, after contingency is applied
+                "min_voltage": minimum bus voltage in pu after contingency is applied, or after fault is cleared for "LINE FAULT"
+                "end_time": time in second when simulation ends
+                "pruned": logic of contingency being benign and simulation being cut short
+            None if numpy is missing or kind is invalid.
+        Tips:
+            Each contingency is simulated with a clone of the toolkit with run_many(). Load and solve the case before screening.
+            Contingency is unstable if simulation diverges, and instability time is the time when NaN is first found.
+            Contingency is pruned if rotor angle difference never exceeds prune_angle till prune_time after fault clearing. Pruned contingency is stable.
+            Ranked results start with unstable contingencies in the order of instability time, followed by stable contingencies in descending order of maximum rotor angle difference.
+        Example:
+            simulator.load_powerflow_data("IEEE39.raw", "PSS/E")
+            simulator.solve_powerflow("NR")
+            simulator.load_dynamic_data("IEEE39.dyr", "PSS/E")
+            results = simulator.screen_contingencies("LINE FAULT", clearing_time=0.1, prune_time=1.0)
+            unstable = [result["contingency"] for result in results if not result["stable"]]
+        """
+        if numpy is None:
+            print("screen_contingencies() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        kind = kind.upper()
+        if kind not in ["LINE FAULT", "LINE TRIP", "GENERATOR TRIP", "HVDC BLOCK"]:
+            return None
+        if devices is None:
+            if kind in ["LINE FAULT", "LINE TRIP"]:
+                devices = self.get_all_lines()
+            elif kind=="GENERATOR TRIP":
+                devices = self.get_all_generators()
+            else:
+                devices = self.get_all_hvdcs()
+        contingencies = list(itertools.combinations(devices, k))
+        generators = self.get_all_generators()
+        buses = self.get_all_buses()
+        if prune_angle is None:
+            prune_angle = 0.5*angle_threshold
+        if kind=="LINE FAULT":
+            disturbance_end_time = fault_time+clearing_time
+        else:
+            disturbance_end_time = fault_time
+
+        screen = {"kind": kind, "generators": generators, "buses": buses, "fault_shunt": fault_shunt, "fault_time": fault_time,
+                  "disturbance_end_time": disturbance_end_time, "simulation_time": simulation_time, "angle_threshold": angle_threshold,
+                  "prune_time": prune_time, "prune_angle": prune_angle}
+
+        functions = [lambda toolkit, contingency=contingency: self.__screen_contingency(toolkit, screen, contingency) for contingency in contingencies]
+        results = self.run_many(functions, thread_number=thread_number, log_file=log_file)
+        if rank:
+            results.sort(key=lambda result: (result["stable"], result["instability_time"] if not result["stable"] else -result["max_angle_difference"]))
+        return results
+
+    def __screen_contingency(self, toolkit, screen, contingency):
+        kind, generators, buses = screen["kind"], screen["generators"], screen["buses"]
+        fault_time, disturbance_end_time, simulation_time = screen["fault_time"], screen["disturbance_end_time"], screen["simulation_time"]
+        prune_time = screen["prune_time"]
+        for file_type in ("BIN", "CSV", "JSON"):
+            toolkit.set_dynamic_simulator_parameter("b", file_type+" EXPORT LOGIC", False)
+        toolkit.set_dynamic_simulator_parameter("b", "ANGLE STABILITY SURVEILLANCE LOGIC", True)
+        toolkit.set_dynamic_simulator_parameter("d", "ANGLE STABILITY THRESHOLD IN DEG", screen["angle_threshold"])
+        for generator in generators:
+            toolkit.prepare_generator_meter(generator, "ROTOR ANGLE IN DEG")
+        for bus in buses:
+            toolkit.prepare_bus_meter(bus, "VOLTAGE IN PU")
+        time_step = toolkit.get_dynamic_simulation_time_step()
+        toolkit.set_meter_buffer_capacity(int(simulation_time/time_step)+10)
+        in_service = [generator not in contingency for generator in generators]
+
+        toolkit.start_dynamic_simulation()
+        toolkit.run_dynamic_simulation_to_time(fault_time)
+        for device in contingency:
+            if kind=="LINE FAULT":
+                toolkit.set_line_fault(device, "THREE PHASE FAULT", 0.0, screen["fault_shunt"])
+            elif kind=="LINE TRIP":
+                toolkit.trip_line(device)
+            elif kind=="GENERATOR TRIP":
+                toolkit.trip_generator(device)
+            else:
+                toolkit.manually_block_hvdc(device)
+        stopped = False
+        if kind=="LINE FAULT":
+            toolkit.run_dynamic_simulation_to_time(disturbance_end_time)
+            stopped = toolkit.get_dynamic_simulation_early_stop_flag()
+            if not stopped:
+                for device in contingency:
+                    toolkit.clear_line_fault(device, "THREE PHASE FAULT", 0.0)
+                    toolkit.trip_line(device)
+        if not stopped:
+            if prune_time is None:
+                toolkit.run_dynamic_simulation_to_time(simulation_time)
+            else:
+                is_benign = lambda t: self.__is_benign_contingency(toolkit, screen, in_service, time_step, t)
+                toolkit.run_dynamic_simulation_to_time(simulation_time, callback=is_benign, callback_step_interval=10)
+        toolkit.stop_dynamic_simulation()
+
+        stable = toolkit.is_system_angular_stable()
+        end_time = toolkit.get_dynamic_simulation_time()
+        angles, voltages = self.__get_post_disturbance_values(toolkit, screen, in_service, time_step)
+        diverged = numpy.isnan(angles).any() or numpy.isnan(voltages).any()
+        if diverged:
+            stable = False
+            dy_time, dy_value = toolkit.get_meter_buffer(copy=False)
+            end_time = float(dy_time[numpy.isnan(dy_value).any(axis=1)][0])
+        result = {"contingency": contingency,
+                  "stable": stable,
+                  "instability_time": None if stable else end_time,
+                  "max_angle_difference": self.__get_max_angle_difference(angles),
+                  "min_voltage": float(numpy.min(voltages)) if voltages.size>0 else float("nan"),
+                  "end_time": end_time,
+                  "pruned": stable and end_time<simulation_time-0.5*time_step}
+        return result
+
+    def __get_post_disturbance_values(self, toolkit, screen, in_service, time_step):
+        # rotor angles of generators in service after contingency, and bus voltages after disturbance ends
+        n_generator = len(screen["generators"])
+        dy_time, dy_value = toolkit.get_meter_buffer(copy=False)
+        angles = dy_value[dy_time>=screen["fault_time"], :n_generator][:, in_service]
+        voltages = dy_value[dy_time>screen["disturbance_end_time"]+0.5*time_step, n_generator:]
+        return angles, voltages
+
+    def __is_benign_contingency(self, toolkit, screen, in_service, time_step, t):
+        if t<screen["disturbance_end_time"]+screen["prune_time"]:
+            return False
+        angles, voltages = self.__get_post_disturbance_values(toolkit, screen, in_service, time_step)
+        return self.__get_max_angle_difference(angles)<screen["prune_angle"]
+
+    def __get_max_angle_difference(self, angles):
+        if angles.shape[0]==0 or angles.shape[1]==0:
+            return 0.0
+        return float(numpy.max(numpy.max(angles, axis=1)-numpy.min(angles, axis=1)))
+
+    def search_cct(self, faults, fault_shunt=(0.0, -2e4), fault_location=0.0, trip_line=True, fault_time=0.0, simulation_time=5.0, angle_threshold=180.0, min_clearing_time=0.0, max_clearing_time=1.0, tolerance=None, sections=None, log_file=""):
+        """
+        Search critical clearing time (CCT) of faults with multi-section search in parallel threads. Module numpy is required.
+        Args:
+            (1) faults: Fault device, or list of fault devices. Fault device is bus number for bus fault, or line device id in format of (ibus, jbus, ickt) for line fault.
+            (2) fault_shunt: Complex per unit fault shunt in the form of (g+jb).
+            (3) fault_location: Relative fault location to ibus for line fault.
+            (4) trip_line: Logic of tripping faulted line when line fault is cleared.
+            (5) fault_time: Time in second when fault is applied.
+            (6) simulation_time: Time in second when simulation of each clearing time candidate ends.
+            (7) angle_threshold: Rotor angle difference threshold in deg of rotor angle stability surveillance.
+            (8) min_clearing_time: Lower bound of CCT in second.
+            (9) max_clearing_time: Upper bound of CCT in second.
+            (10) tolerance: Time in second. Search stops when the gap between stable and unstable clearing time is no more than tolerance. If None, dynamic simulation time step is used.
+            (11) sections: Count of clearing time candidates simulated in parallel in each search round. If None, count of CPUs is used.
+            (12) log_file: string, log file name of clones. If no file is set (""), the log will be exported to stdout.
+        Rets:
+            (1) dict of search result if faults is a fault device, or list of dict of search result of each fault with keys:
+                "fault": fault device
+                "cct": maximum stable clearing time found in second. None if system is unstable with min_clearing_time
+                "unstable_clearing_time": minimum unstable clearing time found in second. None if system is stable with max_clearing_time
+                "simulation_count": count of simulated clearing time candidates
+            None if numpy is missing.
+        Tips:
+            Each search round simulates sections candidates evenly spaced between current stable and unstable clearing time in parallel, so the gap shrinks by sections+1 times per round.
+            Each thread works with its own clone of the toolkit. Simulation before the fault is run once per thread, and the dynamic state at the fault instant is saved with save_dynamic_state() and restored for every candidate of the fault.
+            Simulation is treated as unstable if rotor angle stability surveillance detects instability, or simulation diverges.
+            Load and solve the case before searching. Do not change the toolkit before search_cct() returns.
+            CCT_SEARCHER of STEPS kernel is not used, since it only works with default toolkit, reloads PSS/E files for every simulation, and only supports line fault.
+        Example:
+            simulator.load_powerflow_data("IEEE39.raw", "PSS/E")
+            simulator.solve_powerflow("NR")
+            simulator.load_dynamic_data("IEEE39.dyr", "PSS/E")
+            result = simulator.search_cct((16, 17, "1"))
+            results = simulator.search_cct([16, 17, (16, 17, "1")], sections=8)
+        """
+        if numpy is None:
+            print("search_cct() is dependent on module numpy which is missing. please install numpy before use it")
+            return None
+        if ThreadPoolExecutor is None:
+            print("search_cct() is dependent on module concurrent.futures which is missing. please install futures before use it")
+            return None
+        batch = isinstance(faults, list)
+        if not batch:
+            faults = [faults]
+        if sections is None:
+            sections = os.cpu_count()
+        if tolerance is None:
+            tolerance = self.get_dynamic_simulation_time_step()
+
+        search = {"clone_lock": threading.Lock(), "clones": [], "worker": threading.local(), "log_file": log_file,
+                  "fault_shunt": fault_shunt, "fault_location": fault_location, "trip_line": trip_line,
+                  "fault_time": fault_time, "simulation_time": simulation_time, "angle_threshold": angle_threshold}
+
+        results = []
+        self.__begin_parallel_run()
+        try:
+            with ThreadPoolExecutor(max_workers=sections) as executor:
+                for fault in faults:
+                    stable_time, unstable_time = min_clearing_time, max_clearing_time
+                    stables = list(executor.map(lambda clearing_time: self.__is_stable_with_clearing_time(search, fault, clearing_time), [min_clearing_time, max_clearing_time]))
+                    simulation_count = 2
+                    if not stables[0]:
+                        stable_time, unstable_time = None, min_clearing_time
+                    elif stables[1]:
+                        stable_time, unstable_time = max_clearing_time, None
+                    while stable_time is not None and unstable_time is not None:
+                        gap = unstable_time-stable_time
+                        if gap<=tolerance:
+                            break
+                        count = min(sections, int(numpy.ceil(gap/tolerance))-1)
+                        candidates = [stable_time+gap*(i+1)/(count+1) for i in range(count)]
+                        stables = list(executor.map(lambda clearing_time: self.__is_stable_with_clearing_time(search, fault, clearing_time), candidates))
+                        simulation_count += count
+                        for clearing_time, stable in zip(candidates, stables):
+                            if stable:
+                                stable_time = clearing_time
+                            else:
+                                unstable_time = clearing_time
+                                break
+                    results.append({"fault": fault, "cct": stable_time, "unstable_clearing_time": unstable_time, "simulation_count": simulation_count})
+        finally:
+            self.__end_parallel_run()
+        del search["clones"][:]
+        if batch:
+            return results
+        else:
+            return results[0]
+
+    def __get_cct_search_worker_toolkit(self, search):
+        # each worker thread keeps one clone with dynamic state saved at fault time
+        worker = search["worker"]
+        if getattr(worker, "toolkit", None) is None:
+            with search["clone_lock"]:
+                toolkit = self.clone(search["log_file"])
+                search["clones"].append(toolkit)
+            for file_type in ("BIN", "CSV", "JSON"):
+                toolkit.set_dynamic_simulator_parameter("b", file_type+" EXPORT LOGIC", False)
+            toolkit.set_dynamic_simulator_parameter("b", "ANGLE STABILITY SURVEILLANCE LOGIC", True)
+            toolkit.set_dynamic_simulator_parameter("d", "ANGLE STABILITY THRESHOLD IN DEG", search["angle_threshold"])
+            toolkit.start_dynamic_simulation()
+            toolkit.run_dynamic_simulation_to_time(search["fault_time"])
+            worker.toolkit = toolkit
+            worker.prefault_state = toolkit.save_dynamic_state()
+            worker.fault = None
+            worker.fault_state = None
+        return worker.toolkit
+
+    def __is_stable_with_clearing_time(self, search, fault, clearing_time):
+        toolkit = self.__get_cct_search_worker_toolkit(search)
+        worker = search["worker"]
+        fault_shunt, fault_location = search["fault_shunt"], search["fault_location"]
+        if worker.fault!=fault:
+            if worker.fault_state is not None:
+                toolkit.release_dynamic_state(worker.fault_state)
+            toolkit.restore_dynamic_state(worker.prefault_state)
+            if isinstance(fault, tuple):
+                toolkit.set_line_fault(fault, "THREE PHASE FAULT", fault_location, fault_shunt)
+            else:
+                toolkit.set_bus_fault(fault, "THREE PHASE FAULT", fault_shunt)
+            worker.fault = fault
+            worker.fault_state = toolkit.save_dynamic_state()
+        else:
+            toolkit.restore_dynamic_state(worker.fault_state)
+
+        toolkit.run_dynamic_simulation_to_time(search["fault_time"]+clearing_time)
+        if not toolkit.get_dynamic_simulation_early_stop_flag():
+            if isinstance(fault, tuple):
+                toolkit.clear_line_fault(fault, "THREE PHASE FAULT", fault_location)
+                if search["trip_line"]:
+                    toolkit.trip_line(fault)
+            else:
+                toolkit.clear_bus_fault(fault, "THREE PHASE FAULT")
+            toolkit.run_dynamic_simulation_to_time(search["simulation_time"])
+        if not toolkit.is_system_angular_stable():
+            return False
+        return not numpy.isnan(toolkit.get_device_data_array("BUS", "D", "VOLTAGE IN PU")).any()
+
     def get_generator_voltage_reference_in_pu(self, generator):
         """
         Get generator voltage reference of exciter model. If there is no exciter model for the generator, 0 will be returned.
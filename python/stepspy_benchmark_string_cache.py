@@ -0,0 +1,62 @@
+#coding=utf-8
+'''
+Micro-benchmark of the cached encoding of device types and parameter names in stepspy.
+Compare per-call time of get/set data APIs with the string cache disabled and enabled.
+Usage: python stepspy_benchmark_string_cache.py [raw file] [number of rounds]
+'''
+import sys
+import platform
+import timeit
+from ctypes import c_char_p
+import stepspy
+from stepspy import stepspy as stepspy_module
+
+raw_file = sys.argv[1] if len(sys.argv)>1 else '../bench/ieee39.raw'
+rounds = int(sys.argv[2]) if len(sys.argv)>2 else 20
+
+simulator = stepspy.STEPS(is_default=False, log_file='benchmark_string_cache.log')
+simulator.load_powerflow_data(raw_file, 'PSS/E')
+buses = simulator.get_all_buses()
+generators = simulator.get_all_generators()
+
+def legacy_get_c_char_p_of_string(data):
+    python_version = platform.python_version_tuple()
+    python_version = python_version[0]
+    if python_version == '3':
+        return c_char_p(bytes(data, 'utf-8'))
+    elif python_version == '2':
+        return c_char_p(bytes(data))
+    else:
+        return None
+
+def encode_with_legacy():
+    for name in ['PGEN_MW', 'VOLTAGE IN PU', 'THREE PHASE FAULT']:
+        legacy_get_c_char_p_of_string(name)
+
+def encode_with_cache():
+    for name in ['PGEN_MW', 'VOLTAGE IN PU', 'THREE PHASE FAULT']:
+        simulator._STEPS__get_c_char_p_of_string(name)
+
+def get_and_set_data():
+    for bus in buses:
+        simulator.get_bus_data(bus, 'F', 'VOLTAGE IN PU')
+    for generator in generators:
+        pgen = simulator.get_generator_data(generator, 'F', 'PGEN_MW')
+        simulator.set_generator_data(generator, 'F', 'PGEN_MW', pgen)
+
+def best_time_per_call(func, ncalls):
+    return min(timeit.repeat(func, number=rounds, repeat=5))/(rounds*ncalls)
+
+ncalls = 3
+t_legacy = best_time_per_call(encode_with_legacy, ncalls)
+t_cached = best_time_per_call(encode_with_cache, ncalls)
+print("string encoding: legacy {:.3f} us/call, cached {:.3f} us/call, speedup {:.2f}x".format(t_legacy*1e6, t_cached*1e6, t_legacy/t_cached))
+
+ncalls = len(buses)+2*len(generators)
+cache_size = stepspy_module.C_CHAR_P_CACHE_SIZE
+stepspy_module.C_CHAR_P_CACHE_SIZE = 0
+stepspy_module.C_CHAR_P_CACHE.clear()
+t_uncached = best_time_per_call(get_and_set_data, ncalls)
+stepspy_module.C_CHAR_P_CACHE_SIZE = cache_size
+t_cached = best_time_per_call(get_and_set_data, ncalls)
+print("get/set data: uncached {:.3f} us/call, cached {:.3f} us/call, speedup {:.2f}x".format(t_uncached*1e6, t_cached*1e6, t_uncached/t_cached))
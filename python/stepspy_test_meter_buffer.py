@@ -0,0 +1,47 @@
+import os
+import numpy
+import stepspy
+
+bench = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bench")
+
+if __name__ =='__main__':
+    simulator = stepspy.STEPS(is_default=False, log_file="stepspy_test_meter_buffer.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "IEEE9.raw"), "PSS/E")
+    simulator.load_dynamic_data(os.path.join(bench, "IEEE9.dyr"), "PSS/E")
+    simulator.solve_powerflow("NR")
+    simulator.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+    simulator.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+    simulator.set_dynamic_simulation_time_step(0.01)
+    simulator.prepare_bus_meter(7, "VOLTAGE IN PU")
+    simulator.prepare_generator_meter((2, "1"), "ROTOR ANGLE IN DEG")
+
+    simulator.set_meter_buffer_capacity(1000)
+    simulator.start_dynamic_simulation()
+    simulator.run_dynamic_simulation_to_time(0.5)
+    simulator.set_bus_fault(7, "THREE PHASE FAULT", (0.0, -2e4))
+    simulator.run_dynamic_simulation_to_time(0.6)
+    simulator.clear_bus_fault(7, "THREE PHASE FAULT")
+    simulator.run_dynamic_simulation_to_time(1.0)
+    t, values = simulator.get_meter_buffer()
+    view_t, view_values = simulator.get_meter_buffer(copy=False)
+    assert values.shape==(len(t), simulator.get_meter_count())
+    assert (t==view_t).all() and (values==view_values).all()
+    assert t.flags.writeable and values.flags.writeable
+    assert not view_t.flags.writeable and not view_values.flags.writeable
+    assert abs(t[-1]-1.0)<1e-9
+    print("meter buffer is copied by default, and viewed with copy=False")
+
+    saved_t, saved_values = numpy.array(t), numpy.array(values)
+    simulator.set_meter_buffer_capacity(10, ring=True)
+    simulator.start_dynamic_simulation()
+    simulator.run_dynamic_simulation_to_time(0.5)
+    assert (t==saved_t).all() and (values==saved_values).all()
+    print("copy of meter buffer is kept after meter buffer is released")
+
+    ring_t, ring_values = simulator.get_meter_buffer()
+    assert len(ring_t)==10 and (numpy.diff(ring_t)>0).all() and abs(ring_t[-1]-0.5)<1e-9
+    storage_t, storage_values = simulator.get_meter_buffer(ordered=False)
+    assert sorted(storage_t)==sorted(ring_t)
+    print("ring meter buffer is ordered in time")
+    simulator.stop_dynamic_simulation()
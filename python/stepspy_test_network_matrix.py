@@ -0,0 +1,111 @@
+import os
+import csv
+import numpy
+import stepspy
+
+bench = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bench")
+
+def get_entries_of_matrix(matrix, row_buses, column_buses):
+    # map (row bus, column bus) to value of nonzero entry
+    matrix = matrix.tocoo()
+    return {(int(row_buses[i]), int(column_buses[j])): value for i, j, value in zip(matrix.row, matrix.col, matrix.data)}
+
+def get_entries_of_file(file, columns, row_type=None, column_type=None):
+    entries = {}
+    with open(file) as f:
+        for record in csv.DictReader(f):
+            if row_type is not None and (record["ROW_TYPE"]!=row_type or record["COLUMN_TYPE"]!=column_type):
+                continue
+            values = [float(record[column]) for column in columns]
+            entries[(int(record["ROW_BUS"]), int(record["COLUMN_BUS"]))] = values[0] if len(values)==1 else complex(values[0], values[1])
+    return entries
+
+def assert_same_entries(matrix_entries, file_entries, tolerance):
+    assert set(matrix_entries.keys())==set(file_entries.keys())
+    for key, value in matrix_entries.items():
+        assert abs(value-file_entries[key])<tolerance
+
+if __name__ =='__main__':
+    simulator = stepspy.STEPS(is_default=False, log_file="stepspy_test_network_matrix.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "ieee39.raw"), "PSS/E")
+    simulator.load_dynamic_data(os.path.join(bench, "IEEE39.dyr"), "PSS/E")
+    simulator.solve_powerflow("NR")
+
+    Y, buses = simulator.get_network_Y_matrix()
+    assert Y.dtype==numpy.complex128 and Y.shape==(len(buses), len(buses))
+    simulator.save_network_Y_matrix("Y_matrix.csv")
+    assert_same_entries(get_entries_of_matrix(Y, buses, buses), get_entries_of_file("Y_matrix.csv", ["REAL", "IMAGINARY"]), 1e-12)
+    print("network Y matrix is the same as saved to file")
+
+    BP, BQ, buses = simulator.get_decoupled_network_B_matrix()
+    assert BP.dtype==numpy.float64 and BQ.dtype==numpy.float64
+    simulator.save_decoupled_network_B_matrix("B_matrix.csv")
+    assert_same_entries(get_entries_of_matrix(BP, buses, buses), get_entries_of_file("B_matrix.csv", ["BP"]), 1e-12)
+    assert_same_entries(get_entries_of_matrix(BQ, buses, buses), get_entries_of_file("B_matrix.csv", ["BQ"]), 1e-12)
+    print("decoupled network B matrix is the same as saved to file")
+
+    B, buses = simulator.get_dc_network_B_matrix()
+    simulator.save_dc_network_B_matrix("DC_B_matrix.csv")
+    assert_same_entries(get_entries_of_matrix(B, buses, buses), get_entries_of_file("DC_B_matrix.csv", ["B"]), 1e-12)
+    print("DC network B matrix is the same as saved to file")
+
+    J, P_buses, Q_buses = simulator.get_jacobian_matrix()
+    nP = len(P_buses)
+    assert J.shape==(nP+len(Q_buses), nP+len(Q_buses))
+    simulator.save_jacobian_matrix("jacobian_matrix.csv")
+    for row_type, column_type, rows, columns in (("P", "A", slice(None, nP), slice(None, nP)), ("P", "V", slice(None, nP), slice(nP, None)),
+                                                 ("Q", "A", slice(nP, None), slice(None, nP)), ("Q", "V", slice(nP, None), slice(nP, None))):
+        row_buses = P_buses if row_type=="P" else Q_buses
+        column_buses = P_buses if column_type=="A" else Q_buses
+        matrix_entries = get_entries_of_matrix(J[rows, columns], row_buses, column_buses)
+        file_entries = get_entries_of_file("jacobian_matrix.csv", ["VALUE"], row_type, column_type)
+        file_entries = {key: value for key, value in file_entries.items() if key[0] in row_buses and key[1] in column_buses and value!=0.0}
+        matrix_entries = {key: value for key, value in matrix_entries.items() if abs(value)>=5e-7}
+        assert_same_entries(matrix_entries, file_entries, 1e-6)
+    print("jacobian matrix is the same as saved to file")
+
+    Y, buses = simulator.get_network_Y_matrix()
+    powerflow_entries = get_entries_of_matrix(Y, buses, buses)
+    simulator.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+    simulator.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+    simulator.start_dynamic_simulation()
+    simulator.run_dynamic_simulation_to_time(0.1)
+    simulator.set_bus_fault(16, "THREE PHASE FAULT", (0.0, -2e4))
+    simulator.run_dynamic_simulation_to_time(0.11)
+    Y, buses = simulator.get_dynamic_network_Y_matrix(rebuild=False)
+    simulator.save_dynamic_network_Y_matrix("dynamic_Y_matrix.csv")
+    simulator.clear_bus_fault(16, "THREE PHASE FAULT")
+    simulator.stop_dynamic_simulation()
+    dynamic_entries = get_entries_of_matrix(Y, buses, buses)
+    assert_same_entries(dynamic_entries, get_entries_of_file("dynamic_Y_matrix.csv", ["REAL", "IMAGINARY"]), 1e-12)
+    assert abs(dynamic_entries[(16, 16)].imag-powerflow_entries[(16, 16)].imag)>1e4
+    print("dynamic network Y matrix with fault is the same as saved to file")
+
+    simulator = stepspy.STEPS(is_default=False, log_file="stepspy_test_network_matrix.log")
+    simulator.set_allowed_maximum_bus_number(10000)
+    simulator.load_powerflow_data(os.path.join(bench, "IEEE9.raw"), "PSS/E")
+    simulator.load_dynamic_data(os.path.join(bench, "IEEE9.dyr"), "PSS/E")
+    simulator.solve_powerflow("NR")
+    simulator.set_dynamic_simulator_parameter("b", "BIN EXPORT LOGIC", False)
+    simulator.set_dynamic_simulator_parameter("b", "CSV EXPORT LOGIC", False)
+    assert simulator.get_dynamic_simulator_parameter("b", "NETWORK MATRIX INCREMENTAL UPDATE LOGIC")
+    simulator.start_dynamic_simulation()
+    simulator.run_dynamic_simulation_to_time(0.1)
+    Y, buses = simulator.get_dynamic_network_Y_matrix(rebuild=False)
+    original_entries = get_entries_of_matrix(Y, buses, buses)
+    simulator.set_generator_data((1, "1"), "D", "MBASE_MVA", 2.0*simulator.get_generator_data((1, "1"), "D", "MBASE_MVA"))
+    simulator.set_generator_data((2, "1"), "D", "XSOURCE_PU", 2.0*simulator.get_generator_data((2, "1"), "D", "XSOURCE_PU"))
+    simulator.set_generator_data((3, "1"), "B", "STATUS", False)
+    simulator.run_dynamic_simulation_to_time(0.11)
+    Y, buses = simulator.get_dynamic_network_Y_matrix(rebuild=False)
+    updated_entries = get_entries_of_matrix(Y, buses, buses)
+    simulator.stop_dynamic_simulation()
+    for bus in (1, 2, 3):
+        assert abs(updated_entries[(bus, bus)]-original_entries[(bus, bus)])>1e-3
+    Y, buses = simulator.get_dynamic_network_Y_matrix(rebuild=True)
+    assert_same_entries(updated_entries, get_entries_of_matrix(Y, buses, buses), 1e-9)
+    print("dynamic network Y matrix is updated with generator data changed during dynamic simulation")
+
+    for file in ("Y_matrix.csv", "B_matrix.csv", "DC_B_matrix.csv", "dynamic_Y_matrix.csv", "jacobian_matrix.csv"):
+        os.remove(file)